@@ -34,6 +34,13 @@ a = Analysis(
         'PyQt5.QtCore',
         'PyQt5.QtGui',
         'PyQt5.QtWidgets',
+        # Backends registered by 'module:Class' path (imported on first use)
+        'implementations.whisper_stt',
+        'implementations.opus_translation',
+        'implementations.ct2_translation',
+        'implementations.energy_vad',
+        'implementations.silero_vad',
+        'implementations.mock_backends',
         # Speech recognition
         'faster_whisper',
         'ctranslate2',
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3.11
+"""
+Outlined Label Paint Benchmark
+투명 오버레이 OutlinedLabel 프레임당 페인트 비용 비교 (8방향 drawText vs 캐시된 외곽선 pixmap)
+
+화면 없이(offscreen) 같은 크기의 라벨 두 개를 만들고 repaint()를 반복합니다.
+- static: 같은 자막을 다시 그림 (창 이동 / 겹침 / 애니메이션 등으로 인한 repaint)
+- update: 프레임마다 자막이 바뀜 (캐시를 매번 다시 만듦)
+
+사용법:
+    python benchmarks/bench_outline_label.py [--frames 300] [--scale 2] [--font-size 28]
+"""
+
+import os
+import sys
+import time
+import argparse
+from pathlib import Path
+
+# Add project root to path
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+SAMPLE_TEXT = "오늘 회의에서는 다음 분기 제품 출시 일정과 예산 배분에 대해 논의하겠습니다"
+
+
+def make_legacy_label_class():
+    """기존 OutlinedLabel (gui/renderers/transparent_renderer.py 이전 구현)"""
+    from PyQt5.QtWidgets import QLabel
+    from PyQt5.QtGui import QPainter, QColor, QPen
+
+    class LegacyOutlinedLabel(QLabel):
+        def __init__(self, text=""):
+            super().__init__(text)
+            self.outline_color = QColor(0, 0, 0)
+            self.outline_width = 2
+            self.paints = 0
+
+        def paintEvent(self, event):
+            self.paints += 1
+            painter = QPainter(self)
+            painter.setRenderHint(QPainter.Antialiasing)
+            painter.setPen(QPen(self.outline_color, self.outline_width))
+            painter.setFont(self.font())
+
+            rect = self.rect()
+            alignment = self.alignment()
+            for dx in [-self.outline_width, 0, self.outline_width]:
+                for dy in [-self.outline_width, 0, self.outline_width]:
+                    if dx == 0 and dy == 0:
+                        continue
+                    painter.drawText(rect.adjusted(dx, dy, dx, dy), alignment, self.text())
+            painter.end()
+
+            super().paintEvent(event)
+
+    return LegacyOutlinedLabel
+
+
+def setup_label(label, font_size: int, width: int):
+    """투명 오버레이 한국어 라벨과 같은 설정"""
+    from PyQt5.QtCore import Qt
+
+    label.setAlignment(Qt.AlignCenter)
+    label.setWordWrap(True)
+    label.setStyleSheet(
+        f"color: #FFFFFF; font-size: {font_size}px; font-weight: bold; background: transparent;"
+    )
+    label.outline_width = 3
+    label.resize(width, font_size * 3)
+    label.show()
+
+
+def measure(app, label, frames: int, changing: bool) -> float:
+    """
+    repaint() 반복 측정
+
+    Args:
+        app: QApplication
+        label: 라벨
+        frames: 반복 횟수
+        changing: True면 프레임마다 텍스트 변경
+
+    Returns:
+        float: 프레임당 평균 ms
+    """
+    label.setText(SAMPLE_TEXT)
+    label.repaint()
+    app.processEvents()
+
+    start = time.perf_counter()
+    for frame in range(frames):
+        if changing:
+            label.setText(f"{SAMPLE_TEXT} {frame}")
+        label.repaint()
+    return (time.perf_counter() - start) * 1000 / frames
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Outlined label paint benchmark')
+    parser.add_argument('--frames', type=int, default=300, help='측정 프레임 수')
+    parser.add_argument('--scale', type=float, default=2.0, help='장치 픽셀 비율 (4K 150-200%% 배율 재현)')
+    parser.add_argument('--font-size', type=int, default=28, help='글자 크기 (px)')
+    parser.add_argument('--width', type=int, default=1600, help='라벨 폭 (논리 px)')
+    args = parser.parse_args()
+
+    os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+    os.environ['QT_SCALE_FACTOR'] = str(args.scale)
+
+    from PyQt5.QtWidgets import QApplication
+    from gui.renderers.transparent_renderer import OutlinedLabel
+
+    app = QApplication(sys.argv)
+
+    legacy = make_legacy_label_class()()
+    cached = OutlinedLabel()
+    for label in (legacy, cached):
+        setup_label(label, args.font_size, args.width)
+
+    results = {}
+    for mode, changing in (('static', False), ('update', True)):
+        results[mode] = (
+            measure(app, legacy, args.frames, changing),
+            measure(app, cached, args.frames, changing)
+        )
+
+    print("=" * 60)
+    print(f"Outlined label benchmark ({args.frames} frames, {args.font_size}px, "
+          f"{args.width}px x{args.scale:g} DPR)")
+    print("=" * 60)
+    print(f"{'ms / frame':24}{'8x drawText':>16}{'cached path':>16}")
+    for mode, (legacy_ms, cached_ms) in results.items():
+        print(f"{mode:24}{legacy_ms:>16.3f}{cached_ms:>16.3f}")
+    print(f"\ncached label: {cached.paints} paints, {cached.renders} renders")
+
+
+if __name__ == '__main__':
+    main()
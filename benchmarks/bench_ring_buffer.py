@@ -0,0 +1,147 @@
+#!/usr/bin/env python3.11
+"""
+Ring Buffer Microbenchmark
+AudioCapture 녹음 루프의 할당량 비교 (리스트 버퍼 vs 링 버퍼)
+
+PyAudio 없이 stream.read() 결과를 흉내 낸 동일한 bytes 객체를 두 루프에
+반복해서 넣고, 읽기 1회마다 tracemalloc 피크 증가량을 합산합니다.
+측정값은 오디오 1초당 새로 할당된 바이트 수와 할당이 발생한 읽기 횟수입니다.
+
+사용법:
+    python benchmarks/bench_ring_buffer.py [--seconds 60]
+"""
+
+import sys
+import gc
+import time
+import argparse
+import tracemalloc
+from pathlib import Path
+import numpy as np
+
+# Add project root to path
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from core.ring_buffer import AudioRingBuffer, FramePool
+
+
+SAMPLE_RATE = 16000
+BUFFER_SIZE = 1024
+CHUNK_SIZE = int(SAMPLE_RATE * 3.0)
+OVERLAP = CHUNK_SIZE // 2
+
+
+def make_legacy_step():
+    """기존 리스트 기반 녹음 루프 1회 (core/audio_capture.py 이전 구현)"""
+    state = {'buffer': []}
+    emitted = []
+
+    def step(data: bytes):
+        audio_chunk = np.frombuffer(data, dtype=np.int16)
+        state['buffer'].extend(audio_chunk)
+
+        if len(state['buffer']) >= CHUNK_SIZE:
+            audio_array = np.array(state['buffer'][:CHUNK_SIZE], dtype=np.float32)
+            audio_array = audio_array / 32768.0
+            emitted.append(audio_array)
+            state['buffer'] = state['buffer'][CHUNK_SIZE - OVERLAP:]
+
+        # 소비자가 청크를 처리하고 놓는 상황 재현
+        emitted.clear()
+
+    return step
+
+
+def make_ring_step():
+    """링 버퍼 기반 녹음 루프 1회 (현재 구현)"""
+    ring = AudioRingBuffer(CHUNK_SIZE + BUFFER_SIZE * 4)
+    pool = FramePool(CHUNK_SIZE)
+    emitted = []
+
+    def step(data: bytes):
+        ring.write(np.frombuffer(data, dtype=np.int16))
+
+        while ring.available >= CHUNK_SIZE:
+            emitted.append(ring.read_window(CHUNK_SIZE, out=pool.acquire(), overlap=OVERLAP))
+
+        for frame in emitted:
+            pool.release(frame)
+        emitted.clear()
+
+    return step, pool
+
+
+def measure(step, data: bytes, reads: int) -> dict:
+    """
+    읽기 루프 측정
+
+    Args:
+        step: 읽기 1회 함수
+        data: 모의 stream.read() 결과
+        reads: 읽기 횟수
+
+    Returns:
+        dict: 측정 결과
+    """
+    # 워밍업 (링 버퍼 초기 청크 및 풀 채우기)
+    for _ in range(CHUNK_SIZE // BUFFER_SIZE * 2):
+        step(data)
+
+    gc.collect()
+    gen0_before = gc.get_stats()[0]['collections']
+
+    tracemalloc.start()
+    allocated_bytes = 0
+    allocating_reads = 0
+
+    start = time.perf_counter()
+    for _ in range(reads):
+        current, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        step(data)
+        _, peak = tracemalloc.get_traced_memory()
+        delta = peak - current
+        if delta > 0:
+            allocated_bytes += delta
+            allocating_reads += 1
+    elapsed = time.perf_counter() - start
+
+    tracemalloc.stop()
+    gen0_after = gc.get_stats()[0]['collections']
+
+    audio_seconds = reads * BUFFER_SIZE / SAMPLE_RATE
+    return {
+        'bytes_per_sec': allocated_bytes / audio_seconds,
+        'allocating_reads_per_sec': allocating_reads / audio_seconds,
+        'gc_gen0': gen0_after - gen0_before,
+        'cpu_ms_per_sec': elapsed * 1000 / audio_seconds
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Ring buffer allocation benchmark')
+    parser.add_argument('--seconds', type=float, default=60.0, help='시뮬레이션할 오디오 길이 (초)')
+    args = parser.parse_args()
+
+    reads = int(args.seconds * SAMPLE_RATE / BUFFER_SIZE)
+    rng = np.random.default_rng(0)
+    data = rng.integers(-32768, 32767, BUFFER_SIZE, dtype=np.int16).tobytes()
+
+    legacy = measure(make_legacy_step(), data, reads)
+    ring_step, pool = make_ring_step()
+    ring = measure(ring_step, data, reads)
+
+    print("=" * 60)
+    print(f"Ring buffer benchmark ({args.seconds:.0f}s audio, {reads} reads)")
+    print("=" * 60)
+    print(f"{'':24}{'list (before)':>16}{'ring (after)':>16}")
+    print(f"{'alloc bytes / s':24}{legacy['bytes_per_sec']:>16,.0f}{ring['bytes_per_sec']:>16,.0f}")
+    print(f"{'allocating reads / s':24}{legacy['allocating_reads_per_sec']:>16.1f}{ring['allocating_reads_per_sec']:>16.1f}")
+    print(f"{'gc gen0 collections':24}{legacy['gc_gen0']:>16}{ring['gc_gen0']:>16}")
+    print(f"{'cpu ms / audio s':24}{legacy['cpu_ms_per_sec']:>16.2f}{ring['cpu_ms_per_sec']:>16.2f}")
+    print(f"\nframe pool: {pool.get_stats()}")
+
+
+if __name__ == '__main__':
+    main()
@@ -5,11 +5,28 @@ Audio Capture Module
 
 import pyaudio
 import numpy as np
-from typing import Optional, Callable, Generator
+from typing import Optional, Callable, Generator, Tuple
 import threading
 import queue
 import time
 
+from core.ring_buffer import AudioRingBuffer, FramePool
+
+
+# 캡처 모드
+# - blocking: 녹음 스레드가 stream.read()로 직접 읽기
+# - callback: PortAudio 콜백이 링 버퍼에 쓰고 청크 스레드가 꺼내기
+CAPTURE_MODES = ('blocking', 'callback')
+
+# 큐가 가득 찼을 때 처리 방식
+# - drop_oldest: 가장 오래된 청크 1개를 버림
+# - latest: 대기 중인 청크를 모두 버리고 최신 청크만 유지
+# - block: STT가 따라올 때까지 캡처 스레드 대기 (밀린 샘플은 링 버퍼/드라이버에서 버려짐)
+OVERFLOW_POLICIES = ('drop_oldest', 'latest', 'block')
+
+# 앞 청크가 버려져 이전 청크와 오디오가 이어지지 않음 (get_traced_stream()의 분할 사유 자리에 표시)
+GAP = 'gap'
+
 
 class AudioCapture:
     """오디오 캡처 클래스"""
@@ -19,7 +36,11 @@ class AudioCapture:
         sample_rate: int = 16000,
         chunk_duration: float = 3.0,
         buffer_size: int = 1024,
-        channels: int = 1
+        channels: int = 1,
+        overlap_ratio: float = 0.5,
+        capture_mode: str = 'blocking',
+        queue_size: int = 0,
+        overflow_policy: str = 'drop_oldest'
     ):
         """
         Args:
@@ -27,21 +48,71 @@ class AudioCapture:
             chunk_duration: 청크 지속 시간 (초)
             buffer_size: 버퍼 크기
             channels: 채널 수 (1=모노, 2=스테레오)
+            overlap_ratio: 연속 청크 간 오버랩 비율 (0 이상 1 미만)
+            capture_mode: 캡처 모드 ('blocking', 'callback')
+            queue_size: STT 대기 청크 최대 개수 (0=무제한)
+            overflow_policy: 큐가 가득 찼을 때 처리 방식 ('drop_oldest', 'latest', 'block')
         """
+        if capture_mode not in CAPTURE_MODES:
+            raise ValueError(f"Unknown capture mode: {capture_mode}")
+        if overflow_policy not in OVERFLOW_POLICIES:
+            raise ValueError(f"Unknown overflow policy: {overflow_policy}")
+        
         self.sample_rate = sample_rate
         self.chunk_duration = chunk_duration
         self.buffer_size = buffer_size
         self.channels = channels
+        self.overlap_ratio = overlap_ratio
+        self.capture_mode = capture_mode
+        self.queue_size = queue_size
+        self.overflow_policy = overflow_policy
         
         # 청크 크기 계산 (샘플 수)
         self.chunk_size = int(sample_rate * chunk_duration)
+        self.overlap_size = int(self.chunk_size * overlap_ratio)
+        
+        # 링 버퍼 및 출력 프레임 풀
+        # 콜백 모드는 청크 스레드가 늦게 깨어나도 버티도록 청크 1개분 여유를 더 둠
+        ring_capacity = self.chunk_size + buffer_size * channels * 4
+        if capture_mode == 'callback':
+            ring_capacity += self.chunk_size
+        self.ring_buffer = AudioRingBuffer(ring_capacity)
+        self.frame_pool = FramePool(self.chunk_size)
+        
+        # 무음 청크 게이트 (core.vad_gate.VoiceActivityGate, None=비활성)
+        self.vad_gate = None
+        
+        # 휴지 기반 가변 길이 분할기 (core.segmenter.SpeechSegmenter)
+        # 설정되면 고정 길이 윈도우와 VAD 게이트 대신 사용
+        self.segmenter = None
+        self._segment_scratch = np.empty(ring_capacity, dtype=np.float32)
+        
+        # 콜백 모드: 청크 준비 알림
+        self._chunk_ready = threading.Event()
+        
+        # PortAudio 상태 플래그 카운터 (콜백 모드)
+        self.input_overflows = 0
+        self.input_underflows = 0
         
         # PyAudio 인스턴스
         self.audio = None
         self.stream = None
         
-        # 버퍼 큐
-        self.audio_queue = queue.Queue()
+        # 버퍼 큐: (청크, 캡처 완료 시각, 추적 레코드, 분할 사유, 일련번호)
+        # 일련번호가 건너뛰면 중간 청크가 버려진 것 (소비자 쪽에서 GAP으로 표시)
+        self.audio_queue = queue.Queue(maxsize=queue_size)
+        self._sequence = 0
+        
+        # 버려진 청크 수 (큐 넘침 / 지연 초과)
+        self.dropped_overflow = 0
+        self.dropped_stale = 0
+        
+        # 자막 지연 추적 (core.latency_tracer.LatencyTracer, None=비활성)
+        self.tracer = None
+        
+        # 캡처 시각 기준 시계 (재생 하네스는 가상 시계로 교체)
+        self.clock: Callable[[], float] = time.perf_counter
+        self._last_write_time = 0.0
         
         # 상태
         self.is_recording = False
@@ -103,6 +174,18 @@ class AudioCapture:
             return False
         
         try:
+            self._reset_state()
+            
+            # 콜백 모드는 스트림이 열리자마자 콜백이 호출되므로 먼저 상태 설정
+            self.is_recording = True
+            
+            stream_kwargs = {}
+            if self.capture_mode == 'callback':
+                stream_kwargs['stream_callback'] = self._stream_callback
+                loop_target = self._chunk_loop
+            else:
+                loop_target = self._record_loop
+            
             # 스트림 열기
             self.stream = self.audio.open(
                 format=pyaudio.paInt16,
@@ -110,26 +193,40 @@ class AudioCapture:
                 rate=self.sample_rate,
                 input=True,
                 input_device_index=device_index,
-                frames_per_buffer=self.buffer_size
+                frames_per_buffer=self.buffer_size,
+                **stream_kwargs
             )
             
-            self.is_recording = True
-            
             # 녹음 스레드 시작
             self.record_thread = threading.Thread(
-                target=self._record_loop,
+                target=loop_target,
                 args=(callback,),
                 daemon=True
             )
             self.record_thread.start()
             
-            print("✅ 녹음 시작")
+            print(f"✅ 녹음 시작 (모드: {self.capture_mode})")
             return True
             
         except Exception as e:
+            self.is_recording = False
             print(f"❌ 녹음 시작 실패: {e}")
             return False
     
+    def _reset_state(self):
+        """녹음 시작 전 버퍼 / 카운터 / VAD 상태 초기화"""
+        self.ring_buffer.clear()
+        self._chunk_ready.clear()
+        self._last_write_time = 0.0
+        self.input_overflows = 0
+        self.input_underflows = 0
+        self.dropped_overflow = 0
+        self.dropped_stale = 0
+        if self.vad_gate:
+            self.vad_gate.reset()
+        if self.segmenter:
+            self.segmenter.reset()
+    
     def _record_loop(self, callback: Optional[Callable[[np.ndarray], None]]):
         """
         녹음 루프 (별도 스레드)
@@ -137,48 +234,184 @@ class AudioCapture:
         Args:
             callback: 오디오 청크 콜백 함수
         """
-        audio_buffer = []
-        
         while self.is_recording:
             try:
                 # 오디오 데이터 읽기
                 data = self.stream.read(self.buffer_size, exception_on_overflow=False)
                 
-                # numpy 배열로 변환
-                audio_chunk = np.frombuffer(data, dtype=np.int16)
-                
-                # 버퍼에 추가
-                audio_buffer.extend(audio_chunk)
+                # 링 버퍼에 추가 (복사 1회, 박싱 없음)
+                self.ring_buffer.write(np.frombuffer(data, dtype=np.int16))
+                self._last_write_time = self.clock()
                 
                 # 청크 크기에 도달하면 처리
-                if len(audio_buffer) >= self.chunk_size:
-                    # numpy 배열로 변환
-                    audio_array = np.array(audio_buffer[:self.chunk_size], dtype=np.float32)
-                    
-                    # 정규화 (-1 to 1)
-                    audio_array = audio_array / 32768.0
-                    
-                    # 큐에 추가
-                    self.audio_queue.put(audio_array)
-                    
-                    # 콜백 호출
-                    if callback:
-                        callback(audio_array)
-                    
-                    # 버퍼 초기화 (오버랩 50%)
-                    overlap = self.chunk_size // 2
-                    audio_buffer = audio_buffer[self.chunk_size - overlap:]
+                self._emit_chunks(callback)
                     
             except Exception as e:
                 print(f"❌ 녹음 루프 에러: {e}")
                 break
     
+    def _stream_callback(self, in_data, frame_count, time_info, status_flags):
+        """
+        PortAudio 스트림 콜백 (오디오 스레드)
+        
+        GIL을 잡는 시간을 줄이기 위해 링 버퍼 복사와 플래그 집계만 수행합니다.
+        
+        Returns:
+            tuple: (출력 데이터, 스트림 계속 여부)
+        """
+        if status_flags & pyaudio.paInputOverflow:
+            self.input_overflows += 1
+        if status_flags & pyaudio.paInputUnderflow:
+            self.input_underflows += 1
+        
+        self.ring_buffer.write(np.frombuffer(in_data, dtype=np.int16))
+        self._last_write_time = self.clock()
+        
+        if self.ring_buffer.available >= self.emit_threshold:
+            self._chunk_ready.set()
+        
+        return (None, pyaudio.paContinue if self.is_recording else pyaudio.paComplete)
+    
+    def _chunk_loop(self, callback: Optional[Callable[[np.ndarray], None]]):
+        """
+        청크 루프 (콜백 모드, 별도 스레드)
+        
+        Args:
+            callback: 오디오 청크 콜백 함수
+        """
+        while self.is_recording:
+            if not self._chunk_ready.wait(timeout=0.5):
+                continue
+            self._chunk_ready.clear()
+            
+            try:
+                self._emit_chunks(callback)
+            except Exception as e:
+                print(f"❌ 청크 루프 에러: {e}")
+                break
+    
+    @property
+    def emit_threshold(self) -> int:
+        """청크 처리를 시작할 링 버퍼 샘플 수"""
+        if self.segmenter:
+            return self.segmenter.frame_size
+        return self.chunk_size
+    
+    def _emit_chunks(self, callback: Optional[Callable[[np.ndarray], None]]):
+        """
+        링 버퍼에 쌓인 청크를 모두 큐로 전달
+        
+        Args:
+            callback: 오디오 청크 콜백 함수
+        """
+        if self.segmenter:
+            self._emit_segments(callback)
+            return
+        
+        while self.ring_buffer.available >= self.chunk_size:
+            # 미리 할당된 프레임에 float32로 변환 (-1 to 1)
+            audio_array = self.ring_buffer.read_window(
+                self.chunk_size,
+                out=self.frame_pool.acquire(),
+                overlap=self.overlap_size
+            )
+            
+            # 무음 청크는 STT 큐로 보내지 않음
+            if self.vad_gate and not self.vad_gate.process(audio_array):
+                self._release(audio_array)
+                continue
+            
+            # 큐에 추가
+            self._enqueue(audio_array)
+            
+            # 콜백 호출
+            if callback:
+                callback(audio_array)
+    
+    def _emit_segments(self, callback: Optional[Callable[[np.ndarray], None]]):
+        """
+        링 버퍼의 새 샘플을 분할기에 넣고 완성된 청크를 큐로 전달
+        
+        Args:
+            callback: 오디오 청크 콜백 함수
+        """
+        available = self.ring_buffer.available
+        if available == 0:
+            return
+        
+        audio = self.ring_buffer.read_window(available, out=self._segment_scratch)
+        segments = self.segmenter.process(audio)
+        for segment, cut in zip(segments, self.segmenter.segment_reasons):
+            self._enqueue(segment, cut)
+            if callback:
+                callback(segment)
+    
+    def _enqueue(self, chunk: np.ndarray, cut: Optional[str] = None):
+        """
+        청크를 큐에 추가 (추적 활성 시 캡처/큐 시각 기록)
+        
+        캡처 시작 시각은 마지막 링 버퍼 쓰기 시각에서 청크 길이를 빼서 추정합니다.
+        
+        Args:
+            chunk: 오디오 청크
+            cut: 분할기 분할 사유 (core.segmenter.CUT_*, 고정 길이 윈도우는 None)
+        """
+        capture_end = self._last_write_time or self.clock()
+        trace = None
+        if self.tracer:
+            trace = self.tracer.new_trace()
+            trace.mark('capture_start', capture_end - len(chunk) / self.sample_rate)
+            trace.mark('capture_end', capture_end)
+            trace.mark('enqueue')
+        self._put((chunk, capture_end, trace, cut, self._sequence))
+        self._sequence += 1
+    
+    def _put(self, item: tuple):
+        """큐에 추가 (가득 차면 overflow_policy에 따라 버리거나 대기)"""
+        if self.overflow_policy == 'block':
+            while True:
+                try:
+                    self.audio_queue.put(item, timeout=0.5)
+                    return
+                except queue.Full:
+                    # 녹음이 끝났는데 소비자가 없으면 버림
+                    if not self.is_recording:
+                        self.dropped_overflow += 1
+                        self._release(item[0])
+                        return
+        
+        while True:
+            try:
+                self.audio_queue.put_nowait(item)
+                return
+            except queue.Full:
+                discard = self.audio_queue.qsize() if self.overflow_policy == 'latest' else 1
+                for _ in range(discard):
+                    try:
+                        dropped = self.audio_queue.get_nowait()
+                    except queue.Empty:
+                        break
+                    self._release(dropped[0])
+                    self.audio_queue.task_done()
+                    self.dropped_overflow += 1
+    
+    def _release(self, chunk: np.ndarray):
+        """다 쓴 청크 프레임을 풀로 반환 (고정 길이 윈도우 / 분할기 청크)"""
+        self.frame_pool.release(chunk)
+        if self.segmenter:
+            self.segmenter.pool.release(chunk)
+    
+    def count_stale_drop(self):
+        """지연 한도를 넘어 소비자가 건너뛴 청크 기록"""
+        self.dropped_stale += 1
+    
     def stop_recording(self):
         """녹음 중지"""
         if not self.is_recording:
             return
         
         self.is_recording = False
+        self._chunk_ready.set()
         
         # 스레드 종료 대기
         if self.record_thread:
@@ -190,6 +423,12 @@ class AudioCapture:
             self.stream.close()
             self.stream = None
         
+        # 진행 중인 발화 내보내기
+        if self.segmenter:
+            segments = self.segmenter.flush()
+            for segment, cut in zip(segments, self.segmenter.segment_reasons):
+                self._enqueue(segment, cut)
+        
         print("✅ 녹음 중지")
     
     def get_audio_stream(self) -> Generator[np.ndarray, None, None]:
@@ -197,15 +436,38 @@ class AudioCapture:
         오디오 스트림 생성기
         
         Yields:
-            np.ndarray: 오디오 청크 (float32, -1 to 1)
+            np.ndarray: 오디오 청크 (float32, -1 to 1, 다음 청크를 요청하면 재사용되므로 보관하려면 복사)
         """
+        for audio_chunk, _, _, _ in self.get_traced_stream():
+            yield audio_chunk
+    
+    def get_traced_stream(self) -> Generator[Tuple[np.ndarray, float, Optional[object], Optional[str]], None, None]:
+        """
+        캡처 시각, 추적 레코드, 분할 사유가 붙은 오디오 스트림 생성기
+        
+        Yields:
+            tuple: (오디오 청크, 캡처 완료 시각(self.clock 기준), CaptionTrace 또는 None,
+                    분할 사유(core.segmenter.CUT_*, 고정 길이 윈도우는 None,
+                    바로 앞 청크가 큐에서 버려졌으면 GAP))
+                   오디오 청크는 다음 청크를 요청할 때 프레임 풀로 반환되므로 보관하려면 복사
+        """
+        expected = None
         while self.is_recording or not self.audio_queue.empty():
             try:
                 # 타임아웃으로 큐에서 가져오기
-                audio_chunk = self.audio_queue.get(timeout=0.5)
-                yield audio_chunk
+                audio_chunk, captured_at, trace, cut, sequence = self.audio_queue.get(timeout=0.5)
             except queue.Empty:
                 continue
+            if expected is not None and sequence != expected:
+                cut = GAP
+            expected = sequence + 1
+            if trace is not None:
+                trace.mark('dequeue')
+            yield audio_chunk, captured_at, trace, cut
+            
+            # 소비자가 다음 청크를 요청하면 이전 청크 처리 완료 (프레임 반환)
+            self._release(audio_chunk)
+            self.audio_queue.task_done()
     
     def cleanup(self):
         """리소스 정리"""
@@ -215,6 +477,30 @@ class AudioCapture:
             self.audio.terminate()
             self.audio = None
     
+    def get_capture_stats(self) -> dict:
+        """
+        캡처 통계
+        
+        Returns:
+            dict: 캡처 모드, 오버런/언더런 횟수, 버려진 샘플/청크 수
+        """
+        return {
+            'capture_mode': self.capture_mode,
+            'input_overflows': self.input_overflows,
+            'input_underflows': self.input_underflows,
+            'dropped_samples': self.ring_buffer.overflow_samples,
+            'queue': {
+                'size': self.audio_queue.qsize(),
+                'max_size': self.queue_size,
+                'policy': self.overflow_policy,
+                'dropped_overflow': self.dropped_overflow,
+                'dropped_stale': self.dropped_stale
+            },
+            'frame_pool': self.frame_pool.get_stats(),
+            'vad': self.vad_gate.get_stats() if self.vad_gate else None,
+            'segmenter': self.segmenter.get_stats() if self.segmenter else None
+        }
+    
     def get_audio_level(self) -> float:
         """
         현재 오디오 레벨 (RMS)
@@ -227,7 +513,7 @@ class AudioCapture:
         
         try:
             # 최근 청크 가져오기
-            audio_chunk = self.audio_queue.queue[-1]
+            audio_chunk = self.audio_queue.queue[-1][0]
             
             # RMS 계산
             rms = np.sqrt(np.mean(audio_chunk ** 2))
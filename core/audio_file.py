@@ -0,0 +1,91 @@
+"""
+Audio File
+오디오/비디오 파일 디코딩 (오프라인 배치 처리용)
+
+WAV는 표준 라이브러리(wave)로 읽고, 그 밖의 형식(mp3, m4a, mp4, mkv 등)은
+faster-whisper에 포함된 PyAV 디코더로 읽습니다.
+"""
+
+import wave
+from pathlib import Path
+from typing import Tuple
+
+import numpy as np
+
+
+# 배치 입력으로 인식할 확장자
+AUDIO_EXTENSIONS = ('.wav', '.mp3', '.m4a', '.flac', '.ogg', '.opus', '.aac', '.wma')
+VIDEO_EXTENSIONS = ('.mp4', '.mkv', '.mov', '.avi', '.webm', '.ts')
+MEDIA_EXTENSIONS = AUDIO_EXTENSIONS + VIDEO_EXTENSIONS
+
+
+def read_wav(path: str) -> Tuple[np.ndarray, int]:
+    """
+    PCM WAV 파일 읽기 (다채널은 평균으로 모노 변환)
+
+    Args:
+        path: WAV 파일 경로
+
+    Returns:
+        Tuple[np.ndarray, int]: (float32 샘플 -1 to 1, 샘플링 레이트)
+    """
+    with wave.open(str(path), 'rb') as wav:
+        channels = wav.getnchannels()
+        sample_width = wav.getsampwidth()
+        sample_rate = wav.getframerate()
+        data = wav.readframes(wav.getnframes())
+
+    if sample_width == 1:
+        audio = (np.frombuffer(data, dtype=np.uint8).astype(np.float32) - 128) / 128.0
+    elif sample_width == 2:
+        audio = np.frombuffer(data, dtype=np.int16).astype(np.float32) / 32768.0
+    elif sample_width == 4:
+        audio = np.frombuffer(data, dtype=np.int32).astype(np.float32) / 2147483648.0
+    else:
+        raise ValueError(f"Unsupported WAV sample width: {sample_width * 8} bit")
+
+    if channels > 1:
+        audio = audio.reshape(-1, channels).mean(axis=1)
+
+    return audio.astype(np.float32, copy=False), sample_rate
+
+
+def resample(audio: np.ndarray, src_rate: int, dst_rate: int) -> np.ndarray:
+    """
+    선형 보간 리샘플링
+
+    Args:
+        audio: float32 샘플
+        src_rate: 원본 샘플링 레이트
+        dst_rate: 대상 샘플링 레이트
+
+    Returns:
+        np.ndarray: 리샘플링된 float32 샘플
+    """
+    if src_rate == dst_rate or len(audio) == 0:
+        return audio
+    n_out = int(round(len(audio) * dst_rate / src_rate))
+    positions = np.arange(n_out) * (src_rate / dst_rate)
+    return np.interp(positions, np.arange(len(audio)), audio).astype(np.float32)
+
+
+def load_audio(path: str, sample_rate: int = 16000) -> np.ndarray:
+    """
+    오디오/비디오 파일을 모노 float32로 디코딩
+
+    Args:
+        path: 파일 경로
+        sample_rate: 출력 샘플링 레이트
+
+    Returns:
+        np.ndarray: float32 샘플 (-1 to 1)
+    """
+    if Path(path).suffix.lower() == '.wav':
+        try:
+            audio, file_rate = read_wav(path)
+            return resample(audio, file_rate, sample_rate)
+        except (wave.Error, ValueError):
+            pass  # 압축 WAV 등은 PyAV로 디코딩
+
+    from faster_whisper import decode_audio
+    return decode_audio(str(path), sampling_rate=sample_rate)
@@ -0,0 +1,426 @@
+"""
+Batch Transcriber
+오디오/비디오 파일 오프라인 일괄 자막 생성
+
+파일마다 VAD로 발화 구간을 나눈 뒤 프로세스 풀에서 병렬로 음성 인식하고,
+메인 프로세스에서 번역을 translate_batch()로 묶어 처리해 SRT / WebVTT /
+JSON Lines로 저장합니다. 파일별 매니페스트에 진행 상태를 기록하므로 중단된
+작업은 끝난 단계부터 이어서 처리합니다.
+"""
+
+import json
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Iterable
+
+from core.audio_file import load_audio, MEDIA_EXTENSIONS
+from core.config_manager import ConfigManager
+from core.segmenter import SpeechSegmenter
+from core.subtitle_writer import write_subtitles, write_atomic, SUBTITLE_FORMATS, SUBTITLE_TEXT_MODES
+from services.model_factory import ModelFactory
+from services.base_translation import BaseTranslationService
+
+
+MANIFEST_VERSION = 1
+
+# 매니페스트 상태
+STATUS_TRANSCRIBED = 'transcribed'
+STATUS_DONE = 'done'
+
+# 작업 프로세스 상태 (프로세스마다 모델을 한 번만 로드)
+_worker: Dict[str, Any] = {}
+
+
+def _init_worker(
+    profile: str,
+    stt_config: Dict[str, Any],
+    vad_config: Dict[str, Any],
+    segmenter_config: Dict[str, Any],
+    sample_rate: int
+):
+    """
+    작업 프로세스 초기화 (STT / VAD 모델 로드)
+
+    Args:
+        profile: 성능 프로필
+        stt_config: STT 설정 (cpu_threads는 프로세스당 스레드 수)
+        vad_config: VAD 설정
+        segmenter_config: 분할기 설정 (stt.segmenter)
+        sample_rate: 디코딩 샘플링 레이트
+    """
+    import implementations  # noqa: F401  (팩토리 등록)
+
+    stt = ModelFactory.create_stt_service(profile, stt_config)
+    if not stt.initialize():
+        raise RuntimeError("STT 서비스 초기화 실패")
+
+    vad = ModelFactory.create_vad_service(vad_config)
+    if not vad.initialize():
+        vad = ModelFactory.create_vad_service({**vad_config, 'backend': 'energy'})
+        vad.initialize()
+
+    _worker.update(
+        stt=stt,
+        vad=vad,
+        segmenter_config=segmenter_config,
+        threshold=vad_config.get('threshold', 0.5),
+        sample_rate=sample_rate
+    )
+
+
+def _cleanup_worker():
+    """작업 프로세스 모델 해제 (프로세스 내 실행 시)"""
+    for key in ('stt', 'vad'):
+        service = _worker.pop(key, None)
+        if service is not None:
+            service.cleanup()
+    _worker.clear()
+
+
+def transcribe_file(path: str) -> Dict[str, Any]:
+    """
+    파일 1개 음성 인식 (작업 프로세스)
+
+    Args:
+        path: 오디오/비디오 파일 경로
+
+    Returns:
+        Dict: {
+            'cues': [{'start', 'end', 'korean', 'stt_confidence'}, ...],
+            'duration': float  # 오디오 길이 (초)
+        }
+    """
+    stt = _worker['stt']
+    sample_rate = _worker['sample_rate']
+    seg_config = _worker['segmenter_config']
+
+    # 오프라인 처리는 지연 한도가 필요 없으므로 최대 길이에서만 강제 분할
+    max_duration = seg_config.get('max_duration', 8.0)
+    segmenter = SpeechSegmenter(
+        _worker['vad'],
+        min_duration=seg_config.get('min_duration', 0.3),
+        max_duration=max_duration,
+        max_latency=max_duration,
+        pause_ms=seg_config.get('pause_ms', 500),
+        pre_roll_ms=seg_config.get('pre_roll_ms', 200),
+        forced_overlap=seg_config.get('forced_overlap', 0.5),
+        threshold=_worker['threshold']
+    )
+    segmenter.reset()
+
+    audio = load_audio(path, sample_rate)
+    cues: List[Dict[str, Any]] = []
+
+    # 분할기 출력은 풀 프레임의 뷰이므로 다음 입력 전에 인식
+    block = sample_rate * 30
+    for i in range(0, len(audio), block):
+        segments = segmenter.process(audio[i:i + block])
+        for offset, segment in zip(segmenter.segment_offsets, segments):
+            cues.extend(_transcribe_segment(stt, segment, offset, sample_rate))
+
+    segments = segmenter.flush()
+    for offset, segment in zip(segmenter.segment_offsets, segments):
+        cues.extend(_transcribe_segment(stt, segment, offset, sample_rate))
+
+    return {'cues': cues, 'duration': len(audio) / sample_rate}
+
+
+def _transcribe_segment(stt, segment, offset: float, sample_rate: int) -> List[Dict[str, Any]]:
+    """발화 구간 1개 인식 후 파일 기준 시각의 큐로 변환"""
+    results = [r for r in stt.transcribe_stream(segment, sample_rate) if r['text'] and r['text'].strip()]
+    segment_end = offset + len(segment) / sample_rate
+
+    cues = []
+    for i, result in enumerate(results):
+        start = offset + result.get('timestamp', 0.0)
+        if result.get('words'):
+            end = offset + result['words'][-1]['end']
+        elif i + 1 < len(results):
+            end = offset + results[i + 1].get('timestamp', 0.0)
+        else:
+            end = segment_end
+        cues.append({
+            'start': round(start, 3),
+            'end': round(max(end, start + 0.2), 3),
+            'korean': result['text'].strip(),
+            'stt_confidence': result['confidence']
+        })
+    return cues
+
+
+class BatchTranscriber:
+    """오프라인 일괄 자막 생성기"""
+
+    def __init__(
+        self,
+        config_mgr: ConfigManager,
+        output_dir: str = "subtitles",
+        workers: Optional[int] = None,
+        formats: Optional[Iterable[str]] = None,
+        text_mode: Optional[str] = None,
+        use_processes: bool = True
+    ):
+        """
+        Args:
+            config_mgr: 설정 관리자
+            output_dir: 자막 / 매니페스트 저장 디렉토리
+            workers: STT 프로세스 수 (None이면 batch.workers, 0이면 코어 수 기준 자동)
+            formats: 저장 형식 (None이면 batch.formats)
+            text_mode: SRT / WebVTT 자막 줄 구성 (None이면 batch.subtitle_text)
+            use_processes: False면 메인 프로세스에서 순차 인식 (디버깅/테스트용)
+        """
+        batch_config = config_mgr.get('batch', {})
+
+        self.config_mgr = config_mgr
+        self.output_dir = Path(output_dir)
+        self.threads_per_worker = batch_config.get('threads_per_worker', 4)
+        self.translation_batch_size = batch_config.get('translation_batch_size', 16)
+        self.formats = tuple(formats or batch_config.get('formats', SUBTITLE_FORMATS))
+        self.text_mode = text_mode or batch_config.get('subtitle_text', 'both')
+        self.use_processes = use_processes
+
+        workers = batch_config.get('workers', 0) if workers is None else workers
+        if workers <= 0:
+            workers = max(1, (os.cpu_count() or 4) // self.threads_per_worker)
+        self.workers = workers
+
+        for fmt in self.formats:
+            if fmt not in SUBTITLE_FORMATS:
+                raise ValueError(f"Unknown subtitle format: {fmt}")
+        if self.text_mode not in SUBTITLE_TEXT_MODES:
+            raise ValueError(f"Unknown subtitle text mode: {self.text_mode}")
+
+        self.translation_service: Optional[BaseTranslationService] = None
+
+    def initialize(self) -> bool:
+        """
+        번역 서비스 초기화 (STT 모델은 작업 프로세스에서 로드)
+
+        Returns:
+            bool: 초기화 성공 여부
+        """
+        import implementations  # noqa: F401  (팩토리 등록)
+
+        trans_config = self.config_mgr.get_translation_config()
+        self.translation_service = ModelFactory.create_translation_service(trans_config)
+
+        print(f"⏳ 번역 모델 로드 중... ({trans_config.get('backend', 'opus_mt')})")
+        if self.translation_service.initialize():
+            return True
+
+        if trans_config.get('backend', 'opus_mt') == 'opus_mt':
+            print("❌ 번역 서비스 초기화 실패")
+            return False
+
+        print("⚠️  번역 백엔드 초기화 실패, opus_mt 백엔드 사용")
+        self.translation_service = ModelFactory.create_translation_service(
+            {**trans_config, 'backend': 'opus_mt'}
+        )
+        if not self.translation_service.initialize():
+            print("❌ 번역 서비스 초기화 실패")
+            return False
+        return True
+
+    @staticmethod
+    def find_inputs(paths: Iterable[str]) -> List[Path]:
+        """
+        입력 경로 확장 (디렉토리는 하위 미디어 파일 전체)
+
+        Args:
+            paths: 파일 또는 디렉토리 경로
+
+        Returns:
+            List[Path]: 미디어 파일 목록 (중복 제거, 정렬)
+        """
+        files = set()
+        for path in map(Path, paths):
+            if path.is_dir():
+                files.update(
+                    p for p in path.rglob('*')
+                    if p.is_file() and p.suffix.lower() in MEDIA_EXTENSIONS
+                )
+            elif path.is_file():
+                files.add(path)
+            else:
+                print(f"⚠️  입력 파일을 찾을 수 없습니다: {path}")
+        return sorted(files)
+
+    def _worker_args(self) -> tuple:
+        """작업 프로세스 초기화 인자"""
+        profile = self.config_mgr.get_current_profile()
+        stt_config = {
+            **self.config_mgr.get_stt_config(profile),
+            'cpu_threads': self.threads_per_worker
+        }
+        return (
+            profile,
+            stt_config,
+            self.config_mgr.get_vad_config(),
+            self.config_mgr.get('stt.segmenter', {}),
+            self.config_mgr.get('stt.audio.sample_rate', 16000)
+        )
+
+    def run(self, paths: Iterable[str]) -> Dict[str, Any]:
+        """
+        일괄 처리 실행
+
+        Args:
+            paths: 입력 파일 또는 디렉토리 경로
+
+        Returns:
+            Dict: {files, skipped, resumed, completed, failed, cues, audio_seconds, elapsed}
+        """
+        started = time.perf_counter()
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+
+        files = self.find_inputs(paths)
+        summary = {
+            'files': len(files), 'skipped': 0, 'resumed': 0, 'completed': 0,
+            'failed': 0, 'cues': 0, 'audio_seconds': 0.0, 'elapsed': 0.0
+        }
+
+        pending = []
+        for path in files:
+            manifest = self._load_manifest(path)
+            if manifest is None:
+                pending.append(path)
+            elif manifest['status'] == STATUS_DONE and all(Path(p).exists() for p in manifest['outputs']):
+                summary['skipped'] += 1
+            else:
+                # 인식이 끝난 파일은 번역/저장만 다시 수행
+                summary['resumed'] += 1
+                self._finish(path, manifest, summary)
+
+        if pending:
+            print(f"⏳ {len(pending)}개 파일 음성 인식 중... (프로세스 {self.workers}개)")
+            if self.use_processes:
+                self._run_pool(pending, summary)
+            else:
+                self._run_inline(pending, summary)
+
+        summary['elapsed'] = time.perf_counter() - started
+        print(
+            f"✅ 일괄 처리 완료: 완료 {summary['completed']}, 이어서 처리 {summary['resumed']}, "
+            f"건너뜀 {summary['skipped']}, 실패 {summary['failed']} ({summary['elapsed']:.1f}초)"
+        )
+        return summary
+
+    def _run_pool(self, pending: List[Path], summary: Dict[str, Any]):
+        """프로세스 풀에서 인식 (끝난 파일부터 메인 프로세스에서 번역/저장)"""
+        # 번역 런타임 스레드가 있는 상태에서 fork하지 않도록 spawn 사용
+        context = multiprocessing.get_context('spawn')
+        with ProcessPoolExecutor(
+            max_workers=min(self.workers, len(pending)),
+            mp_context=context,
+            initializer=_init_worker,
+            initargs=self._worker_args()
+        ) as executor:
+            futures = {executor.submit(transcribe_file, str(path)): path for path in pending}
+            for future in as_completed(futures):
+                path = futures[future]
+                try:
+                    result = future.result()
+                except Exception as e:
+                    print(f"❌ 음성 인식 실패: {path.name}: {e}")
+                    summary['failed'] += 1
+                    continue
+                self._on_transcribed(path, result, summary)
+
+    def _run_inline(self, pending: List[Path], summary: Dict[str, Any]):
+        """메인 프로세스에서 순차 인식"""
+        _init_worker(*self._worker_args())
+        try:
+            for path in pending:
+                try:
+                    result = transcribe_file(str(path))
+                except Exception as e:
+                    print(f"❌ 음성 인식 실패: {path.name}: {e}")
+                    summary['failed'] += 1
+                    continue
+                self._on_transcribed(path, result, summary)
+        finally:
+            _cleanup_worker()
+
+    def _on_transcribed(self, path: Path, result: Dict[str, Any], summary: Dict[str, Any]):
+        """인식 결과를 매니페스트에 기록한 뒤 번역/저장"""
+        manifest = {
+            'version': MANIFEST_VERSION,
+            'source': self._fingerprint(path),
+            'status': STATUS_TRANSCRIBED,
+            'duration': result['duration'],
+            'cues': result['cues'],
+            'outputs': []
+        }
+        self._save_manifest(path, manifest)
+        summary['completed'] += 1
+        self._finish(path, manifest, summary)
+
+    def _finish(self, path: Path, manifest: Dict[str, Any], summary: Dict[str, Any]):
+        """번역 (필요 시) 후 자막 파일 저장, 매니페스트 완료 처리"""
+        cues = manifest['cues']
+        if manifest['status'] != STATUS_DONE:
+            self._translate(cues)
+
+        manifest['outputs'] = write_subtitles(cues, self._output_base(path), self.formats, self.text_mode)
+        manifest['status'] = STATUS_DONE
+        self._save_manifest(path, manifest)
+
+        summary['cues'] += len(cues)
+        summary['audio_seconds'] += manifest.get('duration', 0.0)
+        print(f"✅ {path.name}: 자막 {len(cues)}개")
+
+    def _translate(self, cues: List[Dict[str, Any]]):
+        """큐 번역 (translation_batch_size개씩 translate_batch)"""
+        for i in range(0, len(cues), self.translation_batch_size):
+            batch = cues[i:i + self.translation_batch_size]
+            results = self.translation_service.translate_batch([cue['korean'] for cue in batch])
+            for cue, result in zip(batch, results):
+                cue['english'] = result['translated_text']
+                cue['trans_confidence'] = result['confidence']
+
+    def _output_base(self, path: Path) -> Path:
+        """확장자를 뺀 출력 경로"""
+        return self.output_dir / path.stem
+
+    def _manifest_path(self, path: Path) -> Path:
+        """파일별 매니페스트 경로"""
+        return self.output_dir / f"{path.stem}.manifest.json"
+
+    @staticmethod
+    def _fingerprint(path: Path) -> Dict[str, Any]:
+        """원본 파일 식별 정보 (바뀌면 처음부터 다시 처리)"""
+        stat = path.stat()
+        return {'path': str(path.resolve()), 'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns}
+
+    def _load_manifest(self, path: Path) -> Optional[Dict[str, Any]]:
+        """
+        이어서 처리할 수 있는 매니페스트 읽기
+
+        Returns:
+            Optional[Dict]: 버전과 원본 파일이 일치하면 매니페스트, 아니면 None
+        """
+        manifest_path = self._manifest_path(path)
+        if not manifest_path.exists():
+            return None
+        try:
+            with open(manifest_path, 'r', encoding='utf-8') as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if manifest.get('version') != MANIFEST_VERSION or manifest.get('source') != self._fingerprint(path):
+            return None
+        return manifest
+
+    def _save_manifest(self, path: Path, manifest: Dict[str, Any]):
+        """매니페스트 저장"""
+        write_atomic(self._manifest_path(path), json.dumps(manifest, ensure_ascii=False, indent=2))
+
+    def cleanup(self):
+        """리소스 정리"""
+        if self.translation_service:
+            self.translation_service.cleanup()
+            self.translation_service = None
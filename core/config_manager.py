@@ -47,6 +47,9 @@ class ConfigManager:
     
     _instance = None
     
+    # 성능 프로필 (stt.whisper.<profile>)
+    PROFILES = ('lightweight', 'standard')
+    
     def __new__(cls, config_path: Optional[str] = None):
         if cls._instance is None:
             cls._instance = super().__new__(cls)
@@ -192,18 +195,55 @@ class ConfigManager:
         audio_config = self.get('stt.audio', {})
         
         return {
+            'cpu_threads': self.get_thread_budget()['stt'],
             **stt_config,
+            'backend': self.get('stt.backend', 'whisper'),
+            'mock': self.get('stt.mock', {}),
             'audio': audio_config
         }
     
+    def get_vad_config(self) -> Dict[str, Any]:
+        """
+        VAD 게이트 설정 가져오기
+        
+        Returns:
+            Dict: VAD 설정 (오디오 샘플링 레이트 포함)
+        """
+        vad_config = self.get('stt.vad', {})
+        sample_rate = self.get('stt.audio.sample_rate', 16000)
+        
+        return {
+            'sample_rate': sample_rate,
+            **vad_config
+        }
+    
     def get_translation_config(self) -> Dict[str, Any]:
         """
         번역 설정 가져오기
         
         Returns:
-            Dict: 번역 설정
+            Dict: 번역 설정 (CPU 스레드 예산 포함)
+        """
+        return {
+            'cpu_threads': self.get_thread_budget()['translation'],
+            **self.get('translation', {})
+        }
+    
+    def get_thread_budget(self) -> Dict[str, int]:
+        """
+        Whisper와 번역이 나눠 쓰는 CPU 스레드 예산
+        
+        전체 예산(performance.cpu_threads)에서 번역 몫(performance.translation_threads)을
+        떼어 주고 나머지를 Whisper에 할당해 두 단계가 코어를 두고 경합하지 않게 합니다.
+        번역 몫은 CTranslate2 백엔드만 스레드 수로 적용하지만, 다른 백엔드(PyTorch 등)도
+        같은 코어를 쓰므로 Whisper 몫은 백엔드와 관계없이 나눕니다.
+        
+        Returns:
+            Dict: {'stt': Whisper 스레드 수, 'translation': 번역 스레드 수}
         """
-        return self.get('translation', {})
+        total = self.get('performance.cpu_threads', 0) or os.cpu_count() or 4
+        translation = min(self.get('performance.translation_threads', 2), max(1, total - 1))
+        return {'stt': max(1, total - translation), 'translation': translation}
     
     def get_gui_config(self) -> Dict[str, Any]:
         """
@@ -230,7 +270,7 @@ class ConfigManager:
         Args:
             profile: 프로필 이름 ('lightweight' 또는 'standard')
         """
-        if profile not in ['lightweight', 'standard']:
+        if profile not in self.PROFILES:
             raise ValueError(f"Invalid profile: {profile}")
         
         self.set('performance.profile', profile)
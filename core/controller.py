@@ -5,11 +5,19 @@ Caption Controller
 
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, Callable, Dict, Any
 import numpy as np
 
 from core.config_manager import ConfigManager
-from core.audio_capture import AudioCapture
+from core.audio_capture import AudioCapture, GAP
+from core.vad_gate import VoiceActivityGate
+from core.segmenter import SpeechSegmenter, CUT_MAX_DURATION
+from core.streaming_stt import LocalAgreementSession
+from core.transcript_merger import TranscriptMerger
+from core.pipeline import PipelineStage
+from core.translation_batcher import BatchingTranslator
+from core.latency_tracer import LatencyTracer
 from services.model_factory import ModelFactory
 from services.base_stt import BaseSTTService
 from services.base_translation import BaseTranslationService
@@ -18,85 +26,477 @@ from services.base_translation import BaseTranslationService
 class CaptionController:
     """실시간 자막 생성 컨트롤러"""
     
-    def __init__(self, config_path: str = "config.yaml"):
+    def __init__(
+        self,
+        config_path: str = "config.yaml",
+        audio_factory: Optional[Callable[..., AudioCapture]] = None
+    ):
         """
         Args:
             config_path: 설정 파일 경로
+            audio_factory: 오디오 입력 생성 함수 (AudioCapture 생성자 인자를 받음,
+                None이면 마이크 입력 AudioCapture)
         """
         # 설정 로드
         self.config_mgr = ConfigManager()
         self.config_mgr.load_config(config_path)
         
+        self.audio_factory = audio_factory or AudioCapture
+        
         # 컴포넌트
         self.audio_capture: Optional[AudioCapture] = None
         self.stt_service: Optional[BaseSTTService] = None
         self.translation_service: Optional[BaseTranslationService] = None
         
-        # 상태
+        # 스트리밍 STT 세션 (stt.audio.chunking: streaming)
+        self.streaming_session: Optional[LocalAgreementSession] = None
+        
+        # 오버랩 청크 중복 제거 (stt.merge.enabled)
+        self.transcript_merger: Optional[TranscriptMerger] = None
+        
+        # 파이프라인 단계 (STT 스레드 → 번역 → 출력)
+        self.translate_stage: Optional[PipelineStage] = None
+        self.emit_stage: Optional[PipelineStage] = None
+        
+        # 번역 마이크로 배칭 (translation.batching.enabled)
+        self.translation_batcher: Optional[BatchingTranslator] = None
+        
+        # 자막 단위 지연 추적 (tracing.enabled)
+        self.tracer: Optional[LatencyTracer] = None
+        
+        # 구성 요소별 초기화 시간 (초) / 예열 결과 (performance.warmup)
+        self.load_times: Dict[str, float] = {}
+        self.warmup_stats: Dict[str, Dict[str, Any]] = {}
+        self.init_thread: Optional[threading.Thread] = None
+        
+        # STT 서비스 교체 (set_profile): STT 스레드는 청크 단위로 잠금을 잡고,
+        # 교체 스레드는 참조를 바꿀 때만 잡으므로 교체는 항상 청크 사이에 일어남
+        self._stt_lock = threading.Lock()
+        self.swap_thread: Optional[threading.Thread] = None
+        
+        # 상태 (is_initialized: initialize()가 끝까지 성공했을 때만 True)
+        self.is_initialized = False
         self.is_running = False
         self.process_thread: Optional[threading.Thread] = None
         
         # 콜백
         self.caption_callback: Optional[Callable[[Dict[str, Any]], None]] = None
         
-    def initialize(self) -> bool:
+    def initialize(
+        self,
+        progress_callback: Optional[Callable[[str, str, float], None]] = None
+    ) -> bool:
         """
-        컨트롤러 초기화
+        컨트롤러 초기화 (STT / 번역 모델은 동시에 로드)
         
+        Args:
+            progress_callback: 진행 이벤트 콜백 (구성 요소, 상태, 경과 초)
+                - 구성 요소: 'audio', 'stt', 'translation'
+                - 상태: 'loading', 'ready', 'failed'
+                - 로드 스레드에서 호출됨
+            
         Returns:
             bool: 초기화 성공 여부
         """
         try:
             print("=== 컨트롤러 초기화 시작 ===")
+            self.is_initialized = False
+            self.load_times = {}
+            self.warmup_stats = {}
             
             # 오디오 캡처 초기화
             audio_config = self.config_mgr.get('stt.audio', {})
-            self.audio_capture = AudioCapture(
+            chunk_duration = audio_config.get('chunk_duration', 3.0)
+            overlap_ratio = audio_config.get('overlap_ratio', 0.5)
+            
+            # 스트리밍 모드: 짧은 무오버랩 청크를 세션 버퍼에 이어 붙임
+            if audio_config.get('chunking') == 'streaming':
+                chunk_duration = self.config_mgr.get('stt.streaming.min_step', 0.3)
+                overlap_ratio = 0.0
+            
+            self.audio_capture = self.audio_factory(
                 sample_rate=audio_config.get('sample_rate', 16000),
-                chunk_duration=audio_config.get('chunk_duration', 3.0),
-                buffer_size=audio_config.get('buffer_size', 1024)
+                chunk_duration=chunk_duration,
+                buffer_size=audio_config.get('buffer_size', 1024),
+                overlap_ratio=overlap_ratio,
+                capture_mode=audio_config.get('capture_mode', 'blocking'),
+                queue_size=audio_config.get('queue_size', 0),
+                overflow_policy=audio_config.get('overflow_policy', 'drop_oldest')
             )
             
-            if not self.audio_capture.initialize():
+            if not self._timed_load('audio', self.audio_capture.initialize, progress_callback):
                 print("❌ 오디오 캡처 초기화 실패")
                 return False
             
             print("✅ 오디오 캡처 초기화 완료")
             
-            # STT 서비스 초기화
-            profile = self.config_mgr.get_current_profile()
-            stt_config = self.config_mgr.get_stt_config(profile)
-            
-            # 구현체 import (팩토리 등록)
+            # 구현체 import (팩토리 등록, 로드 스레드 시작 전에 완료)
             import implementations
             
-            self.stt_service = ModelFactory.create_stt_service(profile, stt_config)
+            # STT / 번역 모델 동시 로드 (디스크 I/O와 역직렬화가 서로 겹침)
+            with ThreadPoolExecutor(max_workers=2, thread_name_prefix='model-load') as executor:
+                stt_future = executor.submit(
+                    self._load_and_warmup, 'stt', self._load_stt,
+                    lambda: self._warmup_stt(self.stt_service), progress_callback
+                )
+                translation_future = executor.submit(
+                    self._load_and_warmup, 'translation', self._load_translation,
+                    self._warmup_translation, progress_callback
+                )
+                stt_ok = stt_future.result()
+                translation_ok = translation_future.result()
             
-            print(f"⏳ STT 모델 로드 중... (프로필: {profile})")
-            if not self.stt_service.initialize():
+            # 초기화에 실패한 서비스는 사용하지 않음 (생성 후 initialize()에서 실패해도 참조가 남음)
+            if not stt_ok:
+                self.stt_service = None
+            if not translation_ok:
+                self.translation_service = None
+            
+            if not stt_ok:
                 print("❌ STT 서비스 초기화 실패")
                 return False
+            if not translation_ok:
+                print("❌ 번역 서비스 초기화 실패")
+                return False
             
-            print("✅ STT 서비스 초기화 완료")
+            loaded = ", ".join(f"{name} {seconds:.1f}초" for name, seconds in self.load_times.items())
+            print(f"✅ 모델 로드 완료 ({loaded})")
             
-            # 번역 서비스 초기화
-            trans_config = self.config_mgr.get_translation_config()
-            self.translation_service = ModelFactory.create_translation_service(trans_config)
+            # VAD 초기화 (무음 게이트 또는 가변 길이 분할기)
+            self._setup_vad()
             
-            print("⏳ 번역 모델 로드 중...")
-            if not self.translation_service.initialize():
-                print("❌ 번역 서비스 초기화 실패")
-                return False
+            # 오버랩 중복 제거 초기화
+            self._setup_merger()
+            
+            # 번역/출력 단계 구성
+            self._setup_pipeline()
+            
+            # 지연 추적 연결
+            tracing_config = self.config_mgr.get('tracing', {})
+            if tracing_config.get('enabled', False):
+                self.tracer = LatencyTracer(window=tracing_config.get('window', 1000))
+                self.audio_capture.tracer = self.tracer
             
-            print("✅ 번역 서비스 초기화 완료")
             print("=== 컨트롤러 초기화 완료 ===\n")
             
+            self.is_initialized = True
             return True
             
         except Exception as e:
             print(f"❌ 컨트롤러 초기화 실패: {e}")
             return False
     
+    def initialize_async(
+        self,
+        progress_callback: Optional[Callable[[str, str, float], None]] = None,
+        done_callback: Optional[Callable[[bool], None]] = None
+    ) -> threading.Thread:
+        """
+        백그라운드 스레드에서 초기화 (GUI가 모델 로드를 기다리지 않도록)
+        
+        Args:
+            progress_callback: 진행 이벤트 콜백 (initialize() 참고)
+            done_callback: 완료 콜백 (초기화 성공 여부, 로드 스레드에서 호출됨)
+            
+        Returns:
+            threading.Thread: 초기화 스레드
+        """
+        def run():
+            success = self.initialize(progress_callback)
+            if done_callback:
+                done_callback(success)
+        
+        self.init_thread = threading.Thread(target=run, name="controller-init", daemon=True)
+        self.init_thread.start()
+        return self.init_thread
+    
+    def _timed_load(
+        self,
+        component: str,
+        load: Callable[[], bool],
+        progress_callback: Optional[Callable[[str, str, float], None]]
+    ) -> bool:
+        """
+        구성 요소 초기화 시간 측정 및 진행 이벤트 전달
+        
+        Args:
+            component: 구성 요소 이름
+            load: 초기화 함수 (성공 여부 반환)
+            progress_callback: 진행 이벤트 콜백
+            
+        Returns:
+            bool: 초기화 성공 여부
+        """
+        def notify(status: str, elapsed: float):
+            if progress_callback:
+                try:
+                    progress_callback(component, status, elapsed)
+                except Exception as e:
+                    print(f"⚠️  진행 콜백 에러: {e}")
+        
+        notify('loading', 0.0)
+        started = time.perf_counter()
+        try:
+            success = load()
+        except Exception as e:
+            print(f"❌ {component} 초기화 에러: {e}")
+            success = False
+        elapsed = time.perf_counter() - started
+        
+        self.load_times[component] = elapsed
+        notify('ready' if success else 'failed', elapsed)
+        return success
+    
+    def _load_and_warmup(
+        self,
+        component: str,
+        load: Callable[[], bool],
+        warmup: Callable[[], None],
+        progress_callback: Optional[Callable[[str, str, float], None]]
+    ) -> bool:
+        """
+        구성 요소 로드 후 예열 (로드 스레드)
+        
+        예열은 로드 시간 측정이 끝난 뒤 실행하므로 load_times에는 모델 로드만 포함되고,
+        예열 결과는 warmup_stats에 따로 기록됩니다.
+        
+        Args:
+            component: 구성 요소 이름
+            load: 초기화 함수 (성공 여부 반환)
+            warmup: 예열 함수 (로드 성공 시에만 호출)
+            progress_callback: 진행 이벤트 콜백
+            
+        Returns:
+            bool: 초기화 성공 여부
+        """
+        success = self._timed_load(component, load, progress_callback)
+        if success:
+            warmup()
+        return success
+    
+    def _load_stt(self) -> bool:
+        """
+        STT 서비스 생성 및 모델 로드 (로드 스레드)
+        
+        Returns:
+            bool: 성공 여부
+        """
+        profile = self.config_mgr.get_current_profile()
+        stt_config = self._live_stt_config(profile)
+        
+        self.stt_service = ModelFactory.create_stt_service(profile, stt_config)
+        
+        print(f"⏳ STT 모델 로드 중... (프로필: {profile})")
+        if not self.stt_service.initialize():
+            return False
+        
+        print("✅ STT 서비스 초기화 완료")
+        return True
+    
+    def _uses_vad_gate(self) -> bool:
+        """
+        오디오 캡처 앞단에 VAD(무음 게이트 / 분할기)를 연결하는지 여부 (_setup_vad() 기준)
+        
+        Returns:
+            bool: 앞단 VAD 사용 여부
+        """
+        chunking = self.config_mgr.get('stt.audio.chunking', 'fixed')
+        if chunking == 'streaming':
+            return False
+        return chunking == 'adaptive' or self.config_mgr.get('stt.vad.enabled', False)
+    
+    def _live_stt_config(self, profile: str, overrides: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        실시간 자막용 STT 설정
+        
+        앞단 VAD가 무음 청크를 이미 걸러내므로 faster-whisper 내장 VAD(vad_filter)는
+        같은 오디오를 다시 검사할 뿐이라 끕니다.
+        
+        Args:
+            profile: 프로필 이름
+            overrides: 프로필 STT 설정 덮어쓰기
+            
+        Returns:
+            Dict: STT 설정
+        """
+        stt_config = {**self.config_mgr.get_stt_config(profile), **(overrides or {})}
+        if self._uses_vad_gate():
+            stt_config['vad_filter'] = False
+        return stt_config
+    
+    def _warmup_stt(self, stt_service: BaseSTTService):
+        """
+        STT 모델 예열 (performance.warmup.enabled)
+        
+        Args:
+            stt_service: 초기화된 STT 서비스
+        """
+        warmup_config = self.config_mgr.get('performance.warmup', {})
+        if warmup_config.get('enabled', False):
+            self._warmup('stt', lambda: stt_service.warmup(
+                runs=warmup_config.get('runs', 2),
+                seconds=warmup_config.get('audio_seconds', 2.0),
+                sample_rate=self.config_mgr.get('stt.audio.sample_rate', 16000)
+            ))
+    
+    def _load_translation(self) -> bool:
+        """
+        번역 서비스 생성 및 모델 로드 (로드 스레드)
+        
+        Returns:
+            bool: 성공 여부
+        """
+        trans_config = self.config_mgr.get_translation_config()
+        self.translation_service = ModelFactory.create_translation_service(trans_config)
+        
+        print(f"⏳ 번역 모델 로드 중... ({trans_config.get('backend', 'opus_mt')})")
+        if not self.translation_service.initialize():
+            # CTranslate2 변환/로드 실패 시 PyTorch Opus-MT로 대체
+            if trans_config.get('backend', 'opus_mt') == 'opus_mt':
+                return False
+            
+            print("⚠️  번역 백엔드 초기화 실패, opus_mt 백엔드 사용")
+            self.translation_service = ModelFactory.create_translation_service(
+                {**trans_config, 'backend': 'opus_mt'}
+            )
+            if not self.translation_service.initialize():
+                return False
+        
+        print("✅ 번역 서비스 초기화 완료")
+        return True
+    
+    def _warmup_translation(self):
+        """번역 모델 예열 (performance.warmup.enabled)"""
+        warmup_config = self.config_mgr.get('performance.warmup', {})
+        if warmup_config.get('enabled', False):
+            self._warmup('translation', lambda: self.translation_service.warmup(
+                runs=warmup_config.get('runs', 2)
+            ))
+    
+    def _warmup(self, component: str, warmup: Callable[[], Dict[str, Any]]):
+        """
+        모델 예열 후 첫 호출 / 이후 호출 지연 기록 (실패해도 초기화는 계속)
+        
+        Args:
+            component: 구성 요소 이름 ('stt', 'translation')
+            warmup: 예열 함수 (서비스의 warmup())
+        """
+        try:
+            stats = warmup()
+        except Exception as e:
+            print(f"⚠️  {component} 예열 실패: {e}")
+            return
+        
+        self.warmup_stats[component] = stats
+        steady = f", 이후 {stats['steady_ms']:.0f}ms" if stats['steady_ms'] is not None else ""
+        print(f"✅ {component} 예열 완료 (첫 호출 {stats['first_ms']:.0f}ms{steady})")
+    
+    def _setup_vad(self):
+        """
+        VAD 생성 후 오디오 캡처에 연결
+        
+        - chunking: fixed → 고정 길이 윈도우 앞단의 무음 게이트 (stt.vad.enabled)
+        - chunking: adaptive → 휴지 기반 가변 길이 분할기
+        - chunking: streaming → 사용 안 함 (스트리밍 세션이 버퍼를 직접 관리)
+        """
+        if not self._uses_vad_gate():
+            return
+        
+        vad_config = self.config_mgr.get_vad_config()
+        chunking = self.config_mgr.get('stt.audio.chunking', 'fixed')
+        
+        # 설정된 백엔드 초기화 실패 시 energy 백엔드로 대체
+        vad_service = ModelFactory.create_vad_service(vad_config)
+        if not vad_service.initialize():
+            print(f"⚠️  VAD 백엔드 '{vad_config.get('backend')}' 초기화 실패, energy 백엔드 사용")
+            vad_service = ModelFactory.create_vad_service({**vad_config, 'backend': 'energy'})
+            vad_service.initialize()
+        
+        if chunking == 'adaptive':
+            seg_config = self.config_mgr.get('stt.segmenter', {})
+            self.audio_capture.segmenter = SpeechSegmenter(
+                vad_service,
+                min_duration=seg_config.get('min_duration', 0.3),
+                max_duration=seg_config.get('max_duration', 8.0),
+                max_latency=seg_config.get('max_latency', 4.0),
+                pause_ms=seg_config.get('pause_ms', 500),
+                pre_roll_ms=seg_config.get('pre_roll_ms', 200),
+                forced_overlap=seg_config.get('forced_overlap', 0.5),
+                threshold=vad_config.get('threshold', 0.5)
+            )
+            print(f"✅ 가변 길이 분할기 초기화 완료 ({vad_service.__class__.__name__})")
+        else:
+            self.audio_capture.vad_gate = VoiceActivityGate(
+                vad_service,
+                overlap_size=self.audio_capture.overlap_size,
+                threshold=vad_config.get('threshold', 0.5),
+                hangover_ms=vad_config.get('hangover_ms', 300)
+            )
+            print(f"✅ VAD 게이트 초기화 완료 ({vad_service.__class__.__name__})")
+    
+    def _setup_pipeline(self):
+        """
+        번역 → 출력 파이프라인 단계 생성
+        
+        STT 스레드가 다음 청크를 디코딩하는 동안 번역 워커가 이전 결과를
+        번역합니다. 출력 단계는 순번 순서대로 콜백을 호출합니다.
+        """
+        pipeline_config = self.config_mgr.get('pipeline', {})
+        queue_size = pipeline_config.get('queue_size', 8)
+        workers = pipeline_config.get('translation_workers', 1)
+        
+        # 배칭 사용 시 배치 크기만큼 요청이 동시에 대기할 수 있도록 워커 수 확보
+        batch_config = self.config_mgr.get('translation.batching', {})
+        if batch_config.get('enabled', False):
+            self.translation_batcher = BatchingTranslator(
+                self.translation_service,
+                max_batch=batch_config.get('max_batch', 8),
+                max_wait_ms=batch_config.get('max_wait_ms', 100)
+            )
+            workers = max(workers, self.translation_batcher.max_batch)
+        
+        self.emit_stage = PipelineStage(
+            'emit',
+            self._emit_caption,
+            maxsize=queue_size,
+            ordered=True
+        )
+        self.translate_stage = PipelineStage(
+            'translate',
+            self._translate_result,
+            output=self.emit_stage,
+            workers=workers,
+            maxsize=queue_size
+        )
+    
+    def _setup_merger(self):
+        """
+        오버랩 청크 병합기 생성
+        
+        - chunking: fixed → 고정 오버랩 (단어 타임스탬프가 있으면 시간 기준으로 자름)
+        - chunking: adaptive → 강제 분할 시에만 오버랩이 생기므로 텍스트 비교만 사용
+          (휴지 / 지연 한도 분할 다음 청크는 비교하지 않음, _process_loop() 참고)
+        - chunking: streaming → 사용 안 함 (스트리밍 세션이 확정 구간을 관리)
+        """
+        merge_config = self.config_mgr.get('stt.merge', {})
+        chunking = self.config_mgr.get('stt.audio.chunking', 'fixed')
+        
+        if not merge_config.get('enabled', True) or chunking == 'streaming':
+            return
+        
+        if chunking == 'adaptive':
+            overlap_seconds = None
+        elif self.audio_capture.overlap_size > 0:
+            overlap_seconds = self.audio_capture.overlap_size / self.audio_capture.sample_rate
+        else:
+            return
+        
+        self.transcript_merger = TranscriptMerger(
+            overlap_seconds=overlap_seconds,
+            search_words=merge_config.get('search_words', 20),
+            min_match_words=merge_config.get('min_match_words', 2)
+        )
+    
     def start(
         self,
         caption_callback: Optional[Callable[[Dict[str, Any]], None]] = None,
@@ -116,11 +516,30 @@ class CaptionController:
             print("⚠️  이미 실행 중입니다")
             return False
         
-        if not self.audio_capture or not self.stt_service or not self.translation_service:
+        if not self.is_initialized:
             print("❌ 초기화되지 않았습니다. initialize()를 먼저 호출하세요")
             return False
         
         self.caption_callback = caption_callback
+        
+        # 스트리밍 세션 생성 (단어 타임스탬프를 지원하는 STT만 가능)
+        self.streaming_session = None
+        if self.config_mgr.get('stt.audio.chunking') == 'streaming':
+            if self.stt_service.supports_word_timestamps:
+                stream_config = self.config_mgr.get('stt.streaming', {})
+                self.streaming_session = LocalAgreementSession(
+                    self.stt_service,
+                    sample_rate=self.audio_capture.sample_rate,
+                    min_step=stream_config.get('min_step', 0.3),
+                    max_buffer=stream_config.get('max_buffer', 15.0),
+                    max_line_words=stream_config.get('max_line_words', 12)
+                )
+            else:
+                print("⚠️  STT 서비스가 단어 타임스탬프를 지원하지 않아 청크 단위로 처리합니다")
+        
+        if self.transcript_merger:
+            self.transcript_merger.reset()
+        
         self.is_running = True
         
         # 오디오 캡처 시작
@@ -128,7 +547,13 @@ class CaptionController:
             self.is_running = False
             return False
         
-        # 처리 스레드 시작
+        # 파이프라인 단계 시작 (뒤 단계부터)
+        if self.translation_batcher:
+            self.translation_batcher.start()
+        self.emit_stage.start()
+        self.translate_stage.start()
+        
+        # STT 스레드 시작
         self.process_thread = threading.Thread(
             target=self._process_loop,
             daemon=True
@@ -139,45 +564,153 @@ class CaptionController:
         return True
     
     def _process_loop(self):
-        """처리 루프 (별도 스레드)"""
+        """STT 루프 (별도 스레드): 오디오 → 텍스트 후 번역 단계로 전달"""
         print("🎤 오디오 스트림 처리 시작...")
         
-        for audio_chunk in self.audio_capture.get_audio_stream():
+        session = self.streaming_session
+        seq = 0
+        
+        # 청크를 건너뛰면 다음 청크는 앞 청크와 이어지지 않음
+        gap = False
+        
+        # 캡처 후 이 시간이 지난 청크는 건너뛰어 자막이 실시간에서 밀리지 않게 함
+        max_latency = self.config_mgr.get('stt.audio.max_caption_latency', 0)
+        
+        for audio_chunk, captured_at, trace, cut in self.audio_capture.get_traced_stream():
             if not self.is_running:
                 break
             
+            if max_latency and self.audio_capture.clock() - captured_at > max_latency:
+                self.audio_capture.count_stale_drop()
+                gap = True
+                continue
+            
+            if gap:
+                cut = GAP
+                gap = False
+            
             try:
-                # STT: 오디오 → 텍스트
-                for stt_result in self.stt_service.transcribe_stream(audio_chunk):
-                    korean_text = stt_result['text']
-                    
-                    if not korean_text or not korean_text.strip():
-                        continue
-                    
-                    print(f"🇰🇷 한국어: {korean_text}")
-                    
-                    # 번역: 한국어 → 영어
-                    trans_result = self.translation_service.translate(korean_text)
-                    english_text = trans_result['translated_text']
-                    
-                    print(f"🇺🇸 영어: {english_text}")
-                    
-                    # 자막 데이터 생성
-                    caption_data = {
-                        'korean': korean_text,
-                        'english': english_text,
-                        'timestamp': time.time(),
-                        'stt_confidence': stt_result['confidence'],
-                        'trans_confidence': trans_result['confidence']
-                    }
-                    
-                    # 콜백 호출
-                    if self.caption_callback:
-                        self.caption_callback(caption_data)
+                if trace:
+                    trace.mark('stt_start')
+                
+                # STT: 오디오 → 텍스트 (청크 처리 중에는 STT 서비스 교체 대기)
+                with self._stt_lock:
+                    if session:
+                        # 끊긴 오디오를 한 버퍼로 잇지 않도록 앞부분을 확정하고 새로 시작
+                        if cut == GAP:
+                            for stt_result in session.finish():
+                                if stt_result['text'].strip():
+                                    self.translate_stage.put(seq, stt_result)
+                                    seq += 1
+                        session.insert_audio(audio_chunk)
+                        stt_results = session.process_iter()
+                    else:
+                        stt_results = list(self.stt_service.transcribe_stream(audio_chunk))
+                
+                # 이전 청크와 겹치는 단어 제거 (새 텍스트만 번역)
+                # 분할기 청크는 최대 길이 강제 분할 다음에만 오디오가 겹침 (휴지 / 지연 한도 / flush는 비교 안 함)
+                # 앞 청크가 버려졌으면(GAP) 고정 길이 윈도우도 이어지지 않으므로 비교 안 함
+                if not session and self.transcript_merger:
+                    if cut is not None and cut != CUT_MAX_DURATION:
+                        self.transcript_merger.reset()
+                    stt_results = self.transcript_merger.merge_chunk(stt_results)
+                
+                if trace:
+                    trace.mark('stt_end')
+                
+                stt_results = [r for r in stt_results if r['text'] and r['text'].strip()]
+                for index, stt_result in enumerate(stt_results):
+                    # 같은 청크에서 나온 두 번째 자막부터는 추적 레코드 사본 사용
+                    # (번역 단계로 넘기기 전에 만들고, 마지막 자막 뒤에는 만들지 않음)
+                    if trace:
+                        stt_result['trace'] = trace
+                        if index + 1 < len(stt_results):
+                            trace = trace.fork()
+                    self.translate_stage.put(seq, stt_result)
+                    seq += 1
                     
             except Exception as e:
                 print(f"❌ 처리 에러: {e}")
                 continue
+        
+        # 스트리밍 세션: 남은 미확정 결과 확정
+        if session:
+            try:
+                with self._stt_lock:
+                    final_results = session.finish()
+                for stt_result in final_results:
+                    if stt_result['text'].strip():
+                        self.translate_stage.put(seq, stt_result)
+                        seq += 1
+            except Exception as e:
+                print(f"❌ 처리 에러: {e}")
+        
+        # 남은 번역/출력 처리 후 단계 종료
+        self.translate_stage.close()
+    
+    def _translate_result(self, stt_result: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        STT 결과 번역 (번역 단계 워커)
+        
+        부분 결과(is_final=False)는 번역 없이 진행 중인 줄 갱신용으로만 전달합니다.
+        
+        Args:
+            stt_result: STT 결과 (text, confidence, is_final, timestamp, 선택: trace)
+            
+        Returns:
+            Dict: 자막 데이터
+        """
+        korean_text = stt_result['text']
+        is_final = stt_result.get('is_final', True)
+        trace = stt_result.get('trace')
+        
+        if trace:
+            trace.mark('translate_start')
+        
+        if is_final:
+            print(f"🇰🇷 한국어: {korean_text}")
+            
+            # 번역: 한국어 → 영어 (배칭 사용 시 다른 워커의 요청과 묶어서 처리)
+            translator = self.translation_batcher or self.translation_service
+            trans_result = translator.translate(korean_text)
+            english_text = trans_result['translated_text']
+            trans_confidence = trans_result['confidence']
+            
+            print(f"🇺🇸 영어: {english_text}")
+        else:
+            english_text = ''
+            trans_confidence = 0.0
+        
+        # 자막 데이터 생성
+        caption_data = {
+            'korean': korean_text,
+            'english': english_text,
+            'timestamp': time.time(),
+            'stt_confidence': stt_result['confidence'],
+            'trans_confidence': trans_confidence,
+            'is_final': is_final
+        }
+        
+        # 화면 갱신 시각은 CaptionWindow.add_caption()에서 기록
+        if trace:
+            trace.mark('translate_end')
+            caption_data['trace'] = trace
+        
+        return caption_data
+    
+    def _emit_caption(self, caption_data: Dict[str, Any]):
+        """
+        자막 콜백 호출 (출력 단계, 순번 순서 보장)
+        
+        Args:
+            caption_data: 자막 데이터
+        """
+        trace = caption_data.get('trace')
+        if trace:
+            trace.mark('callback')
+        
+        if self.caption_callback:
+            self.caption_callback(caption_data)
     
     def stop(self):
         """자막 생성 중지"""
@@ -191,17 +724,33 @@ class CaptionController:
         if self.audio_capture:
             self.audio_capture.stop_recording()
         
-        # 처리 스레드 종료 대기
+        # STT 스레드 및 파이프라인 단계 종료 대기
         if self.process_thread:
             self.process_thread.join(timeout=3.0)
+        if self.translate_stage:
+            self.translate_stage.join(timeout=3.0)
+        if self.emit_stage:
+            self.emit_stage.join(timeout=1.0)
+        if self.translation_batcher:
+            self.translation_batcher.stop()
         
         print("✅ 자막 생성 중지 완료")
     
     def cleanup(self):
         """리소스 정리"""
+        # 백그라운드 초기화 / 모델 교체 중이면 로드가 끝난 뒤 정리
+        for thread in (self.init_thread, self.swap_thread):
+            if thread and thread.is_alive():
+                print("⏳ 모델 로드 완료 대기 중...")
+                thread.join()
+        
         self.stop()
         
         if self.audio_capture:
+            if self.audio_capture.vad_gate:
+                self.audio_capture.vad_gate.vad.cleanup()
+            if self.audio_capture.segmenter:
+                self.audio_capture.segmenter.vad.cleanup()
             self.audio_capture.cleanup()
         
         if self.stt_service:
@@ -210,6 +759,7 @@ class CaptionController:
         if self.translation_service:
             self.translation_service.cleanup()
         
+        self.is_initialized = False
         print("✅ 리소스 정리 완료")
     
     def list_audio_devices(self) -> list:
@@ -237,27 +787,122 @@ class CaptionController:
         
         return self.audio_capture.get_audio_level()
     
-    def set_profile(self, profile: str) -> bool:
+    def export_trace(self, path: Optional[str] = None) -> Optional[str]:
         """
-        성능 프로필 변경 (재초기화 필요)
+        최근 자막 추적 레코드를 Chrome trace-event JSON으로 저장
         
         Args:
-            profile: 프로필 이름 (light, standard)
+            path: 저장 경로 (None이면 tracing.export_path)
             
         Returns:
-            bool: 변경 성공 여부
+            Optional[str]: 저장 경로 (추적 비활성이면 None)
         """
-        if self.is_running:
-            print("⚠️  실행 중에는 프로필을 변경할 수 없습니다")
+        if not self.tracer:
+            print("⚠️  지연 추적이 비활성화되어 있습니다 (tracing.enabled)")
+            return None
+        
+        path = path or self.config_mgr.get('tracing.export_path', 'logs/caption_trace.json')
+        count = self.tracer.export_chrome_trace(path)
+        print(f"✅ 지연 추적 저장: {path} ({count}개 이벤트)")
+        return path
+    
+    def set_profile(
+        self,
+        profile: str,
+        overrides: Optional[Dict[str, Any]] = None,
+        done_callback: Optional[Callable[[bool], None]] = None
+    ) -> bool:
+        """
+        성능 프로필 변경
+        
+        모델이 로드되어 있으면 새 STT 서비스를 백그라운드에서 로드(및 예열)하는
+        동안 기존 서비스가 계속 자막을 만들고, 로드가 끝나면 청크 사이에서
+        참조를 교체한 뒤 기존 모델을 해제합니다. 실행 중에도 자막이 끊기지 않습니다.
+        
+        Args:
+            profile: 프로필 이름 (lightweight, standard)
+            overrides: 프로필 STT 설정 덮어쓰기 (예: {'model_size': 'medium', 'compute_type': 'int8'})
+            done_callback: 교체 완료 콜백 (성공 여부, 교체 스레드에서 호출됨).
+                모델을 로드하지 않는 경우(초기화 전)에는 호출되지 않음
+            
+        Returns:
+            bool: 변경 요청 수락 여부 (모델 교체는 백그라운드에서 진행)
+        """
+        if self.init_thread and self.init_thread.is_alive():
+            print("⚠️  모델 로드 중에는 프로필을 변경할 수 없습니다")
             return False
         
-        try:
-            self.config_mgr.set_profile(profile)
+        if self.swap_thread and self.swap_thread.is_alive():
+            print("⚠️  이미 STT 모델을 교체하는 중입니다")
+            return False
+        
+        if profile not in ConfigManager.PROFILES:
+            print(f"❌ 프로필 변경 실패: 알 수 없는 프로필 {profile}")
+            return False
+        
+        # 초기화 전 (또는 실패 후): 다음 initialize()가 새 프로필로 로드
+        if not self.is_initialized:
+            self._apply_profile(profile, overrides)
             print(f"✅ 프로필 변경: {profile}")
             return True
+        
+        def run():
+            success = self._swap_stt(profile, overrides or {})
+            if done_callback:
+                done_callback(success)
+        
+        self.swap_thread = threading.Thread(target=run, name="stt-swap", daemon=True)
+        self.swap_thread.start()
+        return True
+    
+    def _apply_profile(self, profile: str, overrides: Optional[Dict[str, Any]]):
+        """설정에 프로필 및 STT 설정 덮어쓰기 반영"""
+        self.config_mgr.set_profile(profile)
+        for key, value in (overrides or {}).items():
+            self.config_mgr.set(f'stt.whisper.{profile}.{key}', value)
+    
+    def _swap_stt(self, profile: str, overrides: Dict[str, Any]) -> bool:
+        """
+        새 STT 서비스 로드 후 기존 서비스와 교체 (교체 스레드)
+        
+        Args:
+            profile: 프로필 이름
+            overrides: 프로필 STT 설정 덮어쓰기
+            
+        Returns:
+            bool: 교체 성공 여부 (실패하면 기존 서비스와 설정 유지)
+        """
+        print(f"⏳ STT 모델 교체 중... (프로필: {profile})")
+        started = time.perf_counter()
+        
+        try:
+            stt_config = self._live_stt_config(profile, overrides)
+            stt_service = ModelFactory.create_stt_service(profile, stt_config)
+            if not stt_service.initialize():
+                print("❌ STT 모델 교체 실패: 새 모델을 로드하지 못했습니다")
+                return False
         except Exception as e:
-            print(f"❌ 프로필 변경 실패: {e}")
+            print(f"❌ STT 모델 교체 실패: {e}")
             return False
+        
+        # 스트리밍 세션은 버퍼를 유지한 채 STT 서비스만 바꿈
+        if self.streaming_session and not stt_service.supports_word_timestamps:
+            print("❌ STT 모델 교체 실패: 스트리밍 모드에는 단어 타임스탬프가 필요합니다")
+            stt_service.cleanup()
+            return False
+        
+        self._warmup_stt(stt_service)
+        
+        with self._stt_lock:
+            previous, self.stt_service = self.stt_service, stt_service
+            if self.streaming_session:
+                self.streaming_session.stt_service = stt_service
+        
+        previous.cleanup()
+        self._apply_profile(profile, overrides)
+        self.load_times['stt'] = time.perf_counter() - started
+        print(f"✅ STT 모델 교체 완료 (프로필: {profile}, {self.load_times['stt']:.1f}초)")
+        return True
     
     def get_status(self) -> Dict[str, Any]:
         """
@@ -267,9 +912,21 @@ class CaptionController:
             Dict: 상태 정보
         """
         return {
+            'initialized': self.is_initialized,
             'is_running': self.is_running,
             'profile': self.config_mgr.get_current_profile(),
             'stt_initialized': self.stt_service is not None and self.stt_service.is_initialized,
+            'stt_swapping': self.swap_thread is not None and self.swap_thread.is_alive(),
             'translation_initialized': self.translation_service is not None and self.translation_service.is_initialized,
-            'audio_level': self.get_audio_level()
+            'load_times': dict(self.load_times),
+            'warmup': dict(self.warmup_stats),
+            'audio_level': self.get_audio_level(),
+            'capture': self.audio_capture.get_capture_stats() if self.audio_capture else {},
+            'merge': self.transcript_merger.get_stats() if self.transcript_merger else None,
+            'pipeline': {
+                stage.name: stage.get_stats()
+                for stage in (self.translate_stage, self.emit_stage) if stage
+            },
+            'translation_batching': self.translation_batcher.get_stats() if self.translation_batcher else None,
+            'latency': self.tracer.get_stats() if self.tracer else None
         }
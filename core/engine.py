@@ -0,0 +1,178 @@
+"""
+Caption Engine
+Qt 없이 실행하는 헤드리스 자막 엔진
+
+CaptionController를 감싸 자막을 JSON Lines로 stdout 또는 파일에 기록합니다.
+PyQt5를 import하지 않으므로 디스플레이가 없는 서버에서도 실행할 수 있습니다.
+"""
+
+import json
+import signal
+import sys
+import threading
+import time
+from typing import Optional, Callable, Dict, Any, List, TextIO
+
+from core.controller import CaptionController
+
+
+# JSON Lines로 내보내는 자막 필드
+RECORD_FIELDS = ('korean', 'english', 'timestamp', 'stt_confidence', 'trans_confidence', 'is_final')
+
+
+class CaptionEngine:
+    """헤드리스 자막 엔진 (CaptionController 래퍼)"""
+
+    def __init__(
+        self,
+        config_path: str = "config.yaml",
+        output: Optional[TextIO] = None,
+        include_partials: bool = False
+    ):
+        """
+        Args:
+            config_path: 설정 파일 경로
+            output: JSON Lines 출력 스트림 (None이면 기록하지 않음)
+            include_partials: 스트리밍 부분 결과(is_final=False)도 기록
+        """
+        self.controller = CaptionController(config_path)
+        self.output = output
+        self.include_partials = include_partials
+
+        self.listeners: List[Callable[[Dict[str, Any]], None]] = []
+        self.captions_written = 0
+
+        self._write_lock = threading.Lock()
+        self._stop_event = threading.Event()
+
+    @staticmethod
+    def to_record(caption_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        자막 데이터를 JSON 직렬화 가능한 레코드로 변환 (추적 레코드 등 내부 필드 제외)
+
+        Args:
+            caption_data: 컨트롤러 자막 데이터
+
+        Returns:
+            Dict: 자막 레코드
+        """
+        return {key: caption_data[key] for key in RECORD_FIELDS if key in caption_data}
+
+    def add_listener(self, callback: Callable[[Dict[str, Any]], None]):
+        """
+        자막 레코드 수신 콜백 등록
+
+        Args:
+            callback: 자막 레코드를 받는 함수 (출력 단계 스레드에서 호출)
+        """
+        self.listeners.append(callback)
+
+    def initialize(self) -> bool:
+        """
+        모델 로드 및 컨트롤러 초기화
+
+        Returns:
+            bool: 초기화 성공 여부
+        """
+        return self.controller.initialize()
+
+    def start(self, device_index: Optional[int] = None) -> bool:
+        """
+        자막 생성 시작
+
+        Args:
+            device_index: 오디오 디바이스 인덱스
+
+        Returns:
+            bool: 시작 성공 여부
+        """
+        self._stop_event.clear()
+        return self.controller.start(caption_callback=self._on_caption, device_index=device_index)
+
+    def stop(self):
+        """자막 생성 중지 (남은 자막은 기록 후 종료)"""
+        self._stop_event.set()
+        self.controller.stop()
+        if self.output:
+            self.output.flush()
+
+    def cleanup(self):
+        """리소스 정리"""
+        self.stop()
+        self.controller.cleanup()
+
+    def run(self, device_index: Optional[int] = None, duration: Optional[float] = None) -> int:
+        """
+        초기화 → 시작 → 중지 신호(Ctrl+C, SIGTERM) 또는 duration까지 실행 → 정리
+
+        Args:
+            device_index: 오디오 디바이스 인덱스
+            duration: 실행 시간 (초, None이면 중지 신호까지)
+
+        Returns:
+            int: 종료 코드 (0=정상)
+        """
+        if threading.current_thread() is threading.main_thread():
+            signal.signal(signal.SIGTERM, lambda signum, frame: self._stop_event.set())
+
+        try:
+            if not self.initialize():
+                print("❌ 헤드리스 엔진 초기화 실패")
+                return 1
+
+            if not self.start(device_index):
+                print("❌ 헤드리스 엔진 시작 실패")
+                return 1
+
+            deadline = time.monotonic() + duration if duration else None
+            while not self._stop_event.is_set():
+                timeout = 0.5 if deadline is None else min(0.5, deadline - time.monotonic())
+                if timeout <= 0:
+                    break
+                self._stop_event.wait(timeout)
+
+        except KeyboardInterrupt:
+            print("\n⏳ 중지 중...")
+
+        finally:
+            self.cleanup()
+            print(f"✅ 헤드리스 엔진 종료 (자막 {self.captions_written}개 기록)")
+
+        return 0
+
+    def _on_caption(self, caption_data: Dict[str, Any]):
+        """
+        자막 수신 콜백 (출력 단계 스레드)
+
+        Args:
+            caption_data: 컨트롤러 자막 데이터
+        """
+        if not caption_data.get('is_final', True) and not self.include_partials:
+            return
+
+        record = self.to_record(caption_data)
+
+        if self.output:
+            line = json.dumps(record, ensure_ascii=False)
+            with self._write_lock:
+                self.output.write(line + "\n")
+                self.output.flush()
+                self.captions_written += 1
+
+        for listener in self.listeners:
+            try:
+                listener(record)
+            except Exception as e:
+                print(f"❌ 자막 리스너 에러: {e}", file=sys.stderr)
+
+    def get_status(self) -> Dict[str, Any]:
+        """
+        엔진 상태 정보
+
+        Returns:
+            Dict: 컨트롤러 상태 + 기록한 자막 수
+        """
+        return {
+            **self.controller.get_status(),
+            'captions_written': self.captions_written
+        }
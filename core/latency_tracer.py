@@ -0,0 +1,208 @@
+"""
+Latency Tracer
+자막 단위 종단 간 지연 추적
+
+오디오 청크마다 추적 레코드(CaptionTrace)를 만들어 캡처 → 큐 → STT → 번역 →
+콜백 → 화면 갱신까지 단계별 monotonic 시각(time.perf_counter)을 기록합니다.
+구간별 지연은 p50/p95/p99로 집계되고, 최근 레코드는 Chrome trace-event JSON
+(chrome://tracing, Perfetto)으로 내보낼 수 있습니다.
+"""
+
+import itertools
+import json
+import threading
+import time
+from collections import deque
+from pathlib import Path
+from typing import Callable, Dict, Any, List, Optional
+
+import numpy as np
+
+
+# 구간 정의: (구간 이름, 시작 마크, 끝 마크)
+STAGES = (
+    ('capture', 'capture_start', 'capture_end'),
+    ('queue', 'enqueue', 'dequeue'),
+    ('stt', 'stt_start', 'stt_end'),
+    ('translate_wait', 'stt_end', 'translate_start'),
+    ('translate', 'translate_start', 'translate_end'),
+    ('emit', 'translate_end', 'callback'),
+    ('paint', 'callback', 'paint'),
+    # 마지막 샘플 도착 → 콜백 / 화면 갱신
+    ('total', 'capture_end', 'callback'),
+    ('total_paint', 'capture_end', 'paint'),
+)
+
+# Chrome trace 타임라인에 그릴 구간 (합계 구간 제외)
+TIMELINE_STAGES = STAGES[:7]
+
+
+class CaptionTrace:
+    """자막 1개의 단계별 시각 기록"""
+
+    __slots__ = ('tracer', 'id', 'marks')
+
+    def __init__(self, tracer: 'LatencyTracer', trace_id: int, marks: Optional[Dict[str, float]] = None):
+        self.tracer = tracer
+        self.id = trace_id
+        self.marks: Dict[str, float] = dict(marks) if marks else {}
+
+    def mark(self, name: str, timestamp: Optional[float] = None):
+        """
+        단계 시각 기록 (끝나는 구간이 있으면 바로 집계)
+
+        Args:
+            name: 마크 이름 (STAGES 참고)
+            timestamp: 추적기 시계 기준 시각 (None이면 현재)
+        """
+        if timestamp is None:
+            timestamp = self.tracer.clock()
+        self.marks[name] = timestamp
+        self.tracer._record(self, name, timestamp)
+
+    def fork(self) -> 'CaptionTrace':
+        """
+        같은 청크에서 나온 다음 자막용 사본 (이전 마크 유지, 재집계 안 함)
+
+        Returns:
+            CaptionTrace: 새 추적 레코드
+        """
+        return self.tracer._new(self.marks)
+
+
+class LatencyTracer:
+    """구간별 지연 히스토그램 및 최근 추적 레코드 보관"""
+
+    def __init__(self, window: int = 1000, clock: Callable[[], float] = time.perf_counter):
+        """
+        Args:
+            window: 구간별로 보관할 최근 측정값 수 (추적 레코드 보관 수도 동일)
+            clock: 시각 함수 (재생 하네스는 가상 시계 사용)
+        """
+        self.window = window
+        self.clock = clock
+
+        self._ids = itertools.count(1)
+        self._traces: deque = deque(maxlen=window)
+        self._durations: Dict[str, deque] = {stage: deque(maxlen=window) for stage, _, _ in STAGES}
+        self._lock = threading.Lock()
+
+        # 구간별 누적 측정 수 / 시간 (window와 무관)
+        self._totals: Dict[str, List[float]] = {stage: [0, 0.0] for stage, _, _ in STAGES}
+
+    def new_trace(self) -> CaptionTrace:
+        """
+        새 추적 레코드 생성
+
+        Returns:
+            CaptionTrace: 빈 추적 레코드
+        """
+        return self._new(None)
+
+    def _new(self, marks: Optional[Dict[str, float]]) -> CaptionTrace:
+        """추적 레코드 생성 후 보관"""
+        trace = CaptionTrace(self, next(self._ids), marks)
+        with self._lock:
+            self._traces.append(trace)
+        return trace
+
+    def _record(self, trace: CaptionTrace, name: str, timestamp: float):
+        """name으로 끝나는 구간의 지연 기록"""
+        for stage, start, end in STAGES:
+            if end == name and start in trace.marks:
+                duration = timestamp - trace.marks[start]
+                self._durations[stage].append(duration)
+                with self._lock:
+                    self._totals[stage][0] += 1
+                    self._totals[stage][1] += duration
+
+    def reset(self):
+        """측정값 및 추적 레코드 삭제"""
+        with self._lock:
+            self._traces.clear()
+            for durations in self._durations.values():
+                durations.clear()
+            for totals in self._totals.values():
+                totals[:] = [0, 0.0]
+
+    def get_stats(self) -> Dict[str, Dict[str, float]]:
+        """
+        구간별 지연 통계
+
+        Returns:
+            Dict: {구간: {count, p50_ms, p95_ms, p99_ms, max_ms}} (측정값 없는 구간 제외)
+        """
+        stats = {}
+        for stage, _, _ in STAGES:
+            values = np.fromiter(list(self._durations[stage]), dtype=np.float64) * 1000
+            if values.size == 0:
+                continue
+            p50, p95, p99 = np.percentile(values, (50, 95, 99))
+            stats[stage] = {
+                'count': int(values.size),
+                'p50_ms': round(float(p50), 2),
+                'p95_ms': round(float(p95), 2),
+                'p99_ms': round(float(p99), 2),
+                'max_ms': round(float(values.max()), 2)
+            }
+        return stats
+
+    def get_totals(self) -> Dict[str, Dict[str, float]]:
+        """
+        구간별 누적 측정 수와 시간 (RTF 계산용)
+
+        Returns:
+            Dict: {구간: {count, seconds}}
+        """
+        with self._lock:
+            return {
+                stage: {'count': int(count), 'seconds': seconds}
+                for stage, (count, seconds) in self._totals.items()
+            }
+
+    def to_chrome_trace(self) -> Dict[str, Any]:
+        """
+        최근 추적 레코드를 Chrome trace-event 형식으로 변환
+
+        자막마다 한 줄(tid)에 구간을 완료 이벤트('X')로 그립니다.
+
+        Returns:
+            Dict: {'traceEvents': [...], 'displayTimeUnit': 'ms'}
+        """
+        with self._lock:
+            traces = [(trace.id, dict(trace.marks)) for trace in self._traces]
+
+        events: List[Dict[str, Any]] = []
+        for trace_id, marks in traces:
+            for stage, start, end in TIMELINE_STAGES:
+                if start not in marks or end not in marks:
+                    continue
+                events.append({
+                    'name': stage,
+                    'cat': 'caption',
+                    'ph': 'X',
+                    'ts': marks[start] * 1e6,
+                    'dur': max(0.0, marks[end] - marks[start]) * 1e6,
+                    'pid': 1,
+                    'tid': trace_id,
+                    'args': {'trace_id': trace_id}
+                })
+
+        return {'traceEvents': events, 'displayTimeUnit': 'ms'}
+
+    def export_chrome_trace(self, path: str) -> int:
+        """
+        Chrome trace-event JSON 파일로 저장
+
+        Args:
+            path: 저장 경로
+
+        Returns:
+            int: 기록된 이벤트 수
+        """
+        trace = self.to_chrome_trace()
+        output = Path(path)
+        output.parent.mkdir(parents=True, exist_ok=True)
+        with open(output, 'w', encoding='utf-8') as f:
+            json.dump(trace, f)
+        return len(trace['traceEvents'])
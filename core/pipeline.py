@@ -0,0 +1,167 @@
+"""
+Pipeline Stage
+순번 기반 파이프라인 단계 (캡처 → STT → 번역 → 출력)
+
+각 단계는 자체 워커 스레드와 크기 제한 입력 큐를 가집니다. 큐가 가득 차면
+앞 단계의 put()이 블록되어 자연스럽게 역압(backpressure)이 걸립니다.
+항목은 (순번, 데이터) 쌍으로 흐르며, ordered 단계는 순번 순서대로만
+처리하므로 여러 워커가 병렬 처리해도 출력 순서가 유지됩니다.
+"""
+
+import queue
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+
+# 단계 종료 신호
+_STOP = object()
+
+
+class PipelineStage:
+    """순번 기반 파이프라인 단계"""
+
+    def __init__(
+        self,
+        name: str,
+        handler: Callable[[Any], Any],
+        output: Optional['PipelineStage'] = None,
+        workers: int = 1,
+        maxsize: int = 8,
+        ordered: bool = False
+    ):
+        """
+        Args:
+            name: 단계 이름 (스레드 이름, 통계용)
+            handler: 항목 처리 함수 (반환값을 다음 단계로 전달, None=전달할 결과 없음)
+            output: 다음 단계 (None=마지막 단계)
+            workers: 워커 스레드 수
+            maxsize: 입력 큐 최대 크기
+            ordered: 순번 순서대로 처리 (워커 1개만 가능)
+        """
+        if ordered and workers != 1:
+            raise ValueError("Ordered stage requires a single worker")
+
+        self.name = name
+        self.handler = handler
+        self.output = output
+        self.workers = workers
+        self.ordered = ordered
+
+        self.input: queue.Queue = queue.Queue(maxsize=maxsize)
+        self._threads = []
+        self._lock = threading.Lock()
+        self._running_workers = 0
+
+        # ordered 단계: 순서가 앞선 항목을 기다리는 동안 보관
+        self._pending: Dict[int, Any] = {}
+        self._next_seq = 0
+
+        # 통계
+        self.processed = 0
+        self.errors = 0
+        self.busy_time = 0.0
+
+    def start(self):
+        """워커 스레드 시작"""
+        self._next_seq = 0
+        self._pending.clear()
+        self._running_workers = self.workers
+        self._threads = [
+            threading.Thread(target=self._worker, name=f"{self.name}-{i}", daemon=True)
+            for i in range(self.workers)
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def put(self, seq: int, item: Any):
+        """
+        항목 추가 (큐가 가득 차면 블록)
+
+        Args:
+            seq: 순번 (0부터 빠짐없이 증가)
+            item: 처리할 데이터 (None=건너뛸 순번)
+        """
+        self.input.put((seq, item))
+
+    def close(self):
+        """입력 종료 (남은 항목 처리 후 워커 종료, 다음 단계도 이어서 종료)"""
+        for _ in range(self.workers):
+            self.input.put(_STOP)
+
+    def join(self, timeout: Optional[float] = None):
+        """
+        워커 종료 대기
+
+        Args:
+            timeout: 전체 대기 시간 (초)
+        """
+        deadline = None if timeout is None else time.time() + timeout
+        for thread in self._threads:
+            remaining = None if deadline is None else max(0.0, deadline - time.time())
+            thread.join(timeout=remaining)
+
+    @property
+    def idle(self) -> bool:
+        """입력 큐의 항목을 모두 처리했는지 (다음 단계 전달 포함)"""
+        return self.input.unfinished_tasks == 0
+
+    def _worker(self):
+        """워커 루프"""
+        while True:
+            entry = self.input.get()
+            if entry is _STOP:
+                self.input.task_done()
+                break
+
+            seq, item = entry
+            if self.ordered:
+                self._pending[seq] = item
+                while self._next_seq in self._pending:
+                    self._process(self._next_seq, self._pending.pop(self._next_seq))
+                    self._next_seq += 1
+            else:
+                self._process(seq, item)
+            self.input.task_done()
+
+        # 마지막 워커가 다음 단계 종료
+        with self._lock:
+            self._running_workers -= 1
+            last = self._running_workers == 0
+        if last and self.output:
+            self.output.close()
+
+    def _process(self, seq: int, item: Any):
+        """항목 1개 처리 후 다음 단계로 전달 (실패해도 순번은 전달)"""
+        result = None
+        if item is not None:
+            start = time.perf_counter()
+            failed = False
+            try:
+                result = self.handler(item)
+            except Exception as e:
+                failed = True
+                print(f"❌ {self.name} 처리 에러: {e}")
+
+            with self._lock:
+                self.busy_time += time.perf_counter() - start
+                self.processed += 1
+                self.errors += failed
+
+        if self.output:
+            self.output.put(seq, result)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        단계 통계
+
+        Returns:
+            Dict: 워커 수, 대기 항목 수, 처리/에러 수, 누적 처리 시간
+        """
+        return {
+            'workers': self.workers,
+            'queued': self.input.qsize(),
+            'processed': self.processed,
+            'errors': self.errors,
+            'busy_time': self.busy_time
+        }
@@ -0,0 +1,317 @@
+"""
+Replay Harness
+녹음 파일 재생으로 파이프라인 튜닝 (마이크 불필요)
+
+FileAudioSource는 AudioCapture 자리에 끼워 WAV 등 녹음 파일을 링 버퍼에
+블록 단위로 넣습니다. VAD 게이트, 분할기, 크기 제한 큐, 지연 추적은 마이크
+입력과 같은 코드를 그대로 사용합니다.
+
+- realtime: 오디오 길이만큼 실제 시간을 들여 재생
+- fast: 파이프라인이 쉬는 동안의 대기 시간을 가상 시계로 건너뜀. 처리 시간은
+  실제로 흐르고 대기만 생략되므로, 같은 처리 시간이면 지연 수치가 재생마다
+  같게 나옵니다.
+"""
+
+import json
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Callable
+
+import numpy as np
+
+from core.audio_capture import AudioCapture
+from core.audio_file import load_audio
+from core.controller import CaptionController
+from core.latency_tracer import LatencyTracer
+
+
+class VirtualClock:
+    """쉬는 구간을 건너뛸 수 있는 monotonic 시계 (재생 시작 = 0초)"""
+
+    def __init__(self):
+        self._start = time.perf_counter()
+        self._skipped = 0.0
+        self._lock = threading.Lock()
+
+    def __call__(self) -> float:
+        """현재 가상 시각 (초)"""
+        return time.perf_counter() - self._start + self._skipped
+
+    def advance_to(self, timestamp: float):
+        """
+        가상 시각을 timestamp까지 건너뜀 (이미 지났으면 그대로)
+
+        Args:
+            timestamp: 목표 시각 (초)
+        """
+        with self._lock:
+            now = self()
+            if timestamp > now:
+                self._skipped += timestamp - now
+
+    @property
+    def skipped(self) -> float:
+        """건너뛴 시간 합계 (초)"""
+        return self._skipped
+
+
+class FileAudioSource(AudioCapture):
+    """녹음 파일 오디오 입력 (AudioCapture 대체)"""
+
+    def __init__(
+        self,
+        audio_path: str,
+        realtime: bool = False,
+        clock: Optional[VirtualClock] = None,
+        **kwargs
+    ):
+        """
+        Args:
+            audio_path: 오디오/비디오 파일 경로
+            realtime: True면 실제 시간 속도로 재생, False면 쉬는 구간을 건너뜀
+            clock: 가상 시계 (None이면 새로 생성)
+            **kwargs: AudioCapture 인자 (sample_rate, chunk_duration, ...)
+        """
+        super().__init__(**kwargs)
+        self.audio_path = audio_path
+        self.realtime = realtime
+        self.clock = clock or VirtualClock()
+
+        # 파이프라인 유휴 여부 (fast 모드에서 시계를 건너뛸 때 확인, 하네스가 설정)
+        self.idle_check: Callable[[], bool] = lambda: True
+
+        self.samples: Optional[np.ndarray] = None
+        self.finished = threading.Event()
+
+    @property
+    def duration(self) -> float:
+        """파일 길이 (초)"""
+        return len(self.samples) / self.sample_rate if self.samples is not None else 0.0
+
+    def initialize(self) -> bool:
+        """
+        파일 디코딩 (PyAudio 미사용)
+
+        Returns:
+            bool: 성공 여부
+        """
+        try:
+            audio = load_audio(self.audio_path, self.sample_rate)
+            self.samples = (np.clip(audio, -1.0, 1.0) * 32767).astype(np.int16)
+            return True
+        except Exception as e:
+            print(f"❌ 오디오 파일 로드 실패: {e}")
+            return False
+
+    def list_devices(self) -> list:
+        """파일 입력은 디바이스 없음"""
+        return []
+
+    def start_recording(
+        self,
+        device_index: Optional[int] = None,
+        callback: Optional[Callable[[np.ndarray], None]] = None
+    ) -> bool:
+        """
+        재생 시작 (device_index 무시)
+
+        Returns:
+            bool: 시작 성공 여부
+        """
+        if self.is_recording or self.samples is None:
+            return False
+
+        self._reset_state()
+        self.finished.clear()
+        self.is_recording = True
+        self.record_thread = threading.Thread(
+            target=self._feed_loop,
+            args=(callback,),
+            name="file-audio-source",
+            daemon=True
+        )
+        self.record_thread.start()
+        print(f"✅ 파일 재생 시작 ({'realtime' if self.realtime else 'fast'}, {self.duration:.1f}초)")
+        return True
+
+    def _feed_loop(self, callback: Optional[Callable[[np.ndarray], None]]):
+        """PortAudio 블록 크기 단위로 링 버퍼에 넣기 (별도 스레드)"""
+        total = len(self.samples)
+
+        for start in range(0, total, self.buffer_size):
+            if not self.is_recording:
+                return
+
+            block = self.samples[start:start + self.buffer_size]
+            due = (start + len(block)) / self.sample_rate
+
+            # 블록의 마지막 샘플이 도착할 시각까지 대기
+            while self.clock() < due:
+                if not self.realtime and self.idle_check():
+                    self.clock.advance_to(due)
+                    break
+                time.sleep(min(0.005, max(0.0, due - self.clock())))
+
+            self.ring_buffer.write(block)
+            self._last_write_time = due
+            self._emit_chunks(callback)
+
+        # 파일 끝: 진행 중인 발화 내보내기
+        if self.segmenter:
+            segments = self.segmenter.flush()
+            for segment, cut in zip(segments, self.segmenter.segment_reasons):
+                self._enqueue(segment, cut)
+        self.finished.set()
+
+
+class ReplayHarness:
+    """녹음 파일로 CaptionController 전체 파이프라인 실행 및 보고서 생성"""
+
+    def __init__(
+        self,
+        audio_path: str,
+        config_path: str = "config.yaml",
+        realtime: bool = False
+    ):
+        """
+        Args:
+            audio_path: 오디오/비디오 파일 경로
+            config_path: 설정 파일 경로 (청크 / VAD / 프로필 설정 실험용)
+            realtime: True면 실제 시간 속도로 재생
+        """
+        self.audio_path = audio_path
+        self.realtime = realtime
+        self.clock = VirtualClock()
+
+        self.controller = CaptionController(
+            config_path,
+            audio_factory=lambda **kwargs: FileAudioSource(
+                audio_path, realtime=realtime, clock=self.clock, **kwargs
+            )
+        )
+
+        self.captions: List[Dict[str, Any]] = []
+        self.partials = 0
+        self.wall_seconds = 0.0
+        self.report: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+
+    def _on_caption(self, caption_data: Dict[str, Any]):
+        """자막 수집 (출력 단계 스레드)"""
+        with self._lock:
+            if caption_data.get('is_final', True):
+                self.captions.append({
+                    key: value for key, value in caption_data.items() if key != 'trace'
+                })
+            else:
+                self.partials += 1
+
+    def _is_idle(self) -> bool:
+        """큐와 파이프라인 단계에 처리 중인 항목이 없는지"""
+        controller = self.controller
+        return (
+            controller.audio_capture.audio_queue.unfinished_tasks == 0
+            and controller.translate_stage.idle
+            and controller.emit_stage.idle
+        )
+
+    def run(self, timeout: Optional[float] = None) -> Dict[str, Any]:
+        """
+        초기화 → 파일 끝까지 재생 → 남은 자막 처리 → 정리
+
+        Args:
+            timeout: 파일 재생 최대 대기 시간 (초, None이면 무제한)
+
+        Returns:
+            Dict: 재생 보고서 (get_report())
+        """
+        if not self.controller.initialize():
+            raise RuntimeError("컨트롤러 초기화 실패")
+
+        source: FileAudioSource = self.controller.audio_capture
+        source.idle_check = self._is_idle
+
+        # 가상 시계 기준 지연 추적 (tracing 설정과 무관하게 사용)
+        window = self.controller.config_mgr.get('tracing.window', 1000)
+        self.controller.tracer = LatencyTracer(window=window, clock=self.clock)
+        source.tracer = self.controller.tracer
+
+        started = time.perf_counter()
+        try:
+            if not self.controller.start(caption_callback=self._on_caption):
+                raise RuntimeError("재생 시작 실패")
+
+            if not source.finished.wait(timeout):
+                print("⚠️  재생 시간 초과")
+
+            # 큐에 남은 청크까지 자막으로 만든 뒤 중지
+            while not self._is_idle():
+                time.sleep(0.01)
+            self.wall_seconds = time.perf_counter() - started
+            self.report = self.get_report()
+        finally:
+            self.controller.cleanup()
+
+        return self.report
+
+    def get_report(self) -> Dict[str, Any]:
+        """
+        재생 보고서
+
+        Returns:
+            Dict: {
+                'file', 'mode', 'audio_seconds', 'wall_seconds',
+                'rtf': 전체 처리 시간 / 오디오 길이 (fast 모드),
+                'stt_rtf': STT 누적 처리 시간 / 오디오 길이,
+                'captions', 'partials',
+                'latency': 구간별 p50/p95/p99 (가상 시계 기준),
+                'dropped': {
+                    'silent': VAD 게이트가 막은 청크 (adaptive는 분할기가 버린 짧은 구간),
+                    'overflow', 'stale'
+                },
+                'capture': AudioCapture 통계
+            }
+        """
+        source: FileAudioSource = self.controller.audio_capture
+        tracer = self.controller.tracer
+        capture = source.get_capture_stats()
+        audio_seconds = source.duration
+
+        if capture.get('vad'):
+            silent = capture['vad']['windows_dropped']
+        elif capture.get('segmenter'):
+            silent = capture['segmenter']['discarded']
+        else:
+            silent = 0
+        totals = tracer.get_totals()
+
+        return {
+            'file': str(self.audio_path),
+            'mode': 'realtime' if self.realtime else 'fast',
+            'audio_seconds': round(audio_seconds, 3),
+            'wall_seconds': round(self.wall_seconds, 3),
+            'rtf': round(self.wall_seconds / audio_seconds, 4) if audio_seconds else 0.0,
+            'stt_rtf': round(totals['stt']['seconds'] / audio_seconds, 4) if audio_seconds else 0.0,
+            'captions': len(self.captions),
+            'partials': self.partials,
+            'latency': tracer.get_stats(),
+            'dropped': {
+                'silent': silent,
+                'overflow': capture['queue']['dropped_overflow'],
+                'stale': capture['queue']['dropped_stale']
+            },
+            'capture': capture
+        }
+
+    def save_report(self, path: str):
+        """
+        보고서를 JSON으로 저장
+
+        Args:
+            path: 저장 경로
+        """
+        output = Path(path)
+        output.parent.mkdir(parents=True, exist_ok=True)
+        with open(output, 'w', encoding='utf-8') as f:
+            json.dump({**self.report, 'caption_list': self.captions}, f, ensure_ascii=False, indent=2)
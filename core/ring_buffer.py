@@ -0,0 +1,245 @@
+"""
+Audio Ring Buffer
+고정 용량 int16 링 버퍼 및 float32 출력 프레임 풀
+
+AudioCapture의 녹음 루프는 기존에 파이썬 리스트에 샘플을 하나씩 박싱해서
+쌓았습니다. 이 모듈은 미리 할당된 numpy 배열만 사용하므로 정상 상태에서는
+청크당 추가 할당이 발생하지 않습니다.
+"""
+
+import threading
+from typing import Optional, Tuple
+import numpy as np
+
+
+# int16 → float32 정규화 계수
+INT16_SCALE = np.float32(1.0 / 32768.0)
+
+
+class AudioRingBuffer:
+    """고정 용량 int16 링 버퍼 (단일 생산자 / 단일 소비자)"""
+
+    def __init__(self, capacity: int):
+        """
+        Args:
+            capacity: 버퍼 용량 (샘플 수)
+        """
+        if capacity <= 0:
+            raise ValueError(f"capacity must be positive: {capacity}")
+
+        self.capacity = capacity
+        self._storage = np.zeros(capacity, dtype=np.int16)
+
+        # 읽기 위치와 저장된 샘플 수
+        self._read_pos = 0
+        self._size = 0
+
+        # 용량 초과로 덮어쓴 샘플 수
+        self.overflow_samples = 0
+
+        self._lock = threading.Lock()
+
+    @property
+    def available(self) -> int:
+        """읽을 수 있는 샘플 수"""
+        return self._size
+
+    @property
+    def free_space(self) -> int:
+        """남은 공간 (샘플 수)"""
+        return self.capacity - self._size
+
+    def write(self, samples: np.ndarray) -> int:
+        """
+        샘플 쓰기 (공간이 부족하면 가장 오래된 샘플을 덮어씀)
+
+        Args:
+            samples: int16 샘플 배열
+
+        Returns:
+            int: 덮어쓴(버려진) 샘플 수
+        """
+        n = len(samples)
+        if n == 0:
+            return 0
+
+        with self._lock:
+            dropped = 0
+
+            # 용량보다 큰 입력은 마지막 부분만 유지
+            if n > self.capacity:
+                dropped += n - self.capacity
+                samples = samples[n - self.capacity:]
+                n = self.capacity
+
+            # 공간 부족 시 가장 오래된 샘플 버림
+            overflow = n - self.free_space
+            if overflow > 0:
+                self._read_pos = (self._read_pos + overflow) % self.capacity
+                self._size -= overflow
+                dropped += overflow
+
+            write_pos = (self._read_pos + self._size) % self.capacity
+            first = min(n, self.capacity - write_pos)
+            self._storage[write_pos:write_pos + first] = samples[:first]
+            if first < n:
+                self._storage[:n - first] = samples[first:]
+
+            self._size += n
+            self.overflow_samples += dropped
+            return dropped
+
+    def peek(self, size: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        복사 없이 가장 오래된 샘플 구간 조회
+
+        반환되는 배열은 내부 저장소의 뷰이므로 다음 write() 전까지만 유효합니다.
+
+        Args:
+            size: 조회할 샘플 수
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: (앞 구간, 랩어라운드 구간) int16 뷰
+        """
+        with self._lock:
+            if size > self._size:
+                raise ValueError(f"not enough samples: requested {size}, available {self._size}")
+
+            first = min(size, self.capacity - self._read_pos)
+            head = self._storage[self._read_pos:self._read_pos + first]
+            tail = self._storage[:size - first]
+            return head, tail
+
+    def read_window(
+        self,
+        size: int,
+        out: Optional[np.ndarray] = None,
+        overlap: int = 0
+    ) -> np.ndarray:
+        """
+        윈도우를 float32(-1 to 1)로 변환하여 읽기
+
+        윈도우를 읽은 뒤 (size - overlap) 샘플만큼 전진하므로 다음 윈도우는
+        이번 윈도우의 마지막 overlap 샘플로 시작합니다.
+
+        Args:
+            size: 윈도우 크기 (샘플 수)
+            out: 결과를 기록할 미리 할당된 float32 배열 (None이면 새로 할당)
+            overlap: 다음 윈도우와 겹칠 샘플 수
+
+        Returns:
+            np.ndarray: float32 윈도우 (out이 주어지면 out[:size])
+        """
+        if not 0 <= overlap < size:
+            raise ValueError(f"overlap must be in [0, {size}): {overlap}")
+
+        if out is None:
+            out = np.empty(size, dtype=np.float32)
+        elif len(out) < size:
+            raise ValueError(f"output buffer too small: {len(out)} < {size}")
+
+        # 대입으로 형 변환 후 제자리 스케일링 (임시 배열 없음)
+        head, tail = self.peek(size)
+        window = out[:size]
+        window[:len(head)] = head
+        if len(tail):
+            window[len(head):] = tail
+        window *= INT16_SCALE
+
+        self.advance(size - overlap)
+        return window
+
+    def advance(self, count: int):
+        """
+        읽기 위치 전진 (샘플 버리기)
+
+        Args:
+            count: 버릴 샘플 수
+        """
+        with self._lock:
+            count = min(count, self._size)
+            self._read_pos = (self._read_pos + count) % self.capacity
+            self._size -= count
+
+    def clear(self):
+        """버퍼 비우기"""
+        with self._lock:
+            self._read_pos = 0
+            self._size = 0
+
+
+class FramePool:
+    """
+    float32 출력 프레임 풀
+
+    프레임 소유권은 명시적으로 관리합니다. acquire()로 가져간 프레임은
+    release()로 돌려받기 전까지 다시 내주지 않으므로, 반환하지 않은 프레임은
+    재사용되지 않을 뿐 사용 중에 덮어써지지 않습니다.
+    """
+
+    def __init__(self, frame_size: int, max_frames: int = 16):
+        """
+        Args:
+            frame_size: 프레임 크기 (샘플 수)
+            max_frames: 풀에 보관할 최대 프레임 수
+        """
+        self.frame_size = frame_size
+        self.max_frames = max_frames
+        self._frames = []
+        self._free = []
+        self._lock = threading.Lock()
+
+        # 통계
+        self.allocated = 0
+        self.reused = 0
+
+    def acquire(self) -> np.ndarray:
+        """
+        사용 가능한 프레임 가져오기
+
+        Returns:
+            np.ndarray: float32 프레임 (frame_size)
+        """
+        with self._lock:
+            if self._free:
+                self.reused += 1
+                return self._free.pop()
+
+            frame = np.empty(self.frame_size, dtype=np.float32)
+            self.allocated += 1
+
+            # 풀이 가득 차면 풀 밖에서 일회용으로 사용
+            if len(self._frames) < self.max_frames:
+                self._frames.append(frame)
+
+            return frame
+
+    def release(self, frame: np.ndarray):
+        """
+        프레임 반환 (이후 acquire()에서 재사용)
+
+        프레임의 뷰(슬라이스)도 받으며, 이 풀의 프레임이 아니거나 이미 반환된
+        프레임은 무시합니다.
+
+        Args:
+            frame: acquire()로 가져간 프레임 또는 그 뷰
+        """
+        owner = frame if frame.base is None else frame.base
+        with self._lock:
+            if any(owner is pooled for pooled in self._free):
+                return
+            if any(owner is pooled for pooled in self._frames):
+                self._free.append(owner)
+
+    def get_stats(self) -> dict:
+        """
+        풀 통계
+
+        Returns:
+            dict: 할당/재사용 횟수
+        """
+        return {
+            'pooled': len(self._frames),
+            'allocated': self.allocated,
+            'reused': self.reused
+        }
@@ -0,0 +1,282 @@
+"""
+Speech Segmenter
+발화 종료 지점(휴지) 기반 가변 길이 청크 분할
+
+고정 길이 윈도우 + 50% 오버랩 대신, VAD 프레임 판정을 따라가며 휴지에서
+청크를 자릅니다. 오버랩은 최대 길이 제한으로 발화 중간을 강제로 자를 때만
+사용합니다.
+"""
+
+from typing import Dict, Any, List, Optional
+import numpy as np
+
+from core.ring_buffer import FramePool
+from services.base_vad import BaseVADService
+
+
+# 청크 분할 사유
+CUT_PAUSE = 'pause'
+CUT_DEADLINE = 'deadline'
+CUT_MAX_DURATION = 'max_duration'
+CUT_FLUSH = 'flush'
+
+
+class SpeechSegmenter:
+    """휴지 기반 가변 길이 청크 분할기"""
+
+    def __init__(
+        self,
+        vad: BaseVADService,
+        min_duration: float = 0.3,
+        max_duration: float = 8.0,
+        max_latency: float = 4.0,
+        pause_ms: float = 500.0,
+        pre_roll_ms: float = 200.0,
+        forced_overlap: float = 0.5,
+        threshold: float = 0.5
+    ):
+        """
+        Args:
+            vad: 초기화된 VAD 서비스
+            min_duration: 최소 음성 길이 (초, 이보다 짧은 발화는 잡음으로 버림)
+            max_duration: 최대 청크 길이 (초, 초과 시 오버랩을 두고 강제 분할)
+            max_latency: 지연 한도 (초, 초과 시 가장 최근의 짧은 휴지에서 분할)
+            pause_ms: 발화 종료로 판단할 무음 길이 (밀리초)
+            pre_roll_ms: 발화 시작 전에 포함할 오디오 (밀리초)
+            forced_overlap: 강제 분할 시 다음 청크와 겹칠 길이 (초)
+            threshold: 음성 판정 확률 임계값
+        """
+        if not 0 < min_duration < max_latency <= max_duration:
+            raise ValueError("Expected 0 < min_duration < max_latency <= max_duration")
+
+        self.vad = vad
+        self.sample_rate = vad.sample_rate
+        self.frame_size = vad.frame_size
+        self.threshold = threshold
+
+        frames_per_sec = self.sample_rate / self.frame_size
+        self.min_frames = max(1, int(min_duration * frames_per_sec))
+        self.max_frames = int(max_duration * frames_per_sec)
+        self.deadline_frames = int(max_latency * frames_per_sec)
+        self.pause_frames = max(1, int(pause_ms / 1000 * frames_per_sec))
+        self.pre_roll_frames = int(pre_roll_ms / 1000 * frames_per_sec)
+        self.overlap_frames = int(forced_overlap * frames_per_sec)
+
+        # 현재 청크 버퍼 (프레임 단위) 및 프레임별 음성 여부
+        capacity = self.max_frames + self.pre_roll_frames
+        self._frames = np.zeros((capacity, self.frame_size), dtype=np.float32)
+        self._is_speech = np.zeros(capacity, dtype=bool)
+        self._count = 0
+
+        # 발화 상태
+        self._in_speech = False
+        self._speech_start = 0
+        self._speech_frames = 0
+        self._silence_run = 0
+        self._last_gap: Optional[int] = None
+
+        # 프레임 경계에 걸친 나머지 샘플
+        self._remainder = np.zeros(0, dtype=np.float32)
+
+        # 버퍼 첫 프레임의 스트림 내 위치 (프레임 단위, reset() 기준)
+        self._base_frame = 0
+
+        # 마지막 process() / flush() 호출에서 나온 청크의 시작 시각 (초, reset() 기준)
+        self.segment_offsets: List[float] = []
+        
+        # 같은 청크들의 분할 사유 (CUT_*, 강제 분할만 다음 청크와 오디오가 겹침)
+        self.segment_reasons: List[str] = []
+
+        # 출력 청크 풀 (가변 길이 청크는 풀 프레임의 뷰로 전달)
+        self.pool = FramePool(capacity * self.frame_size)
+
+        # 통계
+        self.samples_in = 0
+        self.samples_out = 0
+        self.discarded = 0
+        self.cuts = {CUT_PAUSE: 0, CUT_DEADLINE: 0, CUT_MAX_DURATION: 0, CUT_FLUSH: 0}
+
+    def process(self, audio: np.ndarray) -> List[np.ndarray]:
+        """
+        오디오 입력 및 완성된 청크 반환
+
+        Args:
+            audio: 새 오디오 샘플 (float32, -1 to 1, 이전 입력과 겹치지 않음)
+
+        Returns:
+            List[np.ndarray]: 완성된 청크 목록 (float32)
+        """
+        self.samples_in += len(audio)
+        self.segment_offsets = []
+        self.segment_reasons = []
+
+        samples = np.concatenate([self._remainder, audio]) if len(self._remainder) else audio
+        n_frames = len(samples) // self.frame_size
+        used = n_frames * self.frame_size
+        self._remainder = samples[used:].copy()
+
+        if n_frames == 0:
+            return []
+
+        frames = samples[:used].reshape(n_frames, self.frame_size)
+        probs = self.vad.process_frames(frames)
+
+        segments = []
+        for frame, prob in zip(frames, probs):
+            segment = self._push_frame(frame, prob >= self.threshold)
+            if segment is not None:
+                segments.append(segment)
+        return segments
+
+    def _push_frame(self, frame: np.ndarray, is_speech: bool) -> Optional[np.ndarray]:
+        """
+        프레임 1개 처리
+
+        Returns:
+            Optional[np.ndarray]: 분할이 일어나면 완성된 청크
+        """
+        index = self._count
+        self._frames[index] = frame
+        self._is_speech[index] = is_speech
+        self._count += 1
+
+        if not self._in_speech:
+            if is_speech:
+                self._in_speech = True
+                self._speech_start = index
+                self._speech_frames = 1
+                self._silence_run = 0
+                self._last_gap = None
+            elif self._count > self.pre_roll_frames:
+                # 발화 전에는 프리롤 길이만큼만 유지
+                self._drop_front(self._count - self.pre_roll_frames)
+            return None
+
+        if is_speech:
+            self._speech_frames += 1
+            self._silence_run = 0
+        else:
+            self._silence_run += 1
+            if index - self._speech_start >= self.min_frames:
+                self._last_gap = index
+
+        # 1) 휴지: 발화 종료
+        if self._silence_run >= self.pause_frames:
+            end = self._count - self._silence_run + min(self._silence_run, self.pre_roll_frames)
+            if self._speech_frames < self.min_frames:
+                self.discarded += 1
+                segment = None
+            else:
+                segment = self._emit(end, CUT_PAUSE)
+            self._in_speech = False
+            # 남은 무음은 다음 발화의 프리롤로 사용
+            keep = min(self._count, self.pre_roll_frames)
+            self._drop_front(self._count - keep)
+            return segment
+
+        length = self._count - self._speech_start
+
+        # 2) 지연 한도: 가장 최근의 짧은 휴지에서 분할 (오버랩 없음)
+        if length >= self.deadline_frames and self._last_gap is not None:
+            cut = self._last_gap + 1
+            segment = self._emit(cut, CUT_DEADLINE)
+            self._drop_front(cut)
+            self._restart_speech()
+            return segment
+
+        # 3) 최대 길이: 오버랩을 두고 강제 분할
+        if self._count >= len(self._frames) or length >= self.max_frames:
+            segment = self._emit(self._count, CUT_MAX_DURATION)
+            self._drop_front(self._count - min(self.overlap_frames, self._count))
+            self._restart_speech()
+            return segment
+
+        return None
+
+    def _restart_speech(self):
+        """분할 후 남은 프레임으로 발화 상태 재설정"""
+        self._speech_start = 0
+        self._speech_frames = int(np.count_nonzero(self._is_speech[:self._count]))
+        self._silence_run = 0
+        self._last_gap = None
+
+        # 남은 프레임이 모두 무음이면 대기 상태로 복귀
+        if self._speech_frames == 0:
+            self._in_speech = False
+            self._drop_front(self._count - min(self._count, self.pre_roll_frames))
+
+    def _emit(self, end: int, reason: str) -> np.ndarray:
+        """
+        버퍼 앞쪽 end 프레임을 청크로 출력
+
+        Args:
+            end: 출력할 프레임 수
+            reason: 분할 사유
+
+        Returns:
+            np.ndarray: 청크 (float32, 풀 프레임의 뷰)
+        """
+        n_samples = end * self.frame_size
+        segment = self.pool.acquire()[:n_samples]
+        segment[:] = self._frames[:end].reshape(-1)
+        self.segment_offsets.append(self._base_frame * self.frame_size / self.sample_rate)
+        self.segment_reasons.append(reason)
+
+        self.cuts[reason] += 1
+        self.samples_out += n_samples
+        return segment
+
+    def _drop_front(self, count: int):
+        """버퍼 앞쪽 프레임 버리기"""
+        if count <= 0:
+            return
+        remaining = self._count - count
+        if remaining > 0:
+            self._frames[:remaining] = self._frames[count:self._count]
+            self._is_speech[:remaining] = self._is_speech[count:self._count]
+        self._count = remaining
+        self._speech_start = max(0, self._speech_start - count)
+        self._base_frame += count
+
+    def flush(self) -> List[np.ndarray]:
+        """
+        진행 중인 발화를 청크로 내보내기 (녹음 종료 시)
+
+        Returns:
+            List[np.ndarray]: 남은 청크 목록
+        """
+        segments = []
+        self.segment_offsets = []
+        self.segment_reasons = []
+        if self._in_speech and self._speech_frames >= self.min_frames:
+            segments.append(self._emit(self._count, CUT_FLUSH))
+        self.reset()
+        return segments
+
+    def reset(self):
+        """스트림 상태 초기화 (통계 유지)"""
+        self.vad.reset()
+        self._count = 0
+        self._in_speech = False
+        self._speech_frames = 0
+        self._silence_run = 0
+        self._last_gap = None
+        self._remainder = np.zeros(0, dtype=np.float32)
+        self._base_frame = 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        분할 통계
+
+        Returns:
+            Dict: 사유별 분할 횟수, STT로 보낸 오디오 비율 등
+        """
+        segments = sum(self.cuts.values())
+        return {
+            'backend': self.vad.__class__.__name__,
+            'segments': segments,
+            'cuts': dict(self.cuts),
+            'discarded': self.discarded,
+            'mean_duration': self.samples_out / segments / self.sample_rate if segments else 0.0,
+            'stt_audio_ratio': self.samples_out / self.samples_in if self.samples_in else 0.0
+        }
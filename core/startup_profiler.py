@@ -0,0 +1,200 @@
+"""
+Startup Profiler
+시작 시간 측정 (단계별 시간, 모듈별 import 시간)
+
+sys.meta_path 맨 앞에 finder를 넣어 모듈 실행(exec_module) 시간을 잽니다.
+자체 시간은 하위 모듈 import를 뺀 시간, 누적 시간은 포함한 시간입니다.
+python -X importtime과 같은 기준이지만 실행 중에 결과를 보고서로 받을 수 있습니다.
+
+사용법:
+    python main.py --profile-startup
+    python main.py --list-devices --profile-startup
+"""
+
+import contextlib
+import sys
+import threading
+import time
+from typing import Dict, Any, List, Optional
+
+
+class _ImportTimer:
+    """모듈 exec_module() 시간을 재는 meta path finder"""
+
+    def __init__(self, profiler: 'StartupProfiler'):
+        self.profiler = profiler
+        self._local = threading.local()
+
+    def find_spec(self, fullname, path, target=None):
+        """다른 finder가 찾은 spec의 로더에 시간 측정 연결"""
+        spec = None
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, 'find_spec'):
+                continue
+            spec = finder.find_spec(fullname, path, target)
+            if spec is not None:
+                break
+
+        # 내장 / frozen 모듈 로더는 클래스 자체라 건드리지 않음
+        loader = getattr(spec, 'loader', None)
+        if loader is None or isinstance(loader, type) or not hasattr(loader, 'exec_module'):
+            return spec
+
+        original = loader.exec_module
+
+        def exec_module(module):
+            del loader.exec_module
+            self._enter()
+            try:
+                original(module)
+            finally:
+                self._exit(fullname)
+
+        loader.exec_module = exec_module
+        return spec
+
+    def _enter(self):
+        """import 시작 (스레드별 스택)"""
+        stack = getattr(self._local, 'stack', None)
+        if stack is None:
+            stack = self._local.stack = []
+        stack.append([time.perf_counter(), 0.0])
+
+    def _exit(self, fullname: str):
+        """import 종료: 자체 / 누적 시간 기록 후 부모에 누적 시간 전달"""
+        stack = self._local.stack
+        started, children = stack.pop()
+        cumulative = time.perf_counter() - started
+        if stack:
+            stack[-1][1] += cumulative
+        self.profiler._record_import(fullname, cumulative - children, cumulative, outermost=not stack)
+
+
+class StartupProfiler:
+    """시작 단계 / import 시간 측정"""
+
+    def __init__(self, enabled: bool = True):
+        """
+        Args:
+            enabled: False면 측정하지 않음 (phase()는 아무 일도 하지 않음)
+        """
+        self.enabled = enabled
+        self.started = time.perf_counter()
+
+        self.phases: List[tuple] = []
+        self.imports: Dict[str, List[float]] = {}
+        self.import_seconds = 0.0
+        self._finder: Optional[_ImportTimer] = None
+        self._lock = threading.Lock()
+
+    def start(self) -> 'StartupProfiler':
+        """
+        import 시간 측정 시작
+
+        Returns:
+            StartupProfiler: self
+        """
+        if self.enabled and self._finder is None:
+            self.started = time.perf_counter()
+            self._finder = _ImportTimer(self)
+            sys.meta_path.insert(0, self._finder)
+        return self
+
+    def stop(self):
+        """import 시간 측정 중지"""
+        if self._finder is not None:
+            sys.meta_path.remove(self._finder)
+            self._finder = None
+
+    def _record_import(self, module: str, self_seconds: float, cumulative: float, outermost: bool):
+        """모듈 import 시간 기록 (바깥쪽 import만 전체 import 시간에 합산)"""
+        with self._lock:
+            self.imports[module] = [self_seconds, cumulative]
+            if outermost:
+                self.import_seconds += cumulative
+
+    @contextlib.contextmanager
+    def phase(self, name: str):
+        """
+        시작 단계 시간 측정
+
+        Args:
+            name: 단계 이름
+        """
+        if not self.enabled:
+            yield
+            return
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases.append((name, time.perf_counter() - started))
+
+    def elapsed_ms(self) -> float:
+        """측정 시작 후 경과 시간 (ms)"""
+        return (time.perf_counter() - self.started) * 1000
+
+    def get_report(self, top: int = 15) -> Dict[str, Any]:
+        """
+        시작 시간 보고서
+
+        Args:
+            top: 자체 시간 기준으로 나열할 모듈 수
+
+        Returns:
+            Dict: {
+                'total_ms': 측정 시작 후 경과 시간,
+                'phases': [{name, ms}],
+                'import_ms': 바깥쪽 import 누적 시간 합계,
+                'modules': 측정된 모듈 수,
+                'slowest': [{module, self_ms, cumulative_ms}] (자체 시간 순)
+            }
+        """
+        with self._lock:
+            imports = dict(self.imports)
+            import_seconds = self.import_seconds
+
+        slowest = sorted(imports.items(), key=lambda item: item[1][0], reverse=True)[:top]
+
+        return {
+            'total_ms': round(self.elapsed_ms(), 1),
+            'phases': [{'name': name, 'ms': round(seconds * 1000, 1)} for name, seconds in self.phases],
+            'import_ms': round(import_seconds * 1000, 1),
+            'modules': len(imports),
+            'slowest': [
+                {
+                    'module': name,
+                    'self_ms': round(self_seconds * 1000, 2),
+                    'cumulative_ms': round(cumulative * 1000, 2)
+                }
+                for name, (self_seconds, cumulative) in slowest
+            ]
+        }
+
+    def print_report(self, budget_ms: Optional[float] = None, top: int = 15) -> bool:
+        """
+        보고서 출력
+
+        Args:
+            budget_ms: 시작 시간 예산 (ms, None이면 확인 안 함)
+            top: 나열할 모듈 수
+
+        Returns:
+            bool: 예산 이내 여부 (예산이 없으면 True)
+        """
+        report = self.get_report(top)
+
+        print("=== 시작 시간 프로파일 ===")
+        budget = f" (예산 {budget_ms:.0f}ms)" if budget_ms else ""
+        print(f"  전체: {report['total_ms']:.0f}ms{budget}, import: {report['import_ms']:.0f}ms ({report['modules']}개 모듈)")
+        if report['phases']:
+            print("  단계: " + ", ".join(f"{phase['name']} {phase['ms']:.0f}ms" for phase in report['phases']))
+        print("  느린 import (자체 / 누적):")
+        for entry in report['slowest']:
+            print(f"    {entry['module']:<40} {entry['self_ms']:8.1f}ms / {entry['cumulative_ms']:8.1f}ms")
+        print()
+
+        if budget_ms and report['total_ms'] > budget_ms:
+            print(f"⚠️  시작 시간 예산 초과: {report['total_ms']:.0f}ms > {budget_ms:.0f}ms")
+            return False
+        return True
@@ -0,0 +1,317 @@
+"""
+Streaming STT Session
+LocalAgreement 방식 스트리밍 디코딩 (부분 결과 지원)
+
+오디오 버퍼를 조금씩 늘려가며 반복 디코딩하고, 연속된 두 디코딩 결과가
+일치하는 앞부분(prefix)만 확정합니다. 확정되지 않은 꼬리는 부분 결과
+(is_final=False)로 내보내 화면의 진행 중인 줄을 갱신합니다.
+"""
+
+import re
+from typing import Dict, Any, List
+import numpy as np
+
+from services.base_stt import BaseSTTService
+
+
+# 문장 종료 판단 문자
+SENTENCE_END = ('.', '?', '!', '。')
+
+# 단어 비교 시 무시할 문장 부호
+_PUNCTUATION = re.compile(r"[^\w]+", re.UNICODE)
+
+
+def _normalize(word: str) -> str:
+    """단어 비교용 정규화 (문장 부호 제거, 소문자)"""
+    return _PUNCTUATION.sub('', word).lower()
+
+
+class HypothesisBuffer:
+    """
+    연속 디코딩 결과의 일치 구간 확정 버퍼
+
+    단어는 {'word', 'start', 'end', 'probability'} 딕셔너리이며,
+    시간은 스트림 시작 기준 절대 시각(초)입니다.
+    """
+
+    def __init__(self):
+        self.committed_in_buffer: List[Dict[str, Any]] = []
+        self.unconfirmed: List[Dict[str, Any]] = []
+        self.new: List[Dict[str, Any]] = []
+        self.last_committed_time = 0.0
+
+    def insert(self, words: List[Dict[str, Any]]):
+        """
+        새 디코딩 결과 추가
+
+        Args:
+            words: 절대 시각 단어 목록
+        """
+        # 이미 확정된 시점 이후의 단어만 사용
+        self.new = [w for w in words if w['start'] > self.last_committed_time - 0.1]
+
+        # 확정 단어와 새 결과 앞부분이 겹치면 (최대 5단어 n-gram) 제거
+        if self.new and abs(self.new[0]['start'] - self.last_committed_time) < 1.0 \
+                and self.committed_in_buffer:
+            max_n = min(len(self.committed_in_buffer), len(self.new), 5)
+            for n in range(1, max_n + 1):
+                committed_tail = [_normalize(w['word']) for w in self.committed_in_buffer[-n:]]
+                new_head = [_normalize(w['word']) for w in self.new[:n]]
+                if committed_tail == new_head:
+                    del self.new[:n]
+                    break
+
+    def flush(self) -> List[Dict[str, Any]]:
+        """
+        이전 결과와 일치하는 앞부분 확정
+
+        Returns:
+            List[Dict]: 새로 확정된 단어 목록
+        """
+        commit = []
+        while self.new and self.unconfirmed:
+            if _normalize(self.new[0]['word']) != _normalize(self.unconfirmed[0]['word']):
+                break
+            word = self.new.pop(0)
+            self.unconfirmed.pop(0)
+            commit.append(word)
+            self.last_committed_time = word['end']
+
+        self.unconfirmed = self.new
+        self.new = []
+        self.committed_in_buffer.extend(commit)
+        return commit
+
+    def pop_committed(self, time: float):
+        """
+        time 이전에 끝난 확정 단어 제거 (오디오 잘라낸 뒤)
+
+        Args:
+            time: 절대 시각 (초)
+        """
+        while self.committed_in_buffer and self.committed_in_buffer[0]['end'] <= time:
+            self.committed_in_buffer.pop(0)
+
+    def take_unconfirmed(self) -> List[Dict[str, Any]]:
+        """
+        미확정 단어를 모두 확정 처리하고 반환 (스트림 종료/버퍼 초과 시)
+
+        Returns:
+            List[Dict]: 미확정 단어 목록
+        """
+        words = self.unconfirmed
+        self.unconfirmed = []
+        if words:
+            self.last_committed_time = words[-1]['end']
+            self.committed_in_buffer.extend(words)
+        return words
+
+
+class LocalAgreementSession:
+    """LocalAgreement-2 스트리밍 STT 세션"""
+
+    def __init__(
+        self,
+        stt_service: BaseSTTService,
+        sample_rate: int = 16000,
+        min_step: float = 0.3,
+        max_buffer: float = 15.0,
+        max_line_words: int = 12,
+        prompt_chars: int = 200
+    ):
+        """
+        Args:
+            stt_service: 단어 타임스탬프를 지원하는 STT 서비스 (transcribe_words)
+            sample_rate: 샘플링 레이트
+            min_step: 재디코딩 사이에 필요한 새 오디오 길이 (초)
+            max_buffer: 디코딩 버퍼 최대 길이 (초, 초과 시 미확정 결과를 강제 확정)
+            max_line_words: 문장 종료 없이도 줄을 확정할 단어 수
+            prompt_chars: 디코딩 프롬프트로 넘길 이전 확정 텍스트 길이
+        """
+        if not stt_service.supports_word_timestamps:
+            raise ValueError(f"{stt_service.__class__.__name__} does not provide word timestamps")
+
+        self.stt_service = stt_service
+        self.sample_rate = sample_rate
+        self.min_step_samples = int(min_step * sample_rate)
+        self.max_buffer_samples = int(max_buffer * sample_rate)
+        self.max_line_words = max_line_words
+        self.prompt_chars = prompt_chars
+
+        # 디코딩 버퍼 (최대 길이 + 입력 1회분 여유)
+        self._audio = np.zeros(self.max_buffer_samples * 2, dtype=np.float32)
+        self._audio_len = 0
+        self._buffer_offset = 0.0
+        self._new_samples = 0
+
+        self.hypothesis = HypothesisBuffer()
+        self._line_words: List[Dict[str, Any]] = []
+        self._committed_text = ''
+        self._last_partial = ''
+
+        # 통계
+        self.decode_count = 0
+
+    @property
+    def buffer_duration(self) -> float:
+        """현재 디코딩 버퍼 길이 (초)"""
+        return self._audio_len / self.sample_rate
+
+    def insert_audio(self, audio_chunk: np.ndarray):
+        """
+        새 오디오 추가
+
+        Args:
+            audio_chunk: 이전 입력과 겹치지 않는 오디오 (float32, -1 to 1)
+        """
+        n = len(audio_chunk)
+        if self._audio_len + n > len(self._audio):
+            # 버퍼가 넘치면 가장 오래된 오디오부터 버림
+            self._drop_samples(self._audio_len + n - len(self._audio))
+
+        self._audio[self._audio_len:self._audio_len + n] = audio_chunk
+        self._audio_len += n
+        self._new_samples += n
+
+    def process_iter(self) -> List[Dict[str, Any]]:
+        """
+        새 오디오가 충분하면 재디코딩 후 결과 반환
+
+        Returns:
+            List[Dict]: 확정 결과(is_final=True) 및 부분 결과(is_final=False)
+        """
+        if self._new_samples < self.min_step_samples:
+            return []
+        self._new_samples = 0
+
+        words = self.stt_service.transcribe_words(
+            self._audio[:self._audio_len],
+            sample_rate=self.sample_rate,
+            prompt=self._committed_text[-self.prompt_chars:] or None
+        )
+        self.decode_count += 1
+
+        for word in words:
+            word['start'] += self._buffer_offset
+            word['end'] += self._buffer_offset
+
+        self.hypothesis.insert(words)
+        committed = self.hypothesis.flush()
+
+        # 합의가 나지 않은 채로 버퍼가 너무 길어지면 강제 확정
+        overflow = self._audio_len >= self.max_buffer_samples
+        if overflow:
+            committed += self.hypothesis.take_unconfirmed()
+
+        results = self._commit(committed, force=overflow)
+
+        # 확정할 단어가 없어도(무음 / 인식 없음) 최대 길이를 넘은 오디오는 버림
+        # (다음 단어가 걸쳐 있을 수 있는 마지막 min_step 분량만 남김)
+        if self._audio_len >= self.max_buffer_samples:
+            self._drop_samples(self._audio_len - self.min_step_samples)
+
+        pending = self._line_words + self.hypothesis.unconfirmed
+        pending_text = self._join(pending)
+        if pending_text != self._last_partial:
+            self._last_partial = pending_text
+            if pending_text:
+                results.append(self._make_result(pending, is_final=False))
+
+        return results
+
+    def finish(self) -> List[Dict[str, Any]]:
+        """
+        스트림 종료: 남은 오디오를 디코딩하고 미확정 결과까지 확정
+
+        Returns:
+            List[Dict]: 마지막 확정 결과
+        """
+        if self._new_samples > 0 and self._audio_len > 0:
+            self._new_samples = self.min_step_samples
+            self.process_iter()
+
+        results = self._commit(self.hypothesis.take_unconfirmed(), force=True)
+        self.reset()
+        return results
+
+    def reset(self):
+        """세션 상태 초기화"""
+        self._audio_len = 0
+        self._buffer_offset = 0.0
+        self._new_samples = 0
+        self.hypothesis = HypothesisBuffer()
+        self._line_words = []
+        self._committed_text = ''
+        self._last_partial = ''
+
+    def _commit(self, words: List[Dict[str, Any]], force: bool) -> List[Dict[str, Any]]:
+        """
+        확정 단어를 현재 줄에 추가하고, 줄이 끝나면 확정 결과로 반환
+
+        Args:
+            words: 새로 확정된 단어
+            force: 문장이 끝나지 않았어도 줄 확정
+
+        Returns:
+            List[Dict]: 확정 결과
+        """
+        self._line_words.extend(words)
+        if words:
+            self._committed_text = (self._committed_text + ' ' + self._join(words)).strip()
+
+        if not self._line_words:
+            return []
+
+        last_word = self._line_words[-1]['word'].strip()
+        if not (force or last_word.endswith(SENTENCE_END) or len(self._line_words) >= self.max_line_words):
+            return []
+
+        result = self._make_result(self._line_words, is_final=True)
+        line_end = self._line_words[-1]['end']
+        self._line_words = []
+        self._last_partial = ''
+
+        # 확정된 줄까지의 오디오 잘라내기
+        self._drop_samples(int(round((line_end - self._buffer_offset) * self.sample_rate)))
+        return [result]
+
+    def _drop_samples(self, count: int):
+        """
+        버퍼 앞쪽 오디오 버리기
+
+        Args:
+            count: 버릴 샘플 수
+        """
+        cut = max(0, min(count, self._audio_len))
+        if cut == 0:
+            return
+
+        remaining = self._audio_len - cut
+        self._audio[:remaining] = self._audio[cut:self._audio_len]
+        self._audio_len = remaining
+        self._buffer_offset += cut / self.sample_rate
+        self.hypothesis.pop_committed(self._buffer_offset)
+
+    @staticmethod
+    def _join(words: List[Dict[str, Any]]) -> str:
+        """단어 목록을 텍스트로 결합"""
+        return ''.join(w['word'] for w in words).strip()
+
+    def _make_result(self, words: List[Dict[str, Any]], is_final: bool) -> Dict[str, Any]:
+        """
+        transcribe_stream()과 같은 형식의 결과 생성
+
+        Args:
+            words: 결과에 포함할 단어
+            is_final: 확정 여부
+
+        Returns:
+            Dict: STT 결과
+        """
+        probs = [w.get('probability', 0.0) for w in words]
+        return {
+            'text': self._join(words),
+            'confidence': float(np.mean(probs)) if probs else 0.0,
+            'is_final': is_final,
+            'timestamp': float(words[0]['start']) if words else self._buffer_offset
+        }
@@ -0,0 +1,150 @@
+"""
+Subtitle Writer
+시간 정보가 있는 자막(큐)을 SRT / WebVTT / JSON Lines로 기록
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Dict, Any, List
+
+
+SUBTITLE_FORMATS = ('srt', 'vtt', 'jsonl')
+
+# 자막 줄 구성: both (원문 + 번역), source (원문), translation (번역)
+SUBTITLE_TEXT_MODES = ('both', 'source', 'translation')
+
+
+def format_timestamp(seconds: float, separator: str = ',') -> str:
+    """
+    자막 시각 문자열 (HH:MM:SS,mmm)
+
+    Args:
+        seconds: 시각 (초)
+        separator: 밀리초 구분자 (SRT ',', WebVTT '.')
+
+    Returns:
+        str: 시각 문자열
+    """
+    millis = int(round(max(0.0, seconds) * 1000))
+    hours, millis = divmod(millis, 3600000)
+    minutes, millis = divmod(millis, 60000)
+    secs, millis = divmod(millis, 1000)
+    return f"{hours:02d}:{minutes:02d}:{secs:02d}{separator}{millis:03d}"
+
+
+def cue_text(cue: Dict[str, Any], text_mode: str = 'both') -> str:
+    """
+    큐 표시 텍스트
+
+    Args:
+        cue: {start, end, korean, english, ...}
+        text_mode: 'both', 'source', 'translation'
+
+    Returns:
+        str: 자막 텍스트 (여러 줄 가능)
+    """
+    if text_mode == 'source':
+        lines = [cue['korean']]
+    elif text_mode == 'translation':
+        lines = [cue.get('english') or cue['korean']]
+    else:
+        lines = [cue['korean'], cue.get('english', '')]
+    return "\n".join(line for line in lines if line)
+
+
+def format_srt(cues: List[Dict[str, Any]], text_mode: str = 'both') -> str:
+    """
+    SRT 문서 생성
+
+    Args:
+        cues: 시간 순서 큐 목록
+        text_mode: 자막 줄 구성
+
+    Returns:
+        str: SRT 문서
+    """
+    blocks = []
+    for index, cue in enumerate(cues, 1):
+        blocks.append(
+            f"{index}\n"
+            f"{format_timestamp(cue['start'])} --> {format_timestamp(cue['end'])}\n"
+            f"{cue_text(cue, text_mode)}\n"
+        )
+    return "\n".join(blocks)
+
+
+def format_vtt(cues: List[Dict[str, Any]], text_mode: str = 'both') -> str:
+    """
+    WebVTT 문서 생성
+
+    Args:
+        cues: 시간 순서 큐 목록
+        text_mode: 자막 줄 구성
+
+    Returns:
+        str: WebVTT 문서
+    """
+    blocks = ["WEBVTT\n"]
+    for cue in cues:
+        blocks.append(
+            f"{format_timestamp(cue['start'], '.')} --> {format_timestamp(cue['end'], '.')}\n"
+            f"{cue_text(cue, text_mode)}\n"
+        )
+    return "\n".join(blocks)
+
+
+def format_jsonl(cues: List[Dict[str, Any]]) -> str:
+    """
+    JSON Lines 문서 생성 (큐 1개당 1줄)
+
+    Args:
+        cues: 시간 순서 큐 목록
+
+    Returns:
+        str: JSON Lines 문서
+    """
+    return "".join(json.dumps(cue, ensure_ascii=False) + "\n" for cue in cues)
+
+
+def write_atomic(path: Path, content: str):
+    """임시 파일에 쓴 뒤 교체 (중단 시 반쯤 쓴 파일이 남지 않음)"""
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write(content)
+    os.replace(tmp_path, path)
+
+
+def write_subtitles(
+    cues: List[Dict[str, Any]],
+    output_base: Path,
+    formats=SUBTITLE_FORMATS,
+    text_mode: str = 'both'
+) -> List[str]:
+    """
+    큐 목록을 여러 형식으로 저장
+
+    Args:
+        cues: 시간 순서 큐 목록
+        output_base: 확장자를 뺀 출력 경로
+        formats: 저장할 형식 ('srt', 'vtt', 'jsonl')
+        text_mode: SRT / WebVTT 자막 줄 구성
+
+    Returns:
+        List[str]: 저장한 파일 경로
+    """
+    paths = []
+    for fmt in formats:
+        if fmt == 'srt':
+            content = format_srt(cues, text_mode)
+        elif fmt == 'vtt':
+            content = format_vtt(cues, text_mode)
+        elif fmt == 'jsonl':
+            content = format_jsonl(cues)
+        else:
+            raise ValueError(f"Unknown subtitle format: {fmt}")
+
+        path = output_base.with_name(f"{output_base.name}.{fmt}")
+        write_atomic(path, content)
+        paths.append(str(path))
+    return paths
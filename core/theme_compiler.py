@@ -0,0 +1,203 @@
+"""
+Theme Compiler
+테마 검증 및 컴파일 (색상 / 글꼴을 Qt 객체로 변환, 스타일시트 생성)
+
+ThemeManager.compile_theme()이 테마 내용 해시별로 한 번만 컴파일해 캐시하고,
+렌더러는 중첩 dict를 다시 읽는 대신 컴파일된 값을 그대로 사용합니다.
+"""
+
+import hashlib
+import json
+from typing import Dict, Any, List
+
+from PyQt5.QtCore import Qt
+from PyQt5.QtGui import QColor, QFont
+
+
+ALIGNMENTS = {'left': Qt.AlignLeft, 'center': Qt.AlignCenter, 'right': Qt.AlignRight}
+
+# 언어별 기본값 (테마에 없는 항목)
+CAPTION_DEFAULTS = {
+    'korean': {'font_size': 24, 'color': '#FFFFFF', 'stroke_width': 3},
+    'english': {'font_size': 20, 'color': '#FFFF00', 'stroke_width': 2}
+}
+
+
+def theme_hash(theme_data: Dict[str, Any]) -> str:
+    """
+    테마 내용 해시 (키 순서와 무관)
+
+    Args:
+        theme_data: 테마 데이터
+
+    Returns:
+        str: SHA-1 hex
+    """
+    encoded = json.dumps(theme_data, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha1(encoded.encode('utf-8')).hexdigest()
+
+
+def _section(config: Dict[str, Any], key: str, path: str, errors: List[str]) -> Dict[str, Any]:
+    """하위 설정 dict (없으면 빈 dict, dict가 아니면 오류 기록)"""
+    value = config.get(key)
+    if value is None:
+        return {}
+    if not isinstance(value, dict):
+        errors.append(f"{path}{key}: dict가 아닙니다")
+        return {}
+    return value
+
+
+def _color(value: Any, path: str, errors: List[str]) -> QColor:
+    """색상 문자열 → QColor (#RGB, #RRGGBB, 색 이름)"""
+    color = QColor(str(value))
+    if not color.isValid():
+        errors.append(f"{path}: 잘못된 색상 {value!r}")
+        return QColor(0, 0, 0)
+    return color
+
+
+def _number(value: Any, path: str, errors: List[str], minimum: float = 0, maximum: float = None):
+    """숫자 범위 확인 (잘못되면 오류 기록 후 minimum 반환)"""
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        errors.append(f"{path}: 숫자가 아닙니다 ({value!r})")
+        return minimum
+    if value < minimum or (maximum is not None and value > maximum):
+        errors.append(f"{path}: 범위를 벗어났습니다 ({value})")
+        return minimum
+    return value
+
+
+class CaptionStyle:
+    """언어별 자막 스타일 (컴파일 결과)"""
+
+    def __init__(self, config: Dict[str, Any], language: str, errors: List[str]):
+        """
+        Args:
+            config: 테마 caption.<language> 설정
+            language: 'korean' 또는 'english'
+            errors: 검증 오류 목록 (추가됨)
+        """
+        defaults = CAPTION_DEFAULTS[language]
+        path = f"caption.{language}"
+
+        self.family = str(config.get('font_family', 'Arial'))
+        self.size = int(_number(config.get('font_size', defaults['font_size']), f"{path}.font_size", errors, 1))
+        self.bold = config.get('font_weight') == 'bold'
+        self.color = _color(config.get('color', defaults['color']), f"{path}.color", errors)
+
+        alignment = config.get('alignment', 'left')
+        if alignment not in ALIGNMENTS:
+            errors.append(f"{path}.alignment: left / center / right 중 하나여야 합니다 ({alignment!r})")
+        self.alignment = ALIGNMENTS.get(alignment, Qt.AlignLeft)
+
+        # 외곽선 (투명 오버레이)
+        self.stroke_width = int(_number(
+            config.get('stroke_width', defaults['stroke_width']), f"{path}.stroke_width", errors
+        ))
+        self.stroke_color = _color(config.get('stroke_color', '#000000'), f"{path}.stroke_color", errors)
+
+        self.font = QFont(self.family)
+        self.font.setPixelSize(self.size)
+        self.font.setBold(self.bold)
+
+    def label_rule(self, object_name: str) -> str:
+        """QLabel 스타일시트 규칙"""
+        return f"""
+            QLabel#{object_name} {{
+                color: {self.color.name()};
+                font-size: {self.size}px;
+                font-family: "{self.family}";
+                font-weight: {'bold' if self.bold else 'normal'};
+                background: transparent;
+            }}
+        """
+
+
+class CompiledTheme:
+    """검증 / 변환을 마친 테마 (렌더러끼리 공유하므로 값을 수정하지 말 것)"""
+
+    def __init__(self, theme_data: Dict[str, Any], key: str):
+        """
+        Args:
+            theme_data: 테마 데이터 (YAML)
+            key: 테마 내용 해시
+
+        Raises:
+            ValueError: 검증 실패 (모든 오류를 한 번에 나열)
+        """
+        if not isinstance(theme_data, dict):
+            raise ValueError("테마 데이터가 dict가 아닙니다")
+
+        errors: List[str] = []
+        self.key = key
+        self.config = theme_data
+
+        meta = _section(theme_data, 'theme', '', errors)
+        self.name = meta.get('name', '')
+        self.renderer = meta.get('renderer', 'PanelRenderer')
+
+        # 배경 (색상 + 투명도)
+        background = _section(theme_data, 'background', '', errors)
+        self.background = _color(background.get('color', '#000000'), 'background.color', errors)
+        self.background.setAlpha(int(_number(
+            background.get('opacity', 0.7), 'background.opacity', errors, 0, 1
+        ) * 255))
+        self.border_radius = _number(background.get('border_radius', 0), 'background.border_radius', errors)
+
+        # 자막
+        caption = _section(theme_data, 'caption', '', errors)
+        self.korean = CaptionStyle(_section(caption, 'korean', 'caption.', errors), 'korean', errors)
+        self.english = CaptionStyle(_section(caption, 'english', 'caption.', errors), 'english', errors)
+        self.max_lines = int(_number(caption.get('max_lines', 10), 'caption.max_lines', errors, 1))
+        self.fade_duration = _number(caption.get('fade_duration', 0.5), 'caption.fade_duration', errors)
+
+        # 창 / 레이아웃 (기본값이 렌더러마다 달라 형식만 확인)
+        self.window = _section(theme_data, 'window', '', errors)
+        self.layout = _section(theme_data, 'layout', '', errors)
+        for key_name in ('padding', 'spacing'):
+            if key_name in self.layout:
+                _number(self.layout[key_name], f"layout.{key_name}", errors)
+
+        if errors:
+            raise ValueError(f"테마 '{self.name or key[:8]}' 검증 실패: " + "; ".join(errors))
+
+        # 스타일시트 (패널 / 기록 / 뉴스 자막형, 투명 오버레이)
+        labels = self.korean.label_rule('KoreanCaption') + self.english.label_rule('EnglishCaption')
+        background_rgba = (
+            f"rgba({self.background.red()}, {self.background.green()}, "
+            f"{self.background.blue()}, {self.background.alpha()})"
+        )
+        self.stylesheet = f"""
+            QWidget#CaptionWidget {{
+                background-color: {background_rgba};
+                border-radius: {self.border_radius}px;
+            }}
+            {labels}
+            QScrollArea {{
+                border: none;
+                background: transparent;
+            }}
+
+            QScrollBar:vertical {{
+                background: transparent;
+                width: 10px;
+                margin: 0px;
+            }}
+
+            QScrollBar::handle:vertical {{
+                background: rgba(255, 255, 255, 0.3);
+                border-radius: 5px;
+                min-height: 20px;
+            }}
+
+            QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {{
+                height: 0px;
+            }}
+        """
+        self.overlay_stylesheet = f"""
+            QWidget#CaptionWidget {{
+                background: transparent;
+            }}
+            {labels}
+        """
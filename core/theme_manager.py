@@ -9,7 +9,7 @@ PyInstaller 환경에서의 파일 경로 처리:
 
 import yaml
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Union
 import sys
 
 
@@ -51,6 +51,9 @@ class ThemeManager:
         self.themes: Dict[str, Dict[str, Any]] = {}
         self.current_theme: Optional[str] = None
         self.themes_dir: Path = get_resource_path("themes")
+        
+        # 컴파일된 테마 (테마 내용 해시 → CompiledTheme)
+        self._compiled: Dict[str, Any] = {}
         self._initialized = True
     
     def load_themes(self, themes_dir: str = "themes"):
@@ -92,6 +95,36 @@ class ThemeManager:
         """
         return self.themes.get(theme_name)
     
+    def compile_theme(self, theme: Union[str, Dict[str, Any]]):
+        """
+        테마 컴파일 (검증, 색상 / 글꼴 변환, 스타일시트 생성)
+        
+        같은 내용의 테마는 한 번만 컴파일하고 내용 해시로 캐시하므로
+        설정 변경으로 테마 데이터가 바뀌면 다음 호출에서 다시 컴파일합니다.
+        
+        Args:
+            theme: 테마 이름 또는 테마 데이터
+            
+        Returns:
+            CompiledTheme: 컴파일된 테마
+            
+        Raises:
+            ValueError: 테마가 없거나 검증 실패
+        """
+        # Qt 의존 모듈이므로 필요할 때 import (엔진 / CLI 경로는 테마를 쓰지 않음)
+        from core.theme_compiler import CompiledTheme, theme_hash
+        
+        theme_data = self.themes.get(theme) if isinstance(theme, str) else theme
+        if theme_data is None:
+            raise ValueError(f"테마를 찾을 수 없습니다: {theme}")
+        
+        key = theme_hash(theme_data)
+        compiled = self._compiled.get(key)
+        if compiled is None:
+            compiled = CompiledTheme(theme_data, key)
+            self._compiled[key] = compiled
+        return compiled
+    
     def set_current_theme(self, theme_name: str) -> bool:
         """
         현재 테마 설정
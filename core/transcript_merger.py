@@ -0,0 +1,154 @@
+"""
+Transcript Merger
+오버랩 청크의 중복 인식 결과 제거
+
+연속 청크는 오디오가 겹치므로 같은 단어가 두 번 인식됩니다. 단어
+타임스탬프가 있으면 오버랩 구간에 속한 단어를 시간으로 잘라내고, 없으면
+이전 청크 끝과 새 청크 앞의 가장 긴 공통 단어열을 찾아 잘라냅니다.
+"""
+
+import re
+from difflib import SequenceMatcher
+from typing import Dict, Any, List, Optional
+
+
+# 단어 비교 시 무시할 문장 부호
+_PUNCTUATION = re.compile(r"[^\w]+", re.UNICODE)
+
+
+def _normalize(token: str) -> str:
+    """단어 비교용 정규화 (문장 부호 제거, 소문자)"""
+    return _PUNCTUATION.sub('', token).lower()
+
+
+class TranscriptMerger:
+    """오버랩 청크 인식 결과 병합기"""
+
+    def __init__(
+        self,
+        overlap_seconds: Optional[float] = None,
+        search_words: int = 20,
+        max_lead_words: int = 2,
+        min_match_words: int = 2
+    ):
+        """
+        Args:
+            overlap_seconds: 연속 청크 간 고정 오버랩 (초, None=고정 오버랩 없음 → 텍스트 비교만 사용)
+            search_words: 텍스트 비교 시 이전 청크 끝 / 새 청크 앞에서 볼 단어 수
+            max_lead_words: 일치 구간 앞에 허용할 새 청크 단어 수 (경계에서 잘린 단어)
+            min_match_words: 중복으로 판정할 최소 일치 단어 수 (두 청크의 경계에서 바로 이어지는 일치는 예외)
+        """
+        self.overlap_seconds = overlap_seconds
+        self.search_words = search_words
+        self.max_lead_words = max_lead_words
+        self.min_match_words = min_match_words
+
+        # 이전 청크 인식 결과 (정규화된 단어)
+        self._previous: List[str] = []
+
+        # 통계
+        self.chunks = 0
+        self.duplicate_words = 0
+        self.suppressed_results = 0
+        self.timestamp_merges = 0
+        self.text_merges = 0
+
+    def merge_chunk(self, results: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        청크 1개의 STT 결과에서 이전 청크와 겹치는 부분 제거
+
+        Args:
+            results: transcribe_stream() 결과 목록 (청크 기준 시각, 'words' 선택)
+
+        Returns:
+            List[Dict]: 새 텍스트만 남긴 결과 목록 (빈 결과 제외)
+        """
+        self.chunks += 1
+        results = [r for r in results if r.get('text', '').strip()]
+
+        if self.overlap_seconds and results and all(r.get('words') for r in results):
+            merged = self._merge_by_timestamps(results)
+        else:
+            merged = self._merge_by_text(results)
+
+        # 다음 청크 비교용으로 이번 청크 전체 단어 보관
+        self._previous = [
+            _normalize(token)
+            for result in results for token in result['text'].split()
+        ][-self.search_words:]
+
+        self.suppressed_results += len(results) - len(merged)
+        return merged
+
+    def _merge_by_timestamps(self, results: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """오버랩 구간(중심 시각 기준)에 속한 단어 제거"""
+        merged = []
+        dropped = 0
+        for result in results:
+            words = [w for w in result['words'] if (w['start'] + w['end']) / 2 >= self.overlap_seconds]
+            dropped += len(result['words']) - len(words)
+            if len(words) == len(result['words']):
+                merged.append(result)
+            elif words:
+                merged.append({
+                    **result,
+                    'text': ''.join(w['word'] for w in words).strip(),
+                    'timestamp': words[0]['start'],
+                    'words': words
+                })
+
+        if dropped:
+            self.timestamp_merges += 1
+            self.duplicate_words += dropped
+        return merged
+
+    def _merge_by_text(self, results: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """이전 청크 끝과 가장 길게 일치하는 앞부분 제거"""
+        if not self._previous or not results:
+            return results
+
+        tokens = [(i, token) for i, result in enumerate(results) for token in result['text'].split()]
+        head = [_normalize(token) for _, token in tokens[:self.search_words]]
+
+        match = SequenceMatcher(None, self._previous, head, autojunk=False) \
+            .find_longest_match(0, len(self._previous), 0, len(head))
+
+        # 이전 청크의 마지막 단어에서 끝나고 새 청크의 첫 단어에서 시작하는 일치는 1단어여도 중복으로 판정
+        # (앞에 다른 단어가 있으면 "… 네" → "아 그래요 네 …"처럼 실제 발화일 수 있음)
+        anchored = match.size > 0 and match.b == 0 and match.a + match.size == len(self._previous)
+        if match.b > self.max_lead_words or \
+                (match.size < min(self.min_match_words, len(head)) and not anchored):
+            return results
+
+        # 일치 구간 끝까지 제거 (앞쪽의 잘린 단어 포함)
+        drop = match.b + match.size
+        self.text_merges += 1
+        self.duplicate_words += drop
+
+        merged = []
+        for i, result in enumerate(results):
+            kept = [token for j, (index, token) in enumerate(tokens) if index == i and j >= drop]
+            if len(kept) == len(result['text'].split()):
+                merged.append(result)
+            elif kept:
+                merged.append({**result, 'text': ' '.join(kept)})
+        return merged
+
+    def reset(self):
+        """스트림 상태 초기화 (통계 유지)"""
+        self._previous = []
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        병합 통계
+
+        Returns:
+            Dict: 제거된 중복 단어 수, 통째로 제거된 결과 수, 병합 방식별 횟수
+        """
+        return {
+            'chunks': self.chunks,
+            'duplicate_words': self.duplicate_words,
+            'suppressed_results': self.suppressed_results,
+            'timestamp_merges': self.timestamp_merges,
+            'text_merges': self.text_merges
+        }
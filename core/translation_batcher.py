@@ -0,0 +1,217 @@
+"""
+Translation Batcher
+번역 요청 마이크로 배칭
+
+여러 워커가 동시에 보낸 번역 요청을 짧은 대기 시간(max_wait_ms) 또는 최대
+개수(max_batch) 중 먼저 도달하는 조건까지 모아 translate_batch() 한 번으로
+처리합니다. 패딩된 generate() 1회로 여러 문장을 번역하므로 호출당 고정
+오버헤드가 줄어듭니다. 대기 중인 다른 요청이 없으면 기다리지 않고 바로
+처리합니다 (실시간 자막은 보통 한 번에 1개씩 도착).
+"""
+
+import queue
+import threading
+import time
+from bisect import bisect_left
+from collections import Counter
+from concurrent.futures import Future
+from typing import Dict, Any, List, Optional, Tuple
+
+from services.base_translation import BaseTranslationService
+
+
+# 대기 시간 히스토그램 구간 상한 (밀리초)
+WAIT_BUCKETS_MS = (5, 10, 25, 50, 100, 150, 250, 500)
+
+
+class BatchingTranslator:
+    """마이크로 배칭 번역기 (translate() 호환)"""
+
+    def __init__(
+        self,
+        translation_service: BaseTranslationService,
+        max_batch: int = 8,
+        max_wait_ms: float = 100.0
+    ):
+        """
+        Args:
+            translation_service: 초기화된 번역 서비스 (translate_batch 사용)
+            max_batch: 배치 최대 문장 수
+            max_wait_ms: 첫 요청 이후 배치를 모으는 최대 시간 (밀리초, 다른 요청이 대기 중일 때만)
+        """
+        self.translation_service = translation_service
+        self.max_batch = max_batch
+        self.max_wait = max_wait_ms / 1000
+
+        self._requests: queue.Queue = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._running = False
+        
+        # submit()과 stop() 직렬화 (종료 표시 뒤에 들어온 요청이 처리되지 않고 남지 않도록)
+        self._submit_lock = threading.Lock()
+
+        # 통계
+        self._lock = threading.Lock()
+        self.batches = 0
+        self.items = 0
+        self.batch_sizes: Counter = Counter()
+        self.wait_histogram = [0] * (len(WAIT_BUCKETS_MS) + 1)
+
+    def start(self):
+        """배치 스레드 시작"""
+        if self._running:
+            return
+        self._running = True
+        self._thread = threading.Thread(target=self._batch_loop, name="translation-batcher", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 3.0):
+        """
+        배치 스레드 종료 (대기 중인 요청은 처리 후 종료)
+        
+        배치 스레드가 제시간에 끝나지 않으면 남은 요청은 예외로 실패시킵니다.
+        
+        Args:
+            timeout: 배치 스레드 종료 대기 시간 (초)
+        """
+        with self._submit_lock:
+            if not self._running:
+                return
+            self._running = False
+            self._requests.put(None)
+        
+        thread, self._thread = self._thread, None
+        if thread:
+            thread.join(timeout=timeout)
+        
+        # 처리되지 못한 요청 실패 처리 (결과를 기다리는 호출자가 멈추지 않도록)
+        error = RuntimeError("번역 배치 스레드가 종료되었습니다")
+        while True:
+            try:
+                request = self._requests.get_nowait()
+            except queue.Empty:
+                break
+            if request is not None:
+                _, _, future = request
+                future.set_exception(error)
+        
+        # 배치 처리 중에 멈춘 스레드는 현재 배치 후 종료되도록 종료 표시를 다시 넣음
+        if thread and thread.is_alive():
+            self._requests.put(None)
+
+    def submit(self, text: str) -> Future:
+        """
+        번역 요청 (비동기)
+
+        Args:
+            text: 번역할 텍스트
+
+        Returns:
+            Future: translate()와 같은 형식의 결과
+            
+        Raises:
+            RuntimeError: 배치 스레드가 실행 중이 아님 (start() 전 / stop() 후)
+        """
+        future = Future()
+        with self._submit_lock:
+            if not self._running:
+                raise RuntimeError("번역 배치 스레드가 실행 중이 아닙니다")
+            self._requests.put((text, time.perf_counter(), future))
+        return future
+
+    def translate(self, text: str) -> Dict[str, Any]:
+        """
+        번역 (배치 처리가 끝날 때까지 블록)
+
+        Args:
+            text: 번역할 텍스트
+
+        Returns:
+            Dict: 번역 결과 (BaseTranslationService.translate()와 같은 형식)
+        """
+        if not self._running:
+            return self.translation_service.translate(text)
+
+        # 캐시 적중은 배치 대기 없이 바로 반환
+        cached = self.translation_service.get_cached(text)
+        if cached is not None:
+            return cached
+        
+        try:
+            future = self.submit(text)
+        except RuntimeError:
+            # 확인 직후 stop()된 경우
+            return self.translation_service.translate(text)
+        return future.result()
+
+    def _batch_loop(self):
+        """배치 수집 및 처리 루프"""
+        while True:
+            first = self._requests.get()
+            if first is None:
+                break
+
+            batch = [first]
+            stop = False
+            
+            # 대기 중인 다른 요청이 없으면 바로 처리 (혼자 온 요청을 max_wait만큼 붙잡지 않음)
+            wait = self.max_wait if not self._requests.empty() else 0.0
+            deadline = time.perf_counter() + wait
+
+            while len(batch) < self.max_batch:
+                remaining = deadline - time.perf_counter()
+                if remaining <= 0:
+                    break
+                try:
+                    request = self._requests.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if request is None:
+                    stop = True
+                    break
+                batch.append(request)
+
+            self._run_batch(batch)
+            if stop:
+                break
+
+    def _run_batch(self, batch: List[Tuple[str, float, Future]]):
+        """배치 번역 후 각 요청의 Future에 결과 전달"""
+        started = time.perf_counter()
+        self._record(len(batch), [started - submitted for _, submitted, _ in batch])
+
+        try:
+            results = self.translation_service.translate_batch([text for text, _, _ in batch])
+        except Exception as e:
+            for _, _, future in batch:
+                future.set_exception(e)
+            return
+
+        for (_, _, future), result in zip(batch, results):
+            future.set_result(result)
+
+    def _record(self, size: int, waits: List[float]):
+        """배치 크기 및 대기 시간 기록"""
+        with self._lock:
+            self.batches += 1
+            self.items += size
+            self.batch_sizes[size] += 1
+            for wait in waits:
+                self.wait_histogram[bisect_left(WAIT_BUCKETS_MS, wait * 1000)] += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        배칭 통계
+
+        Returns:
+            Dict: 배치 수, 평균 배치 크기, 배치 크기 / 대기 시간 히스토그램
+        """
+        with self._lock:
+            wait_labels = [f"<={bound}ms" for bound in WAIT_BUCKETS_MS] + [f">{WAIT_BUCKETS_MS[-1]}ms"]
+            return {
+                'batches': self.batches,
+                'items': self.items,
+                'mean_batch_size': self.items / self.batches if self.batches else 0.0,
+                'batch_size_histogram': dict(sorted(self.batch_sizes.items())),
+                'wait_histogram': dict(zip(wait_labels, self.wait_histogram))
+            }
@@ -0,0 +1,128 @@
+"""
+Voice Activity Gate
+STT 큐 앞단에서 무음 청크를 걸러내는 스트리밍 VAD 게이트
+"""
+
+from collections import deque
+from typing import Dict, Any
+import numpy as np
+
+from services.base_vad import BaseVADService
+
+
+class VoiceActivityGate:
+    """
+    스트리밍 VAD 게이트
+
+    연속 청크는 overlap_size 샘플만큼 겹치므로, 각 청크에서 새로 들어온
+    부분만 VAD에 넣고 겹치는 부분은 이전 판정을 재사용합니다. 프레임 경계에
+    걸친 나머지 샘플과 행오버(음성 종료 후 유지 시간)는 청크 간에 이어집니다.
+    """
+
+    def __init__(
+        self,
+        vad: BaseVADService,
+        overlap_size: int = 0,
+        threshold: float = 0.5,
+        hangover_ms: float = 300.0
+    ):
+        """
+        Args:
+            vad: 초기화된 VAD 서비스
+            overlap_size: 연속 청크 간 오버랩 (샘플 수)
+            threshold: 음성 판정 확률 임계값
+            hangover_ms: 음성 종료 후 음성으로 유지할 시간 (밀리초)
+        """
+        self.vad = vad
+        self.overlap_size = overlap_size
+        self.threshold = threshold
+        self.frame_size = vad.frame_size
+        self.hangover_frames = int(hangover_ms / 1000 * vad.sample_rate / self.frame_size)
+
+        # 오버랩 구간을 덮는 최근 프레임 판정
+        overlap_frames = -(-overlap_size // self.frame_size)
+        self._recent = deque(maxlen=max(overlap_frames, 1))
+
+        # 청크 간 이어지는 상태
+        self._remainder = np.zeros(0, dtype=np.float32)
+        self._hangover = 0
+        self._has_previous = False
+
+        # 통계 (새로 들어온 샘플 기준)
+        self.windows_total = 0
+        self.windows_dropped = 0
+        self.samples_total = 0
+        self.samples_suppressed = 0
+
+    def process(self, audio_chunk: np.ndarray) -> bool:
+        """
+        청크 판정
+
+        Args:
+            audio_chunk: 오디오 청크 (float32, -1 to 1)
+
+        Returns:
+            bool: STT로 넘길지 여부 (False=무음 청크)
+        """
+        # 이전 청크와 겹치지 않는 새 샘플
+        new_samples = audio_chunk[self.overlap_size:] if self._has_previous else audio_chunk
+        self._has_previous = True
+
+        # 오버랩 구간의 이전 판정
+        overlap_speech = self.overlap_size > 0 and any(self._recent)
+
+        # 새 샘플을 프레임 단위로 판정
+        samples = np.concatenate([self._remainder, new_samples])
+        n_frames = len(samples) // self.frame_size
+        used = n_frames * self.frame_size
+        self._remainder = samples[used:]
+
+        new_speech = False
+        if n_frames:
+            frames = samples[:used].reshape(n_frames, self.frame_size)
+            probs = self.vad.process_frames(frames)
+
+            for prob in probs:
+                if prob >= self.threshold:
+                    self._hangover = self.hangover_frames
+                    is_speech = True
+                elif self._hangover > 0:
+                    self._hangover -= 1
+                    is_speech = True
+                else:
+                    is_speech = False
+
+                self._recent.append(is_speech)
+                new_speech = new_speech or is_speech
+
+        has_speech = overlap_speech or new_speech
+
+        self.windows_total += 1
+        self.samples_total += len(new_samples)
+        if not has_speech:
+            self.windows_dropped += 1
+            self.samples_suppressed += len(new_samples)
+
+        return has_speech
+
+    def reset(self):
+        """스트림 상태 초기화 (통계 유지)"""
+        self.vad.reset()
+        self._recent.clear()
+        self._remainder = np.zeros(0, dtype=np.float32)
+        self._hangover = 0
+        self._has_previous = False
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        게이트 통계
+
+        Returns:
+            Dict: 처리/차단 청크 수, 차단된 오디오 비율
+        """
+        return {
+            'backend': self.vad.__class__.__name__,
+            'windows_total': self.windows_total,
+            'windows_dropped': self.windows_dropped,
+            'suppressed_ratio': self.samples_suppressed / self.samples_total if self.samples_total else 0.0
+        }
@@ -4,9 +4,10 @@ Live Caption Application
 """
 
 import sys
-from typing import Optional, Dict, Any
-from PyQt5.QtWidgets import QApplication
-from PyQt5.QtCore import QTimer, Qt
+import threading
+from typing import Optional, Dict, Any, List, Callable
+from PyQt5.QtWidgets import QApplication, QSystemTrayIcon
+from PyQt5.QtCore import QObject, QTimer, Qt, pyqtSignal
 
 from core.controller import CaptionController
 from core.config_manager import ConfigManager
@@ -15,6 +16,113 @@ from gui.settings_window import SettingsWindow
 from gui.system_tray import SystemTray
 
 
+# 모델 로드 진행 표시 이름
+COMPONENT_LABELS = {'audio': '오디오', 'stt': 'STT', 'translation': '번역'}
+
+
+class ControllerBridge(QObject):
+    """
+    컨트롤러 스레드 이벤트를 Qt 메인 스레드로 전달 (스레드 간 queued 시그널)
+    
+    자막은 버퍼에 모았다가 고정 UI 주기(기본 30Hz)마다 한 묶음으로 전달합니다.
+    자막마다 타이머/클로저를 만들지 않고, STT 출력이 몰려도 이벤트 루프에는
+    주기당 한 번만 그립니다. 유휴 상태에서는 타이머가 멈춰 있고, 첫 자막은
+    기다리지 않고 바로 전달됩니다.
+    """
+    
+    # 모델 로드 진행 (구성 요소, 상태, 경과 초)
+    load_progress = pyqtSignal(str, str, float)
+    
+    # 초기화 완료 (성공 여부)
+    load_finished = pyqtSignal(bool)
+    
+    # STT 모델 교체 완료 (성공 여부)
+    profile_swapped = pyqtSignal(bool)
+    
+    # 자막 버퍼가 비어 있다가 채워짐 (내부용, 주기 타이머 시작)
+    _captions_pending = pyqtSignal()
+    
+    def __init__(self, tick_hz: float = 30.0, parent: Optional[QObject] = None):
+        """
+        Args:
+            tick_hz: 자막 묶음 전달 주기 (Hz)
+            parent: 부모 QObject
+        """
+        super().__init__(parent)
+        
+        # 자막 묶음 수신 (Qt 메인 스레드에서 호출)
+        self.on_captions: Optional[Callable[[List[Dict[str, Any]]], None]] = None
+        
+        self._captions: List[Dict[str, Any]] = []
+        self._lock = threading.Lock()
+        self._scheduled = False
+        
+        self._timer = QTimer(self)
+        self._timer.setInterval(max(1, int(1000 / tick_hz)))
+        self._timer.timeout.connect(self._drain)
+        self._captions_pending.connect(self._on_captions_pending, Qt.QueuedConnection)
+        
+        # 통계
+        self.captions_delivered = 0
+        self.batches = 0
+        self.max_batch = 0
+    
+    def push_caption(self, caption_data: Dict[str, Any]):
+        """
+        자막 버퍼에 추가 (컨트롤러 스레드에서 호출)
+        
+        Args:
+            caption_data: 자막 데이터
+        """
+        with self._lock:
+            self._captions.append(caption_data)
+            if self._scheduled:
+                return
+            self._scheduled = True
+        self._captions_pending.emit()
+    
+    def _on_captions_pending(self):
+        """유휴 후 첫 자막: 바로 전달하고 주기 타이머 시작 (Qt 메인 스레드)"""
+        if not self._timer.isActive():
+            self._timer.start()
+            self._drain()
+    
+    def _drain(self):
+        """지난 주기 이후 도착한 자막을 한 묶음으로 전달 (Qt 메인 스레드)"""
+        with self._lock:
+            batch, self._captions = self._captions, []
+            if not batch:
+                # 한 주기 동안 자막이 없으면 타이머 정지 (다음 push_caption()이 다시 시작)
+                self._scheduled = False
+                self._timer.stop()
+                return
+        
+        self.captions_delivered += len(batch)
+        self.batches += 1
+        self.max_batch = max(self.max_batch, len(batch))
+        
+        if self.on_captions:
+            self.on_captions(batch)
+    
+    def flush(self):
+        """남은 자막 즉시 전달 (Qt 메인 스레드)"""
+        self._drain()
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        자막 전달 통계
+        
+        Returns:
+            Dict: {'captions', 'batches', 'max_batch', 'tick_ms'}
+        """
+        return {
+            'captions': self.captions_delivered,
+            'batches': self.batches,
+            'max_batch': self.max_batch,
+            'tick_ms': self._timer.interval()
+        }
+
+
 class LiveCaptionApp:
     """Live Caption 메인 애플리케이션"""
     
@@ -46,29 +154,44 @@ class LiveCaptionApp:
         # 시스템 트레이
         self.system_tray: Optional[SystemTray] = None
         
+        # 컨트롤러 → Qt 메인 스레드 이벤트 전달
+        self.bridge = ControllerBridge(tick_hz=self.config_mgr.get('gui.caption.update_hz', 30))
+        self.bridge.load_progress.connect(self._on_load_progress)
+        self.bridge.load_finished.connect(self._on_load_finished)
+        self.bridge.profile_swapped.connect(self._on_profile_swapped)
+        self.bridge.on_captions = self._on_captions_batch
+        
         # 상태
         self.is_initialized = False
         self.is_running = False
         
+        # 모델 로드 상태 (창과 트레이는 로드 완료 전에 표시)
+        self.is_loading = False
+        self.models_ready = False
+        self.load_status: Dict[str, str] = {}
+        self._pending_start: Optional[Dict[str, Any]] = None
+        
     def initialize(self) -> bool:
         """
         애플리케이션 초기화
         
+        자막 창과 트레이를 먼저 표시하고 모델은 백그라운드에서 로드합니다.
+        로드 완료 전의 start() 요청은 로드가 끝나면 실행됩니다.
+        
         Returns:
-            bool: 초기화 성공 여부
+            bool: 초기화 성공 여부 (모델 로드 실패는 _on_load_finished()에서 알림)
         """
         print("=== Live Caption 초기화 시작 ===")
         
-        # 컨트롤러 초기화
-        if not self.controller.initialize():
-            print("❌ 컨트롤러 초기화 실패")
-            return False
-        
         # 자막 창 생성
         try:
             self.caption_window = CaptionWindow(self.theme_name)
             self.caption_window.show()
             print(f"✅ 자막 창 생성 완료 (테마: {self.theme_name})")
+            
+            # 나머지 테마 렌더러는 첫 화면을 그린 뒤 미리 생성 (테마 변경을 페이지 전환으로)
+            if self.config_mgr.get('gui.preload_themes', True):
+                QTimer.singleShot(0, self.caption_window.preload_renderers)
         except Exception as e:
             print(f"❌ 자막 창 생성 실패: {e}")
             return False
@@ -83,10 +206,77 @@ class LiveCaptionApp:
             print(f"⚠️  시스템 트레이 생성 실패: {e}")
             # 트레이 없이도 계속 진행
         
+        # 컨트롤러 초기화 (모델 로드, 백그라운드)
+        self.is_loading = True
+        self._set_status("모델 로드 중...")
+        self.controller.initialize_async(
+            progress_callback=self.bridge.load_progress.emit,
+            done_callback=self.bridge.load_finished.emit
+        )
+        
         self.is_initialized = True
-        print("=== Live Caption 초기화 완료 ===\n")
+        print("=== Live Caption 초기화 완료 (모델 로드 중) ===\n")
         return True
     
+    def _set_status(self, message: Optional[str]):
+        """
+        자막 창 제목 / 트레이 툴팁에 상태 표시
+        
+        Args:
+            message: 상태 메시지 (None이면 지움)
+        """
+        if self.caption_window:
+            self.caption_window.set_status(message)
+        if self.system_tray:
+            self.system_tray.set_status(message)
+    
+    def _on_load_progress(self, component: str, status: str, elapsed: float):
+        """
+        모델 로드 진행 (Qt 메인 스레드)
+        
+        Args:
+            component: 구성 요소 ('audio', 'stt', 'translation')
+            status: 'loading', 'ready', 'failed'
+            elapsed: 경과 시간 (초)
+        """
+        label = COMPONENT_LABELS.get(component, component)
+        if status == 'loading':
+            self.load_status[component] = f"{label} 로드 중"
+        elif status == 'ready':
+            self.load_status[component] = f"{label} {elapsed:.1f}초"
+        else:
+            self.load_status[component] = f"{label} 실패"
+        
+        if self.is_loading:
+            self._set_status(", ".join(self.load_status.values()))
+    
+    def _on_load_finished(self, success: bool):
+        """
+        모델 로드 완료 (Qt 메인 스레드)
+        
+        Args:
+            success: 초기화 성공 여부
+        """
+        self.is_loading = False
+        self.models_ready = success
+        pending, self._pending_start = self._pending_start, None
+        
+        if not success:
+            print("❌ 컨트롤러 초기화 실패")
+            self._set_status("모델 로드 실패")
+            if self.system_tray:
+                self.system_tray.set_start_enabled(False)
+                self.system_tray.show_message(
+                    "Live Caption", "모델 로드에 실패했습니다", QSystemTrayIcon.Critical
+                )
+            return
+        
+        self._set_status(None)
+        
+        # 로드 중에 요청된 시작 실행
+        if pending is not None:
+            self.start(**pending)
+    
     def _connect_tray_signals(self):
         """트레이 시그널 연결"""
         if not self.system_tray:
@@ -141,6 +331,16 @@ class LiveCaptionApp:
             print("⚠️  이미 실행 중입니다")
             return False
         
+        # 모델 로드 중이면 완료 후 시작
+        if self.is_loading:
+            self._pending_start = {'device_index': device_index}
+            print("⏳ 모델 로드가 끝나면 자막 생성을 시작합니다")
+            return True
+        
+        if not self.models_ready:
+            print("❌ 모델 로드에 실패해 자막 생성을 시작할 수 없습니다")
+            return False
+        
         # 컨트롤러 시작 (자막 콜백 연결)
         if not self.controller.start(
             caption_callback=self._on_caption_received,
@@ -161,6 +361,9 @@ class LiveCaptionApp:
     
     def stop(self):
         """자막 생성 중지"""
+        # 모델 로드 후 시작 예약 취소
+        self._pending_start = None
+        
         if not self.is_running:
             return
         
@@ -168,6 +371,9 @@ class LiveCaptionApp:
         self.controller.stop()
         self.is_running = False
         
+        # 마지막 주기에 도착한 자막 표시
+        self.bridge.flush()
+        
         # 트레이 상태 업데이트
         if self.system_tray:
             self.system_tray.set_running_state(False)
@@ -177,14 +383,22 @@ class LiveCaptionApp:
     
     def _on_caption_received(self, caption_data: Dict[str, Any]):
         """
-        자막 수신 콜백
+        자막 수신 콜백 (컨트롤러 출력 스레드)
         
         Args:
             caption_data: 자막 데이터
         """
+        self.bridge.push_caption(caption_data)
+    
+    def _on_captions_batch(self, captions: List[Dict[str, Any]]):
+        """
+        자막 묶음 표시 (Qt 메인 스레드, UI 주기마다)
+        
+        Args:
+            captions: 지난 주기 이후 도착한 자막 (도착 순서)
+        """
         if self.caption_window:
-            # Qt 메인 스레드에서 실행
-            QTimer.singleShot(0, lambda: self.caption_window.add_caption(caption_data))
+            self.caption_window.add_captions(captions)
     
     def change_theme(self, theme_name: str):
         """
@@ -244,13 +458,33 @@ class LiveCaptionApp:
             
             self.caption_window.show()
         
-        # 성능 프로필 변경
-        if 'performance' in settings:
-            # TODO: 컨트롤러 재시작 필요
-            print("⚠️  성능 프로필 변경은 재시작이 필요합니다")
+        # 성능 프로필 변경 (실행 중이면 자막을 끊지 않고 STT 모델 교체)
+        profile = settings.get('performance', {}).get('profile')
+        if profile and profile != self.controller.config_mgr.get_current_profile():
+            if self.controller.set_profile(profile, done_callback=self.bridge.profile_swapped.emit):
+                if self.controller.stt_service is not None:
+                    self._set_status("STT 모델 교체 중...")
         
         print("✅ 설정 적용 완료")
     
+    def _on_profile_swapped(self, success: bool):
+        """
+        STT 모델 교체 완료 (Qt 메인 스레드)
+        
+        Args:
+            success: 교체 성공 여부 (실패하면 기존 모델로 계속 동작)
+        """
+        self._set_status(None)
+        if self.system_tray:
+            profile = self.controller.config_mgr.get_current_profile()
+            if success:
+                self.system_tray.show_message("Live Caption", f"성능 프로필이 '{profile}'로 변경되었습니다")
+            else:
+                self.system_tray.show_message(
+                    "Live Caption", "STT 모델 교체에 실패해 기존 모델을 계속 사용합니다",
+                    QSystemTrayIcon.Warning
+                )
+    
     def list_audio_devices(self) -> list:
         """
         사용 가능한 오디오 디바이스 목록
@@ -273,6 +507,7 @@ class LiveCaptionApp:
             'initialized': self.is_initialized,
             'running': self.is_running,
             'theme': self.theme_name,
+            'caption_delivery': self.bridge.get_stats(),
             'controller': controller_status
         }
     
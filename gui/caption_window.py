@@ -3,8 +3,8 @@ Caption Window
 자막 표시 메인 창
 """
 
-from typing import Dict, Any, Optional
-from PyQt5.QtWidgets import QMainWindow, QApplication
+from typing import Dict, Any, Optional, List
+from PyQt5.QtWidgets import QMainWindow, QApplication, QStackedWidget
 from PyQt5.QtCore import Qt, QPoint, QTimer
 from PyQt5.QtGui import QScreen
 
@@ -31,27 +31,52 @@ class CaptionWindow(QMainWindow):
         if self.theme_config is None:
             raise ValueError(f"테마를 찾을 수 없습니다: {theme_name}")
         
+        # 테마별 렌더러 (처음 사용할 때 만들고 위젯 트리와 함께 보관)
+        self.renderers: Dict[str, BaseRenderer] = {}
+        self.stack = QStackedWidget()
+        self.setCentralWidget(self.stack)
+        
         # 렌더러 생성
-        self.renderer: BaseRenderer = RendererFactory.create_renderer(self.theme_config)
+        self.renderer: BaseRenderer = self._get_renderer(theme_name)
+        self.stack.setCurrentWidget(self.renderer.widget)
+        
+        # 제목 표시줄 상태 메시지 (모델 로드 진행 등)
+        self.status_message: Optional[str] = None
+        
+        # 마지막으로 적용한 창 플래그 (같으면 setWindowFlags() 생략)
+        self._window_flags = None
         
         # 창 설정
         self._setup_window()
         
-        # 렌더러 위젯 설정
-        renderer_widget = self.renderer.create_widget()
-        self.setCentralWidget(renderer_widget)
-        
         # 드래그 이동 지원
         self.dragging = False
         self.drag_position = QPoint()
         
+    def _window_title(self) -> str:
+        """창 제목 (상태 메시지 포함)"""
+        theme_meta = self.theme_config.get('theme', {})
+        title = f"Live Caption - {theme_meta.get('name', self.theme_name)}"
+        if self.status_message:
+            title += f" ({self.status_message})"
+        return title
+    
+    def set_status(self, message: Optional[str]):
+        """
+        제목 표시줄 상태 메시지 설정
+        
+        Args:
+            message: 상태 메시지 (None이면 지움)
+        """
+        self.status_message = message
+        self.setWindowTitle(self._window_title())
+        
     def _setup_window(self):
         """창 설정"""
         window_config = self.renderer.get_window_config()
         
         # 창 제목
-        theme_meta = self.theme_config.get('theme', {})
-        self.setWindowTitle(f"Live Caption - {theme_meta.get('name', self.theme_name)}")
+        self.setWindowTitle(self._window_title())
         
         # 창 크기
         width = window_config.get('width', 400)
@@ -66,16 +91,21 @@ class CaptionWindow(QMainWindow):
             flags |= Qt.WindowStaysOnTopHint
         
         # 프레임리스 (투명 오버레이용)
-        if self.theme_name == 'transparent':
+        translucent = self.theme_name == 'transparent'
+        if translucent:
             flags |= Qt.FramelessWindowHint
             flags |= Qt.Tool
-            self.setAttribute(Qt.WA_TranslucentBackground)
+        self.setAttribute(Qt.WA_TranslucentBackground, translucent)
         
-        self.setWindowFlags(flags)
+        # 플래그가 바뀔 때만 적용 (setWindowFlags()는 창을 다시 만들고 숨김)
+        if flags != self._window_flags:
+            visible = self.isVisible()
+            self.setWindowFlags(flags)
+            if visible:
+                self.show()
         
         # Click-through (클릭 투과)
-        if window_config.get('click_through', False):
-            self.setAttribute(Qt.WA_TransparentForMouseEvents)
+        self.setAttribute(Qt.WA_TransparentForMouseEvents, window_config.get('click_through', False))
         
         # 창 투명도
         opacity = window_config.get('opacity', 1.0)
@@ -84,6 +114,11 @@ class CaptionWindow(QMainWindow):
         # 창 위치
         self._set_window_position(window_config.get('position', 'right'))
     
+    def setWindowFlags(self, flags):
+        """창 플래그 설정 (외부에서 바꾼 값도 기록해 _setup_window()가 비교)"""
+        super().setWindowFlags(flags)
+        self._window_flags = flags
+    
     def _set_window_position(self, position: str):
         """
         창 위치 설정
@@ -127,45 +162,99 @@ class CaptionWindow(QMainWindow):
                 - korean: 한국어 텍스트
                 - english: 영어 텍스트
                 - timestamp: 타임스탬프
+                - is_final: False면 진행 중인 줄 갱신 (스트리밍 부분 결과)
+                - trace: 지연 추적 레코드 (있으면 화면 갱신 시각 기록)
+        """
+        self.add_captions([caption_data])
+    
+    def add_captions(self, captions: List[Dict[str, Any]]):
+        """
+        자막 묶음 추가 (화면 갱신 1회)
+        
+        같은 묶음 안에서 뒤에 다른 자막이 오는 부분 결과는 어차피 바로 덮어쓰이므로
+        렌더러에 전달하지 않습니다.
+        
+        Args:
+            captions: 자막 데이터 리스트 (도착 순서, add_caption() 참고)
         """
-        self.renderer.add_caption(caption_data)
+        visible = [
+            caption for index, caption in enumerate(captions)
+            if caption.get('is_final', True) or index == len(captions) - 1
+        ]
+        self.renderer.add_captions(visible)
+        
+        # 숨겨진 기록형 렌더러도 계속 받아 세션 기록에 빈 구간이 생기지 않게 함
+        # (다른 테마는 최근 max_lines개만 갖고 있어 테마 변경 때 이어받을 수 없음)
+        for renderer in self.renderers.values():
+            if renderer is not self.renderer and renderer.keeps_history:
+                renderer.add_captions(visible)
+        
+        for caption in captions:
+            trace = caption.get('trace')
+            if trace:
+                trace.mark('paint')
     
     def clear_captions(self):
-        """모든 자막 삭제"""
-        self.renderer.clear_captions()
+        """모든 자막 삭제 (숨겨진 테마 렌더러 포함)"""
+        for renderer in self.renderers.values():
+            renderer.clear_captions()
+    
+    def _get_renderer(self, theme_name: str) -> Optional[BaseRenderer]:
+        """
+        테마 렌더러 가져오기 (없으면 생성 후 위젯을 숨겨진 페이지로 추가)
+        
+        Args:
+            theme_name: 테마 이름
+            
+        Returns:
+            Optional[BaseRenderer]: 렌더러 (테마가 없으면 None)
+        """
+        renderer = self.renderers.get(theme_name)
+        if renderer is None:
+            theme_config = self.theme_mgr.get_theme(theme_name)
+            if theme_config is None:
+                return None
+            
+            renderer = RendererFactory.create_renderer(theme_config)
+            self.stack.addWidget(renderer.create_widget())
+            self.renderers[theme_name] = renderer
+        
+        return renderer
+    
+    def preload_renderers(self):
+        """로드된 모든 테마의 렌더러를 미리 생성 (테마 변경 시 위젯 생성 비용 제거)"""
+        for theme_name in self.theme_mgr.list_themes():
+            self._get_renderer(theme_name)
     
     def change_theme(self, theme_name: str):
         """
         테마 변경
         
+        렌더러는 테마별로 한 번만 만들어 보관하므로 변경은 페이지 전환과
+        자막 일괄 이전(load_captions)으로 끝납니다.
+        
         Args:
             theme_name: 새 테마 이름
         """
-        # 새 테마 로드
-        new_theme_config = self.theme_mgr.get_theme(theme_name)
-        if new_theme_config is None:
+        if theme_name == self.theme_name:
+            return
+        
+        renderer = self._get_renderer(theme_name)
+        if renderer is None:
             print(f"⚠️  테마를 찾을 수 없습니다: {theme_name}")
             return
         
-        # 기존 자막 저장
-        old_captions = self.renderer.captions.copy()
+        # 자막 이전 (숨겨지는 렌더러는 상태 유지: 기록형 렌더러의 세션 기록 보존)
+        renderer.load_captions(self.renderer.captions)
         
-        # 새 렌더러 생성
         self.theme_name = theme_name
-        self.theme_config = new_theme_config
-        self.renderer = RendererFactory.create_renderer(new_theme_config)
-        
-        # 렌더러 위젯 교체
-        renderer_widget = self.renderer.create_widget()
-        self.setCentralWidget(renderer_widget)
+        self.theme_config = renderer.theme_config
+        self.renderer = renderer
+        self.stack.setCurrentWidget(renderer.widget)
         
         # 창 설정 재적용
         self._setup_window()
         
-        # 자막 복원
-        for caption in old_captions:
-            self.renderer.add_caption(caption)
-        
         print(f"✅ 테마 변경: {theme_name}")
     
     def mousePressEvent(self, event):
@@ -7,6 +7,7 @@ from gui.renderers.base_renderer import BaseRenderer
 from gui.renderers.panel_renderer import PanelRenderer
 from gui.renderers.transparent_renderer import TransparentRenderer
 from gui.renderers.ticker_renderer import TickerRenderer
+from gui.renderers.history_renderer import HistoryRenderer
 from gui.renderers.renderer_factory import RendererFactory
 
 
@@ -15,5 +16,6 @@ __all__ = [
     'PanelRenderer',
     'TransparentRenderer',
     'TickerRenderer',
+    'HistoryRenderer',
     'RendererFactory'
 ]
@@ -9,10 +9,15 @@ from PyQt5.QtWidgets import QWidget
 from PyQt5.QtCore import QPropertyAnimation, QEasingCurve, pyqtProperty
 from PyQt5.QtGui import QColor
 
+from core.theme_manager import ThemeManager
+
 
 class BaseRenderer(ABC):
     """자막 렌더러 베이스 클래스"""
     
+    # 세션 기록 보관 여부 (True면 숨겨진 동안에도 자막 창이 새 자막을 계속 전달)
+    keeps_history = False
+    
     def __init__(self, theme_config: Dict[str, Any]):
         """
         Args:
@@ -21,6 +26,19 @@ class BaseRenderer(ABC):
         self.theme_config = theme_config
         self.widget: QWidget = None
         self.captions: List[Dict[str, Any]] = []
+        self._theme = None
+    
+    @property
+    def theme(self):
+        """
+        컴파일된 테마 (처음 사용할 때 ThemeManager 캐시에서 가져옴)
+        
+        Returns:
+            CompiledTheme: 색상 / 글꼴 / 스타일시트
+        """
+        if self._theme is None:
+            self._theme = ThemeManager().compile_theme(self.theme_config)
+        return self._theme
         
     @abstractmethod
     def create_widget(self) -> QWidget:
@@ -45,6 +63,58 @@ class BaseRenderer(ABC):
         """
         pass
     
+    def update_pending(self, caption_data: Dict[str, Any]):
+        """
+        진행 중인 줄 갱신 (스트리밍 부분 결과)
+        
+        다음 add_caption() 호출 시 확정 자막으로 대체됩니다.
+        기본 구현은 부분 결과를 무시합니다.
+        
+        Args:
+            caption_data: 자막 데이터 (english는 빈 문자열)
+        """
+        pass
+    
+    def add_captions(self, captions: List[Dict[str, Any]]):
+        """
+        자막 묶음 추가 (위젯 갱신을 멈췄다가 마지막에 한 번만 다시 그림)
+        
+        Args:
+            captions: 자막 데이터 리스트 (is_final=False는 update_pending()으로 전달)
+        """
+        if self.widget:
+            self.widget.setUpdatesEnabled(False)
+        try:
+            for caption_data in captions:
+                if caption_data.get('is_final', True):
+                    self.add_caption(caption_data)
+                else:
+                    self.update_pending(caption_data)
+        finally:
+            if self.widget:
+                self.widget.setUpdatesEnabled(True)
+    
+    def load_captions(self, captions):
+        """
+        자막 목록을 한 번에 교체 (테마 전환 시 이전 렌더러의 자막 이어받기)
+        
+        표시할 수 있는 마지막 max_lines개만 추가하며 화면은 마지막에 한 번만 다시 그립니다.
+        
+        Args:
+            captions: 확정 자막 데이터 목록 (오래된 순)
+        """
+        recent = list(captions)[-self.theme.max_lines:]
+        
+        if self.widget:
+            self.widget.setUpdatesEnabled(False)
+        try:
+            self.clear_captions()
+            for caption_data in recent:
+                self.add_caption(caption_data)
+        finally:
+            if self.widget:
+                self.widget.setUpdatesEnabled(True)
+    
     @abstractmethod
     def clear_captions(self):
         """모든 자막 삭제"""
@@ -99,8 +169,7 @@ class BaseRenderer(ABC):
             widget: 대상 위젯
             fade_in: True=페이드 인, False=페이드 아웃
         """
-        caption_config = self.get_caption_config()
-        duration = int(caption_config.get('fade_duration', 0.5) * 1000)
+        duration = int(self.theme.fade_duration * 1000)
         
         animation = QPropertyAnimation(widget, b"windowOpacity")
         animation.setDuration(duration)
@@ -133,81 +202,9 @@ class BaseRenderer(ABC):
     
     def build_stylesheet(self) -> str:
         """
-        테마 설정을 기반으로 스타일시트 생성
+        테마 스타일시트 (컴파일된 테마에 캐시된 문자열)
         
         Returns:
             str: Qt 스타일시트
         """
-        bg_config = self.get_background_config()
-        caption_config = self.get_caption_config()
-        
-        # 배경 색상
-        bg_color = bg_config.get('color', '#000000')
-        bg_opacity = int(bg_config.get('opacity', 0.7) * 255)
-        bg_rgba = f"rgba({self.hex_to_qcolor(bg_color).red()}, " \
-                  f"{self.hex_to_qcolor(bg_color).green()}, " \
-                  f"{self.hex_to_qcolor(bg_color).blue()}, " \
-                  f"{bg_opacity})"
-        
-        # 테두리 반경
-        border_radius = bg_config.get('border_radius', 0)
-        
-        # 한국어 자막 스타일
-        korean_config = caption_config.get('korean', {})
-        korean_color = korean_config.get('color', '#FFFFFF')
-        korean_font_size = korean_config.get('font_size', 24)
-        korean_font_family = korean_config.get('font_family', 'Arial')
-        korean_font_weight = 'bold' if korean_config.get('font_weight') == 'bold' else 'normal'
-        
-        # 영어 자막 스타일
-        english_config = caption_config.get('english', {})
-        english_color = english_config.get('color', '#FFFF00')
-        english_font_size = english_config.get('font_size', 20)
-        english_font_family = english_config.get('font_family', 'Arial')
-        english_font_weight = 'bold' if english_config.get('font_weight') == 'bold' else 'normal'
-        
-        stylesheet = f"""
-            QWidget#CaptionWidget {{
-                background-color: {bg_rgba};
-                border-radius: {border_radius}px;
-            }}
-            
-            QLabel#KoreanCaption {{
-                color: {korean_color};
-                font-size: {korean_font_size}px;
-                font-family: "{korean_font_family}";
-                font-weight: {korean_font_weight};
-                background: transparent;
-            }}
-            
-            QLabel#EnglishCaption {{
-                color: {english_color};
-                font-size: {english_font_size}px;
-                font-family: "{english_font_family}";
-                font-weight: {english_font_weight};
-                background: transparent;
-            }}
-            
-            QScrollArea {{
-                border: none;
-                background: transparent;
-            }}
-            
-            QScrollBar:vertical {{
-                background: transparent;
-                width: 10px;
-                margin: 0px;
-            }}
-            
-            QScrollBar::handle:vertical {{
-                background: rgba(255, 255, 255, 0.3);
-                border-radius: 5px;
-                min-height: 20px;
-            }}
-            
-            QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {{
-                height: 0px;
-            }}
-        """
-        
-        return stylesheet
+        return self.theme.stylesheet
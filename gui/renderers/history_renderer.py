@@ -0,0 +1,486 @@
+"""
+History Renderer
+세션 전체 자막 기록 렌더러 (model/view 가상화)
+
+자막마다 QFrame / QLabel을 만드는 PanelRenderer와 달리 자막은 모델(데이터)로만
+보관하고, 화면에 보이는 행만 델리게이트가 직접 그립니다. 모든 행의 높이가 같아
+자막이 수만 개여도 스크롤과 추가 비용이 일정하며, 줄바꿈 결과(QStaticText)는
+최근에 그린 행만 LRU로 캐시합니다.
+"""
+
+from collections import OrderedDict, deque
+from typing import Dict, Any, List, Optional
+
+from PyQt5.QtWidgets import (
+    QWidget, QVBoxLayout, QAbstractScrollArea, QFrame, QStyledItemDelegate, QStyle,
+    QStyleOptionViewItem
+)
+from PyQt5.QtCore import Qt, QAbstractListModel, QModelIndex, QSize, QPointF, QRect
+from PyQt5.QtGui import (
+    QColor, QFontMetrics, QPainter, QStaticText, QTextLayout, QTextOption
+)
+
+from gui.renderers.base_renderer import BaseRenderer
+
+
+# 모델 데이터 역할
+KoreanRole = Qt.UserRole + 1
+EnglishRole = Qt.UserRole + 2
+PendingRole = Qt.UserRole + 3
+
+
+class CaptionListModel(QAbstractListModel):
+    """자막 기록 모델 (최대 행 수를 넘으면 오래된 자막부터 제거)"""
+
+    def __init__(self, max_rows: int = 50000, parent=None):
+        """
+        Args:
+            max_rows: 보관할 최대 자막 수
+            parent: 부모 QObject
+        """
+        super().__init__(parent)
+        self.max_rows = max(1, max_rows)
+        self.captions: deque = deque()
+
+        # 진행 중인 줄 (스트리밍 부분 결과, 마지막 행으로 표시)
+        self.pending: Optional[Dict[str, Any]] = None
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        """행 수 (진행 중인 줄 포함)"""
+        if parent.isValid():
+            return 0
+        return len(self.captions) + (self.pending is not None)
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole):
+        """행 데이터 (DisplayRole: '한국어\\n영어')"""
+        if not index.isValid():
+            return None
+
+        row = index.row()
+        if row < len(self.captions):
+            caption, pending = self.captions[row], False
+        elif self.pending is not None and row == len(self.captions):
+            caption, pending = self.pending, True
+        else:
+            return None
+
+        if role == KoreanRole:
+            return caption.get('korean', '')
+        if role == EnglishRole:
+            return caption.get('english', '')
+        if role == PendingRole:
+            return pending
+        if role == Qt.DisplayRole:
+            return f"{caption.get('korean', '')}\n{caption.get('english', '')}"
+        return None
+
+    def append_captions(self, captions: List[Dict[str, Any]]):
+        """
+        확정 자막 추가 (진행 중인 줄은 제거, 행 삽입 / 제거 알림은 묶음당 한 번)
+
+        Args:
+            captions: 자막 데이터 리스트
+        """
+        if not captions:
+            return
+
+        self.set_pending(None)
+        captions = captions[-self.max_rows:]
+
+        # 오래된 자막 제거
+        overflow = len(self.captions) + len(captions) - self.max_rows
+        if overflow > 0:
+            self.beginRemoveRows(QModelIndex(), 0, overflow - 1)
+            for _ in range(overflow):
+                self.captions.popleft()
+            self.endRemoveRows()
+
+        start = len(self.captions)
+        self.beginInsertRows(QModelIndex(), start, start + len(captions) - 1)
+        self.captions.extend(captions)
+        self.endInsertRows()
+
+    def set_pending(self, caption_data: Optional[Dict[str, Any]]):
+        """
+        진행 중인 줄 설정 / 갱신 / 제거
+
+        Args:
+            caption_data: 부분 결과 (None이면 진행 중인 줄 제거)
+        """
+        row = len(self.captions)
+
+        if caption_data is None:
+            if self.pending is not None:
+                self.beginRemoveRows(QModelIndex(), row, row)
+                self.pending = None
+                self.endRemoveRows()
+        elif self.pending is None:
+            self.beginInsertRows(QModelIndex(), row, row)
+            self.pending = caption_data
+            self.endInsertRows()
+        else:
+            self.pending = caption_data
+            index = self.index(row)
+            self.dataChanged.emit(index, index)
+
+    def clear(self):
+        """모든 자막 삭제"""
+        self.load([])
+
+    def load(self, captions):
+        """
+        자막 목록 교체 (모델 리셋 한 번)
+
+        Args:
+            captions: 자막 데이터 목록 (오래된 순, 최대 행 수를 넘으면 최근 것만)
+        """
+        recent = list(captions)[-self.max_rows:]
+        self.beginResetModel()
+        self.captions.clear()
+        self.captions.extend(recent)
+        self.pending = None
+        self.endResetModel()
+
+
+class CaptionDelegate(QStyledItemDelegate):
+    """
+    자막 행 델리게이트 (한국어 / 영어 줄을 직접 그림)
+
+    행 높이는 언어별 최대 줄 수로 고정되며 넘치는 텍스트는 말줄임표로 자릅니다.
+    """
+
+    def __init__(self, theme, cache_size: int = 512, parent=None):
+        """
+        Args:
+            theme: 컴파일된 테마 (언어별 글꼴, 색상, 정렬 / layout의 spacing, line_spacing, wrap_lines)
+            cache_size: 줄바꿈 결과 캐시 크기 (텍스트, 폭 단위)
+            parent: 부모 QObject
+        """
+        super().__init__(parent)
+        self.cache_size = cache_size
+        self._cache: OrderedDict = OrderedDict()
+
+        self.wrap_lines = max(1, theme.layout.get('wrap_lines', 2))
+        self.line_spacing = theme.layout.get('line_spacing', 5)
+        self.row_spacing = theme.layout.get('spacing', 10)
+
+        self.styles = {}
+        for role, style in ((KoreanRole, theme.korean), (EnglishRole, theme.english)):
+            # 진행 중인 줄은 반투명
+            pending_color = QColor(style.color)
+            pending_color.setAlphaF(0.6)
+            self.styles[role] = {
+                'font': style.font,
+                'metrics': QFontMetrics(style.font),
+                'color': style.color,
+                'pending_color': pending_color,
+                'alignment': int(style.alignment)
+            }
+
+        self.row_height = (
+            sum(style['metrics'].lineSpacing() * self.wrap_lines for style in self.styles.values())
+            + self.line_spacing + self.row_spacing
+        )
+
+        # 캐시 통계
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+    def sizeHint(self, option, index) -> QSize:
+        """고정 행 크기 (균일 행 높이)"""
+        return QSize(option.rect.width(), self.row_height)
+
+    def _lines(self, role: int, text: str, width: int) -> List[QStaticText]:
+        """
+        텍스트 줄바꿈 결과 (LRU 캐시)
+
+        Args:
+            role: KoreanRole / EnglishRole
+            text: 텍스트
+            width: 줄 폭 (px)
+
+        Returns:
+            List[QStaticText]: 최대 wrap_lines개의 줄 (넘치면 마지막 줄 말줄임)
+        """
+        key = (role, text, width)
+        lines = self._cache.get(key)
+        if lines is not None:
+            self._cache.move_to_end(key)
+            self.cache_hits += 1
+            return lines
+        self.cache_misses += 1
+
+        style = self.styles[role]
+        layout = QTextLayout(text, style['font'])
+        option = QTextOption()
+        option.setWrapMode(QTextOption.WrapAtWordBoundaryOrAnywhere)
+        layout.setTextOption(option)
+
+        spans = []
+        layout.beginLayout()
+        while True:
+            line = layout.createLine()
+            if not line.isValid():
+                break
+            line.setLineWidth(width)
+            spans.append((line.textStart(), line.textLength()))
+        layout.endLayout()
+
+        texts = [text[start:start + length].rstrip() for start, length in spans[:self.wrap_lines]]
+        if len(spans) > self.wrap_lines:
+            rest = text[spans[self.wrap_lines - 1][0]:]
+            texts[-1] = style['metrics'].elidedText(rest, Qt.ElideRight, width)
+
+        lines = []
+        for line_text in texts:
+            static = QStaticText(line_text)
+            static.setTextFormat(Qt.PlainText)
+            static.prepare(font=style['font'])
+            lines.append(static)
+
+        self._cache[key] = lines
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        return lines
+
+    def paint(self, painter, option, index):
+        """행 그리기 (한국어 줄 → 영어 줄)"""
+        rect = option.rect
+        width = max(1, rect.width())
+        y = rect.top()
+
+        painter.save()
+        if option.state & QStyle.State_Selected:
+            painter.fillRect(rect, option.palette.highlight())
+
+        pending = index.data(PendingRole)
+        for role in (KoreanRole, EnglishRole):
+            style = self.styles[role]
+            painter.setFont(style['font'])
+            painter.setPen(style['pending_color'] if pending else style['color'])
+
+            line_height = style['metrics'].lineSpacing()
+            for static in self._lines(role, index.data(role) or '', width):
+                x = rect.left()
+                if style['alignment'] & Qt.AlignHCenter:
+                    x += (width - static.size().width()) / 2
+                elif style['alignment'] & Qt.AlignRight:
+                    x += width - static.size().width()
+                painter.drawStaticText(QPointF(x, y), static)
+                y += line_height
+
+            y = rect.top() + line_height * self.wrap_lines + self.line_spacing
+        painter.restore()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        줄바꿈 캐시 통계
+
+        Returns:
+            Dict: {'entries', 'hits', 'misses', 'row_height'}
+        """
+        return {
+            'entries': len(self._cache),
+            'hits': self.cache_hits,
+            'misses': self.cache_misses,
+            'row_height': self.row_height
+        }
+
+
+class CaptionHistoryView(QAbstractScrollArea):
+    """
+    균일 높이 행 가상 스크롤 뷰 (보이는 행만 모델에서 읽어 델리게이트로 그림)
+
+    QListView는 행이 추가될 때마다 모든 행에 대해 model.index()를 호출해 다시
+    배치하므로 Python 모델에서는 추가 비용이 자막 수에 비례합니다. 이 뷰는
+    스크롤 범위를 행 수 × 행 높이로만 계산합니다.
+    """
+
+    def __init__(self, model: CaptionListModel, delegate: CaptionDelegate, parent=None):
+        """
+        Args:
+            model: 자막 기록 모델
+            delegate: 행 델리게이트 (row_height, paint())
+            parent: 부모 위젯
+        """
+        super().__init__(parent)
+        self.model = model
+        self.delegate = delegate
+
+        self.setObjectName("CaptionHistory")
+        self.setFrameShape(QFrame.NoFrame)
+        self.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.setVerticalScrollBarPolicy(Qt.ScrollBarAsNeeded)
+        self.viewport().setAutoFillBackground(False)
+
+        model.rowsInserted.connect(self._update_scroll_range)
+        model.rowsAboutToBeRemoved.connect(self._on_rows_about_to_be_removed)
+        model.rowsRemoved.connect(self._update_scroll_range)
+        model.modelReset.connect(self._update_scroll_range)
+        model.dataChanged.connect(self._on_data_changed)
+
+        # 마지막 행을 따라 스크롤 (사용자가 위로 스크롤하면 해제, 맨 아래로 오면 다시 설정)
+        self.follow_bottom = True
+        self._update_scroll_range()
+
+    def at_bottom(self) -> bool:
+        """스크롤이 맨 아래인지"""
+        scrollbar = self.verticalScrollBar()
+        return scrollbar.value() >= scrollbar.maximum()
+
+    def _update_scroll_range(self, *args):
+        """행 수에 맞춰 스크롤 범위 갱신 (맨 아래를 보고 있었으면 따라감)"""
+        height = self.viewport().height()
+        row_height = self.delegate.row_height
+        scrollbar = self.verticalScrollBar()
+        scrollbar.setRange(0, max(0, self.model.rowCount() * row_height - height))
+        scrollbar.setPageStep(height)
+        scrollbar.setSingleStep(max(1, row_height // 2))
+        if self.follow_bottom:
+            scrollbar.setValue(scrollbar.maximum())
+        self.viewport().update()
+
+    def _on_rows_about_to_be_removed(self, parent, first: int, last: int):
+        """오래된 행 제거: 위로 스크롤한 상태면 보던 자막이 그대로 보이도록 위치 보정"""
+        if first == 0 and not self.follow_bottom:
+            scrollbar = self.verticalScrollBar()
+            scrollbar.setValue(scrollbar.value() - (last + 1) * self.delegate.row_height)
+
+    def _on_data_changed(self, top_left, bottom_right, roles=()):
+        """행 내용 변경 (진행 중인 줄)"""
+        self.viewport().update()
+
+    def scrollContentsBy(self, dx: int, dy: int):
+        """스크롤: 따라가기 상태 갱신 후 다시 그림"""
+        self.follow_bottom = self.at_bottom()
+        self.viewport().update()
+
+    def resizeEvent(self, event):
+        """크기 변경: 스크롤 범위 갱신"""
+        super().resizeEvent(event)
+        self._update_scroll_range()
+
+    def visible_rows(self) -> range:
+        """
+        화면에 보이는 행 범위
+
+        Returns:
+            range: 행 번호 범위
+        """
+        row_height = self.delegate.row_height
+        top = self.verticalScrollBar().value()
+        first = top // row_height
+        last = min(self.model.rowCount(), (top + self.viewport().height()) // row_height + 1)
+        return range(first, last)
+
+    def paintEvent(self, event):
+        """보이는 행만 그리기"""
+        painter = QPainter(self.viewport())
+        row_height = self.delegate.row_height
+        top = self.verticalScrollBar().value()
+        width = self.viewport().width()
+
+        option = QStyleOptionViewItem()
+        option.initFrom(self)
+        for row in self.visible_rows():
+            option.rect = QRect(0, row * row_height - top, width, row_height)
+            self.delegate.paint(painter, option, self.model.index(row))
+        painter.end()
+
+
+class HistoryRenderer(BaseRenderer):
+    """세션 자막 기록 렌더러 (가상 스크롤 뷰 + 모델 / 델리게이트)"""
+
+    keeps_history = True
+
+    def __init__(self, theme_config: Dict[str, Any]):
+        super().__init__(theme_config)
+
+        self.model = CaptionListModel(self.get_caption_config().get('max_lines', 50000))
+        self.delegate = CaptionDelegate(self.theme)
+        self.view: Optional[CaptionHistoryView] = None
+
+        # 자막 저장소는 모델과 공유 (테마 변경 시 복사)
+        self.captions = self.model.captions
+
+    def create_widget(self) -> QWidget:
+        """기록 위젯 생성"""
+        self.widget = QWidget()
+        self.widget.setObjectName("CaptionWidget")
+
+        main_layout = QVBoxLayout(self.widget)
+        padding = self.get_layout_config().get('padding', 20)
+        main_layout.setContentsMargins(padding, padding, padding, padding)
+
+        self.view = CaptionHistoryView(self.model, self.delegate)
+        main_layout.addWidget(self.view)
+
+        self.widget.setStyleSheet(self.build_stylesheet() + """
+            QAbstractScrollArea#CaptionHistory {
+                border: none;
+                background: transparent;
+            }
+        """)
+
+        return self.widget
+
+    def add_caption(self, caption_data: Dict[str, Any]):
+        """자막 추가"""
+        self.add_captions([caption_data])
+
+    def add_captions(self, captions: List[Dict[str, Any]]):
+        """
+        자막 묶음 추가 (연속된 확정 자막은 행 삽입 한 번으로 처리)
+
+        Args:
+            captions: 자막 데이터 리스트 (is_final=False는 진행 중인 줄 갱신)
+        """
+        finals = []
+        for caption_data in captions:
+            if caption_data.get('is_final', True):
+                finals.append(caption_data)
+                continue
+            self.model.append_captions(finals)
+            finals = []
+            self.model.set_pending(caption_data)
+        self.model.append_captions(finals)
+
+    def update_pending(self, caption_data: Dict[str, Any]):
+        """진행 중인 줄 갱신 (마지막 행)"""
+        self.model.set_pending(caption_data)
+
+    def load_captions(self, captions):
+        """
+        이전 렌더러의 자막 이어받기 (마지막 행으로 스크롤)
+
+        기록이 비어 있으면 모델 리셋 한 번으로 채우고, 이미 있으면 보관 중인 기록은
+        그대로 두고 마지막으로 가진 자막 뒤의 새 자막만 추가합니다.
+        (다른 렌더러는 최근 max_lines개만 갖고 있으므로 기록을 교체하면 세션 기록이 사라짐,
+        숨겨진 동안의 자막은 CaptionWindow가 계속 전달하므로 보통은 추가할 것이 없음)
+
+        Args:
+            captions: 확정 자막 데이터 목록 (오래된 순)
+        """
+        if self.view:
+            self.view.follow_bottom = True
+
+        captions = list(captions)
+        if not self.model.captions:
+            self.model.load(captions)
+            return
+
+        last = self.model.captions[-1]
+        for index in range(len(captions) - 1, -1, -1):
+            if captions[index] is last:
+                captions = captions[index + 1:]
+                break
+        self.model.append_captions(captions)
+
+    def clear_captions(self):
+        """모든 자막 삭제"""
+        self.model.clear()
+
+    def update_display(self):
+        """화면 업데이트"""
+        if self.view:
+            self.view.viewport().update()
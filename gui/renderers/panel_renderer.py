@@ -3,7 +3,7 @@ Panel Renderer
 패널형 자막 렌더러 (우측 패널)
 """
 
-from typing import Dict, Any
+from typing import Dict, Any, List
 from PyQt5.QtWidgets import (
     QWidget, QVBoxLayout, QLabel, QScrollArea, QFrame
 )
@@ -22,6 +22,14 @@ class PanelRenderer(BaseRenderer):
         self.content_widget = None
         self.content_layout = None
         
+        # 진행 중인 줄 (스트리밍 부분 결과)
+        self.pending_frame = None
+        
+        # 재사용 대기 자막 프레임 (밀려난 / 지운 프레임을 숨겨 두고 다시 사용)
+        self.free_frames: List[QFrame] = []
+        self.frames_created = 0
+        self.frames_reused = 0
+        
     def create_widget(self) -> QWidget:
         """패널 위젯 생성"""
         # 메인 위젯
@@ -64,28 +72,84 @@ class PanelRenderer(BaseRenderer):
         # 자막 데이터 저장
         self.captions.append(caption_data)
         
-        # 최대 라인 수 제한
-        caption_config = self.get_caption_config()
-        max_lines = caption_config.get('max_lines', 10)
-        
-        if len(self.captions) > max_lines:
+        # 최대 라인 수 제한: 가장 오래된 프레임을 재사용 대기로 돌림
+        if len(self.captions) > self.theme.max_lines:
             self.captions.pop(0)
-            # 첫 번째 자막 위젯 제거
             item = self.content_layout.itemAt(0)
             if item and item.widget():
-                item.widget().deleteLater()
+                self._release_frame(item.widget())
         
-        # 자막 프레임 생성
-        caption_frame = self._create_caption_frame(caption_data)
-        
-        # 스트레치 제거 후 자막 추가
-        stretch_item = self.content_layout.takeAt(self.content_layout.count() - 1)
-        self.content_layout.addWidget(caption_frame)
-        self.content_layout.addStretch()
+        # 진행 중인 줄이 있으면 확정 자막으로 전환, 없으면 (밀려난) 프레임을 맨 아래에 다시 사용
+        if self.pending_frame is not None:
+            self._set_frame_text(self.pending_frame, caption_data)
+            self.pending_frame = None
+        else:
+            self._append_frame(self._acquire_frame(caption_data))
         
         # 스크롤을 맨 아래로
         QTimer.singleShot(100, self._scroll_to_bottom)
     
+    def update_pending(self, caption_data: Dict[str, Any]):
+        """진행 중인 줄 갱신 (맨 아래 프레임을 제자리에서 수정)"""
+        if not self.content_layout:
+            return
+        
+        if self.pending_frame is None:
+            self.pending_frame = self._acquire_frame(caption_data)
+            self._append_frame(self.pending_frame)
+            QTimer.singleShot(100, self._scroll_to_bottom)
+        else:
+            self._set_frame_text(self.pending_frame, caption_data)
+    
+    def _append_frame(self, frame: QFrame):
+        """자막 프레임을 맨 아래 (스트레치 앞)에 추가"""
+        self.content_layout.insertWidget(self.content_layout.count() - 1, frame)
+    
+    def _acquire_frame(self, caption_data: Dict[str, Any]) -> QFrame:
+        """
+        자막 프레임 확보 (재사용 대기 프레임이 있으면 텍스트만 바꿔 사용)
+        
+        Args:
+            caption_data: 자막 데이터
+            
+        Returns:
+            QFrame: 레이아웃에 추가할 프레임
+        """
+        if self.free_frames:
+            frame = self.free_frames.pop()
+            self._set_frame_text(frame, caption_data)
+            frame.show()
+            self.frames_reused += 1
+            return frame
+        
+        self.frames_created += 1
+        return self._create_caption_frame(caption_data)
+    
+    def _release_frame(self, frame: QFrame):
+        """프레임을 레이아웃에서 빼고 재사용 대기로 보관 (삭제하지 않음)"""
+        self.content_layout.removeWidget(frame)
+        frame.hide()
+        self.free_frames.append(frame)
+    
+    def _set_frame_text(self, frame: QFrame, caption_data: Dict[str, Any]):
+        """자막 프레임 텍스트 변경"""
+        frame.korean_label.setText(caption_data['korean'])
+        frame.english_label.setText(caption_data['english'])
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        프레임 재사용 통계
+        
+        Returns:
+            Dict: {'created', 'reused', 'free', 'visible'}
+        """
+        return {
+            'created': self.frames_created,
+            'reused': self.frames_reused,
+            'free': len(self.free_frames),
+            'visible': self.content_layout.count() - 1 if self.content_layout else 0
+        }
+    
     def _create_caption_frame(self, caption_data: Dict[str, Any]) -> QFrame:
         """자막 프레임 생성"""
         frame = QFrame()
@@ -95,22 +159,12 @@ class PanelRenderer(BaseRenderer):
         layout.setSpacing(5)
         layout.setContentsMargins(0, 0, 0, 0)
         
-        caption_config = self.get_caption_config()
-        
         # 한국어 자막
         korean_label = QLabel(caption_data['korean'])
         korean_label.setObjectName("KoreanCaption")
         korean_label.setWordWrap(True)
         korean_label.setTextInteractionFlags(Qt.TextSelectableByMouse)
-        
-        korean_config = caption_config.get('korean', {})
-        alignment = korean_config.get('alignment', 'left')
-        if alignment == 'center':
-            korean_label.setAlignment(Qt.AlignCenter)
-        elif alignment == 'right':
-            korean_label.setAlignment(Qt.AlignRight)
-        else:
-            korean_label.setAlignment(Qt.AlignLeft)
+        korean_label.setAlignment(self.theme.korean.alignment)
         
         layout.addWidget(korean_label)
         
@@ -119,18 +173,14 @@ class PanelRenderer(BaseRenderer):
         english_label.setObjectName("EnglishCaption")
         english_label.setWordWrap(True)
         english_label.setTextInteractionFlags(Qt.TextSelectableByMouse)
-        
-        english_config = caption_config.get('english', {})
-        alignment = english_config.get('alignment', 'left')
-        if alignment == 'center':
-            english_label.setAlignment(Qt.AlignCenter)
-        elif alignment == 'right':
-            english_label.setAlignment(Qt.AlignRight)
-        else:
-            english_label.setAlignment(Qt.AlignLeft)
+        english_label.setAlignment(self.theme.english.alignment)
         
         layout.addWidget(english_label)
         
+        # 재사용 시 findChild 없이 텍스트 변경
+        frame.korean_label = korean_label
+        frame.english_label = english_label
+        
         return frame
     
     def _scroll_to_bottom(self):
@@ -142,15 +192,18 @@ class PanelRenderer(BaseRenderer):
     def clear_captions(self):
         """모든 자막 삭제"""
         self.captions.clear()
+        self.pending_frame = None
         
         if not self.content_layout:
             return
         
-        # 모든 위젯 제거
-        while self.content_layout.count() > 1:  # 스트레치 제외
-            item = self.content_layout.takeAt(0)
+        # 모든 프레임을 재사용 대기로 (스트레치 제외)
+        while self.content_layout.count() > 1:
+            item = self.content_layout.itemAt(0)
             if item.widget():
-                item.widget().deleteLater()
+                self._release_frame(item.widget())
+            else:
+                self.content_layout.takeAt(0)
     
     def update_display(self):
         """화면 업데이트"""
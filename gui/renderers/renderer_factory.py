@@ -8,6 +8,7 @@ from gui.renderers.base_renderer import BaseRenderer
 from gui.renderers.panel_renderer import PanelRenderer
 from gui.renderers.transparent_renderer import TransparentRenderer
 from gui.renderers.ticker_renderer import TickerRenderer
+from gui.renderers.history_renderer import HistoryRenderer
 
 
 class RendererFactory:
@@ -16,7 +17,8 @@ class RendererFactory:
     _renderers: Dict[str, Type[BaseRenderer]] = {
         'PanelRenderer': PanelRenderer,
         'TransparentRenderer': TransparentRenderer,
-        'TickerRenderer': TickerRenderer
+        'TickerRenderer': TickerRenderer,
+        'HistoryRenderer': HistoryRenderer
     }
     
     @classmethod
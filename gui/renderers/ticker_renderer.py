@@ -85,8 +85,7 @@ class TickerRenderer(BaseRenderer):
         if not self.widget:
             return
         
-        caption_config = self.get_caption_config()
-        duration = int(caption_config.get('fade_duration', 0.3) * 1000)
+        duration = int(self.theme.fade_duration * 1000)
         
         # 아래에서 위로 슬라이드
         animation = QPropertyAnimation(self.widget, b"geometry")
@@ -104,6 +103,14 @@ class TickerRenderer(BaseRenderer):
         animation.setEndValue(current_geo)
         animation.start()
     
+    def update_pending(self, caption_data: Dict[str, Any]):
+        """진행 중인 줄 갱신 (자막 목록에는 추가하지 않음)"""
+        if not self.korean_label or not self.english_label:
+            return
+        
+        self.korean_label.setText(caption_data['korean'])
+        self.english_label.setText(caption_data['english'])
+    
     def clear_captions(self):
         """모든 자막 삭제"""
         self.captions.clear()
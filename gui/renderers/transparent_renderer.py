@@ -3,10 +3,10 @@ Transparent Overlay Renderer
 투명 오버레이 자막 렌더러 (배경 투명)
 """
 
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 from PyQt5.QtWidgets import QWidget, QVBoxLayout, QLabel
-from PyQt5.QtCore import Qt
-from PyQt5.QtGui import QPainter, QColor, QPen
+from PyQt5.QtCore import Qt, QPoint, QSize
+from PyQt5.QtGui import QPainter, QPixmap, QColor, QFontMetrics
 
 from gui.renderers.base_renderer import BaseRenderer
 
@@ -46,10 +46,8 @@ class TransparentRenderer(BaseRenderer):
         self.korean_label.setAlignment(Qt.AlignCenter)
         self.korean_label.setWordWrap(True)
         
-        caption_config = self.get_caption_config()
-        korean_config = caption_config.get('korean', {})
-        self.korean_label.set_outline_color(QColor(0, 0, 0))
-        self.korean_label.set_outline_width(3)
+        self.korean_label.set_outline_color(self.theme.korean.stroke_color)
+        self.korean_label.set_outline_width(self.theme.korean.stroke_width)
         
         layout.addWidget(self.korean_label)
         
@@ -59,9 +57,8 @@ class TransparentRenderer(BaseRenderer):
         self.english_label.setAlignment(Qt.AlignCenter)
         self.english_label.setWordWrap(True)
         
-        english_config = caption_config.get('english', {})
-        self.english_label.set_outline_color(QColor(0, 0, 0))
-        self.english_label.set_outline_width(2)
+        self.english_label.set_outline_color(self.theme.english.stroke_color)
+        self.english_label.set_outline_width(self.theme.english.stroke_width)
         
         layout.addWidget(self.english_label)
         
@@ -71,46 +68,8 @@ class TransparentRenderer(BaseRenderer):
         return self.widget
     
     def _build_transparent_stylesheet(self) -> str:
-        """투명 오버레이용 스타일시트"""
-        caption_config = self.get_caption_config()
-        
-        # 한국어 자막 스타일
-        korean_config = caption_config.get('korean', {})
-        korean_color = korean_config.get('color', '#FFFFFF')
-        korean_font_size = korean_config.get('font_size', 32)
-        korean_font_family = korean_config.get('font_family', 'Arial')
-        korean_font_weight = 'bold' if korean_config.get('font_weight') == 'bold' else 'normal'
-        
-        # 영어 자막 스타일
-        english_config = caption_config.get('english', {})
-        english_color = english_config.get('color', '#FFFF00')
-        english_font_size = english_config.get('font_size', 28)
-        english_font_family = english_config.get('font_family', 'Arial')
-        english_font_weight = 'bold' if english_config.get('font_weight') == 'bold' else 'normal'
-        
-        stylesheet = f"""
-            QWidget#CaptionWidget {{
-                background: transparent;
-            }}
-            
-            QLabel#KoreanCaption {{
-                color: {korean_color};
-                font-size: {korean_font_size}px;
-                font-family: "{korean_font_family}";
-                font-weight: {korean_font_weight};
-                background: transparent;
-            }}
-            
-            QLabel#EnglishCaption {{
-                color: {english_color};
-                font-size: {english_font_size}px;
-                font-family: "{english_font_family}";
-                font-weight: {english_font_weight};
-                background: transparent;
-            }}
-        """
-        
-        return stylesheet
+        """투명 오버레이용 스타일시트 (컴파일된 테마에 캐시된 문자열)"""
+        return self.theme.overlay_stylesheet
     
     def add_caption(self, caption_data: Dict[str, Any]):
         """자막 추가 (최신 자막만 표시)"""
@@ -131,6 +90,14 @@ class TransparentRenderer(BaseRenderer):
         # 페이드 인 애니메이션
         # self.apply_fade_animation(self.widget, fade_in=True)
     
+    def update_pending(self, caption_data: Dict[str, Any]):
+        """진행 중인 줄 갱신 (자막 목록에는 추가하지 않음)"""
+        if not self.korean_label or not self.english_label:
+            return
+        
+        self.korean_label.setText(caption_data['korean'])
+        self.english_label.setText(caption_data['english'])
+    
     def clear_captions(self):
         """모든 자막 삭제"""
         self.captions.clear()
@@ -155,42 +122,108 @@ class TransparentCaptionWidget(QWidget):
 
 
 class OutlinedLabel(QLabel):
-    """외곽선이 있는 라벨"""
+    """
+    외곽선이 있는 라벨
+    
+    외곽선 색 글자를 한 번 그린 마스크를 8방향으로 찍고 그 위에 글자를 그려
+    장치 픽셀 비율에 맞는 QPixmap으로 캐시합니다. 텍스트, 글꼴, 색상, 외곽선,
+    크기가 바뀔 때만 다시 만들고 그 외 repaint는 pixmap 복사 한 번입니다.
+    """
     
     def __init__(self, text=""):
         super().__init__(text)
         self.outline_color = QColor(0, 0, 0)
         self.outline_width = 2
+        
+        # 외곽선 텍스트 캐시 (캐시 키, 글자 영역 pixmap, 위젯 내 위치)
+        self._cache_key: Optional[tuple] = None
+        self._cache: Optional[QPixmap] = None
+        self._cache_origin = QPoint()
+        
+        # 통계 (paints: paintEvent 횟수, renders: 캐시를 다시 만든 횟수)
+        self.paints = 0
+        self.renders = 0
     
     def set_outline_color(self, color: QColor):
         """외곽선 색상 설정"""
         self.outline_color = color
+        self.update()
     
     def set_outline_width(self, width: int):
         """외곽선 두께 설정"""
         self.outline_width = width
+        self.update()
+    
+    def _render_key(self) -> tuple:
+        """캐시 키 (그림을 바꾸는 모든 입력)"""
+        return (
+            self.text(),
+            self.font().key(),
+            self.palette().color(self.foregroundRole()).rgba(),
+            self.outline_color.rgba(),
+            self.outline_width,
+            int(self.alignment()),
+            self.wordWrap(),
+            self.width(),
+            self.height(),
+            self.devicePixelRatioF()
+        )
+    
+    def _new_pixmap(self, size: QSize) -> QPixmap:
+        """투명 pixmap (장치 픽셀 비율 반영)"""
+        ratio = self.devicePixelRatioF()
+        pixmap = QPixmap(size * ratio)
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(Qt.transparent)
+        return pixmap
+    
+    def _render(self):
+        """외곽선 마스크를 8방향으로 찍은 뒤 글자를 올린 pixmap (글자 영역만)"""
+        flags = int(self.alignment())
+        if self.wordWrap():
+            flags |= Qt.TextWordWrap
+        
+        # 글자가 차지하는 영역 + 외곽선 여백
+        width = self.outline_width
+        contents = self.contentsRect()
+        area = QFontMetrics(self.font()).boundingRect(contents, flags, self.text())
+        area = area.adjusted(-width, -width, width, width).intersected(self.rect())
+        text_rect = contents.translated(-area.topLeft())
+        
+        layers = []
+        for color in (self.outline_color, self.palette().color(self.foregroundRole())):
+            layer = self._new_pixmap(area.size())
+            painter = QPainter(layer)
+            painter.setFont(self.font())
+            painter.setPen(color)
+            painter.drawText(text_rect, flags, self.text())
+            painter.end()
+            layers.append(layer)
+        outline, text = layers
+        
+        result = self._new_pixmap(area.size())
+        painter = QPainter(result)
+        for dx in (-width, 0, width):
+            for dy in (-width, 0, width):
+                if dx or dy:
+                    painter.drawPixmap(dx, dy, outline)
+        painter.drawPixmap(0, 0, text)
+        painter.end()
+        
+        self.renders += 1
+        self._cache = result
+        self._cache_origin = area.topLeft()
     
     def paintEvent(self, event):
-        """페인트 이벤트 (외곽선 그리기)"""
+        """페인트 이벤트 (캐시된 외곽선 텍스트 복사)"""
+        self.paints += 1
+        if not self.text():
+            return
+        
+        key = self._render_key()
+        if key != self._cache_key:
+            self._render()
+            self._cache_key = key
+        
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.Antialiasing)
-        
-        # 외곽선 그리기
-        pen = QPen(self.outline_color, self.outline_width)
-        painter.setPen(pen)
-        painter.setFont(self.font())
-        
-        # 텍스트 위치 계산
-        rect = self.rect()
-        alignment = self.alignment()
-        
-        # 외곽선 (8방향)
-        for dx in [-self.outline_width, 0, self.outline_width]:
-            for dy in [-self.outline_width, 0, self.outline_width]:
-                if dx == 0 and dy == 0:
-                    continue
-                offset_rect = rect.adjusted(dx, dy, dx, dy)
-                painter.drawText(offset_rect, alignment, self.text())
-        
-        # 원본 텍스트 (부모 클래스 호출)
-        super().paintEvent(event)
+        painter.drawPixmap(self._cache_origin, self._cache)
@@ -230,7 +230,7 @@ class SettingsWindow(QDialog):
         profile_select_layout = QHBoxLayout()
         profile_select_layout.addWidget(QLabel("프로필:"))
         self.profile_combo = QComboBox()
-        self.profile_combo.addItem("경량 (CPU, 빠른 시작)", "light")
+        self.profile_combo.addItem("경량 (CPU, 빠른 시작)", "lightweight")
         self.profile_combo.addItem("표준 (GPU, 고품질)", "standard")
         profile_select_layout.addWidget(self.profile_combo)
         profile_layout.addLayout(profile_select_layout)
@@ -365,7 +365,7 @@ class SettingsWindow(QDialog):
             self.theme_combo.setCurrentIndex(index)
         
         # 성능
-        profile = self.config_mgr.get('performance.profile', 'light')
+        profile = self.config_mgr.get('performance.profile', 'lightweight')
         index = self.profile_combo.findData(profile)
         if index >= 0:
             self.profile_combo.setCurrentIndex(index)
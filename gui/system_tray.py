@@ -101,6 +101,24 @@ class SystemTray(QObject):
         self.start_action.setEnabled(not is_running)
         self.stop_action.setEnabled(is_running)
     
+    def set_start_enabled(self, enabled: bool):
+        """
+        시작 메뉴 활성화 (모델 로드 실패 시 비활성)
+        
+        Args:
+            enabled: 활성화 여부
+        """
+        self.start_action.setEnabled(enabled and not self.is_running)
+    
+    def set_status(self, message: Optional[str]):
+        """
+        툴팁 상태 메시지 설정
+        
+        Args:
+            message: 상태 메시지 (None이면 기본 툴팁)
+        """
+        self.tray_icon.setToolTip(f"Live Caption - {message}" if message else "Live Caption")
+    
     def show_message(self, title: str, message: str, icon=QSystemTrayIcon.Information):
         """
         알림 메시지 표시
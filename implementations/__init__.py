@@ -1,24 +1,64 @@
 """
 Implementations Module
-STT 및 번역 구현체 모듈
+STT, 번역 및 VAD 구현체 모듈
+
+구현체는 'module:Class' 경로로 등록되어 해당 백엔드를 처음 생성할 때 import됩니다.
+이 패키지를 import해도 faster-whisper / transformers / onnxruntime 등은 로드되지 않습니다.
 """
 
+import importlib
+
 from services.model_factory import ModelFactory
-from implementations.whisper_stt import WhisperLightSTT, WhisperStandardSTT
-from implementations.opus_translation import OpusMTTranslationService
+
+
+# 구현체 클래스 이름 → 모듈 (지연 import)
+_CLASS_MODULES = {
+    'WhisperLightSTT': 'implementations.whisper_stt',
+    'WhisperStandardSTT': 'implementations.whisper_stt',
+    'OpusMTTranslationService': 'implementations.opus_translation',
+    'CTranslate2TranslationService': 'implementations.ct2_translation',
+    'EnergyVADService': 'implementations.energy_vad',
+    'SileroVADService': 'implementations.silero_vad',
+    'MockSTTService': 'implementations.mock_backends',
+    'MockTranslationService': 'implementations.mock_backends',
+}
+
+
+def _path(class_name: str) -> str:
+    """ModelFactory 지연 등록 경로"""
+    return f"{_CLASS_MODULES[class_name]}:{class_name}"
 
 
 # STT 구현체 등록
-ModelFactory.register_stt('whisper_light', WhisperLightSTT)
-ModelFactory.register_stt('whisper_standard', WhisperStandardSTT)
+ModelFactory.register_stt('whisper_light', _path('WhisperLightSTT'))
+ModelFactory.register_stt('whisper_standard', _path('WhisperStandardSTT'))
+ModelFactory.register_stt('mock', _path('MockSTTService'))
 
 # 번역 구현체 등록
-ModelFactory.register_translation('opus_mt', OpusMTTranslationService)
+ModelFactory.register_translation('opus_mt', _path('OpusMTTranslationService'))
+ModelFactory.register_translation('ctranslate2', _path('CTranslate2TranslationService'))
+ModelFactory.register_translation('mock', _path('MockTranslationService'))
+
+# VAD 구현체 등록
+ModelFactory.register_vad('energy', _path('EnergyVADService'))
+ModelFactory.register_vad('silero', _path('SileroVADService'))
+
+
+def __getattr__(name: str):
+    """from implementations import WhisperLightSTT 등 클래스 접근 시 모듈 import"""
+    if name in _CLASS_MODULES:
+        return getattr(importlib.import_module(_CLASS_MODULES[name]), name)
+    raise AttributeError(f"module 'implementations' has no attribute '{name}'")
 
 
 __all__ = [
     'WhisperLightSTT',
     'WhisperStandardSTT',
     'OpusMTTranslationService',
+    'CTranslate2TranslationService',
+    'EnergyVADService',
+    'SileroVADService',
+    'MockSTTService',
+    'MockTranslationService',
     'ModelFactory'
 ]
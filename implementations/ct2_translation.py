@@ -0,0 +1,214 @@
+"""
+CTranslate2 Translation Implementation
+CTranslate2 int8 변환 Marian(Opus-MT) 모델 기반 번역 구현
+"""
+
+import math
+from typing import Dict, Any, List
+from pathlib import Path
+
+from services.base_translation import BaseTranslationService
+from services.translation_cache import cached_translate, cached_translate_batch
+
+
+class CTranslate2TranslationService(BaseTranslationService):
+    """CTranslate2 기반 Opus-MT 번역 서비스 (faster-whisper와 같은 런타임)"""
+
+    def __init__(self, config: Dict[str, Any]):
+        """
+        Args:
+            config: 번역 설정 딕셔너리
+                - model: 원본 모델 이름 (Helsinki-NLP/opus-mt-ko-en)
+                - max_length: 최대 토큰 길이
+                - cache: LRU 번역 캐시 설정
+                - ctranslate2: CTranslate2 설정
+                    - model_dir: 변환된 모델 경로 (없으면 최초 실행 시 변환)
+                    - device: 디바이스 (cpu, cuda)
+                    - compute_type: 연산 타입 (int8, int8_float16, float16)
+                    - beam_size: 빔 서치 크기
+                - cpu_threads: 번역에 할당된 CPU 스레드 수 (Whisper와 공유하는 예산)
+        """
+        super().__init__(config)
+        ct2_config = config.get('ctranslate2', {})
+
+        self.model_name = config.get('model', 'Helsinki-NLP/opus-mt-ko-en')
+        self.max_length = config.get('max_length', 512)
+        self.device = ct2_config.get('device', 'cpu')
+        self.compute_type = ct2_config.get('compute_type', 'int8')
+        self.beam_size = ct2_config.get('beam_size', 4)
+        self.cpu_threads = config.get('cpu_threads', 0)
+        self.model_dir = Path(ct2_config.get(
+            'model_dir',
+            f"models/translation/ct2/{self.model_name.split('/')[-1]}-{self.compute_type}"
+        ))
+
+        self.tokenizer = None
+        self.translator = None
+
+    def initialize(self) -> bool:
+        """
+        CTranslate2 모델 초기화 (변환된 모델이 없으면 변환)
+
+        Returns:
+            bool: 초기화 성공 여부
+        """
+        try:
+            import ctranslate2
+            from transformers import MarianTokenizer
+
+            # 토크나이저 로드 (SentencePiece만 사용, PyTorch 모델은 로드하지 않음)
+            self.tokenizer = MarianTokenizer.from_pretrained(
+                self.model_name,
+                cache_dir="models/translation"
+            )
+
+            # 최초 실행 시 int8 변환
+            if not (self.model_dir / "model.bin").exists():
+                print(f"⏳ 번역 모델 CTranslate2 변환 중... ({self.compute_type})")
+                converter = ctranslate2.converters.TransformersConverter(self.model_name)
+                converter.convert(str(self.model_dir), quantization=self.compute_type, force=True)
+
+            # 단일 요청 지연을 줄이기 위해 배치 1개를 여러 스레드로 처리
+            self.translator = ctranslate2.Translator(
+                str(self.model_dir),
+                device=self.device,
+                compute_type=self.compute_type,
+                inter_threads=1,
+                intra_threads=self.cpu_threads
+            )
+
+            self.is_initialized = True
+            return True
+
+        except Exception as e:
+            print(f"❌ CTranslate2 번역 초기화 실패: {e}")
+            self.is_initialized = False
+            return False
+
+    def _empty_result(self) -> Dict[str, Any]:
+        """빈 번역 결과"""
+        return {
+            'translated_text': '',
+            'source_lang': self.source_lang,
+            'target_lang': self.target_lang,
+            'confidence': 0.0
+        }
+
+    @cached_translate
+    def translate(self, text: str) -> Dict[str, Any]:
+        """
+        텍스트 번역
+
+        Args:
+            text: 번역할 텍스트
+
+        Returns:
+            Dict: {
+                'translated_text': str,  # 번역된 텍스트
+                'source_lang': str,      # 원본 언어
+                'target_lang': str,      # 대상 언어
+                'confidence': float      # 신뢰도 (0-1)
+            }
+        """
+        return self._translate_texts([text])[0]
+
+    @cached_translate_batch
+    def translate_batch(self, texts: List[str]) -> List[Dict[str, Any]]:
+        """
+        여러 텍스트 일괄 번역
+
+        Args:
+            texts: 번역할 텍스트 리스트
+
+        Returns:
+            List[Dict]: 번역 결과 리스트
+        """
+        return self._translate_texts(texts)
+
+    def _translate_texts(self, texts: List[str]) -> List[Dict[str, Any]]:
+        """translate_batch() 1회로 번역 (캐시 미사용)"""
+        if not self.is_initialized or self.translator is None:
+            raise RuntimeError("Model not initialized. Call initialize() first.")
+
+        if not texts:
+            return []
+
+        valid = [i for i, text in enumerate(texts) if text and text.strip()]
+        results = [self._empty_result() for _ in texts]
+        if not valid:
+            return results
+
+        try:
+            # SentencePiece 토큰 단위로 입력
+            sources = [
+                self.tokenizer.convert_ids_to_tokens(
+                    self.tokenizer.encode(texts[i], truncation=True, max_length=self.max_length)
+                )
+                for i in valid
+            ]
+
+            outputs = self.translator.translate_batch(
+                sources,
+                beam_size=self.beam_size,
+                max_decoding_length=self.max_length,
+                return_scores=True
+            )
+
+            for i, output in zip(valid, outputs):
+                target = output.hypotheses[0]
+                translated_text = self.tokenizer.decode(
+                    self.tokenizer.convert_tokens_to_ids(target),
+                    skip_special_tokens=True
+                )
+                results[i] = {
+                    'translated_text': translated_text.strip(),
+                    'source_lang': self.source_lang,
+                    'target_lang': self.target_lang,
+                    # 길이 정규화된 로그 확률 → 토큰 평균 확률
+                    'confidence': min(1.0, math.exp(output.scores[0])) if output.scores else 0.9
+                }
+
+            return results
+
+        except Exception as e:
+            print(f"❌ 번역 실패: {e}")
+            return [self._empty_result() for _ in texts]
+
+    def cleanup(self):
+        """리소스 정리"""
+        if self.translator is not None:
+            del self.translator
+            self.translator = None
+        if self.tokenizer is not None:
+            del self.tokenizer
+            self.tokenizer = None
+        self.is_initialized = False
+
+    def get_model_info(self) -> Dict[str, Any]:
+        """
+        모델 정보 반환
+
+        Returns:
+            Dict: 모델 정보
+        """
+        return {
+            'name': 'Opus-MT (CTranslate2)',
+            'model': self.model_name,
+            'model_dir': str(self.model_dir),
+            'device': self.device,
+            'compute_type': self.compute_type,
+            'cpu_threads': self.cpu_threads,
+            'source_lang': self.source_lang,
+            'target_lang': self.target_lang,
+            'initialized': self.is_initialized,
+            'cache': self.cache.get_stats() if self.cache else None
+        }
+
+    def get_supported_languages(self) -> List[str]:
+        """
+        지원하는 언어 목록 반환
+
+        Returns:
+            List[str]: 언어 코드 리스트
+        """
+        return ['ko', 'en']
@@ -0,0 +1,112 @@
+"""
+Energy VAD Implementation
+에너지 / 영교차율 기반 경량 음성 구간 검출
+"""
+
+import numpy as np
+from typing import Dict, Any
+
+from services.base_vad import BaseVADService
+
+
+class EnergyVADService(BaseVADService):
+    """에너지 + 영교차율(ZCR) 기반 VAD"""
+
+    def __init__(self, config: Dict[str, Any]):
+        """
+        Args:
+            config: VAD 설정 딕셔너리
+                - sample_rate: 샘플링 레이트 (16000)
+                - frame_ms: 프레임 길이 (30)
+                - energy_margin_db: 잡음 레벨 대비 음성 판정 마진 (dB)
+                - min_energy_db: 절대 최소 에너지 (dB, 이 값 미만은 항상 무음)
+                - zcr_range: 무성음(ㅅ, ㅎ 등) 판정 ZCR 범위 [min, max]
+                - noise_adapt_rate: 잡음 레벨 추적 속도 (0-1)
+                - initial_noise_db: 초기 잡음 레벨 추정치 (dB)
+        """
+        super().__init__(config)
+        self.energy_margin_db = config.get('energy_margin_db', 10.0)
+        self.min_energy_db = config.get('min_energy_db', -60.0)
+        self.zcr_range = tuple(config.get('zcr_range', [0.1, 0.5]))
+        self.noise_adapt_rate = config.get('noise_adapt_rate', 0.05)
+        self.initial_noise_db = config.get('initial_noise_db', -50.0)
+
+        # 잡음 레벨 추정치 (dB)
+        # 더 조용한 프레임이 오면 즉시 내려가고, 무음 프레임에서 천천히 올라감
+        self.noise_floor_db = self.initial_noise_db
+
+    def initialize(self) -> bool:
+        """초기화 (모델 로드 없음)"""
+        self.reset()
+        self.is_initialized = True
+        return True
+
+    def process_frames(self, frames: np.ndarray) -> np.ndarray:
+        """
+        프레임별 음성 확률 계산
+
+        Args:
+            frames: 오디오 프레임 (float32, shape=(n_frames, frame_size))
+
+        Returns:
+            np.ndarray: 프레임별 음성 확률 (0-1)
+        """
+        if len(frames) == 0:
+            return np.zeros(0, dtype=np.float32)
+
+        # 프레임 에너지 (dB)
+        rms = np.sqrt(np.mean(np.square(frames, dtype=np.float32), axis=1))
+        energy_db = 20.0 * np.log10(rms + 1e-10)
+
+        # 영교차율
+        signs = np.signbit(frames)
+        zcr = np.count_nonzero(signs[:, 1:] != signs[:, :-1], axis=1) / frames.shape[1]
+
+        probs = np.empty(len(frames), dtype=np.float32)
+        for i in range(len(frames)):
+            margin = energy_db[i] - self.noise_floor_db
+
+            if energy_db[i] < self.min_energy_db:
+                prob = 0.0
+            elif margin >= self.energy_margin_db:
+                prob = 1.0
+            elif margin >= self.energy_margin_db / 2 and \
+                    self.zcr_range[0] <= zcr[i] <= self.zcr_range[1]:
+                # 에너지가 낮은 무성 자음
+                prob = 0.6
+            else:
+                prob = max(0.0, margin / self.energy_margin_db) * 0.5
+            probs[i] = prob
+
+            # 잡음 레벨 추적: 무음 프레임에서는 천천히, 더 조용해지면 즉시 따라감
+            if energy_db[i] < self.noise_floor_db:
+                self.noise_floor_db = energy_db[i]
+            elif prob < 0.5:
+                self.noise_floor_db += self.noise_adapt_rate * (energy_db[i] - self.noise_floor_db)
+
+        return probs
+
+    def reset(self):
+        """스트림 상태 초기화"""
+        self.noise_floor_db = self.initial_noise_db
+
+    def cleanup(self):
+        """리소스 정리"""
+        self.reset()
+        self.is_initialized = False
+
+    def get_model_info(self) -> Dict[str, Any]:
+        """
+        모델 정보 반환
+
+        Returns:
+            Dict: 모델 정보
+        """
+        return {
+            'name': 'Energy/ZCR VAD',
+            'sample_rate': self.sample_rate,
+            'frame_size': self.frame_size,
+            'energy_margin_db': self.energy_margin_db,
+            'noise_floor_db': self.noise_floor_db,
+            'initialized': self.is_initialized
+        }
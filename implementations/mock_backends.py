@@ -0,0 +1,346 @@
+"""
+Mock Backends
+모델 없이 STT / 번역을 흉내 내는 벤치마크용 구현 (stt.backend / translation.backend: mock)
+
+호출마다 설정된 지연(고정 + 입력 크기 비례 + 지터)만큼 CPU를 쓰고 정해진
+텍스트를 돌려줍니다. 난수는 seed로 고정되어 같은 입력 순서면 같은 지연과
+실패가 재현됩니다.
+
+- cpu_load: release → 네이티브 코드처럼 GIL을 놓고 연산 (CTranslate2 / faster-whisper)
+- cpu_load: hold → 순수 Python 루프로 GIL을 잡고 연산
+- cpu_load: sleep → CPU 부하 없이 대기만
+"""
+
+import hashlib
+import threading
+import time
+from typing import Dict, Any, Generator, List, Optional
+
+import numpy as np
+
+from services.base_stt import BaseSTTService
+from services.base_translation import BaseTranslationService
+from services.translation_cache import cached_translate, cached_translate_batch
+
+
+CPU_LOADS = ('release', 'hold', 'sleep')
+
+# hashlib은 2047바이트 넘는 입력에서 GIL을 놓음
+_RELEASE_BLOCK = bytes(256 * 1024)
+
+
+class SimulatedWorkload:
+    """호출 1회의 지연 / CPU 부하 / 실패 시뮬레이션"""
+
+    def __init__(self, config: Dict[str, Any], per_unit_key: str):
+        """
+        Args:
+            config: 모의 설정
+                - latency: 호출당 고정 지연 (초)
+                - <per_unit_key>: 입력 단위당 추가 지연 (초)
+                - jitter: 지연에 더하는 균등 분포 지터 폭 (±초)
+                - failure_rate: 호출 실패 확률 (0-1)
+                - cpu_load: release, hold, sleep
+                - seed: 난수 시드
+            per_unit_key: 입력 크기 비례 지연 키 (STT 'rtf', 번역 'per_item')
+        """
+        self.latency = float(config.get('latency', 0.0))
+        self.per_unit = float(config.get(per_unit_key, 0.0))
+        self.jitter = float(config.get('jitter', 0.0))
+        self.failure_rate = float(config.get('failure_rate', 0.0))
+        self.cpu_load = config.get('cpu_load', 'release')
+        if self.cpu_load not in CPU_LOADS:
+            raise ValueError(f"Unknown cpu_load: {self.cpu_load} (expected one of {CPU_LOADS})")
+
+        self._rng = np.random.default_rng(config.get('seed', 0))
+        self._lock = threading.Lock()
+
+        self.calls = 0
+        self.failures = 0
+        self.busy_seconds = 0.0
+
+    def draw(self, units: float) -> tuple:
+        """
+        다음 호출의 지연과 실패 여부 (호출 순서대로 결정적)
+
+        Args:
+            units: 입력 크기 (오디오 초, 문장 수)
+
+        Returns:
+            tuple: (지연 초, 실패 여부)
+        """
+        with self._lock:
+            jitter = self._rng.uniform(-self.jitter, self.jitter) if self.jitter else 0.0
+            failed = bool(self.failure_rate) and self._rng.random() < self.failure_rate
+            self.calls += 1
+            self.failures += failed
+        return max(0.0, self.latency + self.per_unit * units + jitter), failed
+
+    def run(self, units: float) -> bool:
+        """
+        지연만큼 부하 실행
+
+        Args:
+            units: 입력 크기
+
+        Returns:
+            bool: 호출 성공 여부 (False면 실패로 처리)
+        """
+        seconds, failed = self.draw(units)
+        busy(seconds, self.cpu_load)
+        with self._lock:
+            self.busy_seconds += seconds
+        return not failed
+
+    def get_stats(self) -> Dict[str, Any]:
+        """호출 / 실패 횟수와 누적 부하 시간"""
+        return {
+            'calls': self.calls,
+            'failures': self.failures,
+            'busy_seconds': round(self.busy_seconds, 4),
+            'cpu_load': self.cpu_load
+        }
+
+
+def busy(seconds: float, cpu_load: str = 'release'):
+    """
+    seconds 동안 CPU 부하 발생
+
+    Args:
+        seconds: 부하 시간 (초)
+        cpu_load: release (GIL 해제), hold (GIL 점유), sleep (부하 없음)
+    """
+    if seconds <= 0:
+        return
+    if cpu_load == 'sleep':
+        time.sleep(seconds)
+        return
+
+    deadline = time.perf_counter() + seconds
+    if cpu_load == 'hold':
+        while time.perf_counter() < deadline:
+            sum(range(2000))
+    else:
+        while time.perf_counter() < deadline:
+            hashlib.sha256(_RELEASE_BLOCK).digest()
+
+
+class MockSTTService(BaseSTTService):
+    """모의 STT (오디오 길이에 비례한 지연 후 정해진 텍스트 반환)"""
+
+    supports_word_timestamps = True
+
+    def __init__(self, config: Dict[str, Any]):
+        """
+        Args:
+            config: STT 설정 딕셔너리
+                - mock: 모의 설정 (SimulatedWorkload 참고)
+                    - rtf: 오디오 1초당 처리 시간 (초)
+                    - text: 출력 텍스트 템플릿 ({index}: 호출 번호, {seconds}: 오디오 길이)
+                    - load_time: initialize() 지연 (초, 모델 로드 흉내)
+                    - word_interval: transcribe_words() 단어 간격 (초)
+        """
+        super().__init__(config)
+        mock_config = config.get('mock', {})
+        self.workload = SimulatedWorkload(mock_config, 'rtf')
+        self.text = mock_config.get('text', "모의 자막 {index}번 ({seconds:.1f}초)")
+        self.load_time = float(mock_config.get('load_time', 0.0))
+        self.word_interval = float(mock_config.get('word_interval', 0.4))
+
+    def initialize(self) -> bool:
+        """
+        모의 모델 로드
+
+        Returns:
+            bool: 항상 True
+        """
+        busy(self.load_time, self.workload.cpu_load)
+        self.is_initialized = True
+        return True
+
+    def _require_initialized(self):
+        """초기화 확인 (실제 구현과 같은 예외)"""
+        if not self.is_initialized:
+            raise RuntimeError("Model not initialized. Call initialize() first.")
+
+    def transcribe_stream(
+        self,
+        audio_data: np.ndarray,
+        sample_rate: int = 16000
+    ) -> Generator[Dict[str, Any], None, None]:
+        """
+        오디오 길이만큼 부하 후 텍스트 1개 반환 (실패 시 빈 결과)
+
+        Args:
+            audio_data: 오디오 데이터
+            sample_rate: 샘플링 레이트
+
+        Yields:
+            Dict: {'text', 'confidence', 'is_final', 'timestamp'}
+        """
+        self._require_initialized()
+        seconds = len(audio_data) / sample_rate
+
+        if not self.workload.run(seconds):
+            print("❌ 변환 실패: mock STT failure")
+            yield {'text': '', 'confidence': 0.0, 'is_final': True, 'timestamp': 0.0}
+            return
+
+        yield {
+            'text': self.text.format(index=self.workload.calls, seconds=seconds),
+            'confidence': 0.9,
+            'is_final': True,
+            'timestamp': 0.0
+        }
+
+    def transcribe_words(
+        self,
+        audio_data: np.ndarray,
+        sample_rate: int = 16000,
+        prompt: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        word_interval마다 단어 1개 (스트리밍 세션용)
+
+        Returns:
+            List[Dict]: 단어 목록 (word, start, end, probability)
+        """
+        self._require_initialized()
+        seconds = len(audio_data) / sample_rate
+
+        if not self.workload.run(seconds):
+            print("❌ 변환 실패: mock STT failure")
+            return []
+
+        count = int(seconds / self.word_interval)
+        return [
+            {
+                'word': f" 단어{i + 1}",
+                'start': i * self.word_interval,
+                'end': (i + 1) * self.word_interval,
+                'probability': 0.9
+            }
+            for i in range(count)
+        ]
+
+    def transcribe_file(self, audio_path: str) -> str:
+        """파일 변환 (지연 없이 텍스트 1개)"""
+        self._require_initialized()
+        return self.text.format(index=0, seconds=0.0)
+
+    def cleanup(self):
+        """리소스 정리"""
+        self.is_initialized = False
+
+    def get_model_info(self) -> Dict[str, Any]:
+        """
+        모델 정보 반환
+
+        Returns:
+            Dict: 모델 정보 (호출 통계 포함)
+        """
+        return {
+            'name': 'Mock STT',
+            'initialized': self.is_initialized,
+            **self.workload.get_stats()
+        }
+
+
+class MockTranslationService(BaseTranslationService):
+    """모의 번역 (배치 크기에 비례한 지연 후 접두사를 붙인 원문 반환)"""
+
+    def __init__(self, config: Dict[str, Any]):
+        """
+        Args:
+            config: 번역 설정 딕셔너리
+                - cache: LRU 번역 캐시 설정
+                - mock: 모의 설정 (SimulatedWorkload 참고)
+                    - per_item: 배치 문장 1개당 추가 지연 (초)
+                    - prefix: 번역 결과 접두사
+                    - load_time: initialize() 지연 (초)
+        """
+        super().__init__(config)
+        mock_config = config.get('mock', {})
+        self.workload = SimulatedWorkload(mock_config, 'per_item')
+        self.prefix = mock_config.get('prefix', "[en] ")
+        self.load_time = float(mock_config.get('load_time', 0.0))
+
+    def initialize(self) -> bool:
+        """
+        모의 모델 로드
+
+        Returns:
+            bool: 항상 True
+        """
+        busy(self.load_time, self.workload.cpu_load)
+        self.is_initialized = True
+        return True
+
+    def _result(self, text: str) -> Dict[str, Any]:
+        """번역 결과 1개"""
+        return {
+            'translated_text': f"{self.prefix}{text}" if text and text.strip() else '',
+            'source_lang': self.source_lang,
+            'target_lang': self.target_lang,
+            'confidence': 0.8 if text and text.strip() else 0.0
+        }
+
+    @cached_translate
+    def translate(self, text: str) -> Dict[str, Any]:
+        """
+        텍스트 번역
+
+        Args:
+            text: 번역할 텍스트
+
+        Returns:
+            Dict: {'translated_text', 'source_lang', 'target_lang', 'confidence'}
+        """
+        return self._translate_texts([text])[0]
+
+    @cached_translate_batch
+    def translate_batch(self, texts: List[str]) -> List[Dict[str, Any]]:
+        """
+        여러 텍스트 일괄 번역 (배치 1회 = 호출 1회)
+
+        Args:
+            texts: 번역할 텍스트 리스트
+
+        Returns:
+            List[Dict]: 번역 결과 리스트
+        """
+        return self._translate_texts(texts)
+
+    def _translate_texts(self, texts: List[str]) -> List[Dict[str, Any]]:
+        """배치 크기만큼 부하 후 번역 (캐시 미사용)"""
+        if not self.is_initialized:
+            raise RuntimeError("Model not initialized. Call initialize() first.")
+
+        if not texts:
+            return []
+
+        if not self.workload.run(len(texts)):
+            print("❌ 번역 실패: mock translation failure")
+            return [self._result('') for _ in texts]
+
+        return [self._result(text) for text in texts]
+
+    def cleanup(self):
+        """리소스 정리"""
+        self.is_initialized = False
+
+    def get_model_info(self) -> Dict[str, Any]:
+        """
+        모델 정보 반환
+
+        Returns:
+            Dict: 모델 정보 (호출 통계 포함)
+        """
+        return {
+            'name': 'Mock Translation',
+            'source_lang': self.source_lang,
+            'target_lang': self.target_lang,
+            'initialized': self.is_initialized,
+            'cache': self.cache.get_stats() if self.cache else None,
+            **self.workload.get_stats()
+        }
@@ -8,6 +8,7 @@ from pathlib import Path
 
 
 from services.base_translation import BaseTranslationService
+from services.translation_cache import cached_translate, cached_translate_batch
 
 
 class OpusMTTranslationService(BaseTranslationService):
@@ -21,6 +22,7 @@ class OpusMTTranslationService(BaseTranslationService):
                 - source_lang: 원본 언어 (ko)
                 - target_lang: 대상 언어 (en)
                 - max_length: 최대 토큰 길이
+                - cache: LRU 번역 캐시 설정
         """
         super().__init__(config)
         self.model_name = config.get('model', 'Helsinki-NLP/opus-mt-ko-en')
@@ -61,6 +63,7 @@ class OpusMTTranslationService(BaseTranslationService):
             self.is_initialized = False
             return False
     
+    @cached_translate
     def translate(self, text: str) -> Dict[str, Any]:
         """
         텍스트 번역
@@ -122,6 +125,7 @@ class OpusMTTranslationService(BaseTranslationService):
                 'confidence': 0.0
             }
     
+    @cached_translate_batch
     def translate_batch(self, texts: List[str]) -> List[Dict[str, Any]]:
         """
         여러 텍스트 일괄 번역
@@ -206,7 +210,8 @@ class OpusMTTranslationService(BaseTranslationService):
             'source_lang': self.source_lang,
             'target_lang': self.target_lang,
             'max_length': self.max_length,
-            'initialized': self.is_initialized
+            'initialized': self.is_initialized,
+            'cache': self.cache.get_stats() if self.cache else None
         }
     
     def get_supported_languages(self) -> List[str]:
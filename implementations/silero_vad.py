@@ -0,0 +1,138 @@
+"""
+Silero VAD Implementation
+Silero VAD ONNX 모델 기반 음성 구간 검출 (onnxruntime 필요)
+"""
+
+import numpy as np
+from typing import Dict, Any
+
+from services.base_vad import BaseVADService
+
+
+class SileroVADService(BaseVADService):
+    """Silero VAD (ONNX) 서비스"""
+
+    # Silero는 16kHz에서 512 샘플 프레임만 지원
+    FRAME_SIZE_16K = 512
+
+    # v5 모델이 프레임 앞에 붙이는 이전 프레임 컨텍스트 길이
+    CONTEXT_SIZE_16K = 64
+
+    def __init__(self, config: Dict[str, Any]):
+        """
+        Args:
+            config: VAD 설정 딕셔너리
+                - sample_rate: 샘플링 레이트 (16000)
+                - model_path: Silero VAD ONNX 파일 경로
+                - num_threads: onnxruntime 스레드 수
+        """
+        super().__init__(config)
+        self.frame_size = self.FRAME_SIZE_16K
+        self.model_path = config.get('model_path', 'models/vad/silero_vad.onnx')
+        self.num_threads = config.get('num_threads', 1)
+        self.session = None
+
+        # 모델 버전별 상태 (v5: state + context, v4: h, c)
+        self._is_v5 = True
+        self._state = None
+        self._context = None
+        self._h = None
+        self._c = None
+
+    def initialize(self) -> bool:
+        """
+        ONNX 세션 초기화
+
+        Returns:
+            bool: 초기화 성공 여부
+        """
+        if self.sample_rate != 16000:
+            print(f"❌ Silero VAD는 16kHz만 지원합니다: {self.sample_rate}")
+            return False
+
+        try:
+            import onnxruntime
+
+            options = onnxruntime.SessionOptions()
+            options.intra_op_num_threads = self.num_threads
+            options.inter_op_num_threads = 1
+
+            self.session = onnxruntime.InferenceSession(
+                self.model_path,
+                sess_options=options,
+                providers=['CPUExecutionProvider']
+            )
+
+            input_names = {i.name for i in self.session.get_inputs()}
+            self._is_v5 = 'state' in input_names
+
+            self.reset()
+            self.is_initialized = True
+            return True
+
+        except Exception as e:
+            print(f"❌ Silero VAD 초기화 실패: {e}")
+            self.is_initialized = False
+            return False
+
+    def process_frames(self, frames: np.ndarray) -> np.ndarray:
+        """
+        프레임별 음성 확률 계산 (RNN 상태를 호출 간 유지)
+
+        Args:
+            frames: 오디오 프레임 (float32, shape=(n_frames, 512))
+
+        Returns:
+            np.ndarray: 프레임별 음성 확률 (0-1)
+        """
+        if not self.is_initialized or self.session is None:
+            raise RuntimeError("Model not initialized. Call initialize() first.")
+
+        sr = np.array(self.sample_rate, dtype=np.int64)
+        probs = np.empty(len(frames), dtype=np.float32)
+
+        for i, frame in enumerate(frames):
+            frame = frame.reshape(1, -1).astype(np.float32, copy=False)
+
+            if self._is_v5:
+                x = np.concatenate([self._context, frame], axis=1)
+                out, self._state = self.session.run(
+                    None, {'input': x, 'state': self._state, 'sr': sr}
+                )
+                self._context = x[:, -self.CONTEXT_SIZE_16K:]
+            else:
+                out, self._h, self._c = self.session.run(
+                    None, {'input': frame, 'sr': sr, 'h': self._h, 'c': self._c}
+                )
+
+            probs[i] = float(out.reshape(-1)[0])
+
+        return probs
+
+    def reset(self):
+        """RNN 상태 초기화"""
+        self._state = np.zeros((2, 1, 128), dtype=np.float32)
+        self._context = np.zeros((1, self.CONTEXT_SIZE_16K), dtype=np.float32)
+        self._h = np.zeros((2, 1, 64), dtype=np.float32)
+        self._c = np.zeros((2, 1, 64), dtype=np.float32)
+
+    def cleanup(self):
+        """리소스 정리"""
+        self.session = None
+        self.is_initialized = False
+
+    def get_model_info(self) -> Dict[str, Any]:
+        """
+        모델 정보 반환
+
+        Returns:
+            Dict: 모델 정보
+        """
+        return {
+            'name': 'Silero VAD (ONNX)',
+            'model_path': self.model_path,
+            'version': 'v5' if self._is_v5 else 'v4',
+            'sample_rate': self.sample_rate,
+            'frame_size': self.frame_size,
+            'initialized': self.is_initialized
+        }
@@ -4,7 +4,7 @@ Faster Whisper 기반 음성 인식 구현
 """
 
 import numpy as np
-from typing import Dict, Any, Generator, Optional
+from typing import Dict, Any, Generator, List, Optional
 from pathlib import Path
 import time
 
@@ -14,6 +14,8 @@ from services.base_stt import BaseSTTService
 class WhisperSTTService(BaseSTTService):
     """Faster Whisper 기반 STT 서비스"""
     
+    supports_word_timestamps = True
+    
     def __init__(self, config: Dict[str, Any]):
         """
         Args:
@@ -24,6 +26,8 @@ class WhisperSTTService(BaseSTTService):
                 - language: 언어 코드 (ko)
                 - vad_filter: VAD 필터 사용 여부
                 - beam_size: 빔 서치 크기
+                - word_timestamps: transcribe_stream() 결과에 단어 타임스탬프 포함 여부
+                - cpu_threads: CPU 스레드 수 (0=자동, 번역과 나눠 쓰는 예산)
         """
         super().__init__(config)
         self.model = None
@@ -33,6 +37,8 @@ class WhisperSTTService(BaseSTTService):
         self.language = config.get('language', 'ko')
         self.vad_filter = config.get('vad_filter', True)
         self.beam_size = config.get('beam_size', 5)
+        self.word_timestamps = config.get('word_timestamps', False)
+        self.cpu_threads = config.get('cpu_threads', 0)
         
     def initialize(self) -> bool:
         """
@@ -49,6 +55,7 @@ class WhisperSTTService(BaseSTTService):
                 self.model_size,
                 device=self.device,
                 compute_type=self.compute_type,
+                cpu_threads=self.cpu_threads,
                 download_root="models/whisper"
             )
             
@@ -94,18 +101,27 @@ class WhisperSTTService(BaseSTTService):
                 language=self.language,
                 beam_size=self.beam_size,
                 vad_filter=self.vad_filter,
-                word_timestamps=False
+                word_timestamps=self.word_timestamps
             )
             
             # 세그먼트별로 결과 반환
             for segment in segments:
-                yield {
+                result = {
                     'text': segment.text.strip(),
                     'confidence': segment.avg_logprob,  # 로그 확률
                     'is_final': True,
                     'timestamp': segment.start
                 }
                 
+                # 단어 타임스탬프 (오버랩 중복 제거용)
+                if self.word_timestamps and segment.words:
+                    result['words'] = [
+                        {'word': w.word, 'start': w.start, 'end': w.end, 'probability': w.probability}
+                        for w in segment.words
+                    ]
+                
+                yield result
+                
         except Exception as e:
             print(f"❌ 변환 실패: {e}")
             yield {
@@ -115,6 +131,69 @@ class WhisperSTTService(BaseSTTService):
                 'timestamp': 0.0
             }
     
+    def transcribe_words(
+        self,
+        audio_data: np.ndarray,
+        sample_rate: int = 16000,
+        prompt: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        단어 단위 타임스탬프와 함께 변환 (스트리밍 세션용)
+        
+        Args:
+            audio_data: 오디오 데이터 (numpy array, float32)
+            sample_rate: 샘플링 레이트 (기본 16000Hz)
+            prompt: 이전에 확정된 텍스트 (디코딩 문맥)
+            
+        Returns:
+            List[Dict]: 단어 목록 (word, start, end, probability)
+        """
+        if not self.is_initialized or self.model is None:
+            raise RuntimeError("Model not initialized. Call initialize() first.")
+        
+        try:
+            if audio_data.dtype != np.float32:
+                audio_data = audio_data.astype(np.float32) / 32768.0
+            
+            # 같은 버퍼를 반복 디코딩하므로 이전 결과로 조건부 디코딩하지 않음
+            # (문맥은 prompt로만 전달)
+            segments, info = self.model.transcribe(
+                audio_data,
+                language=self.language,
+                beam_size=self.beam_size,
+                vad_filter=self.vad_filter,
+                word_timestamps=True,
+                initial_prompt=prompt,
+                condition_on_previous_text=False
+            )
+            
+            words = []
+            for segment in segments:
+                for word in segment.words or []:
+                    words.append({
+                        'word': word.word,
+                        'start': word.start,
+                        'end': word.end,
+                        'probability': word.probability
+                    })
+            return words
+            
+        except Exception as e:
+            print(f"❌ 변환 실패: {e}")
+            return []
+    
+    def _warmup_call(self, audio_data: np.ndarray, sample_rate: int):
+        """예열 호출 (VAD 필터를 끄고 디코더까지 실행)"""
+        segments, info = self.model.transcribe(
+            audio_data,
+            language=self.language,
+            beam_size=self.beam_size,
+            vad_filter=False,
+            word_timestamps=self.word_timestamps
+        )
+        for _ in segments:
+            pass
+    
     def transcribe_file(self, audio_path: str) -> str:
         """
         오디오 파일을 텍스트로 변환
@@ -164,6 +243,7 @@ class WhisperSTTService(BaseSTTService):
             'device': self.device,
             'compute_type': self.compute_type,
             'language': self.language,
+            'cpu_threads': self.cpu_threads,
             'initialized': self.is_initialized
         }
 
@@ -9,6 +9,8 @@ Version: 1.0.3
 import sys
 import os
 import argparse
+import contextlib
+import multiprocessing
 import traceback
 from pathlib import Path
 
@@ -40,8 +42,172 @@ def show_error_dialog(title: str, message: str):
         print(f"ERROR: {title}\n{message}")
 
 
+def add_common_arguments(parser: argparse.ArgumentParser, suppress_defaults: bool = False):
+    """
+    GUI / 헤드리스 공통 인자 추가
+    
+    Args:
+        parser: 인자 파서
+        suppress_defaults: 서브커맨드 파서용 (지정하지 않은 인자가 상위 값을 덮어쓰지 않음)
+    """
+    def default(value):
+        return argparse.SUPPRESS if suppress_defaults else value
+    
+    parser.add_argument(
+        '--config',
+        type=str,
+        default=default('config.yaml'),
+        help='설정 파일 경로 (기본값: config.yaml)'
+    )
+    
+    parser.add_argument(
+        '--device',
+        type=int,
+        default=default(None),
+        help='오디오 디바이스 인덱스'
+    )
+    
+    parser.add_argument(
+        '--list-devices',
+        action='store_true',
+        default=default(False),
+        help='사용 가능한 오디오 디바이스 목록 표시'
+    )
+
+
+def print_devices(devices: list):
+    """오디오 디바이스 목록 출력"""
+    print("=== 사용 가능한 오디오 디바이스 ===")
+    for device in devices:
+        print(f"  [{device['index']}] {device['name']}")
+        print(f"      채널: {device['channels']}, 샘플레이트: {device['sample_rate']}Hz")
+    print()
+
+
+def run_headless(args) -> int:
+    """
+    헤드리스 모드 실행 (PyQt5 미사용, 자막을 JSON Lines로 출력)
+    
+    stdout으로 자막을 내보낼 때는 로그를 stderr로 돌려 파이프 출력을 깨끗하게 유지합니다.
+    
+    Args:
+        args: 파싱된 커맨드 라인 인자
+        
+    Returns:
+        int: 종료 코드
+    """
+    from core.engine import CaptionEngine
+    
+    to_stdout = args.output == '-'
+    output = sys.stdout if to_stdout else open(args.output, 'a', encoding='utf-8')
+    log_stream = sys.stderr if to_stdout else sys.stdout
+    
+    try:
+        with contextlib.redirect_stdout(log_stream):
+            engine = CaptionEngine(
+                config_path=args.config,
+                output=output,
+                include_partials=args.partials
+            )
+            
+            if args.list_devices:
+                print_devices(engine.controller.list_audio_devices())
+                return 0
+            
+            return engine.run(device_index=args.device, duration=args.duration)
+    finally:
+        if not to_stdout:
+            output.close()
+
+
+def run_batch(args) -> int:
+    """
+    오프라인 일괄 자막 생성 (SRT / WebVTT / JSON Lines)
+    
+    Args:
+        args: 파싱된 커맨드 라인 인자
+        
+    Returns:
+        int: 종료 코드 (실패한 파일이 있으면 1)
+    """
+    from core.config_manager import ConfigManager
+    from core.batch_transcriber import BatchTranscriber
+    
+    config_mgr = ConfigManager()
+    config_mgr.load_config(args.config)
+    
+    transcriber = BatchTranscriber(
+        config_mgr,
+        output_dir=args.output_dir,
+        workers=args.workers,
+        formats=args.formats.split(',') if args.formats else None,
+        text_mode=args.text
+    )
+    
+    if not transcriber.initialize():
+        return 1
+    
+    try:
+        summary = transcriber.run(args.inputs)
+    finally:
+        transcriber.cleanup()
+    
+    return 1 if summary['failed'] else 0
+
+
+def run_replay(args) -> int:
+    """
+    녹음 파일로 파이프라인 재생 후 지연 / RTF / 버려진 청크 보고
+    
+    Args:
+        args: 파싱된 커맨드 라인 인자
+        
+    Returns:
+        int: 종료 코드
+    """
+    from core.replay import ReplayHarness
+    
+    harness = ReplayHarness(args.input, config_path=args.config, realtime=args.realtime)
+    report = harness.run()
+    
+    total = report['latency'].get('total', {})
+    print("=== 재생 보고서 ===")
+    print(f"  오디오: {report['audio_seconds']:.1f}초, 처리: {report['wall_seconds']:.1f}초 (RTF {report['rtf']:.3f}, STT RTF {report['stt_rtf']:.3f})")
+    print(f"  자막: {report['captions']}개, 지연 p50/p95/p99: {total.get('p50_ms', 0):.0f}/{total.get('p95_ms', 0):.0f}/{total.get('p99_ms', 0):.0f}ms")
+    print(f"  버려진 청크: {report['dropped']}")
+    
+    if args.report:
+        harness.save_report(args.report)
+        print(f"✅ 보고서 저장: {args.report}")
+    return 0
+
+
+def report_startup(profiler, config_path: str):
+    """
+    시작 시간 보고서 출력 (--profile-startup)
+    
+    Args:
+        profiler: StartupProfiler
+        config_path: 설정 파일 경로 (startup.budget_ms, startup.top_modules)
+    """
+    if not profiler.enabled:
+        return
+    profiler.stop()
+    
+    from core.config_manager import ConfigManager
+    config_mgr = ConfigManager()
+    if not config_mgr.config:
+        config_mgr.load_config(config_path)
+    
+    profiler.print_report(
+        budget_ms=config_mgr.get('startup.budget_ms'),
+        top=config_mgr.get('startup.top_modules', 15)
+    )
+
+
 def main():
     """메인 함수"""
+    args = None
     try:
         # 커맨드 라인 인자 파싱
         parser = argparse.ArgumentParser(
@@ -52,61 +218,164 @@ def main():
             '--theme',
             type=str,
             default='panel',
-            choices=['panel', 'transparent', 'ticker'],
+            choices=['panel', 'transparent', 'ticker', 'history'],
             help='자막 테마 (기본값: panel)'
         )
         
+        add_common_arguments(parser)
+        
         parser.add_argument(
+            '--no-auto-start',
+            action='store_true',
+            help='자동 시작 비활성화 (GUI만 표시)'
+        )
+        
+        parser.add_argument(
+            '--profile-startup',
+            action='store_true',
+            help='창 표시까지의 단계별 / 모듈별 import 시간 출력'
+        )
+        
+        # 서브커맨드 (없으면 GUI 실행)
+        subparsers = parser.add_subparsers(dest='command')
+        
+        headless_parser = subparsers.add_parser(
+            'headless',
+            help='GUI 없이 실행하고 자막을 JSON Lines로 출력'
+        )
+        add_common_arguments(headless_parser, suppress_defaults=True)
+        headless_parser.add_argument(
+            '--output', '-o',
+            type=str,
+            default='-',
+            help='JSON Lines 출력 파일 (기본값: - = stdout, 파일은 이어 쓰기)'
+        )
+        headless_parser.add_argument(
+            '--duration',
+            type=float,
+            default=None,
+            help='실행 시간 (초, 기본값: Ctrl+C / SIGTERM까지)'
+        )
+        headless_parser.add_argument(
+            '--partials',
+            action='store_true',
+            help='스트리밍 부분 결과(is_final=false)도 출력'
+        )
+        
+        batch_parser = subparsers.add_parser(
+            'batch',
+            help='오디오/비디오 파일을 SRT / WebVTT / JSON Lines 자막으로 일괄 변환'
+        )
+        batch_parser.add_argument(
+            'inputs',
+            nargs='+',
+            help='입력 파일 또는 디렉토리'
+        )
+        batch_parser.add_argument(
             '--config',
             type=str,
-            default='config.yaml',
+            default=argparse.SUPPRESS,
             help='설정 파일 경로 (기본값: config.yaml)'
         )
-        
-        parser.add_argument(
-            '--device',
+        batch_parser.add_argument(
+            '--output-dir',
+            type=str,
+            default='subtitles',
+            help='자막 / 매니페스트 저장 디렉토리 (기본값: subtitles)'
+        )
+        batch_parser.add_argument(
+            '--workers',
             type=int,
             default=None,
-            help='오디오 디바이스 인덱스'
+            help='STT 프로세스 수 (기본값: batch.workers)'
         )
-        
-        parser.add_argument(
-            '--list-devices',
-            action='store_true',
-            help='사용 가능한 오디오 디바이스 목록 표시'
+        batch_parser.add_argument(
+            '--formats',
+            type=str,
+            default=None,
+            help='저장 형식, 쉼표로 구분 (기본값: batch.formats)'
+        )
+        batch_parser.add_argument(
+            '--text',
+            type=str,
+            default=None,
+            choices=['both', 'source', 'translation'],
+            help='SRT / WebVTT 자막 줄 구성 (기본값: batch.subtitle_text)'
         )
         
-        parser.add_argument(
-            '--no-auto-start',
+        replay_parser = subparsers.add_parser(
+            'replay',
+            help='녹음 파일로 파이프라인을 재생하고 지연 / RTF 보고서 출력'
+        )
+        replay_parser.add_argument(
+            'input',
+            help='오디오/비디오 파일'
+        )
+        replay_parser.add_argument(
+            '--config',
+            type=str,
+            default=argparse.SUPPRESS,
+            help='설정 파일 경로 (기본값: config.yaml)'
+        )
+        replay_parser.add_argument(
+            '--realtime',
             action='store_true',
-            help='자동 시작 비활성화 (GUI만 표시)'
+            help='실제 시간 속도로 재생 (기본값: 쉬는 구간을 건너뛰는 fast 모드)'
+        )
+        replay_parser.add_argument(
+            '--report',
+            type=str,
+            default=None,
+            help='보고서 JSON 저장 경로'
         )
         
         args = parser.parse_args()
         
-        # GUI 모듈 임포트
-        from gui.app import LiveCaptionApp
+        # 시작 시간 측정 (--profile-startup)
+        from core.startup_profiler import StartupProfiler
+        profiler = StartupProfiler(enabled=args.profile_startup).start()
         
-        # 애플리케이션 생성
-        app = LiveCaptionApp(
-            config_path=args.config,
-            theme_name=args.theme
-        )
+        # 헤드리스 모드 (Qt 미사용)
+        if args.command == 'headless':
+            return run_headless(args)
+        
+        # 오프라인 일괄 처리 (Qt 미사용)
+        if args.command == 'batch':
+            return run_batch(args)
+        
+        # 녹음 파일 재생 (Qt 미사용)
+        if args.command == 'replay':
+            return run_replay(args)
         
-        # 디바이스 목록 표시
+        # 디바이스 목록 표시 (Qt / 모델 로드 없이)
         if args.list_devices:
-            print("=== 사용 가능한 오디오 디바이스 ===")
-            devices = app.list_audio_devices()
-            for device in devices:
-                print(f"  [{device['index']}] {device['name']}")
-                print(f"      채널: {device['channels']}, 샘플레이트: {device['sample_rate']}Hz")
-            print()
+            with profiler.phase('list_devices'):
+                from core.audio_capture import AudioCapture
+                audio = AudioCapture()
+                audio.initialize()
+                print_devices(audio.list_devices())
+                audio.cleanup()
+            report_startup(profiler, args.config)
             return 0
         
-        # 초기화
-        if not app.initialize():
+        # GUI 모듈 임포트
+        with profiler.phase('gui_import'):
+            from gui.app import LiveCaptionApp
+        
+        # 애플리케이션 생성
+        with profiler.phase('app_create'):
+            app = LiveCaptionApp(
+                config_path=args.config,
+                theme_name=args.theme
+            )
+        
+        # 초기화 (창 표시, 모델은 백그라운드 로드)
+        with profiler.phase('initialize'):
+            initialized = app.initialize()
+        if not initialized:
             show_error_dialog("초기화 실패", "애플리케이션 초기화에 실패했습니다.")
             return 1
+        report_startup(profiler, args.config)
         
         # 자동 시작
         if not args.no_auto_start:
@@ -119,7 +388,10 @@ def main():
         
     except Exception as e:
         error_msg = f"오류 발생:\n{str(e)}\n\n상세:\n{traceback.format_exc()}"
-        show_error_dialog("Live Caption 오류", error_msg)
+        if getattr(args, 'command', None) in ('headless', 'batch', 'replay'):
+            print(f"ERROR: Live Caption 오류\n{error_msg}", file=sys.stderr)
+        else:
+            show_error_dialog("Live Caption 오류", error_msg)
         
         # 로그 파일에도 기록
         try:
@@ -133,4 +405,6 @@ def main():
 
 
 if __name__ == '__main__':
+    # PyInstaller 빌드에서 일괄 처리 프로세스 풀 사용
+    multiprocessing.freeze_support()
     sys.exit(main())
@@ -4,13 +4,18 @@ Speech-to-Text (STT) Service Interface
 """
 
 from abc import ABC, abstractmethod
-from typing import Generator, Dict, Any, Optional
+from typing import Generator, Dict, Any, List, Optional
 import numpy as np
 
+from services.warmup import synthetic_speech, time_calls
+
 
 class BaseSTTService(ABC):
     """STT 서비스 추상 기본 클래스"""
     
+    # 단어 단위 타임스탬프 지원 여부 (스트리밍 세션에 필요)
+    supports_word_timestamps = False
+    
     def __init__(self, config: Dict[str, Any]):
         """
         Args:
@@ -47,11 +52,59 @@ class BaseSTTService(ABC):
                 'text': str,           # 인식된 텍스트
                 'confidence': float,   # 신뢰도 (0-1)
                 'is_final': bool,      # 최종 결과 여부
-                'timestamp': float     # 타임스탬프
+                'timestamp': float,    # 타임스탬프
+                'words': list          # (선택) 단어 타임스탬프, transcribe_words()와 같은 형식
             }
         """
         pass
     
+    def transcribe_words(
+        self,
+        audio_data: np.ndarray,
+        sample_rate: int = 16000,
+        prompt: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        단어 단위 타임스탬프와 함께 변환 (스트리밍 세션용)
+        
+        supports_word_timestamps = True인 서비스가 재정의합니다.
+        지원하지 않는 서비스는 단어를 내지 않으므로 빈 리스트를 반환합니다.
+        
+        Args:
+            audio_data: 오디오 데이터 (numpy array, float32)
+            sample_rate: 샘플링 레이트 (기본 16000Hz)
+            prompt: 이전에 확정된 텍스트 (디코딩 문맥)
+            
+        Returns:
+            List[Dict]: [{
+                'word': str,           # 단어 (앞 공백 포함)
+                'start': float,        # 시작 시각 (오디오 시작 기준, 초)
+                'end': float,          # 종료 시각 (초)
+                'probability': float   # 단어 확률 (0-1)
+            }, ...]
+        """
+        return []
+    
+    def warmup(self, runs: int = 2, seconds: float = 2.0, sample_rate: int = 16000) -> Dict[str, Any]:
+        """
+        합성 오디오로 모델 예열 (initialize() 직후, 첫 실제 청크가 예열 비용을 내지 않도록)
+        
+        Args:
+            runs: 반복 횟수 (첫 호출 + 이후 호출)
+            seconds: 합성 오디오 길이 (초)
+            sample_rate: 샘플링 레이트
+            
+        Returns:
+            Dict: {'runs', 'first_ms', 'steady_ms'}
+        """
+        audio = synthetic_speech(seconds, sample_rate)
+        return time_calls(lambda: self._warmup_call(audio, sample_rate), runs)
+    
+    def _warmup_call(self, audio_data: np.ndarray, sample_rate: int):
+        """예열 호출 1회 (기본: transcribe_stream() 결과 소비)"""
+        for _ in self.transcribe_stream(audio_data, sample_rate):
+            pass
+    
     @abstractmethod
     def transcribe_file(self, audio_path: str) -> str:
         """
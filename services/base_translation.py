@@ -4,7 +4,10 @@ Translation Service Interface
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
+
+from services.translation_cache import TranslationCache, normalize_text
+from services.warmup import WARMUP_SENTENCE, time_calls
 
 
 class BaseTranslationService(ABC):
@@ -14,12 +17,16 @@ class BaseTranslationService(ABC):
         """
         Args:
             config: 번역 설정 딕셔너리
+                - cache: LRU 번역 캐시 설정 {enabled, max_entries, max_bytes}
         """
         self.config = config
         self.source_lang = config.get('source_lang', 'ko')
         self.target_lang = config.get('target_lang', 'en')
         self.is_initialized = False
         
+        # 번역 캐시 (구현체의 translate()에 cached_translate 데코레이터로 연결)
+        self.cache: Optional[TranslationCache] = TranslationCache.from_config(config.get('cache'))
+        
     @abstractmethod
     def initialize(self) -> bool:
         """
@@ -61,6 +68,48 @@ class BaseTranslationService(ABC):
         """
         pass
     
+    def warmup(self, runs: int = 2, text: str = WARMUP_SENTENCE) -> Dict[str, Any]:
+        """
+        짧은 문장으로 모델 예열 (캐시를 거치지 않고 매번 모델 호출)
+        
+        Args:
+            runs: 반복 횟수 (첫 호출 + 이후 호출)
+            text: 예열 문장
+            
+        Returns:
+            Dict: {'runs', 'first_ms', 'steady_ms'}
+        """
+        # cached_translate 데코레이터가 감싼 원래 함수 호출
+        translate = type(self).translate
+        translate = getattr(translate, '__wrapped__', translate)
+        return time_calls(lambda: translate(self, text), runs)
+    
+    def cache_key(self, text: str) -> Tuple[str, str, str]:
+        """
+        캐시 키 생성
+        
+        Args:
+            text: 원문
+            
+        Returns:
+            Tuple: (정규화된 원문, 원본 언어, 대상 언어)
+        """
+        return (normalize_text(text), self.source_lang, self.target_lang)
+    
+    def get_cached(self, text: str) -> Optional[Dict[str, Any]]:
+        """
+        캐시된 번역 조회 (모델 호출 없음, 실패는 이어지는 translate() 호출에서 집계)
+        
+        Args:
+            text: 원문
+            
+        Returns:
+            Optional[Dict]: 캐시된 번역 결과 (없거나 캐시 비활성이면 None)
+        """
+        if self.cache is None or not text or not text.strip():
+            return None
+        return self.cache.get(self.cache_key(text), count_miss=False)
+    
     def set_languages(self, source_lang: str, target_lang: str):
         """
         번역 언어 설정
@@ -89,7 +138,8 @@ class BaseTranslationService(ABC):
             'source_lang': self.source_lang,
             'target_lang': self.target_lang,
             'config': self.config,
-            'initialized': self.is_initialized
+            'initialized': self.is_initialized,
+            'cache': self.cache.get_stats() if self.cache else None
         }
     
     def get_supported_languages(self) -> List[str]:
@@ -0,0 +1,75 @@
+"""
+Voice Activity Detection (VAD) Service Interface
+음성 구간 검출 서비스 추상 인터페이스
+"""
+
+from abc import ABC, abstractmethod
+from typing import Dict, Any
+import numpy as np
+
+
+class BaseVADService(ABC):
+    """VAD 서비스 추상 기본 클래스"""
+
+    def __init__(self, config: Dict[str, Any]):
+        """
+        Args:
+            config: VAD 설정 딕셔너리
+                - sample_rate: 샘플링 레이트 (16000)
+                - frame_ms: 프레임 길이 (밀리초)
+        """
+        self.config = config
+        self.sample_rate = config.get('sample_rate', 16000)
+        self.frame_size = int(self.sample_rate * config.get('frame_ms', 30) / 1000)
+        self.is_initialized = False
+
+    @abstractmethod
+    def initialize(self) -> bool:
+        """
+        VAD 초기화
+
+        Returns:
+            bool: 초기화 성공 여부
+        """
+        pass
+
+    @abstractmethod
+    def process_frames(self, frames: np.ndarray) -> np.ndarray:
+        """
+        프레임별 음성 확률 계산
+
+        호출 간 내부 상태(잡음 레벨, RNN 상태 등)를 유지하므로 오디오를
+        시간 순서대로, 겹치지 않게 전달해야 합니다.
+
+        Args:
+            frames: 오디오 프레임 (float32, shape=(n_frames, frame_size))
+
+        Returns:
+            np.ndarray: 프레임별 음성 확률 (float32, shape=(n_frames,), 0-1)
+        """
+        pass
+
+    @abstractmethod
+    def reset(self):
+        """스트림 상태 초기화"""
+        pass
+
+    @abstractmethod
+    def cleanup(self):
+        """리소스 정리"""
+        pass
+
+    def get_model_info(self) -> Dict[str, Any]:
+        """
+        모델 정보 반환
+
+        Returns:
+            Dict: 모델 정보
+        """
+        return {
+            'name': self.__class__.__name__,
+            'sample_rate': self.sample_rate,
+            'frame_size': self.frame_size,
+            'config': self.config,
+            'initialized': self.is_initialized
+        }
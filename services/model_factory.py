@@ -1,11 +1,17 @@
 """
 Model Factory
 설정에 따라 적절한 STT/번역 서비스 구현체를 생성하는 팩토리
+
+구현체는 클래스 또는 'module:Class' 경로 문자열로 등록합니다. 경로로 등록하면
+해당 백엔드를 처음 생성할 때 모듈을 import하므로, 쓰지 않는 백엔드의 의존성은
+로드되지 않습니다.
 """
 
-from typing import Dict, Any, Optional
+import importlib
+from typing import Dict, Any, Optional, Union
 from services.base_stt import BaseSTTService
 from services.base_translation import BaseTranslationService
+from services.base_vad import BaseVADService
 
 
 class ModelFactory:
@@ -17,32 +23,82 @@ class ModelFactory:
     # 등록된 번역 구현체
     _translation_implementations = {}
     
+    # 등록된 VAD 구현체
+    _vad_implementations = {}
+    
+    @staticmethod
+    def _check(implementation: Union[type, str], base: type):
+        """클래스 등록 시 상속 확인 (경로 문자열은 생성 시 확인)"""
+        if isinstance(implementation, str):
+            if ':' not in implementation:
+                raise ValueError(f"Lazy implementation must be 'module:Class', got '{implementation}'")
+            return
+        if not issubclass(implementation, base):
+            raise TypeError(f"{implementation} must inherit from {base.__name__}")
+    
+    @staticmethod
+    def _resolve(registry: Dict[str, Union[type, str]], name: str, base: type, kind: str) -> type:
+        """
+        등록된 구현체 클래스 가져오기 (경로 문자열이면 import 후 클래스로 교체)
+        
+        Args:
+            registry: 구현체 등록 딕셔너리
+            name: 구현체 이름
+            base: 상속해야 하는 기본 클래스
+            kind: 오류 메시지용 종류 이름
+            
+        Returns:
+            type: 구현체 클래스
+        """
+        implementation = registry.get(name)
+        if implementation is None:
+            raise ValueError(f"{kind} implementation '{name}' not registered")
+        
+        if isinstance(implementation, str):
+            module_name, class_name = implementation.split(':', 1)
+            implementation = getattr(importlib.import_module(module_name), class_name)
+            if not issubclass(implementation, base):
+                raise TypeError(f"{implementation} must inherit from {base.__name__}")
+            registry[name] = implementation
+        
+        return implementation
+    
     @classmethod
-    def register_stt(cls, name: str, implementation: type):
+    def register_stt(cls, name: str, implementation: Union[type, str]):
         """
         STT 구현체 등록
         
         Args:
             name: 구현체 이름
-            implementation: BaseSTTService를 상속한 클래스
+            implementation: BaseSTTService를 상속한 클래스 또는 'module:Class' 경로
         """
-        if not issubclass(implementation, BaseSTTService):
-            raise TypeError(f"{implementation} must inherit from BaseSTTService")
+        cls._check(implementation, BaseSTTService)
         cls._stt_implementations[name] = implementation
     
     @classmethod
-    def register_translation(cls, name: str, implementation: type):
+    def register_translation(cls, name: str, implementation: Union[type, str]):
         """
         번역 구현체 등록
         
         Args:
             name: 구현체 이름
-            implementation: BaseTranslationService를 상속한 클래스
+            implementation: BaseTranslationService를 상속한 클래스 또는 'module:Class' 경로
         """
-        if not issubclass(implementation, BaseTranslationService):
-            raise TypeError(f"{implementation} must inherit from BaseTranslationService")
+        cls._check(implementation, BaseTranslationService)
         cls._translation_implementations[name] = implementation
     
+    @classmethod
+    def register_vad(cls, name: str, implementation: Union[type, str]):
+        """
+        VAD 구현체 등록
+        
+        Args:
+            name: 구현체 이름
+            implementation: BaseVADService를 상속한 클래스 또는 'module:Class' 경로
+        """
+        cls._check(implementation, BaseVADService)
+        cls._vad_implementations[name] = implementation
+    
     @classmethod
     def create_stt_service(
         cls, 
@@ -53,24 +109,25 @@ class ModelFactory:
         STT 서비스 생성
         
         Args:
-            profile: 성능 프로필 ('light', 'standard')
-            config: STT 설정
+            profile: 성능 프로필 ('lightweight', 'standard', 'light'는 lightweight 별칭)
+            config: STT 설정 (backend: whisper 외의 값이면 프로필 대신 해당 구현체)
             
         Returns:
             BaseSTTService: STT 서비스 인스턴스
         """
-        # 프로필에 따라 구현체 선택
-        if profile == 'light':
+        # backend 키가 whisper가 아니면 그 구현체, 아니면 프로필에 따라 선택
+        backend = config.get('backend', 'whisper')
+        if backend != 'whisper':
+            implementation_name = backend
+        elif profile in ('lightweight', 'light'):
             implementation_name = 'whisper_light'
         elif profile == 'standard':
             implementation_name = 'whisper_standard'
         else:
             raise ValueError(f"Unknown profile: {profile}")
         
-        # 구현체 가져오기
-        implementation = cls._stt_implementations.get(implementation_name)
-        if implementation is None:
-            raise ValueError(f"STT implementation '{implementation_name}' not registered")
+        # 구현체 가져오기 (처음 사용할 때 모듈 import)
+        implementation = cls._resolve(cls._stt_implementations, implementation_name, BaseSTTService, "STT")
         
         # 인스턴스 생성
         return implementation(config)
@@ -84,23 +141,47 @@ class ModelFactory:
         번역 서비스 생성
         
         Args:
-            config: 번역 설정
+            config: 번역 설정 (backend: opus_mt, ctranslate2, mock)
             
         Returns:
             BaseTranslationService: 번역 서비스 인스턴스
         """
-        # 모델 이름에서 구현체 선택
+        # backend 키로 구현체 선택 (없으면 모델 이름에서 선택)
         model_name = config.get('model', 'Helsinki-NLP/opus-mt-ko-en')
         
-        if 'opus-mt' in model_name.lower():
+        if config.get('backend'):
+            implementation_name = config['backend']
+        elif 'opus-mt' in model_name.lower():
             implementation_name = 'opus_mt'
         else:
             implementation_name = 'opus_mt'  # 기본값
         
-        # 구현체 가져오기
-        implementation = cls._translation_implementations.get(implementation_name)
-        if implementation is None:
-            raise ValueError(f"Translation implementation '{implementation_name}' not registered")
+        # 구현체 가져오기 (처음 사용할 때 모듈 import)
+        implementation = cls._resolve(
+            cls._translation_implementations, implementation_name, BaseTranslationService, "Translation"
+        )
+        
+        # 인스턴스 생성
+        return implementation(config)
+    
+    @classmethod
+    def create_vad_service(
+        cls,
+        config: Dict[str, Any]
+    ) -> Optional[BaseVADService]:
+        """
+        VAD 서비스 생성
+        
+        Args:
+            config: VAD 설정 (backend 키로 구현체 선택)
+            
+        Returns:
+            BaseVADService: VAD 서비스 인스턴스
+        """
+        implementation_name = config.get('backend', 'energy')
+        
+        # 구현체 가져오기 (처음 사용할 때 모듈 import)
+        implementation = cls._resolve(cls._vad_implementations, implementation_name, BaseVADService, "VAD")
         
         # 인스턴스 생성
         return implementation(config)
@@ -114,3 +195,8 @@ class ModelFactory:
     def list_translation_implementations(cls) -> list:
         """등록된 번역 구현체 목록"""
         return list(cls._translation_implementations.keys())
+    
+    @classmethod
+    def list_vad_implementations(cls) -> list:
+        """등록된 VAD 구현체 목록"""
+        return list(cls._vad_implementations.keys())
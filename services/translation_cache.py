@@ -0,0 +1,196 @@
+"""
+Translation Cache
+정규화된 원문 기준 LRU 번역 캐시
+
+인사말, 반복 안내 문구처럼 실시간 행사에서 자주 반복되는 문장은 모델을
+다시 돌리지 않고 캐시된 번역을 사용합니다. 번역 구현체는 translate() /
+translate_batch()에 cached_translate / cached_translate_batch 데코레이터를
+붙여 캐시를 사용합니다.
+"""
+
+import functools
+import re
+import threading
+import unicodedata
+from collections import OrderedDict
+from typing import Dict, Any, List, Optional, Tuple
+
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_text(text: str) -> str:
+    """캐시 키용 원문 정규화 (유니코드 NFC, 공백 정리)"""
+    return _WHITESPACE.sub(' ', unicodedata.normalize('NFC', text)).strip()
+
+
+class TranslationCache:
+    """스레드 안전 LRU 번역 캐시 (항목 수 / 용량 제한)"""
+
+    def __init__(self, max_entries: int = 2048, max_bytes: int = 4 * 1024 * 1024):
+        """
+        Args:
+            max_entries: 최대 항목 수
+            max_bytes: 최대 용량 (원문 + 번역문 UTF-8 바이트 기준)
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+
+        self._entries: 'OrderedDict[Tuple[str, str, str], Tuple[Dict[str, Any], int]]' = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+        # 통계
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @classmethod
+    def from_config(cls, config: Optional[Dict[str, Any]]) -> Optional['TranslationCache']:
+        """
+        번역 설정의 cache 섹션으로 생성
+
+        Args:
+            config: {enabled, max_entries, max_bytes} (None이면 비활성)
+
+        Returns:
+            Optional[TranslationCache]: 비활성이면 None
+        """
+        if not config or not config.get('enabled', False):
+            return None
+        return cls(
+            max_entries=config.get('max_entries', 2048),
+            max_bytes=config.get('max_bytes', 4 * 1024 * 1024)
+        )
+
+    def get(self, key: Tuple[str, str, str], count_miss: bool = True) -> Optional[Dict[str, Any]]:
+        """
+        캐시 조회 (적중 시 최근 사용으로 이동)
+
+        Args:
+            key: (정규화된 원문, 원본 언어, 대상 언어)
+            count_miss: 실패를 통계에 반영 (뒤이어 번역 경로에서 다시 조회하면 False)
+
+        Returns:
+            Optional[Dict]: 번역 결과 사본 (없으면 None)
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += count_miss
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return dict(entry[0])
+
+    def put(self, key: Tuple[str, str, str], result: Dict[str, Any]):
+        """
+        번역 결과 저장 (한도 초과 시 오래된 항목부터 제거)
+
+        Args:
+            key: (정규화된 원문, 원본 언어, 대상 언어)
+            result: 번역 결과
+        """
+        size = len(key[0].encode('utf-8')) + len(result.get('translated_text', '').encode('utf-8'))
+        if size > self.max_bytes:
+            return
+
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes -= old[1]
+
+            self._entries[key] = (dict(result), size)
+            self._bytes += size
+
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self._bytes -= evicted_size
+                self.evictions += 1
+
+    def clear(self):
+        """모든 항목 삭제 (통계 유지)"""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        캐시 통계
+
+        Returns:
+            Dict: 적중/실패/제거 횟수, 적중률, 항목 수, 사용 용량
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+                'entries': len(self._entries),
+                'bytes': self._bytes,
+                'max_entries': self.max_entries,
+                'max_bytes': self.max_bytes
+            }
+
+
+def _cacheable(result: Dict[str, Any]) -> bool:
+    """실패한 번역(빈 결과)은 캐시하지 않음"""
+    return bool(result.get('translated_text')) and result.get('confidence', 0.0) > 0.0
+
+
+def cached_translate(translate):
+    """translate(text) 앞단 캐시 데코레이터 (self.cache 사용)"""
+    @functools.wraps(translate)
+    def wrapper(self, text: str) -> Dict[str, Any]:
+        cache = getattr(self, 'cache', None)
+        if cache is None or not text or not text.strip():
+            return translate(self, text)
+
+        key = self.cache_key(text)
+        result = cache.get(key)
+        if result is not None:
+            return result
+
+        result = translate(self, text)
+        if _cacheable(result):
+            cache.put(key, result)
+        return result
+    return wrapper
+
+
+def cached_translate_batch(translate_batch):
+    """translate_batch(texts) 앞단 캐시 데코레이터 (캐시에 없는 문장만 번역)"""
+    @functools.wraps(translate_batch)
+    def wrapper(self, texts: List[str]) -> List[Dict[str, Any]]:
+        cache = getattr(self, 'cache', None)
+        if cache is None or not texts:
+            return translate_batch(self, texts)
+
+        results: List[Optional[Dict[str, Any]]] = [None] * len(texts)
+        missing: Dict[Tuple[str, str, str], List[int]] = {}
+
+        for i, text in enumerate(texts):
+            if not text or not text.strip():
+                missing.setdefault(('', '', ''), []).append(i)
+                continue
+            key = self.cache_key(text)
+            result = cache.get(key) if key not in missing else None
+            if result is not None:
+                results[i] = result
+            else:
+                missing.setdefault(key, []).append(i)
+
+        if missing:
+            # 같은 문장은 한 번만 번역
+            keys = list(missing)
+            translated = translate_batch(self, [texts[missing[key][0]] for key in keys])
+            for key, result in zip(keys, translated):
+                if key[0] and _cacheable(result):
+                    cache.put(key, result)
+                for i in missing[key]:
+                    results[i] = dict(result)
+
+        return results
+    return wrapper
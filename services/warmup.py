@@ -0,0 +1,62 @@
+"""
+Model Warm-up
+초기화 직후 합성 입력으로 모델을 한 번 돌려 첫 호출 비용(지연 할당, 커널 선택)을 미리 지불
+"""
+
+import statistics
+import time
+from typing import Callable, Dict, Any
+
+import numpy as np
+
+
+# 번역 예열 문장
+WARMUP_SENTENCE = "안녕하세요, 실시간 자막 모델을 준비하고 있습니다."
+
+
+def synthetic_speech(seconds: float = 2.0, sample_rate: int = 16000) -> np.ndarray:
+    """
+    음성과 비슷한 합성 오디오 (VAD가 무음으로 버리지 않도록 음절 단위 진폭 변조)
+
+    Args:
+        seconds: 길이 (초)
+        sample_rate: 샘플링 레이트
+
+    Returns:
+        np.ndarray: float32 오디오 (-1 ~ 1)
+    """
+    t = np.arange(int(seconds * sample_rate)) / sample_rate
+    pitch = 140 + 30 * np.sin(2 * np.pi * 0.7 * t)
+    phase = 2 * np.pi * np.cumsum(pitch) / sample_rate
+    voiced = sum(np.sin(k * phase) / k for k in range(1, 6))
+    envelope = 0.5 * (1 + np.sin(2 * np.pi * 4 * t))
+    noise = np.random.default_rng(0).standard_normal(len(t)) * 0.01
+    return (0.2 * voiced * envelope + noise).astype(np.float32)
+
+
+def time_calls(call: Callable[[], Any], runs: int = 2) -> Dict[str, Any]:
+    """
+    같은 호출을 반복해 첫 호출과 이후 호출 지연 비교
+
+    Args:
+        call: 예열 호출
+        runs: 반복 횟수 (1 이상)
+
+    Returns:
+        Dict: {
+            'runs': 반복 횟수,
+            'first_ms': 첫 호출 지연,
+            'steady_ms': 이후 호출 지연 중앙값 (runs=1이면 None)
+        }
+    """
+    durations = []
+    for _ in range(max(1, runs)):
+        started = time.perf_counter()
+        call()
+        durations.append((time.perf_counter() - started) * 1000)
+
+    return {
+        'runs': len(durations),
+        'first_ms': round(durations[0], 1),
+        'steady_ms': round(statistics.median(durations[1:]), 1) if len(durations) > 1 else None
+    }
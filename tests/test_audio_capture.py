@@ -12,7 +12,7 @@ import numpy as np
 PROJECT_ROOT = Path(__file__).parent.parent
 sys.path.insert(0, str(PROJECT_ROOT))
 
-from core.audio_capture import AudioCapture
+from core.audio_capture import AudioCapture, GAP
 
 
 def test_audio_capture_init():
@@ -116,6 +116,124 @@ def test_audio_stream_generator():
     capture.cleanup()
 
 
+def test_callback_mode_stream_callback():
+    """콜백 모드 스트림 콜백 테스트 (디바이스 불필요)"""
+    import pyaudio
+
+    capture = AudioCapture(
+        sample_rate=16000,
+        chunk_duration=0.1,
+        buffer_size=800,
+        capture_mode='callback'
+    )
+    capture.is_recording = True
+
+    data = np.zeros(800, dtype=np.int16).tobytes()
+    _, flag = capture._stream_callback(data, 800, {}, pyaudio.paInputOverflow)
+    assert flag == pyaudio.paContinue
+    assert not capture._chunk_ready.is_set()
+
+    capture._stream_callback(data, 800, {}, pyaudio.paInputUnderflow)
+    assert capture._chunk_ready.is_set()
+
+    capture._emit_chunks(None)
+    assert capture.audio_queue.qsize() == 1
+
+    stats = capture.get_capture_stats()
+    assert stats['capture_mode'] == 'callback'
+    assert stats['input_overflows'] == 1
+    assert stats['input_underflows'] == 1
+
+    capture.is_recording = False
+    _, flag = capture._stream_callback(data, 800, {}, 0)
+    assert flag == pyaudio.paComplete
+
+
+
+def fill_queue(policy: str, chunks: int):
+    """큐 크기 2인 캡처에 청크 여러 개를 넣고 남은 청크의 첫 샘플 반환"""
+    capture = AudioCapture(
+        sample_rate=16000,
+        chunk_duration=0.1,
+        overlap_ratio=0.0,
+        queue_size=2,
+        overflow_policy=policy
+    )
+    for i in range(chunks):
+        capture._enqueue(np.full(1600, i, dtype=np.float32))
+
+    remaining = []
+    while not capture.audio_queue.empty():
+        chunk, _, _, _, _ = capture.audio_queue.get_nowait()
+        remaining.append(int(chunk[0]))
+    return capture, remaining
+
+
+def test_overflow_drop_oldest():
+    """drop_oldest: 가득 차면 가장 오래된 청크부터 버림"""
+    capture, remaining = fill_queue('drop_oldest', 5)
+    assert remaining == [3, 4]
+    assert capture.get_capture_stats()['queue']['dropped_overflow'] == 3
+
+
+def test_overflow_latest():
+    """latest: 가득 차면 대기 중인 청크를 모두 버리고 최신 청크만 유지"""
+    capture, remaining = fill_queue('latest', 5)
+    assert remaining == [4]
+    assert capture.dropped_overflow == 4
+
+
+def test_overflow_block_after_stop():
+    """block: 녹음 중이 아니면 대기하지 않고 버림"""
+    capture, remaining = fill_queue('block', 3)
+    assert remaining == [0, 1]
+    assert capture.dropped_overflow == 1
+
+
+def test_dropped_chunks_marked_as_gap():
+    """버려진 청크 바로 다음 청크는 분할 사유 자리에 GAP 표시"""
+    capture = AudioCapture(
+        sample_rate=16000,
+        chunk_duration=0.1,
+        overlap_ratio=0.0,
+        queue_size=2,
+        overflow_policy='drop_oldest'
+    )
+    capture._enqueue(np.full(1600, 0, dtype=np.float32))
+    stream = capture.get_traced_stream()
+    chunk, _, _, cut = next(stream)
+    assert cut is None
+
+    for i in range(1, 5):
+        capture._enqueue(np.full(1600, i, dtype=np.float32))
+
+    items = [(int(chunk[0]), cut) for chunk, _, _, cut in stream]
+    assert items == [(3, GAP), (4, None)]
+
+
+def test_frames_returned_when_consumer_moves_on():
+    """소비자가 들고 있는 청크 프레임은 다음 청크를 요청할 때까지 재사용하지 않음"""
+    capture = AudioCapture(sample_rate=16000, chunk_duration=0.1, overlap_ratio=0.0)
+    capture._enqueue(capture.frame_pool.acquire())
+    stream = capture.get_traced_stream()
+    held, _, _, _ = next(stream)
+
+    second = capture.frame_pool.acquire()
+    assert second is not held
+    capture._enqueue(second)
+    next(stream)
+    assert capture.frame_pool.acquire() is held
+
+
+def test_unknown_overflow_policy():
+    """알 수 없는 overflow_policy는 ValueError"""
+    try:
+        AudioCapture(overflow_policy='drop_newest')
+        assert False, "expected ValueError"
+    except ValueError:
+        pass
+
+
 if __name__ == '__main__':
     print("=" * 60)
     print("Live Caption - Audio Capture Tests")
@@ -0,0 +1,177 @@
+"""
+Batch Transcriber Tests
+오프라인 일괄 자막 생성 단위 테스트 (프로세스 내 실행, 테스트용 모델)
+"""
+
+import sys
+import json
+import wave
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+# Add project root to path
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from services.base_stt import BaseSTTService
+from services.base_translation import BaseTranslationService
+from services.model_factory import ModelFactory
+from core.config_manager import ConfigManager
+from core.batch_transcriber import BatchTranscriber
+from core.subtitle_writer import format_timestamp, format_srt, format_vtt
+
+
+SAMPLE_RATE = 16000
+
+
+class LengthSTT(BaseSTTService):
+    """구간 길이를 텍스트로 돌려주는 테스트용 STT"""
+
+    calls = 0
+
+    def initialize(self) -> bool:
+        self.is_initialized = True
+        return True
+
+    def transcribe_stream(self, audio_data, sample_rate=16000):
+        LengthSTT.calls += 1
+        yield {
+            'text': f"발화 {len(audio_data) / sample_rate:.1f}초",
+            'confidence': 0.9,
+            'is_final': True,
+            'timestamp': 0.0
+        }
+
+    def transcribe_file(self, audio_path: str) -> str:
+        return ""
+
+    def cleanup(self):
+        self.is_initialized = False
+
+
+class PrefixTranslation(BaseTranslationService):
+    """'en:' 접두사를 붙이는 테스트용 번역"""
+
+    def __init__(self):
+        super().__init__({})
+        self.batches = []
+
+    def initialize(self) -> bool:
+        self.is_initialized = True
+        return True
+
+    def translate(self, text):
+        return self.translate_batch([text])[0]
+
+    def translate_batch(self, texts):
+        self.batches.append(list(texts))
+        return [{'translated_text': f"en:{t}", 'source_lang': 'ko', 'target_lang': 'en', 'confidence': 0.8} for t in texts]
+
+    def cleanup(self):
+        self.is_initialized = False
+
+
+def write_wav(path: Path, audio: np.ndarray):
+    """16비트 모노 WAV 저장"""
+    with wave.open(str(path), 'wb') as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(SAMPLE_RATE)
+        wav.writeframes((audio * 32767).astype(np.int16).tobytes())
+
+
+def tone(seconds: float) -> np.ndarray:
+    """음성 대용 톤"""
+    t = np.arange(int(SAMPLE_RATE * seconds)) / SAMPLE_RATE
+    return (np.sin(2 * np.pi * 200 * t) * 0.3).astype(np.float32)
+
+
+def silence(seconds: float) -> np.ndarray:
+    """배경 잡음"""
+    rng = np.random.default_rng(1)
+    return (rng.standard_normal(int(SAMPLE_RATE * seconds)) * 0.001).astype(np.float32)
+
+
+@pytest.fixture
+def transcriber(tmp_path, monkeypatch):
+    """테스트용 STT / 번역을 쓰는 프로세스 내 일괄 처리기"""
+    import implementations  # noqa: F401  (등록 후 교체)
+    monkeypatch.setitem(ModelFactory._stt_implementations, 'whisper_light', LengthSTT)
+    LengthSTT.calls = 0
+
+    config_mgr = ConfigManager()
+    config_mgr.load_config(str(PROJECT_ROOT / "config.yaml"))
+
+    batch = BatchTranscriber(config_mgr, output_dir=str(tmp_path / "out"), use_processes=False)
+    vad_config = {'sample_rate': SAMPLE_RATE, 'backend': 'energy', 'frame_ms': 30, 'threshold': 0.5}
+    monkeypatch.setattr(batch, '_worker_args', lambda: ('light', {}, vad_config, {}, SAMPLE_RATE))
+    batch.translation_service = PrefixTranslation()
+    return batch
+
+
+def test_timestamp_formats():
+    """SRT / WebVTT 시각 형식"""
+    assert format_timestamp(3725.5) == "01:02:05,500"
+    assert format_timestamp(0.0429, '.') == "00:00:00.043"
+
+    cues = [{'start': 1.0, 'end': 2.5, 'korean': '안녕하세요', 'english': 'Hello'}]
+    assert format_srt(cues) == "1\n00:00:01,000 --> 00:00:02,500\n안녕하세요\nHello\n"
+    assert format_vtt(cues, 'translation').startswith("WEBVTT\n\n00:00:01.000 --> 00:00:02.500\nHello\n")
+
+
+def test_batch_writes_timed_subtitles(tmp_path, transcriber):
+    """VAD 분할 구간마다 시각이 붙은 자막을 저장"""
+    media = tmp_path / "lecture.wav"
+    write_wav(media, np.concatenate([silence(1.0), tone(1.2), silence(1.0), tone(0.6), silence(1.0)]))
+
+    summary = transcriber.run([str(tmp_path)])
+
+    assert summary['completed'] == 1
+    assert summary['cues'] == 2
+    out = tmp_path / "out"
+    cues = [json.loads(line) for line in (out / "lecture.jsonl").read_text(encoding='utf-8').splitlines()]
+    assert [cue['english'] for cue in cues] == [f"en:{cue['korean']}" for cue in cues]
+    assert 0.75 <= cues[0]['start'] <= 1.0
+    assert 2.95 <= cues[1]['start'] <= 3.2
+    assert cues[0]['end'] <= cues[1]['start']
+    assert (out / "lecture.srt").read_text(encoding='utf-8').startswith("1\n00:00:00,")
+    assert (out / "lecture.vtt").exists()
+    # 번역은 파일 단위로 묶어서 한 번
+    assert len(transcriber.translation_service.batches) == 1
+
+
+def test_batch_resumes_from_manifest(tmp_path, transcriber):
+    """완료된 파일은 건너뛰고, 인식만 끝난 파일은 번역/저장부터 재개"""
+    media = tmp_path / "talk.wav"
+    write_wav(media, np.concatenate([silence(0.5), tone(1.0), silence(1.0)]))
+    transcriber.run([str(media)])
+    calls = LengthSTT.calls
+
+    assert transcriber.run([str(media)])['skipped'] == 1
+
+    # 번역 전에 중단된 상태로 되돌림
+    manifest_path = tmp_path / "out" / "talk.manifest.json"
+    manifest = json.loads(manifest_path.read_text(encoding='utf-8'))
+    manifest['status'] = 'transcribed'
+    manifest_path.write_text(json.dumps(manifest), encoding='utf-8')
+    (tmp_path / "out" / "talk.srt").unlink()
+
+    summary = transcriber.run([str(media)])
+    assert summary['resumed'] == 1
+    assert (tmp_path / "out" / "talk.srt").exists()
+    assert LengthSTT.calls == calls
+
+
+def test_changed_source_is_reprocessed(tmp_path, transcriber):
+    """원본 파일이 바뀌면 매니페스트를 무시하고 다시 인식"""
+    media = tmp_path / "talk.wav"
+    write_wav(media, np.concatenate([silence(0.5), tone(1.0), silence(1.0)]))
+    transcriber.run([str(media)])
+
+    write_wav(media, np.concatenate([silence(0.5), tone(2.0), silence(1.0)]))
+    summary = transcriber.run([str(media)])
+
+    assert summary['completed'] == 1
+    assert summary['skipped'] == 0
@@ -0,0 +1,84 @@
+"""
+Caption Bridge Tests
+Qt 메인 스레드 자막 전달 (UI 주기 묶음) 단위 테스트
+"""
+
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from PyQt5.QtWidgets import QApplication
+
+from gui.app import ControllerBridge
+from gui.caption_window import CaptionWindow
+
+
+@pytest.fixture(scope='module')
+def qt_app():
+    """Qt 애플리케이션 (QT_QPA_PLATFORM=offscreen 권장)"""
+    return QApplication.instance() or QApplication([])
+
+
+def caption(index: int, is_final: bool = True) -> dict:
+    """테스트 자막"""
+    return {'korean': f"자막 {index}", 'english': f"caption {index}", 'timestamp': time.time(), 'is_final': is_final}
+
+
+def process_until(qt_app, condition, timeout: float = 5.0):
+    """조건을 만족할 때까지 Qt 이벤트 처리"""
+    deadline = time.perf_counter() + timeout
+    while not condition() and time.perf_counter() < deadline:
+        qt_app.processEvents()
+        time.sleep(0.001)
+
+
+def test_bursty_captions_coalesced(qt_app):
+    """다른 스레드에서 몰려 온 자막을 순서대로, 주기당 한 묶음으로 전달"""
+    bridge = ControllerBridge(tick_hz=30)
+    received = []
+    batches = []
+    bridge.on_captions = lambda batch: (batches.append(len(batch)), received.extend(batch))
+
+    def produce():
+        for index in range(200):
+            bridge.push_caption(caption(index))
+
+    worker = threading.Thread(target=produce)
+    worker.start()
+    worker.join()
+    process_until(qt_app, lambda: len(received) == 200)
+
+    assert [item['korean'] for item in received] == [f"자막 {index}" for index in range(200)]
+    assert len(batches) < 20
+    assert bridge.get_stats()['captions'] == 200
+
+    # 유휴 주기 후 타이머 정지, 다음 자막은 바로 전달
+    process_until(qt_app, lambda: not bridge._timer.isActive(), timeout=1.0)
+    assert not bridge._timer.isActive()
+    bridge.push_caption(caption(200))
+    process_until(qt_app, lambda: len(received) == 201, timeout=1.0)
+    assert received[-1]['korean'] == "자막 200"
+
+
+def test_window_batch_skips_superseded_partials(qt_app):
+    """묶음 안에서 뒤 자막에 덮어쓰이는 부분 결과는 그리지 않음"""
+    window = CaptionWindow('panel')
+    calls = []
+    original = window.renderer.update_pending
+    window.renderer.update_pending = lambda data: (calls.append(data['korean']), original(data))
+
+    window.add_captions([caption(1, False), caption(2, False), caption(3)])
+    assert calls == []
+    assert [item['korean'] for item in window.renderer.captions] == ["자막 3"]
+
+    window.add_captions([caption(4), caption(5, False)])
+    assert calls == ["자막 5"]
+    assert window.renderer.pending_frame is not None
+    window.close()
@@ -0,0 +1,119 @@
+"""
+Controller Loading Tests
+컨트롤러 모델 동시 로드 / 백그라운드 초기화 단위 테스트 (모의 백엔드)
+"""
+
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+import yaml
+
+# Add project root to path
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from core.audio_capture import AudioCapture
+from core.config_manager import ConfigManager
+from core.controller import CaptionController
+
+
+class SilentAudio(AudioCapture):
+    """장치를 열지 않는 오디오 입력"""
+
+    def initialize(self) -> bool:
+        return True
+
+
+@pytest.fixture
+def mock_config(tmp_path):
+    """모델 로드에 각각 0.3초 걸리는 모의 백엔드 설정"""
+    with open(PROJECT_ROOT / "config.yaml", encoding='utf-8') as f:
+        config = yaml.safe_load(f)
+    config['stt']['backend'] = 'mock'
+    config['stt']['mock'] = {'load_time': 0.3, 'cpu_load': 'sleep'}
+    config['translation']['backend'] = 'mock'
+    config['translation']['mock'] = {'load_time': 0.3, 'cpu_load': 'sleep'}
+
+    path = tmp_path / "mock.yaml"
+    path.write_text(yaml.safe_dump(config, allow_unicode=True), encoding='utf-8')
+    yield str(path)
+
+    # ConfigManager는 싱글톤: 다른 테스트를 위해 기본 설정 복구
+    ConfigManager().load_config(str(PROJECT_ROOT / "config.yaml"))
+
+
+def test_models_load_concurrently(mock_config):
+    """STT와 번역 모델을 동시에 로드하고 구성 요소별 시간 / 진행 이벤트 기록"""
+    controller = CaptionController(mock_config, audio_factory=SilentAudio)
+    events = []
+
+    start = time.perf_counter()
+    assert controller.initialize(progress_callback=lambda *event: events.append(event))
+    elapsed = time.perf_counter() - start
+
+    assert elapsed < 0.55
+    assert set(controller.load_times) == {'audio', 'stt', 'translation'}
+    assert controller.load_times['stt'] >= 0.3
+    assert controller.load_times['translation'] >= 0.3
+
+    statuses = {(component, status) for component, status, _ in events}
+    for component in ('audio', 'stt', 'translation'):
+        assert (component, 'loading') in statuses
+        assert (component, 'ready') in statuses
+    assert controller.get_status()['load_times'] == controller.load_times
+    controller.cleanup()
+
+
+def test_initialize_async_returns_immediately(mock_config):
+    """백그라운드 초기화는 바로 돌아오고 완료 콜백으로 결과 전달"""
+    controller = CaptionController(mock_config, audio_factory=SilentAudio)
+    done = threading.Event()
+    results = []
+
+    def on_done(success):
+        results.append(success)
+        done.set()
+
+    start = time.perf_counter()
+    controller.initialize_async(done_callback=on_done)
+    assert time.perf_counter() - start < 0.1
+    assert not done.is_set()
+
+    assert done.wait(timeout=5.0)
+    assert results == [True]
+    assert controller.stt_service.is_initialized
+    controller.cleanup()
+
+
+def test_failed_load_blocks_start(mock_config, monkeypatch):
+    """번역 모델 로드에 실패하면 서비스 참조를 비우고 start()를 거부"""
+    from implementations.mock_backends import MockTranslationService
+    monkeypatch.setattr(MockTranslationService, 'initialize', lambda self: False)
+
+    controller = CaptionController(mock_config, audio_factory=SilentAudio)
+    assert not controller.initialize()
+
+    assert not controller.is_initialized
+    assert controller.translation_service is None
+    assert controller.stt_service is not None
+
+    assert not controller.start()
+    assert not controller.is_running
+    assert not controller.audio_capture.is_recording
+    assert controller.get_status()['initialized'] is False
+    controller.cleanup()
+
+
+def test_whisper_vad_filter_off_behind_vad_gate(mock_config):
+    """앞단 VAD(분할기 / 무음 게이트)를 쓰면 STT 내장 VAD는 끄고, 스트리밍 모드는 유지"""
+    controller = CaptionController(mock_config, audio_factory=SilentAudio)
+    assert controller.initialize()
+    assert controller.audio_capture.segmenter is not None
+    assert controller.stt_service.config['vad_filter'] is False
+    controller.cleanup()
+
+    controller.config_mgr.set('stt.audio.chunking', 'streaming')
+    assert controller._live_stt_config('lightweight')['vad_filter'] is True
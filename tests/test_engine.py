@@ -0,0 +1,75 @@
+"""
+Caption Engine Tests
+헤드리스 자막 엔진 단위 테스트
+"""
+
+import sys
+import io
+import json
+import subprocess
+from pathlib import Path
+
+# Add project root to path
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from core.engine import CaptionEngine
+
+
+def make_engine(**kwargs) -> CaptionEngine:
+    """config.yaml로 엔진 생성 (모델은 로드하지 않음)"""
+    return CaptionEngine(config_path=str(PROJECT_ROOT / "config.yaml"), **kwargs)
+
+
+def caption(text, is_final=True):
+    """컨트롤러 자막 데이터 형식"""
+    return {
+        'korean': text,
+        'english': f"en:{text}",
+        'timestamp': 1700000000.0,
+        'stt_confidence': 0.9,
+        'trans_confidence': 0.8,
+        'is_final': is_final,
+        'trace': object()
+    }
+
+
+def test_engine_does_not_import_qt():
+    """헤드리스 엔진은 PyQt5를 import하지 않음"""
+    code = (
+        "import sys; sys.path.insert(0, '.'); "
+        "import core.engine, implementations; "
+        "assert 'PyQt5' not in sys.modules, 'PyQt5 imported'"
+    )
+    subprocess.run([sys.executable, "-c", code], cwd=PROJECT_ROOT, check=True)
+
+
+def test_captions_written_as_json_lines():
+    """최종 자막은 내부 필드를 뺀 JSON Lines로 기록"""
+    output = io.StringIO()
+    engine = make_engine(output=output)
+
+    engine._on_caption(caption("안녕하세요"))
+    engine._on_caption(caption("반갑", is_final=False))
+    engine._on_caption(caption("반갑습니다"))
+
+    lines = output.getvalue().splitlines()
+    assert len(lines) == 2
+    records = [json.loads(line) for line in lines]
+    assert records[0]['korean'] == "안녕하세요"
+    assert records[1]['english'] == "en:반갑습니다"
+    assert 'trace' not in records[0]
+    assert engine.captions_written == 2
+
+
+def test_partials_and_listeners():
+    """include_partials 설정 시 부분 결과도 전달, 리스너 예외는 무시"""
+    received = []
+    engine = make_engine(include_partials=True)
+    engine.add_listener(lambda record: 1 / 0)
+    engine.add_listener(received.append)
+
+    engine._on_caption(caption("반갑", is_final=False))
+
+    assert received == [CaptionEngine.to_record(caption("반갑", is_final=False))]
+    assert engine.captions_written == 0
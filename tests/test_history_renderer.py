@@ -0,0 +1,100 @@
+"""
+History Renderer Tests
+가상 스크롤 자막 기록 렌더러 (모델 / 델리게이트 / 뷰) 단위 테스트
+"""
+
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from PyQt5.QtWidgets import QApplication
+
+from core.theme_manager import ThemeManager
+from gui.renderers import RendererFactory, HistoryRenderer
+from gui.renderers.history_renderer import CaptionListModel, KoreanRole, PendingRole
+
+
+@pytest.fixture(scope='module')
+def qt_app():
+    """Qt 애플리케이션 (QT_QPA_PLATFORM=offscreen 권장)"""
+    return QApplication.instance() or QApplication([])
+
+
+@pytest.fixture
+def renderer(qt_app):
+    """기록형 테마 렌더러 (위젯 표시)"""
+    theme_mgr = ThemeManager()
+    theme_mgr.load_themes('themes')
+    renderer = RendererFactory.create_renderer(theme_mgr.get_theme('history'))
+    widget = renderer.create_widget()
+    widget.resize(460, 700)
+    widget.show()
+    qt_app.processEvents()
+    yield renderer
+    widget.close()
+
+
+def caption(index: int, is_final: bool = True) -> dict:
+    """테스트 자막"""
+    return {'korean': f"자막 {index}", 'english': f"caption {index}", 'timestamp': 0.0, 'is_final': is_final}
+
+
+def test_model_evicts_and_tracks_pending(qt_app):
+    """최대 행 수를 넘으면 오래된 자막 제거, 진행 중인 줄은 마지막 행"""
+    model = CaptionListModel(max_rows=5)
+    model.append_captions([caption(index) for index in range(8)])
+    assert model.rowCount() == 5
+    assert model.index(0).data(KoreanRole) == "자막 3"
+
+    model.set_pending(caption(8, False))
+    assert model.rowCount() == 6
+    assert model.index(5).data(PendingRole) is True
+
+    model.append_captions([caption(9)])
+    assert model.rowCount() == 5
+    assert model.index(4).data(KoreanRole) == "자막 9"
+    assert model.pending is None
+
+
+def test_large_history_constant_cost(renderer, qt_app):
+    """수만 개 자막을 추가해도 추가 비용이 일정하고 보이는 행만 그림"""
+    assert isinstance(renderer, HistoryRenderer)
+    view = renderer.view
+
+    started = time.perf_counter()
+    for start in range(0, 30000, 10):
+        renderer.add_captions([caption(index) for index in range(start, start + 10)])
+    assert time.perf_counter() - started < 10.0
+
+    assert renderer.model.rowCount() == 30000
+    assert view.at_bottom()
+    assert list(view.visible_rows())[-1] == 29999
+    assert len(view.visible_rows()) <= view.viewport().height() // renderer.delegate.row_height + 2
+
+    view.viewport().repaint()
+    stats = renderer.delegate.get_stats()
+    assert 0 < stats['entries'] <= renderer.delegate.cache_size
+    assert stats['misses'] <= 2 * len(view.visible_rows())
+
+
+def test_scrolled_up_view_stays_put(renderer, qt_app):
+    """위로 스크롤한 상태에서는 새 자막이 와도 보던 자막 유지"""
+    view = renderer.view
+    renderer.add_captions([caption(index) for index in range(100)])
+    view.verticalScrollBar().setValue(0)
+    assert not view.follow_bottom
+
+    renderer.add_captions([caption(100), caption(101, False)])
+    assert view.verticalScrollBar().value() == 0
+    assert renderer.model.rowCount() == 102
+
+    view.verticalScrollBar().setValue(view.verticalScrollBar().maximum())
+    renderer.add_caption(caption(102))
+    assert view.at_bottom()
+    assert renderer.model.rowCount() == 102
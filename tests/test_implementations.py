@@ -31,6 +31,7 @@ def test_factory_registration():
     trans_impls = ModelFactory.list_translation_implementations()
     print(f"✅ 등록된 번역 구현체: {trans_impls}")
     assert 'opus_mt' in trans_impls
+    assert 'ctranslate2' in trans_impls
     
     print("✅ 팩토리 등록 테스트 통과")
 
@@ -146,6 +147,52 @@ def test_config_integration():
     print("✅ 설정 파일 통합 테스트 통과")
 
 
+def test_translation_backend_selection():
+    """translation.backend 키로 번역 구현체 선택 테스트"""
+    print("\n=== 번역 백엔드 선택 테스트 ===")
+    
+    from implementations import CTranslate2TranslationService, OpusMTTranslationService
+    
+    config = {'model': 'Helsinki-NLP/opus-mt-ko-en', 'backend': 'ctranslate2', 'cpu_threads': 2}
+    trans_service = ModelFactory.create_translation_service(config)
+    assert isinstance(trans_service, CTranslate2TranslationService)
+    assert trans_service.compute_type == 'int8'
+    assert trans_service.get_model_info()['cpu_threads'] == 2
+    print(f"✅ ctranslate2: {trans_service.__class__.__name__}")
+    
+    # backend 미지정 시 모델 이름으로 선택 (기존 동작)
+    trans_service = ModelFactory.create_translation_service({'model': 'Helsinki-NLP/opus-mt-ko-en'})
+    assert isinstance(trans_service, OpusMTTranslationService)
+    print(f"✅ 기본값: {trans_service.__class__.__name__}")
+    
+    print("✅ 번역 백엔드 선택 테스트 통과")
+
+
+def test_thread_budget():
+    """Whisper / CTranslate2 번역 CPU 스레드 예산 분배 테스트"""
+    print("\n=== 스레드 예산 테스트 ===")
+    
+    config_mgr = ConfigManager()
+    saved = config_mgr.config
+    try:
+        config_mgr.config = {
+            'performance': {'profile': 'lightweight', 'cpu_threads': 8, 'translation_threads': 2},
+            'translation': {'backend': 'ctranslate2'}
+        }
+        assert config_mgr.get_thread_budget() == {'stt': 6, 'translation': 2}
+        assert config_mgr.get_stt_config()['cpu_threads'] == 6
+        assert config_mgr.get_translation_config()['cpu_threads'] == 2
+        
+        # PyTorch 번역 백엔드도 같은 코어를 쓰므로 Whisper 몫은 그대로 나눔
+        config_mgr.config['translation']['backend'] = 'opus_mt'
+        assert config_mgr.get_thread_budget() == {'stt': 6, 'translation': 2}
+        print("✅ 스레드 예산 분배 확인")
+    finally:
+        config_mgr.config = saved
+    
+    print("✅ 스레드 예산 테스트 통과")
+
+
 if __name__ == '__main__':
     print("=" * 60)
     print("Live Caption - Implementation Layer Tests")
@@ -156,6 +203,8 @@ if __name__ == '__main__':
     test_stt_service_creation()
     test_translation_service_creation()
     test_config_integration()
+    test_translation_backend_selection()
+    test_thread_budget()
     
     print("\n" + "=" * 60)
     print("✅ 모든 테스트 완료!")
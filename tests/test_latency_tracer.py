@@ -0,0 +1,129 @@
+"""
+Latency Tracer Tests
+자막 단위 지연 추적 단위 테스트
+"""
+
+import sys
+import json
+from pathlib import Path
+
+import numpy as np
+
+# Add project root to path
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from core.latency_tracer import LatencyTracer
+
+
+def stamp(trace, offsets):
+    """기준 시각 100.0초에서 offset(초)만큼 떨어진 마크 기록"""
+    for name, offset in offsets:
+        trace.mark(name, 100.0 + offset)
+
+
+FULL_TRACE = [
+    ('capture_start', 0.0), ('capture_end', 1.0), ('enqueue', 1.0), ('dequeue', 1.01),
+    ('stt_start', 1.01), ('stt_end', 1.31), ('translate_start', 1.32), ('translate_end', 1.42),
+    ('callback', 1.43), ('paint', 1.45),
+]
+
+
+def test_stage_durations():
+    """마크가 기록되는 즉시 끝나는 구간의 지연이 집계됨"""
+    tracer = LatencyTracer()
+    stamp(tracer.new_trace(), FULL_TRACE)
+
+    stats = tracer.get_stats()
+    assert stats['capture']['p50_ms'] == 1000.0
+    assert stats['stt']['p50_ms'] == 300.0
+    assert stats['translate_wait']['p50_ms'] == 10.0
+    assert stats['total']['p50_ms'] == 430.0
+    assert stats['total_paint']['p50_ms'] == 450.0
+    assert all(stage['count'] == 1 for stage in stats.values())
+
+
+def test_percentiles():
+    """구간별 p50/p95/p99 계산"""
+    tracer = LatencyTracer()
+    for ms in range(1, 101):
+        stamp(tracer.new_trace(), [('stt_start', 0.0), ('stt_end', ms / 1000)])
+
+    stt = tracer.get_stats()['stt']
+    assert stt['count'] == 100
+    assert stt['p50_ms'] == round(float(np.percentile(np.arange(1, 101), 50)), 2)
+    assert stt['p99_ms'] >= stt['p95_ms'] >= stt['p50_ms']
+    assert stt['max_ms'] == 100.0
+
+
+def test_fork_does_not_double_count():
+    """같은 청크에서 나온 자막 사본은 이전 구간을 다시 집계하지 않음"""
+    tracer = LatencyTracer()
+    trace = tracer.new_trace()
+    stamp(trace, FULL_TRACE[:6])
+
+    second = trace.fork()
+    stamp(second, [('translate_start', 1.5), ('translate_end', 1.6)])
+
+    stats = tracer.get_stats()
+    assert stats['stt']['count'] == 1
+    assert stats['translate']['count'] == 1
+    assert second.id != trace.id
+
+
+def test_window_limit():
+    """최근 window개 측정값만 보관"""
+    tracer = LatencyTracer(window=10)
+    for _ in range(25):
+        stamp(tracer.new_trace(), [('stt_start', 0.0), ('stt_end', 0.1)])
+
+    assert tracer.get_stats()['stt']['count'] == 10
+    assert len(tracer.to_chrome_trace()['traceEvents']) == 10
+
+
+def test_export_chrome_trace(tmp_path):
+    """Chrome trace-event JSON 내보내기 (구간당 완료 이벤트, 마이크로초 단위)"""
+    tracer = LatencyTracer()
+    trace = tracer.new_trace()
+    stamp(trace, FULL_TRACE)
+
+    path = tmp_path / "trace.json"
+    count = tracer.export_chrome_trace(str(path))
+    data = json.loads(path.read_text(encoding='utf-8'))
+
+    events = data['traceEvents']
+    assert count == len(events) == 7
+    stt = next(e for e in events if e['name'] == 'stt')
+    assert stt['ph'] == 'X'
+    assert stt['tid'] == trace.id
+    assert abs(stt['dur'] - 300000) < 1e-3
+
+
+def test_audio_capture_stamps_queue():
+    """오디오 캡처 큐에 추적 레코드가 함께 전달됨"""
+    from core.audio_capture import AudioCapture
+
+    capture = AudioCapture(sample_rate=16000, chunk_duration=0.1, buffer_size=800, overlap_ratio=0.0)
+    capture.tracer = LatencyTracer()
+    capture.ring_buffer.write(np.zeros(1600, dtype=np.int16))
+    capture._emit_chunks(None)
+
+    chunk, _, trace, cut = next(capture.get_traced_stream())
+    assert cut is None
+    assert len(chunk) == 1600
+    assert set(trace.marks) == {'capture_start', 'capture_end', 'enqueue', 'dequeue'}
+    assert abs(trace.marks['capture_end'] - trace.marks['capture_start'] - 0.1) < 1e-9
+    assert 'queue' in capture.tracer.get_stats()
+
+
+if __name__ == "__main__":
+    import tempfile
+
+    test_stage_durations()
+    test_percentiles()
+    test_fork_does_not_double_count()
+    test_window_limit()
+    with tempfile.TemporaryDirectory() as tmp:
+        test_export_chrome_trace(Path(tmp))
+    test_audio_capture_stamps_queue()
+    print("✅ 모든 테스트 통과")
@@ -0,0 +1,109 @@
+"""
+Mock Backend Tests
+벤치마크용 모의 STT / 번역 구현 단위 테스트
+"""
+
+import os
+import sys
+import threading
+import time
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+# Add project root to path
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from services.model_factory import ModelFactory
+from implementations.mock_backends import (
+    SimulatedWorkload, MockSTTService, MockTranslationService, busy
+)
+
+
+def test_factory_selects_mock_backends():
+    """stt.backend / translation.backend: mock이면 프로필과 무관하게 모의 구현"""
+    import implementations  # noqa: F401
+
+    stt = ModelFactory.create_stt_service('standard', {'backend': 'mock'})
+    translation = ModelFactory.create_translation_service({'backend': 'mock'})
+
+    assert isinstance(stt, MockSTTService)
+    assert isinstance(translation, MockTranslationService)
+
+
+def test_workload_is_deterministic():
+    """같은 seed면 같은 지연 / 실패 순서"""
+    config = {'latency': 0.1, 'rtf': 0.5, 'jitter': 0.05, 'failure_rate': 0.3, 'seed': 7}
+    first = SimulatedWorkload(config, 'rtf')
+    second = SimulatedWorkload(config, 'rtf')
+
+    draws = [first.draw(2.0) for _ in range(50)]
+    assert draws == [second.draw(2.0) for _ in range(50)]
+    assert all(1.05 <= seconds <= 1.15 for seconds, _ in draws)
+    assert 0 < first.failures < 50
+
+
+def test_stt_latency_and_text():
+    """오디오 길이에 비례한 지연 후 템플릿 텍스트 반환"""
+    stt = MockSTTService({'mock': {'latency': 0.02, 'rtf': 0.05, 'text': "자막 {index} {seconds:.1f}"}})
+    stt.initialize()
+
+    start = time.perf_counter()
+    results = list(stt.transcribe_stream(np.zeros(32000, dtype=np.float32)))
+    elapsed = time.perf_counter() - start
+
+    assert results[0]['text'] == "자막 1 2.0"
+    assert 0.12 <= elapsed < 0.5
+    assert stt.get_model_info()['calls'] == 1
+
+
+def test_failures_return_empty_results():
+    """실패한 호출은 실제 구현처럼 빈 결과 (번역 캐시에도 저장 안 함)"""
+    stt = MockSTTService({'mock': {'failure_rate': 1.0}})
+    translation = MockTranslationService({'mock': {'failure_rate': 1.0}, 'cache': {'enabled': True}})
+    stt.initialize()
+    translation.initialize()
+
+    assert list(stt.transcribe_stream(np.zeros(1600, dtype=np.float32)))[0]['text'] == ''
+    assert translation.translate("안녕하세요")['translated_text'] == ''
+    assert translation.translate("안녕하세요")['translated_text'] == ''
+    assert translation.workload.calls == 2
+
+
+def test_translation_batch_is_one_call():
+    """배치 1회는 호출 1회, 지연은 문장 수에 비례"""
+    translation = MockTranslationService({'mock': {'latency': 0.01, 'per_item': 0.01, 'prefix': "en:"}})
+    translation.initialize()
+
+    start = time.perf_counter()
+    results = translation.translate_batch(["하나", "둘", "셋", "넷"])
+    elapsed = time.perf_counter() - start
+
+    assert [r['translated_text'] for r in results] == ["en:하나", "en:둘", "en:셋", "en:넷"]
+    assert translation.workload.calls == 1
+    assert 0.05 <= elapsed < 0.3
+
+
+def test_unknown_cpu_load_rejected():
+    """알 수 없는 cpu_load는 ValueError"""
+    with pytest.raises(ValueError):
+        SimulatedWorkload({'cpu_load': 'spin'}, 'rtf')
+
+
+@pytest.mark.skipif((os.cpu_count() or 1) < 2, reason="GIL 해제 효과는 코어 2개 이상에서만 측정 가능")
+def test_release_leaves_gil_to_python_threads():
+    """release 부하 중에는 Python 스레드가 GIL을 거의 그대로 쓰고, hold 부하는 나눠 씀"""
+    def python_progress(cpu_load):
+        thread = threading.Thread(target=busy, args=(0.3, cpu_load))
+        thread.start()
+        count = 0
+        deadline = time.perf_counter() + 0.2
+        while time.perf_counter() < deadline:
+            sum(range(2000))
+            count += 1
+        thread.join()
+        return count
+
+    assert python_progress('release') > python_progress('hold') * 1.3
@@ -0,0 +1,80 @@
+"""
+Outlined Label Tests
+투명 오버레이 외곽선 라벨 캐시 단위 테스트
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from PyQt5.QtWidgets import QApplication
+from PyQt5.QtCore import Qt
+from PyQt5.QtGui import QColor
+
+from gui.renderers.transparent_renderer import OutlinedLabel
+
+
+@pytest.fixture(scope='module')
+def qt_app():
+    """Qt 애플리케이션 (QT_QPA_PLATFORM=offscreen 권장)"""
+    return QApplication.instance() or QApplication([])
+
+
+@pytest.fixture
+def label(qt_app):
+    """표시된 외곽선 라벨"""
+    label = OutlinedLabel("외곽선 자막")
+    label.setAlignment(Qt.AlignCenter)
+    label.setWordWrap(True)
+    label.setStyleSheet("color: #FFFFFF; font-size: 28px; background: transparent;")
+    label.resize(400, 100)
+    label.show()
+    qt_app.processEvents()
+    yield label
+    label.close()
+
+
+def test_repaint_reuses_cache(label):
+    """같은 내용 repaint는 캐시를 다시 만들지 않음"""
+    renders = label.renders
+    for _ in range(5):
+        label.repaint()
+    assert label.paints >= 5
+    assert label.renders == renders
+
+
+def test_cache_invalidated_on_change(label):
+    """텍스트 / 외곽선 / 글꼴 / 크기가 바뀌면 한 번만 다시 만듦"""
+    changes = [
+        lambda: label.setText("새 자막"),
+        lambda: label.set_outline_width(4),
+        lambda: label.set_outline_color(QColor(255, 0, 0)),
+        lambda: label.setStyleSheet("color: #FFFFFF; font-size: 32px; background: transparent;"),
+        lambda: label.resize(500, 120),
+    ]
+    for change in changes:
+        renders = label.renders
+        change()
+        label.repaint()
+        label.repaint()
+        assert label.renders == renders + 1
+
+
+def test_outline_drawn_around_text(label):
+    """글자 주변에 외곽선 색 픽셀이 있음"""
+    label.set_outline_color(QColor(255, 0, 0))
+    label.set_outline_width(3)
+    image = label.grab().toImage()
+
+    colors = {
+        image.pixelColor(x, y).name()
+        for x in range(0, image.width(), 2) for y in range(0, image.height(), 2)
+        if image.pixelColor(x, y).alpha() == 255
+    }
+    assert '#ff0000' in colors
+    assert '#ffffff' in colors
@@ -0,0 +1,82 @@
+"""
+Panel Renderer Tests
+패널형 렌더러 자막 프레임 재사용 단위 테스트
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from PyQt5.QtWidgets import QApplication
+
+from core.theme_manager import ThemeManager
+from gui.renderers import RendererFactory, PanelRenderer
+
+
+@pytest.fixture(scope='module')
+def qt_app():
+    """Qt 애플리케이션 (QT_QPA_PLATFORM=offscreen 권장)"""
+    return QApplication.instance() or QApplication([])
+
+
+@pytest.fixture
+def renderer(qt_app):
+    """패널형 테마 렌더러 (max_lines 10)"""
+    theme_mgr = ThemeManager()
+    theme_mgr.load_themes('themes')
+    renderer = RendererFactory.create_renderer(theme_mgr.get_theme('panel'))
+    widget = renderer.create_widget()
+    widget.show()
+    yield renderer
+    widget.close()
+
+
+def caption(index: int, is_final: bool = True) -> dict:
+    """테스트 자막"""
+    return {'korean': f"자막 {index}", 'english': f"caption {index}", 'timestamp': 0.0, 'is_final': is_final}
+
+
+def visible_texts(renderer: PanelRenderer) -> list:
+    """레이아웃 순서대로 표시 중인 한국어 텍스트"""
+    layout = renderer.content_layout
+    return [layout.itemAt(index).widget().korean_label.text() for index in range(layout.count() - 1)]
+
+
+def test_steady_state_reuses_frames(renderer):
+    """최대 줄 수를 채운 뒤에는 밀려난 프레임을 재사용해 새 위젯을 만들지 않음"""
+    for index in range(10):
+        renderer.add_caption(caption(index))
+    assert renderer.get_stats()['created'] == 10
+
+    for index in range(10, 200):
+        renderer.add_caption(caption(index))
+
+    stats = renderer.get_stats()
+    assert stats['created'] == 10
+    assert stats['reused'] == 190
+    assert stats['visible'] == 10
+    assert visible_texts(renderer) == [f"자막 {index}" for index in range(190, 200)]
+
+
+def test_pending_line_and_clear_reuse_frames(renderer):
+    """진행 중인 줄과 지운 뒤 다시 추가한 자막도 보관한 프레임 사용"""
+    for index in range(10):
+        renderer.add_caption(caption(index))
+    renderer.update_pending(caption(10, False))
+    renderer.add_caption(caption(10))
+    renderer.add_caption(caption(11))
+    created = renderer.get_stats()['created']
+
+    renderer.clear_captions()
+    assert renderer.get_stats()['visible'] == 0
+
+    for index in range(5):
+        renderer.add_caption(caption(index))
+    stats = renderer.get_stats()
+    assert stats['created'] == created
+    assert visible_texts(renderer) == [f"자막 {index}" for index in range(5)]
@@ -0,0 +1,131 @@
+"""
+Pipeline Tests
+순번 기반 파이프라인 단계 단위 테스트
+"""
+
+import sys
+import threading
+import time
+import random
+from pathlib import Path
+
+# Add project root to path
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from core.pipeline import PipelineStage
+
+
+def make_pipeline(handler, workers: int = 3, maxsize: int = 8):
+    """번역 → 출력 2단계 파이프라인 생성"""
+    emitted = []
+    emit = PipelineStage('emit', emitted.append, maxsize=maxsize, ordered=True)
+    work = PipelineStage('work', handler, output=emit, workers=workers, maxsize=maxsize)
+    emit.start()
+    work.start()
+    return work, emit, emitted
+
+
+def test_ordered_output_with_parallel_workers():
+    """여러 워커가 뒤섞여 끝나도 순번 순서대로 출력"""
+    rng = random.Random(0)
+
+    def handler(item):
+        time.sleep(rng.uniform(0, 0.01))
+        return item * 10
+
+    work, emit, emitted = make_pipeline(handler)
+    for seq in range(30):
+        work.put(seq, seq)
+    work.close()
+    work.join(timeout=5.0)
+    emit.join(timeout=5.0)
+
+    assert emitted == [seq * 10 for seq in range(30)]
+    assert work.get_stats()['processed'] == 30
+
+
+def test_failed_item_does_not_block_order():
+    """처리 실패 항목은 건너뛰고 뒤 항목은 계속 출력"""
+    def handler(item):
+        if item == 2:
+            raise RuntimeError("translation failed")
+        return item
+
+    work, emit, emitted = make_pipeline(handler, workers=2)
+    for seq in range(5):
+        work.put(seq, seq)
+    work.close()
+    work.join(timeout=5.0)
+    emit.join(timeout=5.0)
+
+    assert emitted == [0, 1, 3, 4]
+    assert work.get_stats()['errors'] == 1
+
+
+def test_stages_overlap():
+    """다음 항목 생산과 이전 항목 처리가 겹침"""
+    def handler(item):
+        time.sleep(0.05)
+        return item
+
+    work, emit, emitted = make_pipeline(handler, workers=1)
+
+    start = time.perf_counter()
+    for seq in range(4):
+        time.sleep(0.05)  # 앞 단계(STT) 처리 시간
+        work.put(seq, seq)
+    work.close()
+    work.join(timeout=5.0)
+    emit.join(timeout=5.0)
+    elapsed = time.perf_counter() - start
+
+    # 직렬이면 0.4초, 파이프라인이면 약 0.25초
+    assert emitted == [0, 1, 2, 3]
+    assert elapsed < 0.35
+
+
+def test_bounded_queue_backpressure():
+    """큐가 가득 차면 put()이 블록됨"""
+    release = threading.Event()
+    work, emit, emitted = make_pipeline(lambda item: release.wait() and item, workers=1, maxsize=1)
+
+    work.put(0, 0)  # 워커가 꺼내서 처리 중
+    time.sleep(0.05)
+    work.put(1, 1)  # 큐를 채움
+
+    blocked = threading.Thread(target=work.put, args=(2, 2), daemon=True)
+    blocked.start()
+    blocked.join(timeout=0.1)
+    assert blocked.is_alive()
+
+    release.set()
+    blocked.join(timeout=1.0)
+    assert not blocked.is_alive()
+
+    work.close()
+    work.join(timeout=5.0)
+    emit.join(timeout=5.0)
+    assert emitted == [0, 1, 2]
+
+
+def test_idle_after_items_emitted():
+    """처리 중인 항목이 있으면 idle이 아니고, 출력까지 끝나면 idle"""
+    release = threading.Event()
+    work, emit, emitted = make_pipeline(lambda item: release.wait() and item, workers=1)
+    assert work.idle and emit.idle
+
+    work.put(0, 0)
+    time.sleep(0.05)
+    assert not work.idle
+
+    release.set()
+    deadline = time.perf_counter() + 1.0
+    while not (work.idle and emit.idle) and time.perf_counter() < deadline:
+        time.sleep(0.01)
+    assert emitted == [0]
+    assert work.idle and emit.idle
+
+    work.close()
+    work.join(timeout=5.0)
+    emit.join(timeout=5.0)
@@ -0,0 +1,134 @@
+"""
+Profile Swap Tests
+실행 중 STT 모델 교체 (자막 끊김 없음) 단위 테스트 (모의 백엔드)
+"""
+
+import sys
+import threading
+import time
+import wave
+from pathlib import Path
+
+import numpy as np
+import pytest
+import yaml
+
+# Add project root to path
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from core.config_manager import ConfigManager
+from core.controller import CaptionController
+from core.replay import FileAudioSource
+
+
+SAMPLE_RATE = 16000
+
+
+@pytest.fixture
+def swap_setup(tmp_path):
+    """0.5초 고정 청크 / 모의 백엔드 설정과 3초 톤 파일"""
+    with open(PROJECT_ROOT / "config.yaml", encoding='utf-8') as f:
+        config = yaml.safe_load(f)
+    config['performance']['profile'] = 'lightweight'
+    config['performance']['warmup'] = {'enabled': False}
+    config['stt']['audio'].update({
+        'chunking': 'fixed', 'chunk_duration': 0.5, 'overlap_ratio': 0.0, 'max_caption_latency': 0
+    })
+    config['stt']['vad']['enabled'] = False
+    config['stt']['merge']['enabled'] = False
+    config['stt']['backend'] = 'mock'
+    config['stt']['mock'] = {'latency': 0.02, 'cpu_load': 'sleep', 'load_time': 0.3, 'text': "이전 모델 {index}"}
+    config['translation']['backend'] = 'mock'
+    config['translation']['mock'] = {'cpu_load': 'sleep'}
+    config['translation']['batching']['enabled'] = False
+
+    config_path = tmp_path / "swap.yaml"
+    config_path.write_text(yaml.safe_dump(config, allow_unicode=True), encoding='utf-8')
+
+    t = np.arange(3 * SAMPLE_RATE) / SAMPLE_RATE
+    audio = (np.sin(2 * np.pi * 200 * t) * 0.3 * 32767).astype(np.int16)
+    audio_path = tmp_path / "tone.wav"
+    with wave.open(str(audio_path), 'wb') as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(SAMPLE_RATE)
+        wav.writeframes(audio.tobytes())
+
+    yield str(config_path), str(audio_path)
+
+    # ConfigManager는 싱글톤: 다른 테스트를 위해 기본 설정 복구
+    ConfigManager().load_config(str(PROJECT_ROOT / "config.yaml"))
+
+
+def test_swap_while_running_keeps_captions(swap_setup):
+    """실행 중 교체: 새 모델 로드 동안 기존 모델이 계속 자막을 만들고 청크 누락 없음"""
+    config_path, audio_path = swap_setup
+    controller = CaptionController(
+        config_path,
+        audio_factory=lambda **kwargs: FileAudioSource(audio_path, realtime=True, **kwargs)
+    )
+    assert controller.initialize()
+    previous = controller.stt_service
+
+    captions = []
+    swapped = threading.Event()
+    results = []
+
+    def on_swapped(success):
+        results.append(success)
+        swapped.set()
+
+    assert controller.start(caption_callback=captions.append)
+    time.sleep(0.4)
+    overrides = {'mock': {'latency': 0.02, 'cpu_load': 'sleep', 'load_time': 0.3, 'text': "새 모델 {index}"}}
+    assert controller.set_profile('standard', overrides=overrides, done_callback=on_swapped)
+    assert controller.get_status()['stt_swapping']
+    assert not controller.set_profile('lightweight')
+
+    assert swapped.wait(timeout=5.0)
+    assert controller.audio_capture.finished.wait(timeout=5.0)
+    time.sleep(0.3)
+    controller.stop()
+
+    assert results == [True]
+    assert controller.stt_service is not previous
+    assert not previous.is_initialized
+    assert controller.config_mgr.get_current_profile() == 'standard'
+
+    texts = [caption['korean'] for caption in captions]
+    assert len(texts) == 6
+    assert texts[0].startswith("이전 모델")
+    assert texts[-1].startswith("새 모델")
+    controller.cleanup()
+
+
+def test_failed_swap_keeps_previous_model(swap_setup, monkeypatch):
+    """새 모델 로드 실패 시 기존 모델과 프로필 유지"""
+    config_path, audio_path = swap_setup
+    controller = CaptionController(config_path, audio_factory=lambda **kwargs: FileAudioSource(audio_path, **kwargs))
+    assert controller.initialize()
+    previous = controller.stt_service
+
+    from implementations.mock_backends import MockSTTService
+    monkeypatch.setattr(MockSTTService, 'initialize', lambda self: False)
+
+    results = []
+    assert controller.set_profile('standard', done_callback=results.append)
+    controller.swap_thread.join(timeout=5.0)
+
+    assert results == [False]
+    assert controller.stt_service is previous and previous.is_initialized
+    assert controller.config_mgr.get_current_profile() == 'lightweight'
+    controller.cleanup()
+
+
+def test_profile_before_initialize(swap_setup):
+    """초기화 전 변경은 설정만 바꾸고, 알 수 없는 프로필은 거부"""
+    config_path, _ = swap_setup
+    controller = CaptionController(config_path)
+
+    assert controller.set_profile('standard')
+    assert controller.swap_thread is None
+    assert controller.config_mgr.get_current_profile() == 'standard'
+    assert not controller.set_profile('ultra')
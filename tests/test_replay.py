@@ -0,0 +1,132 @@
+"""
+Replay Harness Tests
+녹음 파일 재생 하네스 단위 테스트 (모의 STT / 번역 백엔드, fast 모드)
+"""
+
+import sys
+import json
+import time
+import wave
+from pathlib import Path
+
+import numpy as np
+import pytest
+import yaml
+
+# Add project root to path
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from core.config_manager import ConfigManager
+from core.replay import VirtualClock, ReplayHarness
+
+
+SAMPLE_RATE = 16000
+
+
+def write_wav(path: Path, audio: np.ndarray):
+    """16비트 모노 WAV 저장"""
+    with wave.open(str(path), 'wb') as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(SAMPLE_RATE)
+        wav.writeframes((audio * 32767).astype(np.int16).tobytes())
+
+
+def tone(seconds: float) -> np.ndarray:
+    """음성 대용 톤"""
+    t = np.arange(int(SAMPLE_RATE * seconds)) / SAMPLE_RATE
+    return (np.sin(2 * np.pi * 200 * t) * 0.3).astype(np.float32)
+
+
+def silence(seconds: float) -> np.ndarray:
+    """배경 잡음"""
+    rng = np.random.default_rng(1)
+    return (rng.standard_normal(int(SAMPLE_RATE * seconds)) * 0.001).astype(np.float32)
+
+
+@pytest.fixture
+def replay_config(tmp_path):
+    """모의 STT / 번역 백엔드를 쓰는 설정 파일 (모델 다운로드 없음)"""
+    with open(PROJECT_ROOT / "config.yaml", encoding='utf-8') as f:
+        config = yaml.safe_load(f)
+    config['performance']['profile'] = 'lightweight'
+    config['stt']['audio']['chunking'] = 'adaptive'
+    config['stt']['vad']['backend'] = 'energy'
+    config['stt']['backend'] = 'mock'
+    config['stt']['mock'] = {'latency': 0.05, 'cpu_load': 'sleep', 'text': "발화 {seconds:.1f}초"}
+    config['translation']['backend'] = 'mock'
+    config['translation']['mock'] = {'prefix': "en:"}
+    config['translation']['batching']['enabled'] = False
+
+    path = tmp_path / "replay.yaml"
+    path.write_text(yaml.safe_dump(config, allow_unicode=True), encoding='utf-8')
+    yield str(path)
+
+    # ConfigManager는 싱글톤: 다른 테스트를 위해 기본 설정 복구
+    ConfigManager().load_config(str(PROJECT_ROOT / "config.yaml"))
+
+
+def test_virtual_clock_skips_forward_only():
+    """가상 시계는 건너뛰기만 하고 되돌아가지 않음"""
+    clock = VirtualClock()
+    clock.advance_to(5.0)
+    assert 5.0 <= clock() < 5.5
+
+    clock.advance_to(1.0)
+    assert clock() >= 5.0
+    assert 4.5 <= clock.skipped <= 5.0
+
+
+def test_fast_replay_report(tmp_path, replay_config):
+    """fast 모드는 쉬는 구간을 건너뛰고, 지연은 가상 시계 기준으로 보고"""
+    media = tmp_path / "talk.wav"
+    # 0.1초 잡음은 분할기가 버림
+    audio = np.concatenate([silence(2.0), tone(1.2), silence(3.0), tone(0.8), silence(1.5), tone(0.1), silence(1.4)])
+    write_wav(media, audio)
+
+    harness = ReplayHarness(str(media), config_path=replay_config)
+    started = time.perf_counter()
+    report = harness.run(timeout=30)
+    elapsed = time.perf_counter() - started
+
+    assert report['mode'] == 'fast'
+    assert report['audio_seconds'] == pytest.approx(10.0, abs=0.01)
+    assert elapsed < report['audio_seconds']
+    assert report['rtf'] < 1.0
+
+    assert report['captions'] == 2
+    assert [caption['english'] for caption in harness.captions] == [
+        f"en:{caption['korean']}" for caption in harness.captions
+    ]
+
+    # 지연에는 STT 처리 시간만 들어가고 건너뛴 대기 시간은 빠짐
+    total = report['latency']['total']
+    assert total['count'] == 2
+    assert 40 <= total['p50_ms'] < 1000
+    assert report['stt_rtf'] > 0
+    assert report['dropped']['silent'] > 0
+    assert report['dropped']['overflow'] == 0
+
+    # 청크마다 자막 1개: 자막 없는 추적 레코드(사본)가 Chrome trace에 남지 않음
+    events = harness.controller.tracer.to_chrome_trace()['traceEvents']
+    assert len({event['tid'] for event in events}) == 2
+
+    output = tmp_path / "report.json"
+    harness.save_report(str(output))
+    saved = json.loads(output.read_text(encoding='utf-8'))
+    assert len(saved['caption_list']) == 2
+    assert 'trace' not in saved['caption_list'][0]
+
+
+def test_pause_cut_captions_not_merged(tmp_path, replay_config):
+    """휴지로 나뉜 청크는 오디오가 겹치지 않으므로 같은 문장이 반복돼도 모두 자막으로 출력"""
+    media = tmp_path / "repeat.wav"
+    audio = np.concatenate([silence(1.0), tone(1.0), silence(1.5), tone(1.0), silence(1.5)])
+    write_wav(media, audio)
+
+    harness = ReplayHarness(str(media), config_path=replay_config)
+    report = harness.run(timeout=30)
+
+    assert report['captions'] == 2
+    assert harness.captions[0]['korean'] == harness.captions[1]['korean']
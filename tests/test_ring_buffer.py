@@ -0,0 +1,100 @@
+"""
+Ring Buffer Tests
+오디오 링 버퍼 단위 테스트
+"""
+
+import sys
+from pathlib import Path
+import numpy as np
+import pytest
+
+# Add project root to path
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from core.ring_buffer import AudioRingBuffer, FramePool
+
+
+def test_write_and_read_window():
+    """쓰기 후 float32 윈도우 읽기 테스트"""
+    buffer = AudioRingBuffer(16)
+    buffer.write(np.array([0, 16384, -16384, 32767], dtype=np.int16))
+
+    out = np.zeros(8, dtype=np.float32)
+    window = buffer.read_window(4, out=out)
+
+    assert window.dtype == np.float32
+    assert np.shares_memory(window, out)
+    np.testing.assert_allclose(window, [0.0, 0.5, -0.5, 32767 / 32768.0])
+    assert buffer.available == 0
+
+
+def test_overlap_windows():
+    """오버랩 윈도우 테스트"""
+    buffer = AudioRingBuffer(32)
+    buffer.write(np.arange(12, dtype=np.int16))
+
+    first = buffer.read_window(8, overlap=4) * 32768.0
+    assert buffer.available == 8
+
+    second = buffer.read_window(8, overlap=4) * 32768.0
+    np.testing.assert_array_equal(first[4:], second[:4])
+    np.testing.assert_array_equal(second, np.arange(4, 12))
+
+
+def test_wraparound_peek_is_zero_copy():
+    """랩어라운드 구간 조회 테스트"""
+    buffer = AudioRingBuffer(8)
+    buffer.write(np.arange(6, dtype=np.int16))
+    buffer.advance(5)
+    buffer.write(np.arange(6, 12, dtype=np.int16))
+
+    head, tail = buffer.peek(7)
+    assert np.shares_memory(head, buffer._storage)
+    assert np.shares_memory(tail, buffer._storage)
+    np.testing.assert_array_equal(np.concatenate([head, tail]), np.arange(5, 12))
+
+    window = buffer.read_window(7) * 32768.0
+    np.testing.assert_array_equal(window, np.arange(5, 12))
+
+
+def test_overflow_drops_oldest():
+    """용량 초과 시 오래된 샘플 삭제 테스트"""
+    buffer = AudioRingBuffer(4)
+    assert buffer.write(np.arange(3, dtype=np.int16)) == 0
+    assert buffer.write(np.arange(3, 6, dtype=np.int16)) == 2
+    assert buffer.overflow_samples == 2
+
+    head, tail = buffer.peek(4)
+    np.testing.assert_array_equal(np.concatenate([head, tail]), [2, 3, 4, 5])
+
+
+def test_invalid_overlap():
+    """잘못된 오버랩 값 테스트"""
+    buffer = AudioRingBuffer(8)
+    buffer.write(np.zeros(8, dtype=np.int16))
+
+    with pytest.raises(ValueError):
+        buffer.read_window(4, overlap=4)
+
+
+def test_frame_pool_reuses_released_frames():
+    """프레임 풀 재사용 테스트"""
+    pool = FramePool(16, max_frames=2)
+
+    held = pool.acquire()
+    view = held[:8]
+    assert pool.acquire() is not held
+
+    # 뷰로 반환해도 원본 프레임을 돌려받고, 두 번 반환해도 한 번만 재사용
+    pool.release(view)
+    pool.release(held)
+    assert pool.acquire() is held
+    assert pool.acquire() is not held
+
+    # 풀 밖의 배열은 무시
+    pool.release(np.zeros(16, dtype=np.float32))
+
+    stats = pool.get_stats()
+    assert stats['allocated'] == 3
+    assert stats['reused'] == 1
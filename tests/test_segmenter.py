@@ -0,0 +1,144 @@
+"""
+Speech Segmenter Tests
+휴지 기반 가변 길이 분할기 단위 테스트
+"""
+
+import sys
+from pathlib import Path
+import numpy as np
+
+# Add project root to path
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from implementations.energy_vad import EnergyVADService
+from core.segmenter import SpeechSegmenter, CUT_PAUSE, CUT_DEADLINE, CUT_MAX_DURATION
+
+
+SAMPLE_RATE = 16000
+
+
+def noise(seconds: float) -> np.ndarray:
+    """배경 잡음"""
+    rng = np.random.default_rng(1)
+    return (rng.standard_normal(int(SAMPLE_RATE * seconds)) * 0.001).astype(np.float32)
+
+
+def speech(seconds: float) -> np.ndarray:
+    """음성 대용 톤"""
+    t = np.arange(int(SAMPLE_RATE * seconds)) / SAMPLE_RATE
+    return (np.sin(2 * np.pi * 200 * t) * 0.3).astype(np.float32)
+
+
+def make_segmenter(**kwargs) -> SpeechSegmenter:
+    """테스트용 분할기 생성"""
+    vad = EnergyVADService({'sample_rate': SAMPLE_RATE, 'frame_ms': 30})
+    vad.initialize()
+    return SpeechSegmenter(vad, **kwargs)
+
+
+def feed(segmenter: SpeechSegmenter, audio: np.ndarray, block: int = 1024) -> list:
+    """녹음 루프처럼 작은 블록 단위로 입력"""
+    segments = []
+    for i in range(0, len(audio), block):
+        segments.extend(s.copy() for s in segmenter.process(audio[i:i + block]))
+    return segments
+
+
+def test_cut_at_pauses():
+    """휴지에서 분할 테스트"""
+    segmenter = make_segmenter()
+    audio = np.concatenate([noise(1.0), speech(1.2), noise(1.0), speech(0.6), noise(1.0)])
+
+    segments = feed(segmenter, audio)
+
+    assert len(segments) == 2
+    assert segmenter.cuts[CUT_PAUSE] == 2
+    # 발화 길이 + 프리롤/꼬리 여유 정도
+    assert 1.2 <= len(segments[0]) / SAMPLE_RATE < 1.8
+    assert 0.6 <= len(segments[1]) / SAMPLE_RATE < 1.2
+
+
+def test_short_blip_discarded():
+    """최소 길이 미만 발화 버림 테스트"""
+    segmenter = make_segmenter(min_duration=0.3)
+    audio = np.concatenate([noise(1.0), speech(0.1), noise(1.0)])
+
+    assert feed(segmenter, audio) == []
+    assert segmenter.discarded == 1
+
+
+def test_max_duration_forced_overlap():
+    """최대 길이 강제 분할 및 오버랩 테스트"""
+    segmenter = make_segmenter(max_duration=2.0, max_latency=1.5, forced_overlap=0.5)
+    audio = np.concatenate([noise(0.5), speech(4.5), noise(1.0)])
+
+    segments = feed(segmenter, audio)
+
+    assert segmenter.cuts[CUT_MAX_DURATION] >= 1
+    assert all(len(s) / SAMPLE_RATE <= 2.0 + 0.25 for s in segments)
+
+    # 강제 분할된 다음 청크는 이전 청크의 끝 0.5초로 시작
+    overlap = int(0.5 * SAMPLE_RATE) // segmenter.frame_size * segmenter.frame_size
+    np.testing.assert_array_equal(segments[0][-overlap:], segments[1][:overlap])
+
+
+def test_deadline_cuts_at_short_gap():
+    """지연 한도 초과 시 짧은 휴지 분할 테스트"""
+    segmenter = make_segmenter(max_duration=8.0, max_latency=2.0, pause_ms=500)
+    # 휴지(0.2초)가 발화 종료 기준(0.5초)보다 짧아 발화가 이어짐
+    audio = np.concatenate([noise(0.5), speech(1.5), noise(0.2), speech(1.5), noise(1.0)])
+
+    segments = feed(segmenter, audio)
+
+    assert segmenter.cuts[CUT_DEADLINE] >= 1
+    assert segmenter.cuts[CUT_MAX_DURATION] == 0
+    assert len(segments[0]) / SAMPLE_RATE < 2.5
+
+
+def test_stt_audio_ratio_vs_fixed_windows():
+    """고정 50% 오버랩 대비 STT 입력량 테스트"""
+    segmenter = make_segmenter()
+    parts = []
+    for _ in range(5):
+        parts += [speech(1.5), noise(1.5)]
+    audio = np.concatenate(parts)
+
+    feed(segmenter, audio)
+    stats = segmenter.get_stats()
+
+    # 고정 윈도우 + 50% 오버랩은 입력 오디오의 약 2배를 STT로 보냄
+    assert stats['segments'] == 5
+    assert stats['stt_audio_ratio'] < 1.0
+
+
+def test_segment_offsets():
+    """청크 시작 시각은 프리롤을 포함한 스트림 내 위치"""
+    segmenter = make_segmenter()
+    audio = np.concatenate([noise(1.0), speech(1.2), noise(1.0), speech(0.6), noise(1.0)])
+
+    offsets = []
+    for i in range(0, len(audio), 1024):
+        segmenter.process(audio[i:i + 1024])
+        offsets.extend(segmenter.segment_offsets)
+
+    assert len(offsets) == 2
+    # 발화 시작(1.0초, 3.2초) 직전 프리롤 200ms 이내
+    assert 0.75 <= offsets[0] <= 1.0
+    assert 2.95 <= offsets[1] <= 3.2
+
+
+def test_segment_reasons():
+    """청크마다 분할 사유 기록 (강제 분할만 다음 청크와 겹침)"""
+    segmenter = make_segmenter(max_duration=2.0, max_latency=1.5, forced_overlap=0.5)
+    audio = np.concatenate([noise(0.5), speech(3.0), noise(1.0), speech(0.6), noise(1.0)])
+
+    reasons = []
+    for i in range(0, len(audio), 1024):
+        segments = segmenter.process(audio[i:i + 1024])
+        assert len(segmenter.segment_reasons) == len(segments)
+        reasons.extend(segmenter.segment_reasons)
+
+    assert reasons[0] == CUT_MAX_DURATION
+    assert reasons[-1] == CUT_PAUSE
+    assert sum(segmenter.cuts.values()) == len(reasons)
@@ -0,0 +1,97 @@
+"""
+Startup Tests
+지연 import 구현체 등록 및 시작 시간 프로파일러 단위 테스트
+"""
+
+import sys
+import subprocess
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from services.base_stt import BaseSTTService
+from services.model_factory import ModelFactory
+from core.startup_profiler import StartupProfiler
+
+
+def test_registration_does_not_import_backends():
+    """implementations / 컨트롤러 import만으로는 백엔드 모듈과 ML 라이브러리를 로드하지 않음"""
+    code = (
+        "import sys; sys.path.insert(0, '.'); "
+        "import implementations, core.controller; "
+        "from services.model_factory import ModelFactory; "
+        "assert 'whisper_light' in ModelFactory.list_stt_implementations(); "
+        "loaded = [m for m in ('implementations.whisper_stt', 'implementations.opus_translation', "
+        "'implementations.ct2_translation', 'implementations.silero_vad', "
+        "'faster_whisper', 'ctranslate2', 'transformers', 'torch', 'onnxruntime') if m in sys.modules]; "
+        "assert not loaded, loaded"
+    )
+    subprocess.run([sys.executable, "-c", code], cwd=PROJECT_ROOT, check=True)
+
+
+def test_lazy_backend_resolved_on_create(monkeypatch):
+    """경로로 등록한 구현체는 생성할 때 import 후 클래스로 교체"""
+    import implementations  # noqa: F401
+    monkeypatch.setattr(ModelFactory, '_stt_implementations', dict(ModelFactory._stt_implementations))
+
+    ModelFactory.register_stt('lazy_mock', 'implementations.mock_backends:MockSTTService')
+    service = ModelFactory.create_stt_service('lightweight', {'backend': 'lazy_mock'})
+
+    assert isinstance(service, BaseSTTService)
+    assert ModelFactory._stt_implementations['lazy_mock'] is type(service)
+    assert implementations.MockSTTService is type(service)
+
+
+def test_lazy_backend_type_checked(monkeypatch):
+    """경로 형식 오류는 등록 시, 잘못된 클래스는 생성 시 거부"""
+    monkeypatch.setattr(ModelFactory, '_stt_implementations', dict(ModelFactory._stt_implementations))
+    with pytest.raises(ValueError):
+        ModelFactory.register_stt('bad_path', 'implementations.mock_backends.MockSTTService')
+
+    ModelFactory.register_stt('wrong_base', 'implementations.mock_backends:MockTranslationService')
+    with pytest.raises(TypeError):
+        ModelFactory.create_stt_service('lightweight', {'backend': 'wrong_base'})
+
+
+def test_profiler_times_imports(tmp_path, monkeypatch):
+    """새로 import한 모듈의 자체 / 누적 시간과 단계 시간 기록"""
+    (tmp_path / "slow_parent.py").write_text(
+        "import time, slow_child\ntime.sleep(0.02)\n", encoding='utf-8'
+    )
+    (tmp_path / "slow_child.py").write_text("import time\ntime.sleep(0.03)\n", encoding='utf-8')
+    monkeypatch.syspath_prepend(str(tmp_path))
+
+    profiler = StartupProfiler().start()
+    try:
+        with profiler.phase('load'):
+            import slow_parent  # noqa: F401
+    finally:
+        profiler.stop()
+        sys.modules.pop('slow_parent', None)
+        sys.modules.pop('slow_child', None)
+
+    report = profiler.get_report()
+    modules = {entry['module']: entry for entry in report['slowest']}
+    assert modules['slow_child']['self_ms'] >= 30
+    assert modules['slow_parent']['self_ms'] >= 20
+    # 보고서 값은 0.01ms 단위로 반올림되므로 그만큼 여유를 둠
+    assert (
+        modules['slow_parent']['cumulative_ms'] + 0.02
+        >= modules['slow_parent']['self_ms'] + modules['slow_child']['self_ms']
+    )
+    assert report['import_ms'] >= 50
+    assert report['phases'][0]['name'] == 'load'
+    assert profiler not in sys.meta_path
+
+
+def test_disabled_profiler_is_noop():
+    """비활성 프로파일러는 import hook을 설치하지 않음"""
+    profiler = StartupProfiler(enabled=False).start()
+    with profiler.phase('noop'):
+        pass
+    assert profiler._finder is None
+    assert profiler.phases == []
@@ -0,0 +1,189 @@
+"""
+Streaming STT Tests
+LocalAgreement 스트리밍 세션 단위 테스트
+"""
+
+import sys
+from pathlib import Path
+import numpy as np
+import pytest
+
+# Add project root to path
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from services.base_stt import BaseSTTService
+from core.streaming_stt import HypothesisBuffer, LocalAgreementSession
+
+
+SAMPLE_RATE = 16000
+WORD_SECONDS = 0.4
+WORDS = [' 오늘은', ' 날씨가', ' 좋습니다.', ' 산책을', ' 갈까요?']
+
+
+class RunLengthSTT(BaseSTTService):
+    """
+    테스트용 STT
+
+    오디오 값 k/100 구간을 WORDS[k-1]로 인식합니다. 버퍼 끝에서 잘린
+    마지막 단어는 잘린 길이에 따라 매번 다르게 인식해, 실제 모델처럼
+    꼬리가 불안정합니다.
+    """
+
+    supports_word_timestamps = True
+
+    def __init__(self):
+        super().__init__({})
+        self.calls = 0
+
+    def initialize(self) -> bool:
+        self.is_initialized = True
+        return True
+
+    def transcribe_stream(self, audio_data, sample_rate=16000):
+        yield from ()
+
+    def transcribe_words(self, audio_data, sample_rate=16000, prompt=None):
+        self.calls += 1
+        codes = np.rint(audio_data * 100).astype(int)
+        bounds = np.flatnonzero(np.diff(codes)) + 1
+        starts = np.concatenate([[0], bounds])
+        ends = np.concatenate([bounds, [len(codes)]])
+
+        words = []
+        for start, end in zip(starts, ends):
+            code = codes[start]
+            if code == 0:
+                continue
+            word = WORDS[code - 1]
+            if end == len(codes) and end - start < WORD_SECONDS * sample_rate:
+                word = f"{word[:2]}~{end - start}"
+            words.append({
+                'word': word,
+                'start': start / sample_rate,
+                'end': end / sample_rate,
+                'probability': 0.9
+            })
+        return words
+
+    def transcribe_file(self, audio_path: str) -> str:
+        return ''
+
+    def cleanup(self):
+        self.is_initialized = False
+
+
+class ChunkOnlySTT(RunLengthSTT):
+    """단어 타임스탬프 미지원 STT"""
+
+    supports_word_timestamps = False
+
+
+def make_speech() -> np.ndarray:
+    """WORDS 순서대로 단어 구간을 이어 붙인 오디오"""
+    n = int(WORD_SECONDS * SAMPLE_RATE)
+    return np.concatenate([np.full(n, (i + 1) / 100, dtype=np.float32) for i in range(len(WORDS))])
+
+
+def run_session(session: LocalAgreementSession, audio: np.ndarray, step: float = 0.1):
+    """오디오를 step초 단위로 넣으며 (입력 시각, 결과) 목록 수집"""
+    hop = int(step * SAMPLE_RATE)
+    events = []
+    for i in range(0, len(audio), hop):
+        session.insert_audio(audio[i:i + hop])
+        for result in session.process_iter():
+            events.append(((i + hop) / SAMPLE_RATE, result))
+    for result in session.finish():
+        events.append((len(audio) / SAMPLE_RATE, result))
+    return events
+
+
+def test_hypothesis_buffer_commits_agreed_prefix():
+    """연속 결과의 공통 앞부분만 확정"""
+    buffer = HypothesisBuffer()
+
+    def words(*texts):
+        return [{'word': t, 'start': i * 0.5, 'end': i * 0.5 + 0.4} for i, t in enumerate(texts)]
+
+    buffer.insert(words(' 오늘은', ' 날'))
+    assert buffer.flush() == []
+
+    buffer.insert(words(' 오늘은', ' 날씨가', ' 좋'))
+    committed = buffer.flush()
+    assert [w['word'] for w in committed] == [' 오늘은']
+    assert [w['word'] for w in buffer.unconfirmed] == [' 날씨가', ' 좋']
+
+
+def test_partial_results_arrive_early():
+    """확정 전에 부분 결과가 수백 ms 안에 나옴"""
+    session = LocalAgreementSession(RunLengthSTT(), sample_rate=SAMPLE_RATE, min_step=0.2)
+    events = run_session(session, make_speech())
+
+    partials = [(t, r) for t, r in events if not r['is_final']]
+    finals = [(t, r) for t, r in events if r['is_final']]
+
+    assert partials and finals
+    assert partials[0][0] <= 0.5
+    assert partials[0][0] < finals[0][0]
+
+
+def test_final_text_matches_transcript():
+    """확정 결과를 이으면 전체 문장과 같음 (중복/누락 없음)"""
+    session = LocalAgreementSession(RunLengthSTT(), sample_rate=SAMPLE_RATE, min_step=0.2)
+    events = run_session(session, make_speech())
+
+    finals = [r['text'] for _, r in events if r['is_final']]
+    assert finals == ['오늘은 날씨가 좋습니다.', '산책을 갈까요?']
+
+
+def test_audio_trimmed_after_commit():
+    """문장 확정 후 디코딩 버퍼를 잘라냄"""
+    session = LocalAgreementSession(RunLengthSTT(), sample_rate=SAMPLE_RATE, min_step=0.2)
+    audio = make_speech()
+    hop = int(0.1 * SAMPLE_RATE)
+
+    longest = 0.0
+    for i in range(0, len(audio), hop):
+        session.insert_audio(audio[i:i + hop])
+        session.process_iter()
+        longest = max(longest, session.buffer_duration)
+
+    assert longest < len(audio) / SAMPLE_RATE
+    assert session.buffer_duration < 3 * WORD_SECONDS
+
+
+def test_max_buffer_forces_commit():
+    """합의 없이 버퍼가 가득 차면 강제 확정"""
+    session = LocalAgreementSession(
+        RunLengthSTT(), sample_rate=SAMPLE_RATE, min_step=0.2, max_buffer=1.0
+    )
+    # 끝나지 않는 한 단어 → 매번 잘린 꼬리만 인식
+    audio = np.full(int(3.0 * SAMPLE_RATE), 0.01, dtype=np.float32)
+    events = run_session(session, audio)
+
+    assert any(r['is_final'] for _, r in events)
+    assert session.buffer_duration <= 1.0
+
+
+def test_silence_trimmed_at_max_buffer():
+    """인식 단어가 없는 무음도 최대 길이에서 잘라 매 단계 긴 버퍼를 다시 디코딩하지 않음"""
+    session = LocalAgreementSession(
+        RunLengthSTT(), sample_rate=SAMPLE_RATE, min_step=0.3, max_buffer=15.0
+    )
+    hop = int(0.3 * SAMPLE_RATE)
+    for _ in range(200):
+        session.insert_audio(np.zeros(hop, dtype=np.float32))
+        assert session.process_iter() == []
+        assert session.buffer_duration <= 15.0
+
+
+def test_requires_word_timestamps():
+    """단어 타임스탬프 미지원 서비스 거부"""
+    with pytest.raises(ValueError):
+        LocalAgreementSession(ChunkOnlySTT(), sample_rate=SAMPLE_RATE)
+
+
+def test_base_transcribe_words_is_empty():
+    """기본 transcribe_words()는 예외 없이 빈 리스트 (지원 여부는 supports_word_timestamps로 판단)"""
+    audio = make_speech()
+    assert BaseSTTService.transcribe_words(ChunkOnlySTT(), audio, sample_rate=SAMPLE_RATE) == []
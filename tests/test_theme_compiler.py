@@ -0,0 +1,107 @@
+"""
+Theme Compiler Tests
+테마 컴파일 (검증, Qt 객체 변환, 내용 해시 캐시) 단위 테스트
+"""
+
+import copy
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from PyQt5.QtCore import Qt
+from PyQt5.QtWidgets import QApplication
+
+from core.theme_manager import ThemeManager
+from gui.renderers import RendererFactory
+
+
+@pytest.fixture(scope='module')
+def qt_app():
+    """Qt 애플리케이션 (QT_QPA_PLATFORM=offscreen 권장)"""
+    return QApplication.instance() or QApplication([])
+
+
+@pytest.fixture
+def theme_mgr(qt_app):
+    """테마 관리자 (themes/ 로드)"""
+    theme_mgr = ThemeManager()
+    theme_mgr.load_themes('themes')
+    return theme_mgr
+
+
+def test_compiled_values_are_typed(theme_mgr):
+    """색상 / 글꼴 / 정렬을 Qt 객체로 변환"""
+    compiled = theme_mgr.compile_theme('panel')
+
+    assert compiled.korean.font.pixelSize() == 24
+    assert compiled.korean.font.bold()
+    assert not compiled.english.font.bold()
+    assert compiled.english.color.name() == '#ffff00'
+    assert compiled.korean.alignment == Qt.AlignLeft
+    assert compiled.background.alpha() == int(0.7 * 255)
+    assert compiled.max_lines == 10
+    assert 'QLabel#KoreanCaption' in compiled.stylesheet
+    assert 'rgba(0, 0, 0, 178)' in compiled.stylesheet
+
+
+def test_compiled_once_per_content(theme_mgr):
+    """같은 내용은 캐시된 결과를 공유하고, 내용이 바뀌면 다시 컴파일"""
+    panel = theme_mgr.get_theme('panel')
+    compiled = theme_mgr.compile_theme('panel')
+
+    assert theme_mgr.compile_theme(copy.deepcopy(panel)) is compiled
+
+    first = RendererFactory.create_renderer(panel)
+    second = RendererFactory.create_renderer(panel)
+    assert first.build_stylesheet() is second.build_stylesheet()
+
+    changed = copy.deepcopy(panel)
+    changed['caption']['korean']['font_size'] = 30
+    recompiled = theme_mgr.compile_theme(changed)
+    assert recompiled is not compiled
+    assert recompiled.korean.font.pixelSize() == 30
+
+
+def test_validation_lists_all_errors(theme_mgr):
+    """잘못된 색상 / 숫자 / 정렬을 한 번에 보고"""
+    broken = copy.deepcopy(theme_mgr.get_theme('panel'))
+    broken['background']['color'] = 'not-a-color'
+    broken['background']['opacity'] = 2
+    broken['caption']['english']['alignment'] = 'middle'
+
+    with pytest.raises(ValueError) as error:
+        theme_mgr.compile_theme(broken)
+    message = str(error.value)
+    assert 'background.color' in message
+    assert 'background.opacity' in message
+    assert 'caption.english.alignment' in message
+
+    with pytest.raises(ValueError):
+        theme_mgr.compile_theme('missing')
+
+
+def test_overlay_uses_theme_stroke(theme_mgr):
+    """투명 오버레이 외곽선은 테마의 stroke 설정 사용"""
+    renderer = RendererFactory.create_renderer(theme_mgr.get_theme('transparent'))
+    widget = renderer.create_widget()
+
+    assert widget.styleSheet() == renderer.theme.overlay_stylesheet
+    assert renderer.english_label.outline_width == 3
+    assert renderer.korean_label.outline_color == renderer.theme.korean.stroke_color
+    widget.close()
+
+
+def test_theme_manager_import_stays_qt_free():
+    """테마 관리자 import만으로는 PyQt5를 로드하지 않음 (엔진 / CLI 경로)"""
+    code = (
+        "import sys; sys.path.insert(0, '.'); "
+        "import core.theme_manager; "
+        "assert 'PyQt5' not in sys.modules"
+    )
+    subprocess.run([sys.executable, "-c", code], cwd=PROJECT_ROOT, check=True)
@@ -0,0 +1,128 @@
+"""
+Theme Switch Tests
+자막 창 테마 변경 (렌더러 캐시, 자막 일괄 이전) 단위 테스트
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from PyQt5.QtWidgets import QApplication
+
+from gui.caption_window import CaptionWindow
+
+
+@pytest.fixture(scope='module')
+def qt_app():
+    """Qt 애플리케이션 (QT_QPA_PLATFORM=offscreen 권장)"""
+    return QApplication.instance() or QApplication([])
+
+
+@pytest.fixture
+def window(qt_app):
+    """패널형 테마 자막 창"""
+    window = CaptionWindow('panel')
+    window.show()
+    yield window
+    window.close()
+
+
+def caption(index: int) -> dict:
+    """테스트 자막"""
+    return {'korean': f"자막 {index}", 'english': f"caption {index}", 'timestamp': 0.0}
+
+
+def test_renderers_cached_across_switches(window):
+    """한 번 만든 렌더러와 위젯은 다시 선택할 때 그대로 사용"""
+    panel = window.renderer
+    panel_widget = panel.widget
+
+    window.change_theme('ticker')
+    ticker = window.renderer
+    window.change_theme('panel')
+
+    assert window.renderer is panel
+    assert window.renderer.widget is panel_widget
+    window.change_theme('ticker')
+    assert window.renderer is ticker
+    assert window.stack.currentWidget() is ticker.widget
+    assert set(window.renderers) == {'panel', 'ticker'}
+
+
+def test_captions_carried_over_in_bulk(window):
+    """이전 렌더러의 자막을 새 렌더러로 일괄 이전"""
+    window.add_captions([caption(index) for index in range(15)])
+    panel = window.renderer
+    assert len(panel.captions) == 10
+
+    window.change_theme('history')
+    assert [c['korean'] for c in window.renderer.captions] == [f"자막 {index}" for index in range(5, 15)]
+
+    window.change_theme('panel')
+    assert [c['korean'] for c in panel.captions] == [f"자막 {index}" for index in range(5, 15)]
+    assert panel.get_stats()['visible'] == 10
+
+
+def test_history_kept_across_theme_switches(qt_app):
+    """기록형 → 패널형 → 기록형 전환에도 세션 기록을 유지하고 그 사이 자막만 추가"""
+    window = CaptionWindow('history')
+    history = window.renderer
+    window.add_captions([caption(index) for index in range(30)])
+
+    # 숨겨진 동안 패널 max_lines(10)보다 많은 자막이 와도 빈 구간 없음
+    window.change_theme('panel')
+    window.add_captions([caption(index) for index in range(30, 55)])
+    window.change_theme('history')
+
+    assert window.renderer is history
+    assert [c['korean'] for c in history.captions] == [f"자막 {index}" for index in range(55)]
+
+    window.clear_captions()
+    assert len(history.captions) == 0
+    assert len(window.renderers['panel'].captions) == 0
+    window.close()
+
+
+def test_history_load_keeps_latest_rows(qt_app):
+    """기록형 렌더러 일괄 로드는 최대 행 수를 넘으면 최근 자막만 유지"""
+    window = CaptionWindow('history')
+    renderer = window.renderer
+    max_rows = renderer.model.max_rows
+
+    renderer.load_captions([caption(index) for index in range(max_rows + 5)])
+    assert renderer.model.rowCount() == max_rows
+    assert renderer.captions[0]['korean'] == "자막 5"
+    assert renderer.captions is renderer.model.captions
+    window.close()
+
+
+def test_window_flags_reapplied_only_on_change(window, monkeypatch):
+    """창 플래그가 같은 테마끼리 변경하면 setWindowFlags()를 다시 호출하지 않음"""
+    calls = []
+    original = CaptionWindow.setWindowFlags
+    monkeypatch.setattr(
+        CaptionWindow, 'setWindowFlags',
+        lambda self, flags: (calls.append(flags), original(self, flags))
+    )
+
+    window.change_theme('history')
+    assert calls == []
+
+    window.change_theme('transparent')
+    assert len(calls) == 1
+    assert window.isVisible()
+
+
+def test_preload_and_unknown_theme(window):
+    """미리 생성은 모든 테마 렌더러를 만들고, 없는 테마로는 변경하지 않음"""
+    window.preload_renderers()
+    assert set(window.renderers) == set(window.theme_mgr.list_themes())
+    assert window.stack.currentWidget() is window.renderer.widget
+
+    window.change_theme('missing')
+    assert window.theme_name == 'panel'
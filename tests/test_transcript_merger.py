@@ -0,0 +1,116 @@
+"""
+Transcript Merger Tests
+오버랩 청크 중복 제거 단위 테스트
+"""
+
+import sys
+from pathlib import Path
+
+# Add project root to path
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from core.transcript_merger import TranscriptMerger
+
+
+def make_result(text: str, words=None) -> dict:
+    """transcribe_stream() 형식 결과 생성"""
+    result = {'text': text, 'confidence': -0.2, 'is_final': True, 'timestamp': 0.0}
+    if words is not None:
+        result['words'] = words
+    return result
+
+
+def make_words(*spans) -> list:
+    """(단어, 시작, 끝) 목록을 단어 타임스탬프로 변환"""
+    return [{'word': f' {w}', 'start': s, 'end': e, 'probability': 0.9} for w, s, e in spans]
+
+
+def test_text_merge_drops_repeated_prefix():
+    """텍스트 비교로 이전 청크 끝과 겹치는 앞부분 제거"""
+    merger = TranscriptMerger()
+
+    first = merger.merge_chunk([make_result('오늘 회의 안건은 예산 검토입니다')])
+    assert first[0]['text'] == '오늘 회의 안건은 예산 검토입니다'
+
+    # 경계에서 잘린 첫 단어("건은")와 문장 부호 차이는 무시
+    second = merger.merge_chunk([make_result('건은 예산 검토입니다. 다음으로 일정을 보겠습니다')])
+    assert [r['text'] for r in second] == ['다음으로 일정을 보겠습니다']
+
+    third = merger.merge_chunk([make_result('일정을 보겠습니다 먼저 일정을 보겠습니다')])
+    assert [r['text'] for r in third] == ['먼저 일정을 보겠습니다']
+
+    stats = merger.get_stats()
+    assert stats['chunks'] == 3
+    assert stats['text_merges'] == 2
+    assert stats['suppressed_results'] == 0
+    assert stats['duplicate_words'] == 3 + 2
+
+
+def test_text_merge_keeps_single_word_after_lead():
+    """새 청크 중간의 1단어 일치는 실제 발화로 보고 유지"""
+    merger = TranscriptMerger()
+    merger.merge_chunk([make_result('그럼 시작할까요 네')])
+
+    merged = merger.merge_chunk([make_result('아 그래요 네 질문 있습니다')])
+    assert [r['text'] for r in merged] == ['아 그래요 네 질문 있습니다']
+    assert merger.get_stats()['text_merges'] == 0
+
+
+def test_text_merge_across_results():
+    """청크 안의 여러 세그먼트에 걸친 중복 제거"""
+    merger = TranscriptMerger()
+    merger.merge_chunk([make_result('지금부터 발표를 시작하겠습니다')])
+
+    merged = merger.merge_chunk([
+        make_result('발표를 시작하겠습니다.'),
+        make_result('첫 번째 주제는 성능입니다')
+    ])
+
+    assert [r['text'] for r in merged] == ['첫 번째 주제는 성능입니다']
+    assert merger.get_stats()['suppressed_results'] == 1
+
+
+def test_text_merge_keeps_unrelated_text():
+    """겹치지 않는 청크는 그대로 통과"""
+    merger = TranscriptMerger()
+    merger.merge_chunk([make_result('안녕하세요 여러분')])
+
+    merged = merger.merge_chunk([make_result('오늘 날씨가 좋습니다')])
+    assert [r['text'] for r in merged] == ['오늘 날씨가 좋습니다']
+    assert merger.get_stats()['duplicate_words'] == 0
+
+
+def test_timestamp_merge_drops_overlap_words():
+    """단어 타임스탬프로 오버랩 구간 단어 제거"""
+    merger = TranscriptMerger(overlap_seconds=1.5)
+
+    words = make_words(('예산', 0.2, 0.7), ('검토입니다', 0.8, 1.6), ('다음으로', 1.8, 2.3), ('일정을', 2.4, 2.9))
+    merged = merger.merge_chunk([make_result('예산 검토입니다 다음으로 일정을', words)])
+
+    assert merged[0]['text'] == '다음으로 일정을'
+    assert merged[0]['timestamp'] == 1.8
+
+    stats = merger.get_stats()
+    assert stats['timestamp_merges'] == 1
+    assert stats['duplicate_words'] == 2
+
+
+def test_timestamp_merge_falls_back_to_text():
+    """단어 타임스탬프가 없으면 텍스트 비교 사용"""
+    merger = TranscriptMerger(overlap_seconds=1.5)
+    merger.merge_chunk([make_result('예산 검토입니다')])
+
+    merged = merger.merge_chunk([make_result('예산 검토입니다 다음으로')])
+    assert [r['text'] for r in merged] == ['다음으로']
+    assert merger.get_stats()['text_merges'] == 1
+
+
+def test_reset_clears_previous_chunk():
+    """reset() 후에는 이전 청크와 비교하지 않음"""
+    merger = TranscriptMerger()
+    merger.merge_chunk([make_result('예산 검토입니다')])
+    merger.reset()
+
+    merged = merger.merge_chunk([make_result('예산 검토입니다')])
+    assert [r['text'] for r in merged] == ['예산 검토입니다']
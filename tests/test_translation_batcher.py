@@ -0,0 +1,163 @@
+"""
+Translation Batcher Tests
+번역 마이크로 배칭 단위 테스트
+"""
+
+import sys
+import time
+import threading
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from services.base_translation import BaseTranslationService
+from core.translation_batcher import BatchingTranslator
+
+
+class RecordingTranslation(BaseTranslationService):
+    """translate_batch() 호출을 기록하는 테스트용 번역 서비스"""
+
+    def __init__(self, fail: bool = False, delay: float = 0.0):
+        super().__init__({})
+        self.batches = []
+        self.fail = fail
+        self.delay = delay
+
+    def initialize(self) -> bool:
+        self.is_initialized = True
+        return True
+
+    def translate(self, text):
+        return self.translate_batch([text])[0]
+
+    def translate_batch(self, texts):
+        if self.fail:
+            raise RuntimeError("generate failed")
+        time.sleep(self.delay)
+        self.batches.append(list(texts))
+        return [
+            {'translated_text': f"en:{t}", 'source_lang': 'ko', 'target_lang': 'en', 'confidence': 0.9}
+            for t in texts
+        ]
+
+    def cleanup(self):
+        self.is_initialized = False
+
+
+def translate_concurrently(translator, texts):
+    """여러 스레드에서 동시에 translate() 호출"""
+    results = [None] * len(texts)
+
+    def worker(i, text):
+        results[i] = translator.translate(text)
+
+    threads = [threading.Thread(target=worker, args=(i, t)) for i, t in enumerate(texts)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=5.0)
+    return results
+
+
+def test_concurrent_requests_share_batch():
+    """앞 배치를 처리하는 동안 쌓인 요청이 한 배치로 묶이고 결과는 각 요청에 돌아감"""
+    service = RecordingTranslation(delay=0.2)
+    translator = BatchingTranslator(service, max_batch=8, max_wait_ms=100)
+    translator.start()
+
+    first = translator.submit("문장 0")
+    time.sleep(0.05)
+    texts = [f"문장 {i}" for i in range(1, 6)]
+    results = translate_concurrently(translator, texts)
+    translator.stop()
+
+    assert first.result()['translated_text'] == "en:문장 0"
+    assert [r['translated_text'] for r in results] == [f"en:{t}" for t in texts]
+    assert len(service.batches) == 2
+    assert sorted(service.batches[1]) == sorted(texts)
+
+    stats = translator.get_stats()
+    assert stats['batches'] == 2
+    assert stats['batch_size_histogram'] == {1: 1, 5: 1}
+    assert sum(stats['wait_histogram'].values()) == 6
+
+
+def test_max_batch_splits_requests():
+    """max_batch를 넘는 요청은 여러 배치로 나뉨"""
+    service = RecordingTranslation()
+    translator = BatchingTranslator(service, max_batch=4, max_wait_ms=100)
+    translator.start()
+
+    results = translate_concurrently(translator, [f"문장 {i}" for i in range(10)])
+    translator.stop()
+
+    assert all(r['translated_text'].startswith('en:') for r in results)
+    assert max(len(batch) for batch in service.batches) <= 4
+    assert sum(len(batch) for batch in service.batches) == 10
+
+
+def test_single_request_not_delayed():
+    """대기 중인 다른 요청이 없으면 max_wait_ms를 기다리지 않고 바로 처리"""
+    service = RecordingTranslation()
+    translator = BatchingTranslator(service, max_batch=8, max_wait_ms=500)
+    translator.start()
+
+    start = time.perf_counter()
+    result = translator.translate("안녕하세요")
+    elapsed = time.perf_counter() - start
+    translator.stop()
+
+    assert result['translated_text'] == "en:안녕하세요"
+    assert elapsed < 0.25
+    assert translator.get_stats()['batch_size_histogram'] == {1: 1}
+
+
+def test_stop_fails_pending_and_rejects_new_requests():
+    """종료 시간 안에 처리되지 못한 요청은 예외로 끝나고, 종료 후 요청은 거부"""
+    release = threading.Event()
+    service = RecordingTranslation()
+    original = service.translate_batch
+    service.translate_batch = lambda texts: (release.wait(5.0), original(texts))[1]
+    translator = BatchingTranslator(service, max_wait_ms=10)
+    translator.start()
+
+    translator.submit("느린 문장")
+    time.sleep(0.05)
+    pending = translator.submit("대기 문장")
+    translator.stop(timeout=0.1)
+
+    with pytest.raises(RuntimeError):
+        pending.result(timeout=1.0)
+    with pytest.raises(RuntimeError):
+        translator.submit("종료 후 문장")
+
+    release.set()
+    assert translator.translate("종료 후 문장")['translated_text'] == "en:종료 후 문장"
+
+
+def test_batch_failure_propagates():
+    """배치 번역 실패는 모든 대기 요청에 예외로 전달"""
+    translator = BatchingTranslator(RecordingTranslation(fail=True), max_wait_ms=10)
+    translator.start()
+
+    future = translator.submit("문장")
+    try:
+        future.result(timeout=2.0)
+        assert False, "expected exception"
+    except RuntimeError:
+        pass
+    finally:
+        translator.stop()
+
+
+def test_translate_without_start_is_direct():
+    """start() 전에는 번역 서비스를 직접 호출"""
+    service = RecordingTranslation()
+    translator = BatchingTranslator(service)
+
+    assert translator.translate("문장")['translated_text'] == "en:문장"
+    assert translator.get_stats()['batches'] == 0
@@ -0,0 +1,138 @@
+"""
+Translation Cache Tests
+LRU 번역 캐시 단위 테스트
+"""
+
+import sys
+from pathlib import Path
+
+# Add project root to path
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from services.base_translation import BaseTranslationService
+from services.translation_cache import TranslationCache, cached_translate, cached_translate_batch
+
+
+class CountingTranslation(BaseTranslationService):
+    """모델 호출 횟수를 세는 테스트용 번역 서비스"""
+
+    def __init__(self, config):
+        super().__init__(config)
+        self.model_calls = []
+
+    def initialize(self) -> bool:
+        self.is_initialized = True
+        return True
+
+    def _result(self, text):
+        return {
+            'translated_text': f"en:{text}" if text else '',
+            'source_lang': self.source_lang,
+            'target_lang': self.target_lang,
+            'confidence': 0.9 if text else 0.0
+        }
+
+    @cached_translate
+    def translate(self, text):
+        self.model_calls.append([text])
+        return self._result(text)
+
+    @cached_translate_batch
+    def translate_batch(self, texts):
+        self.model_calls.append(list(texts))
+        return [self._result(t) for t in texts]
+
+    def cleanup(self):
+        self.is_initialized = False
+
+
+def make_service(**cache_config) -> CountingTranslation:
+    """캐시가 켜진 테스트용 번역 서비스 생성"""
+    return CountingTranslation({'cache': {'enabled': True, **cache_config}})
+
+
+def test_cache_hit_skips_model():
+    """정규화된 같은 문장은 모델을 다시 호출하지 않음"""
+    service = make_service()
+
+    first = service.translate('안녕하세요  여러분')
+    second = service.translate(' 안녕하세요 여러분 ')
+
+    assert first['translated_text'] == second['translated_text']
+    assert len(service.model_calls) == 1
+
+    stats = service.get_model_info()['cache']
+    assert stats['hits'] == 1
+    assert stats['misses'] == 1
+
+
+def test_language_pair_in_key():
+    """언어 쌍이 바뀌면 캐시를 공유하지 않음"""
+    service = make_service()
+    service.translate('감사합니다')
+    service.set_languages('ko', 'ja')
+    service.translate('감사합니다')
+
+    assert len(service.model_calls) == 2
+
+
+def test_batch_translates_only_misses():
+    """translate_batch는 캐시에 없는 문장만 한 번씩 번역"""
+    service = make_service()
+    service.translate('안녕하세요')
+
+    results = service.translate_batch(['안녕하세요', '반갑습니다', '', '반갑습니다'])
+
+    assert [r['translated_text'] for r in results] == ['en:안녕하세요', 'en:반갑습니다', '', 'en:반갑습니다']
+    assert service.model_calls[-1] == ['반갑습니다', '']
+
+
+def test_entry_limit_evicts_least_recent():
+    """항목 수 한도 초과 시 가장 오래 쓰지 않은 항목 제거"""
+    service = make_service(max_entries=2)
+    service.translate('하나')
+    service.translate('둘')
+    service.translate('하나')  # 최근 사용으로 갱신
+    service.translate('셋')    # '둘' 제거
+
+    calls = len(service.model_calls)
+    service.translate('하나')
+    assert len(service.model_calls) == calls
+    service.translate('둘')
+    assert len(service.model_calls) == calls + 1
+
+    assert service.get_model_info()['cache']['evictions'] >= 1
+
+
+def test_byte_limit():
+    """용량 한도 초과 시 제거, 한도보다 큰 항목은 저장 안 함"""
+    cache = TranslationCache(max_entries=100, max_bytes=40)
+    cache.put(('가' * 5, 'ko', 'en'), {'translated_text': 'a' * 10})  # 25 bytes
+    cache.put(('나' * 5, 'ko', 'en'), {'translated_text': 'b' * 10})  # 25 bytes → 첫 항목 제거
+    cache.put(('다' * 20, 'ko', 'en'), {'translated_text': 'c'})      # 61 bytes → 저장 안 함
+
+    stats = cache.get_stats()
+    assert stats['entries'] == 1
+    assert stats['bytes'] <= 40
+    assert stats['evictions'] == 1
+
+
+def test_failed_translation_not_cached():
+    """실패한 번역은 캐시하지 않음"""
+    service = make_service()
+    service._result = lambda text: {'translated_text': '', 'source_lang': 'ko', 'target_lang': 'en', 'confidence': 0.0}
+
+    service.translate('안녕하세요')
+    service.translate('안녕하세요')
+    assert len(service.model_calls) == 2
+
+
+def test_cache_disabled_by_default():
+    """cache 설정이 없으면 캐시 비활성"""
+    service = CountingTranslation({})
+    service.translate('안녕하세요')
+    service.translate('안녕하세요')
+
+    assert service.cache is None
+    assert len(service.model_calls) == 2
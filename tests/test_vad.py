@@ -0,0 +1,114 @@
+"""
+VAD Gate Tests
+VAD 백엔드 및 무음 청크 게이트 단위 테스트
+"""
+
+import sys
+from pathlib import Path
+import numpy as np
+
+# Add project root to path
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+# 구현체 import (팩토리 등록 포함)
+import implementations
+
+from services.model_factory import ModelFactory
+from core.vad_gate import VoiceActivityGate
+
+
+SAMPLE_RATE = 16000
+CHUNK_SIZE = SAMPLE_RATE  # 1초 청크
+OVERLAP = CHUNK_SIZE // 2
+
+
+def make_noise(seconds: float, level: float = 0.001) -> np.ndarray:
+    """배경 잡음 생성"""
+    rng = np.random.default_rng(0)
+    return (rng.standard_normal(int(SAMPLE_RATE * seconds)) * level).astype(np.float32)
+
+
+def make_tone(seconds: float, level: float = 0.3) -> np.ndarray:
+    """음성 대용 톤 생성"""
+    t = np.arange(int(SAMPLE_RATE * seconds)) / SAMPLE_RATE
+    return (np.sin(2 * np.pi * 220 * t) * level).astype(np.float32)
+
+
+def split_windows(audio: np.ndarray) -> list:
+    """AudioCapture와 동일한 오버랩 윈도우로 분할"""
+    hop = CHUNK_SIZE - OVERLAP
+    return [audio[i:i + CHUNK_SIZE] for i in range(0, len(audio) - CHUNK_SIZE + 1, hop)]
+
+
+def make_gate(backend: str = 'energy') -> VoiceActivityGate:
+    """테스트용 게이트 생성"""
+    vad = ModelFactory.create_vad_service({'backend': backend, 'sample_rate': SAMPLE_RATE})
+    assert vad.initialize() is True
+    return VoiceActivityGate(vad, overlap_size=OVERLAP, hangover_ms=100)
+
+
+def test_vad_registration():
+    """VAD 구현체 등록 테스트"""
+    vad_impls = ModelFactory.list_vad_implementations()
+    assert 'energy' in vad_impls
+    assert 'silero' in vad_impls
+
+
+def test_energy_vad_frames():
+    """에너지 VAD 프레임 판정 테스트"""
+    vad = ModelFactory.create_vad_service({'backend': 'energy'})
+    vad.initialize()
+
+    audio = np.concatenate([make_noise(0.3), make_tone(0.3)])
+    n_frames = len(audio) // vad.frame_size
+    frames = audio[:n_frames * vad.frame_size].reshape(n_frames, vad.frame_size)
+
+    probs = vad.process_frames(frames)
+    half = n_frames // 2
+    assert probs[:half - 1].max() < 0.5
+    assert probs[half + 1:].min() >= 0.5
+
+
+def test_gate_drops_silence():
+    """무음 윈도우 차단 테스트"""
+    gate = make_gate()
+
+    audio = np.concatenate([make_noise(4.0), make_tone(1.0), make_noise(4.0)])
+    decisions = [gate.process(window) for window in split_windows(audio)]
+
+    # 앞쪽 무음 차단, 음성 포함 윈도우 통과, 뒤쪽 무음 다시 차단
+    assert decisions[0] is False
+    assert any(decisions)
+    assert decisions[-1] is False
+
+    stats = gate.get_stats()
+    assert stats['windows_total'] == len(decisions)
+    assert stats['windows_dropped'] == decisions.count(False)
+    assert 0.5 < stats['suppressed_ratio'] < 1.0
+
+
+def test_gate_keeps_speech_in_overlap():
+    """오버랩 구간 음성 유지 테스트 (이전 청크 판정 재사용)"""
+    gate = make_gate()
+
+    # 첫 윈도우 끝부분에만 음성 → 두 번째 윈도우의 오버랩 구간에 해당
+    audio = np.concatenate([make_noise(0.7), make_tone(0.3), make_noise(0.5)])
+    windows = split_windows(audio)
+
+    assert gate.process(windows[0]) is True
+    assert gate.process(windows[1]) is True
+
+
+def test_gate_evaluates_new_samples_once():
+    """오버랩 샘플 중복 VAD 방지 테스트"""
+    gate = make_gate()
+    calls = []
+    original = gate.vad.process_frames
+    gate.vad.process_frames = lambda frames: calls.append(len(frames)) or original(frames)
+
+    audio = make_noise(3.0)
+    for window in split_windows(audio):
+        gate.process(window)
+
+    assert sum(calls) * gate.frame_size <= len(audio)
@@ -0,0 +1,103 @@
+"""
+Warm-up Tests
+모델 예열 (첫 호출 / 이후 호출 지연 측정) 단위 테스트 (모의 백엔드)
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+import yaml
+
+# Add project root to path
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from core.audio_capture import AudioCapture
+from core.config_manager import ConfigManager
+from core.controller import CaptionController
+from implementations.mock_backends import MockSTTService, MockTranslationService
+from services.warmup import synthetic_speech, time_calls
+
+
+class SilentAudio(AudioCapture):
+    """장치를 열지 않는 오디오 입력"""
+
+    def initialize(self) -> bool:
+        return True
+
+
+def test_synthetic_speech_is_deterministic():
+    """합성 오디오는 길이 / 범위가 맞고 매번 같음"""
+    audio = synthetic_speech(1.5, 16000)
+    assert audio.dtype == np.float32
+    assert len(audio) == 24000
+    assert np.abs(audio).max() <= 1.0
+    assert np.sqrt(np.mean(audio ** 2)) > 0.01
+    assert np.array_equal(audio, synthetic_speech(1.5, 16000))
+
+
+def test_time_calls_separates_first_call():
+    """첫 호출과 이후 호출 중앙값을 따로 기록"""
+    calls = []
+    stats = time_calls(lambda: calls.append(1), runs=3)
+    assert len(calls) == 3
+    assert stats['runs'] == 3
+    assert stats['first_ms'] >= 0 and stats['steady_ms'] >= 0
+
+    assert time_calls(lambda: None, runs=1)['steady_ms'] is None
+
+
+def test_stt_warmup_runs_model():
+    """STT 예열은 합성 오디오로 모델을 runs번 호출"""
+    service = MockSTTService({'mock': {'rtf': 0.0, 'cpu_load': 'sleep'}})
+    assert service.initialize()
+
+    stats = service.warmup(runs=2, seconds=1.0)
+    assert stats['runs'] == 2
+    assert service.workload.calls == 2
+
+
+def test_translation_warmup_bypasses_cache():
+    """번역 예열은 캐시를 거치지 않아 매번 모델을 호출하고 캐시에 남지 않음"""
+    service = MockTranslationService({'mock': {'cpu_load': 'sleep'}, 'cache': {'enabled': True}})
+    assert service.initialize()
+
+    stats = service.warmup(runs=3)
+    assert stats['runs'] == 3
+    assert service.workload.calls == 3
+    assert service.cache.get_stats()['entries'] == 0
+
+
+@pytest.fixture
+def warmup_config(tmp_path):
+    """예열을 켠 모의 백엔드 설정"""
+    with open(PROJECT_ROOT / "config.yaml", encoding='utf-8') as f:
+        config = yaml.safe_load(f)
+    config['stt']['backend'] = 'mock'
+    config['stt']['mock'] = {'cpu_load': 'sleep', 'latency': 0.2, 'load_time': 0.0}
+    config['translation']['backend'] = 'mock'
+    config['translation']['mock'] = {'cpu_load': 'sleep'}
+    config['performance']['warmup'] = {'enabled': True, 'runs': 2, 'audio_seconds': 0.5}
+
+    path = tmp_path / "warmup.yaml"
+    path.write_text(yaml.safe_dump(config, allow_unicode=True), encoding='utf-8')
+    yield str(path)
+
+    # ConfigManager는 싱글톤: 다른 테스트를 위해 기본 설정 복구
+    ConfigManager().load_config(str(PROJECT_ROOT / "config.yaml"))
+
+
+def test_controller_records_warmup(warmup_config):
+    """컨트롤러 초기화 시 두 모델을 예열하고 결과를 상태에 포함"""
+    controller = CaptionController(warmup_config, audio_factory=SilentAudio)
+    assert controller.initialize()
+
+    assert set(controller.warmup_stats) == {'stt', 'translation'}
+    assert controller.warmup_stats['stt']['runs'] == 2
+    assert controller.get_status()['warmup'] == controller.warmup_stats
+
+    # 로드 시간(제목 표시줄 표시)에는 예열 호출이 들어가지 않음
+    assert controller.load_times['stt'] * 1000 < controller.warmup_stats['stt']['first_ms']
+    controller.cleanup()